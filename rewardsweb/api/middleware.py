@@ -0,0 +1,55 @@
+"""Module containing ASA Stats Rewards API response compression middleware."""
+
+import re
+
+import brotli
+from django.utils.cache import patch_vary_headers
+from django.utils.deprecation import MiddlewareMixin
+
+from utils.constants.core import BROTLI_MIN_LENGTH, BROTLI_QUALITY
+
+ACCEPTS_BROTLI_RE = re.compile(r"\bbr\b")
+
+
+class BrotliMiddleware(MiddlewareMixin):
+    """Compress content with brotli if the client accepts it.
+
+    Placed after Django's `GZipMiddleware`, so gzip is used as a fallback
+    for clients that don't support brotli and for streaming responses.
+    """
+
+    def process_response(self, request, response):
+        """Return brotli compressed `response` if possible and worthwhile.
+
+        :param request: HTTP request object
+        :type request: :class:`django.http.HttpRequest`
+        :param response: HTTP response object
+        :type response: :class:`django.http.HttpResponse`
+        :var compressed: compressed response content
+        :type compressed: bytes
+        :var etag: response's entity tag
+        :type etag: str
+        :return: :class:`django.http.HttpResponse`
+        """
+        if response.streaming or len(response.content) < BROTLI_MIN_LENGTH:
+            return response
+
+        if response.has_header("Content-Encoding"):
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if not ACCEPTS_BROTLI_RE.search(request.META.get("HTTP_ACCEPT_ENCODING", "")):
+            return response
+
+        compressed = brotli.compress(response.content, quality=BROTLI_QUALITY)
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response.headers["Content-Length"] = str(len(response.content))
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+
+        response.headers["Content-Encoding"] = "br"
+        return response
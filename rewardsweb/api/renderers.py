@@ -0,0 +1,81 @@
+"""Module containing ASA Stats Rewards API fast JSON renderer and parser.
+
+Both classes are opt-in replacements for DRF's JSON renderer and parser that
+are enabled through the `REST_FRAMEWORK` setting.
+"""
+
+from decimal import Decimal
+
+import orjson
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser
+from rest_framework.renderers import BaseRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+ORJSON_OPTIONS = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """Return serializable representation of object unsupported by orjson.
+
+    Decimals, lazy strings, querysets and the rest are converted the same way
+    DRF's encoder converts them so the output matches the default renderer.
+
+    :param obj: object to serialize
+    :type obj: object
+    :return: object
+    """
+    if isinstance(obj, Decimal):
+        return float(obj)
+
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(BaseRenderer):
+    """Renderer serializing data to JSON by orjson library."""
+
+    media_type = "application/json"
+    format = "json"
+    charset = None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """Render provided `data` into JSON bytes.
+
+        :param data: data to render
+        :type data: object
+        :param accepted_media_type: accepted media type
+        :type accepted_media_type: str
+        :param renderer_context: renderer context
+        :type renderer_context: dict
+        :return: bytes
+        """
+        if data is None:
+            return b""
+
+        return orjson.dumps(data, default=_default, option=ORJSON_OPTIONS)
+
+
+class ORJSONParser(BaseParser):
+    """Parser deserializing JSON request content by orjson library."""
+
+    media_type = "application/json"
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        """Parse JSON content from provided `stream`.
+
+        :param stream: request content stream
+        :type stream: file-like object
+        :param media_type: request content media type
+        :type media_type: str
+        :param parser_context: parser context
+        :type parser_context: dict
+        :return: object
+        """
+        try:
+            return orjson.loads(stream.read())
+
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -156,6 +156,28 @@ class HumanizedContributionSerializer(Serializer):
     confirmed = BooleanField()
 
 
+class ContributorSummarySerializer(Serializer):
+    """Serializer for contributor's summary with the most recent contributions.
+
+    :var name: contributor's name
+    :type name: :class:`rest_framework.serializers.CharField`
+    :var first_cycle_end: end date of contributor's first cycle
+    :type first_cycle_end: :class:`rest_framework.serializers.DateField`
+    :var total_contributions: total number of contributor's contributions
+    :type total_contributions: :class:`rest_framework.serializers.IntegerField`
+    :var total_rewards: sum of contributor's rewards
+    :type total_rewards: :class:`rest_framework.serializers.IntegerField`
+    :var last_contributions: contributor's most recent contributions
+    :type last_contributions: :class:`HumanizedContributionSerializer`
+    """
+
+    name = CharField()
+    first_cycle_end = DateField(allow_null=True)
+    total_contributions = IntegerField()
+    total_rewards = IntegerField()
+    last_contributions = HumanizedContributionSerializer(many=True)
+
+
 class ContributionSerializer(ModelSerializer):
     """Serializer for Contribution model.
 
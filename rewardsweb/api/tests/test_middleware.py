@@ -0,0 +1,68 @@
+"""Testing module for :py:mod:`api.middleware` module."""
+
+import os
+
+import brotli
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory
+from django.utils.deprecation import MiddlewareMixin
+
+from api.middleware import BrotliMiddleware
+
+CONTENT = b'{"contributor_name": "user1", "percentage": "0.50"}' * 20
+
+
+def _process(content=CONTENT, accept="gzip, deflate, br", **headers):
+    response = HttpResponse(content, content_type="application/json")
+    for key, value in headers.items():
+        response.headers[key] = value
+
+    request = RequestFactory().get("/api/contributions", HTTP_ACCEPT_ENCODING=accept)
+    return BrotliMiddleware(lambda request: response).process_response(
+        request, response
+    )
+
+
+class TestApiMiddlewareBrotliMiddleware:
+    """Testing class for :py:class:`api.middleware.BrotliMiddleware`."""
+
+    def test_api_middleware_brotlimiddleware_issubclass_of_middlewaremixin(self):
+        assert issubclass(BrotliMiddleware, MiddlewareMixin)
+
+    def test_api_middleware_brotlimiddleware_compresses_content(self):
+        response = _process(ETag='"abc"')
+        assert response["Content-Encoding"] == "br"
+        assert response["Vary"] == "Accept-Encoding"
+        assert response["ETag"] == 'W/"abc"'
+        assert int(response["Content-Length"]) == len(response.content)
+        assert brotli.decompress(response.content) == CONTENT
+
+    def test_api_middleware_brotlimiddleware_for_client_without_brotli(self):
+        response = _process(accept="gzip, deflate")
+        assert not response.has_header("Content-Encoding")
+        assert response["Vary"] == "Accept-Encoding"
+        assert response.content == CONTENT
+
+    def test_api_middleware_brotlimiddleware_for_short_content(self):
+        response = _process(content=b"{}")
+        assert not response.has_header("Content-Encoding")
+        assert response.content == b"{}"
+
+    def test_api_middleware_brotlimiddleware_for_already_encoded_content(self):
+        response = _process(**{"Content-Encoding": "gzip"})
+        assert response["Content-Encoding"] == "gzip"
+        assert response.content == CONTENT
+
+    def test_api_middleware_brotlimiddleware_for_incompressible_content(self):
+        content = os.urandom(1024)
+        response = _process(content=content)
+        assert not response.has_header("Content-Encoding")
+        assert response.content == content
+
+    def test_api_middleware_brotlimiddleware_for_streaming_response(self):
+        response = StreamingHttpResponse(iter([CONTENT]))
+        request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING="br")
+        returned = BrotliMiddleware(lambda request: response).process_response(
+            request, response
+        )
+        assert not returned.has_header("Content-Encoding")
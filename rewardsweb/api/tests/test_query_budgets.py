@@ -0,0 +1,79 @@
+"""Testing module for SQL query budgets of :py:mod:`api.views` views."""
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Reward,
+    RewardType,
+    SocialPlatform,
+)
+
+
+@pytest.fixture
+def populated():
+    """Create cycles and contributors with several contributions.
+
+    Every collection has several records, so views running a query per
+    record exceed their budgets.
+    """
+    platform = SocialPlatform.objects.create(name="Discord", prefix="")
+    reward = Reward.objects.create(
+        type=RewardType.objects.create(label="F", name="Feature"), amount=1000
+    )
+    cycles = [
+        Cycle.objects.create(start="2023-01-01", end="2023-01-31"),
+        Cycle.objects.create(start="2023-02-01", end="2099-02-28"),
+    ]
+    for index in range(4):
+        contributor = Contributor.objects.create(name=f"user{index}")
+        Handle.objects.create(
+            contributor=contributor, platform=platform, handle=f"user{index}"
+        )
+        for cycle in cycles:
+            Contribution.objects.create(
+                contributor=contributor,
+                cycle=cycle,
+                platform=platform,
+                reward=reward,
+                percentage=50.0,
+                url=f"https://example.com/{index}/{cycle.id}",
+                confirmed=True,
+            )
+
+    cache.clear()
+    return {"cycles": cycles}
+
+
+@pytest.mark.django_db
+class TestApiViewsQueryBudgets:
+    """Testing class for SQL query budgets of API views."""
+
+    @pytest.mark.parametrize(
+        "name,kwargs,max_queries,max_repeated",
+        [
+            ("contributions", {}, 1, 0),
+            ("contributions-tail", {}, 1, 0),
+            ("cycle-by-id", {"cycle_id": 0}, 3, 0),
+            ("cycle-by-id-plain", {"cycle_id": 0}, 1, 0),
+            ("cycle-current", {}, 3, 0),
+            ("cycle-current-plain", {}, 1, 0),
+            ("contributor-summary", {"handle": "user1"}, 4, 0),
+        ],
+    )
+    def test_api_views_query_budget(
+        self, client, populated, query_budget, name, kwargs, max_queries, max_repeated
+    ):
+        if "cycle_id" in kwargs:
+            kwargs = {"cycle_id": populated["cycles"][0].id}
+
+        url = reverse(name, kwargs=kwargs)
+        with query_budget(max_queries, max_repeated):
+            response = client.get(url, REMOTE_ADDR="127.0.0.1")
+
+        assert response.status_code == 200
@@ -0,0 +1,83 @@
+"""Testing module for :py:mod:`api.renderers` module."""
+
+import io
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from api.renderers import ORJSONParser, ORJSONRenderer, _default
+
+
+class TestApiRenderersHelpers:
+    """Testing class for :py:mod:`api.renderers` helper functions."""
+
+    def test_api_renderers_default_for_decimal(self):
+        assert _default(Decimal("0.50")) == 0.5
+
+    def test_api_renderers_default_for_lazy_string(self):
+        assert _default(gettext_lazy("foo")) == "foo"
+
+    def test_api_renderers_default_for_unsupported_object(self):
+        with pytest.raises(TypeError):
+            _default(object())
+
+
+class TestApiRenderersORJSONRenderer:
+    """Testing class for :py:class:`api.renderers.ORJSONRenderer`."""
+
+    def test_api_renderers_orjsonrenderer_issubclass_of_baserenderer(self):
+        assert issubclass(ORJSONRenderer, BaseRenderer)
+
+    def test_api_renderers_orjsonrenderer_attributes(self):
+        assert ORJSONRenderer.media_type == "application/json"
+        assert ORJSONRenderer.format == "json"
+        assert ORJSONRenderer.charset is None
+
+    def test_api_renderers_orjsonrenderer_render_for_none(self):
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_api_renderers_orjsonrenderer_render_matches_drf_output(self):
+        data = [
+            {
+                "id": 1,
+                "contributor_name": "user1 ščž",
+                "percentage": Decimal("0.50"),
+                "amount": "1.50",
+                "start": date(2025, 1, 1),
+                "created_at": datetime(2025, 1, 1, 10, 5, 30, 123, tzinfo=timezone.utc),
+                "updated_at": datetime(2025, 1, 1, 10, 5, 30),
+                "confirmed": True,
+                "issue": None,
+                "rewards": {1: 100, "user2": 200},
+            }
+        ]
+        returned = ORJSONRenderer().render(data)
+        assert json.loads(returned) == json.loads(JSONRenderer().render(data))
+
+
+class TestApiRenderersORJSONParser:
+    """Testing class for :py:class:`api.renderers.ORJSONParser`."""
+
+    def test_api_renderers_orjsonparser_issubclass_of_baseparser(self):
+        assert issubclass(ORJSONParser, BaseParser)
+
+    def test_api_renderers_orjsonparser_attributes(self):
+        assert ORJSONParser.media_type == "application/json"
+        assert ORJSONParser.renderer_class == ORJSONRenderer
+
+    def test_api_renderers_orjsonparser_parse(self):
+        content = b'{"username": "user1", "level": 2, "comment": "\xc5\xa1"}'
+        returned = ORJSONParser().parse(io.BytesIO(content))
+        assert returned == JSONParser().parse(io.BytesIO(content))
+
+    def test_api_renderers_orjsonparser_parse_for_invalid_content(self):
+        with pytest.raises(ParseError) as exception:
+            ORJSONParser().parse(io.BytesIO(b'{"username": '))
+
+        assert str(exception.value).startswith("JSON parse error - ")
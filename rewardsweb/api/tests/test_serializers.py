@@ -6,6 +6,7 @@ from api.serializers import (
     AggregatedCycleSerializer,
     ContributionSerializer,
     ContributorSerializer,
+    ContributorSummarySerializer,
     CycleSerializer,
     HumanizedContributionSerializer,
     RewardSerializer,
@@ -245,6 +246,48 @@ class TestApiSerializersHumanizedContributionSerializer:
         assert "url" in serializer.errors
 
 
+class TestApiSerializersContributorSummarySerializer:
+    """Testing class for :class:`api.serializers.ContributorSummarySerializer`."""
+
+    def test_api_serializers_contributor_summary_serializer_representation(self):
+        data = {
+            "name": "user1",
+            "first_cycle_end": date(2024, 5, 31),
+            "total_contributions": 3,
+            "total_rewards": 80000,
+            "last_contributions": [
+                {
+                    "id": 1,
+                    "contributor_name": "user1",
+                    "cycle_id": 2,
+                    "platform": "Discord",
+                    "url": "https://example.com/1",
+                    "type": "[F] Feature Request",
+                    "level": 2,
+                    "percentage": 1,
+                    "reward": 15000,
+                    "confirmed": True,
+                }
+            ],
+        }
+        returned = ContributorSummarySerializer(data).data
+        assert returned["first_cycle_end"] == "2024-05-31"
+        assert returned["total_contributions"] == 3
+        assert returned["total_rewards"] == 80000
+        assert returned["last_contributions"][0]["percentage"] == "1.00"
+        assert returned["last_contributions"][0]["type"] == "[F] Feature Request"
+
+    def test_api_serializers_contributor_summary_serializer_for_no_cycle(self):
+        data = {
+            "name": "user1",
+            "first_cycle_end": None,
+            "total_contributions": 0,
+            "total_rewards": 0,
+            "last_contributions": [],
+        }
+        assert ContributorSummarySerializer(data).data == data
+
+
 class TestApiSerializersContributionSerializer:
     """Testing class for :py:class:`api.serializers.ContributionSerializer`."""
 
@@ -61,6 +61,22 @@ class TestApiUrls:
         assert hasattr(url.callback, "view_class")
         assert url.callback.view_class.__name__ == "ContributionsTailView"
 
+    def test_api_urls_contributor_summary(self):
+        """Test contributor summary endpoint URL configuration."""
+        url = self._url_from_pattern("contributors/<path:handle>/summary")
+        assert isinstance(url, URLPattern)
+        assert url.name == "contributor-summary"
+        assert hasattr(url.callback, "view_class")
+        assert url.callback.view_class.__name__ == "ContributorSummaryView"
+
+    def test_api_urls_contributions_export(self):
+        """Test contributions export endpoint URL configuration."""
+        url = self._url_from_pattern("contributions/export/<str:export_format>")
+        assert isinstance(url, URLPattern)
+        assert url.name == "contributions-export"
+        assert hasattr(url.callback, "view_class")
+        assert url.callback.view_class.__name__ == "ContributionsExportView"
+
     def test_api_urls_add_contribution(self):
         """Test add contribution endpoint URL configuration."""
         url = self._url_from_pattern("addcontribution")
@@ -71,7 +87,7 @@ class TestApiUrls:
 
     def test_api_urls_pattern_count(self):
         """Test that all expected URL patterns are present."""
-        assert len(urls.urlpatterns) == 7
+        assert len(urls.urlpatterns) == 9
 
     def test_api_urls_all_patterns_are_urlpatterns(self):
         """Test that all URL patterns are valid URLPattern instances."""
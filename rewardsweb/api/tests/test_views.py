@@ -1,29 +1,48 @@
 """Testing module for :py:mod:`api.views` module."""
 
+import asyncio
+import time
 from unittest.mock import AsyncMock, patch
 
 import pytest
 from adrf.views import APIView
+from django.core.cache import cache
+from django.http import Http404, StreamingHttpResponse
 from rest_framework import status
 from rest_framework.permissions import BasePermission
 from rest_framework.response import Response
 
 from api.views import (
     AddContributionView,
+    ContributionsExportView,
     ContributionsTailView,
     ContributionsView,
+    ContributorSummaryView,
     CurrentCycleAggregatedView,
     CurrentCyclePlainView,
     CycleAggregatedView,
     CyclePlainView,
     IsLocalhostPermission,
     LocalhostAPIView,
+    SingleFlight,
     aggregated_cycle_response,
     contributions_response,
 )
+from core.fragments import bump_data_version
 from core.models import Contributor, Cycle, Reward, RewardType, SocialPlatform
 
 
+@pytest.fixture
+def locmem_cache(settings):
+    """Use local memory cache instead of development's dummy cache."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
 class TestIsLocalhostPermission:
     """Testing class for :class:`api.permissions.IsLocalhostPermission`."""
 
@@ -85,17 +104,12 @@ class TestApiViewsHelpers:
         mock_cycle.contributor_rewards = {"addr1": 100, "addr2": 200}
         mock_cycle.total_rewards = 300
 
-        # Mock sync_to_async calls to return awaitable objects
+        # Mock sync_to_async call to return awaitable object
         with patch("api.views.sync_to_async") as mock_sync_to_async:
-            # Create awaitable mocks that return the expected values
-            mock_contributor_rewards = AsyncMock(
-                return_value={"addr1": 100, "addr2": 200}
+            # Create awaitable mock that returns the expected values
+            mock_sync_to_async.return_value = AsyncMock(
+                return_value=({"addr1": 100, "addr2": 200}, 300)
             )
-            mock_total_rewards = AsyncMock(return_value=300)
-            mock_sync_to_async.side_effect = [
-                mock_contributor_rewards,
-                mock_total_rewards,
-            ]
 
             # Mock serializer
             mock_serializer = mocker.MagicMock()
@@ -108,6 +122,11 @@ class TestApiViewsHelpers:
 
         assert isinstance(response, Response)
         assert response.status_code == status.HTTP_200_OK
+        mock_sync_to_async.assert_called_once()
+        assert mock_sync_to_async.call_args[0][0]() == (
+            {"addr1": 100, "addr2": 200},
+            300,
+        )
 
     @pytest.mark.asyncio
     async def test_api_views_contributions_response(self, mocker):
@@ -132,6 +151,175 @@ class TestApiViewsHelpers:
         assert isinstance(response, Response)
         assert response.status_code == status.HTTP_200_OK
 
+    @pytest.mark.asyncio
+    async def test_api_views_contributions_response_for_key(self, mocker):
+        mock_contributions = mocker.MagicMock()
+        mock_humanized_data = [{"id": 1, "contributor_name": "test"}]
+        mock_do = mocker.patch(
+            "api.views.single_flight.do",
+            new_callable=AsyncMock,
+            return_value=mock_humanized_data,
+        )
+        mock_humanize = mocker.patch(
+            "api.views.humanize_contributions", return_value=mock_humanized_data
+        )
+        mock_serializer = mocker.MagicMock()
+        mock_serializer.data = mock_humanized_data
+        mocker.patch(
+            "api.views.HumanizedContributionSerializer", return_value=mock_serializer
+        )
+        response = await contributions_response(mock_contributions, key="foo")
+        assert response.data == mock_humanized_data
+        mock_do.assert_awaited_once()
+        assert mock_do.call_args[0][0] == "foo"
+        mock_do.call_args[0][1]()
+        mock_humanize.assert_called_once_with(mock_contributions)
+
+
+class TestApiViewsSingleFlight:
+    """Testing class for :py:class:`api.views.SingleFlight`."""
+
+    def test_api_views_singleflight_init(self):
+        single_flight = SingleFlight()
+        assert single_flight._lock is not None
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_api_views_singleflight_do_coalesces_concurrent_calls(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return {"total": 300}
+
+        single_flight = SingleFlight()
+        returned = await asyncio.gather(
+            *(single_flight.do("cycle-1", compute) for _ in range(5))
+        )
+        assert len(calls) == 1
+        assert returned == [{"total": 300}] * 5
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_api_views_singleflight_do_for_different_keys(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        single_flight = SingleFlight()
+        await asyncio.gather(
+            single_flight.do("cycle-1", compute), single_flight.do("cycle-2", compute)
+        )
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_api_views_singleflight_do_for_sequential_calls(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        single_flight = SingleFlight()
+        assert await single_flight.do("cycle-1", compute) == 1
+        assert await single_flight.do("cycle-1", compute) == 2
+
+    @pytest.mark.asyncio
+    async def test_api_views_singleflight_do_propagates_exception(self):
+        def compute():
+            time.sleep(0.05)
+            raise ValueError("boom")
+
+        single_flight = SingleFlight()
+        returned = await asyncio.gather(
+            single_flight.do("cycle-1", compute),
+            single_flight.do("cycle-1", compute),
+            return_exceptions=True,
+        )
+        assert all(isinstance(result, ValueError) for result in returned)
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_api_views_singleflight_do_for_cancelled_leader(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.05)
+            return len(calls)
+
+        single_flight = SingleFlight()
+        leader = asyncio.ensure_future(single_flight.do("cycle-1", compute))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(single_flight.do("cycle-1", compute))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == 2
+        assert leader.cancelled()
+        assert single_flight._calls == {}
+
+    @pytest.mark.asyncio
+    async def test_api_views_singleflight_do_for_cancelled_follower(self):
+        def compute():
+            time.sleep(0.05)
+            return 1
+
+        single_flight = SingleFlight()
+        leader = asyncio.ensure_future(single_flight.do("cycle-1", compute))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(single_flight.do("cycle-1", compute))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        assert await leader == 1
+        assert follower.cancelled()
+
+    def test_api_views_singleflight_shared_caches_result(self, locmem_cache):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            return len(calls)
+
+        assert SingleFlight.shared("cycle-1", compute) == 1
+        assert SingleFlight.shared("cycle-1", compute) == 1
+        assert SingleFlight.shared("cycle-2", compute) == 2
+        bump_data_version()
+        assert SingleFlight.shared("cycle-1", compute) == 3
+
+    def test_api_views_singleflight_shared_waits_for_lock_holder(
+        self, locmem_cache, mocker
+    ):
+        compute = mocker.MagicMock()
+        mocker.patch("api.views.data_version", return_value="version")
+        mocker.patch("api.views.cache.add", return_value=False)
+        mocker.patch("api.views.cache.get", side_effect=[None, {"total": 300}])
+        mocked_sleep = mocker.patch("api.views.time.sleep")
+        assert SingleFlight.shared("cycle-1", compute) == {"total": 300}
+        mocked_sleep.assert_called_once()
+        compute.assert_not_called()
+
+    def test_api_views_singleflight_shared_computes_after_lock_timeout(
+        self, locmem_cache, mocker
+    ):
+        mocker.patch("api.views.cache.add", return_value=False)
+        mocked_delete = mocker.patch("api.views.cache.delete")
+        mocker.patch("api.views.time.monotonic", side_effect=[0, 1, 100])
+        mocker.patch("api.views.time.sleep")
+        assert SingleFlight.shared("cycle-1", lambda: 5) == 5
+        mocked_delete.assert_not_called()
+
+    def test_api_views_singleflight_shared_releases_lock_on_error(self, locmem_cache):
+        def compute():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            SingleFlight.shared("cycle-1", compute)
+
+        assert SingleFlight.shared("cycle-1", lambda: 5) == 5
+
 
 class TestLocalhostAPIView:
     """Testing class for :py:class:`api.views.LocalhostAPIView`."""
@@ -329,7 +517,9 @@ class TestApiViewsContributionsView:
             mock_sync_to_async.side_effect = [mock_contributor_call, mock_queryset_call]
 
             with patch("api.views.Contribution.objects") as mock_contribution_objects:
-                mock_contribution_objects.filter.return_value = mock_queryset
+                mock_contribution_objects.filter.return_value.select_related.return_value = (
+                    mock_queryset
+                )
                 with patch(
                     "api.views.contributions_response", new_callable=AsyncMock
                 ) as mock_response:
@@ -341,7 +531,9 @@ class TestApiViewsContributionsView:
                     mock_contribution_objects.filter.assert_called_once_with(
                         contributor=mock_contributor
                     )
-                    mock_response.assert_called_once_with(mock_queryset)
+                    mock_response.assert_called_once_with(
+                        mock_queryset, key="contributions-testuser"
+                    )
                     assert isinstance(response, Response)
 
     @pytest.mark.asyncio
@@ -362,7 +554,9 @@ class TestApiViewsContributionsView:
                 # Mock the chain: objects.order_by().__getitem__()
                 mock_order_by = mocker.MagicMock()
                 mock_order_by.__getitem__.return_value = mock_queryset
-                mock_contribution_objects.order_by.return_value = mock_order_by
+                mock_contribution_objects.order_by.return_value.select_related.return_value = (
+                    mock_order_by
+                )
 
                 with patch(
                     "api.views.contributions_response", new_callable=AsyncMock
@@ -376,7 +570,9 @@ class TestApiViewsContributionsView:
                     mock_order_by.__getitem__.assert_called_once_with(
                         slice(None, 10)
                     )  # CONTRIBUTIONS_TAIL_SIZE * 2 = 5 * 2 = 10
-                    mock_response.assert_called_once_with(mock_queryset)
+                    mock_response.assert_called_once_with(
+                        mock_queryset, key="contributions-"
+                    )
                     assert isinstance(response, Response)
 
 
@@ -402,7 +598,9 @@ class TestApiViewsContributionsTailView:
                 # Mock the chain: objects.order_by().__getitem__()
                 mock_order_by = mocker.MagicMock()
                 mock_order_by.__getitem__.return_value = mock_queryset
-                mock_contribution_objects.order_by.return_value = mock_order_by
+                mock_contribution_objects.order_by.return_value.select_related.return_value = (
+                    mock_order_by
+                )
 
                 with patch(
                     "api.views.contributions_response", new_callable=AsyncMock
@@ -415,10 +613,135 @@ class TestApiViewsContributionsTailView:
                     mock_order_by.__getitem__.assert_called_once_with(
                         slice(None, 5)
                     )  # CONTRIBUTIONS_TAIL_SIZE = 5
-                    mock_response.assert_called_once_with(mock_queryset)
+                    mock_response.assert_called_once_with(
+                        mock_queryset, key="contributions-tail"
+                    )
                     assert isinstance(response, Response)
 
 
+class TestApiViewsContributorSummaryView:
+    """Testing class for :py:class:`api.views.ContributorSummaryView`."""
+
+    def test_api_views_contributorsummaryview_is_subclass_of_localhostapiview(self):
+        assert issubclass(ContributorSummaryView, LocalhostAPIView)
+
+    @pytest.mark.asyncio
+    async def test_api_views_contributor_summary_view_get(self, mocker):
+        view = ContributorSummaryView()
+        mock_request = mocker.MagicMock()
+        mock_request.GET = {"size": "3"}
+        mock_contributor = mocker.MagicMock(spec=Contributor)
+        summary = {
+            "name": "user1",
+            "first_cycle_end": None,
+            "total_contributions": 0,
+            "total_rewards": 0,
+            "last_contributions": [],
+        }
+        mock_contributor.summary.return_value = summary
+        mock_from_handle = mocker.patch(
+            "api.views.Contributor.objects.from_handle", return_value=mock_contributor
+        )
+        response = await view.get(mock_request, "user1")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data == summary
+        mock_from_handle.assert_called_once_with("user1")
+        mock_contributor.summary.assert_called_once_with(size=3)
+
+    @pytest.mark.asyncio
+    async def test_api_views_contributor_summary_view_get_default_size(self, mocker):
+        view = ContributorSummaryView()
+        mock_request = mocker.MagicMock()
+        mock_request.GET = {}
+        mock_contributor = mocker.MagicMock(spec=Contributor)
+        mocker.patch(
+            "api.views.Contributor.objects.from_handle", return_value=mock_contributor
+        )
+        mocker.patch("api.views.ContributorSummarySerializer")
+        await view.get(mock_request, "user1")
+        mock_contributor.summary.assert_called_once_with(size=5)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("size", ["foo", "-1", "0", "101"])
+    async def test_api_views_contributor_summary_view_get_invalid_size(
+        self, mocker, size
+    ):
+        view = ContributorSummaryView()
+        mock_request = mocker.MagicMock()
+        mock_request.GET = {"size": size}
+        mock_from_handle = mocker.patch("api.views.Contributor.objects.from_handle")
+        response = await view.get(mock_request, "user1")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert response.data == {"error": "Invalid size"}
+        mock_from_handle.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("side_effect", [[None], ValueError("ambiguous")])
+    async def test_api_views_contributor_summary_view_get_not_found(
+        self, mocker, side_effect
+    ):
+        view = ContributorSummaryView()
+        mock_request = mocker.MagicMock()
+        mock_request.GET = {}
+        mocker.patch(
+            "api.views.Contributor.objects.from_handle", side_effect=side_effect
+        )
+        response = await view.get(mock_request, "user1")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data == {"error": "Contributor not found"}
+
+
+class TestApiViewsContributionsExportView:
+    """Testing class for :py:class:`api.views.ContributionsExportView`."""
+
+    def test_api_views_contributionsexportview_is_subclass_of_localhostapiview(self):
+        assert issubclass(ContributionsExportView, LocalhostAPIView)
+
+    def test_api_views_contributionsexportview_is_not_async(self):
+        assert ContributionsExportView.view_is_async is False
+
+    def test_api_views_contributions_export_view_get_for_invalid_format(self, mocker):
+        mocked_lines = mocker.patch("api.views.export_lines")
+        with pytest.raises(Http404):
+            ContributionsExportView().get(mocker.MagicMock(), "xml")
+
+        mocked_lines.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "export_format,content_type",
+        [("ndjson", "application/x-ndjson"), ("csv", "text/csv")],
+    )
+    def test_api_views_contributions_export_view_get_streams_lines(
+        self, export_format, content_type, mocker
+    ):
+        mocked_lines = mocker.patch(
+            "api.views.export_lines", return_value=iter(["line1\n", "line2\n"])
+        )
+        response = ContributionsExportView().get(mocker.MagicMock(), export_format)
+        assert isinstance(response, StreamingHttpResponse)
+        assert response["Content-Type"] == content_type
+        assert response["Content-Disposition"] == (
+            f'attachment; filename="contributions.{export_format}"'
+        )
+        assert b"".join(response.streaming_content) == b"line1\nline2\n"
+        mocked_lines.assert_called_once_with(export_format)
+
+    @pytest.mark.django_db
+    def test_api_views_contributions_export_view_integration(self, client):
+        response = client.get("/api/contributions/export/csv", REMOTE_ADDR="127.0.0.1")
+        assert response.status_code == status.HTTP_200_OK
+        assert b"".join(response.streaming_content).startswith(b"id,contributor,")
+
+    @pytest.mark.django_db
+    def test_api_views_contributions_export_view_integration_not_localhost(
+        self, client
+    ):
+        response = client.get(
+            "/api/contributions/export/ndjson", REMOTE_ADDR="192.168.1.1"
+        )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
 class TestApiViewsAddContributionView:
     """Testing class for :py:class:`api.views.AddContributionView`."""
 
@@ -604,6 +927,49 @@ class TestApiViewsAddContributionView:
                                         )
                                         assert response.data == mock_serializer_data
 
+    @pytest.mark.asyncio
+    async def test_api_views_add_contribution_view_post_caches_message(self, mocker):
+        """Test provided Discord message is cached for created contribution."""
+        view = AddContributionView()
+        mock_request = mocker.MagicMock()
+        url = "https://discord.com/channels/906917846754418770/1/2"
+        mock_request.data = {
+            "username": "testuser",
+            "platform": "discord",
+            "type": "[reward] Test Reward",
+            "url": url,
+            "message": {
+                "content": "content",
+                "author": "author",
+                "timestamp": "2025-01-01T10:00:00.000000+00:00",
+            },
+        }
+        mocker.patch("api.views.Contributor.objects")
+        mocker.patch("api.views.Cycle.objects")
+        mocker.patch("api.views.SocialPlatform.objects")
+        mocker.patch("api.views.get_object_or_404")
+        mocker.patch("api.views.Reward.objects")
+        mocker.patch("api.views.transaction.atomic")
+        mocked_serializer = mocker.patch("api.views.ContributionSerializer")
+        mocked_serializer.return_value.is_valid.return_value = True
+        mocked_serializer.return_value.data = {"id": 1}
+        mocked_cache = mocker.patch("api.views.cache_message")
+
+        def sync_wrapper(func):
+            async def async_func(*args, **kwargs):
+                return func(*args, **kwargs)
+
+            return async_func
+
+        mocker.patch("api.views.sync_to_async", side_effect=sync_wrapper)
+
+        response = await view.post(mock_request)
+
+        assert response.status_code == status.HTTP_201_CREATED
+        mocked_cache.assert_called_once_with(
+            url, "content", "author", "2025-01-01T10:00:00.000000+00:00"
+        )
+
     @pytest.mark.asyncio
     async def test_api_views_add_contribution_view_post_type_parsing_edge_cases(
         self, mocker
@@ -29,6 +29,16 @@ urlpatterns = [
         views.ContributionsTailView.as_view(),
         name="contributions-tail",
     ),
+    path(
+        "contributors/<path:handle>/summary",
+        views.ContributorSummaryView.as_view(),
+        name="contributor-summary",
+    ),
+    path(
+        "contributions/export/<str:export_format>",
+        views.ContributionsExportView.as_view(),
+        name="contributions-export",
+    ),
     path(
         "addcontribution", views.AddContributionView.as_view(), name="add-contribution"
     ),
@@ -1,8 +1,16 @@
 """Module containing ASA Stats Rewards API views."""
 
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from functools import partial
+
 from adrf.views import APIView
 from asgiref.sync import sync_to_async
+from django.core.cache import cache
 from django.db import transaction
+from django.http import Http404, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import BasePermission
@@ -11,9 +19,11 @@ from rest_framework.response import Response
 from api.serializers import (
     AggregatedCycleSerializer,
     ContributionSerializer,
+    ContributorSummarySerializer,
     CycleSerializer,
     HumanizedContributionSerializer,
 )
+from core.fragments import data_version
 from core.models import (
     Contribution,
     Contributor,
@@ -22,7 +32,16 @@ from core.models import (
     RewardType,
     SocialPlatform,
 )
-from utils.constants.core import CONTRIBUTIONS_TAIL_SIZE
+from utils.bot import cache_message
+from utils.constants.core import (
+    CONTRIBUTIONS_TAIL_SIZE,
+    CONTRIBUTOR_SUMMARY_MAX_SIZE,
+    HUMANIZED_CONTRIBUTION_RELATED,
+    SINGLE_FLIGHT_LOCK_TIMEOUT,
+    SINGLE_FLIGHT_POLL_INTERVAL,
+    SINGLE_FLIGHT_RESULT_TIMEOUT,
+)
+from utils.exporters import EXPORT_FORMATS, export_lines
 from utils.helpers import humanize_contributions
 
 
@@ -46,6 +65,141 @@ class IsLocalhostPermission(BasePermission):
         return remote_addr in ["127.0.0.1", "localhost", "::1"]
 
 
+class SingleFlight:
+    """Coalesce concurrent identical computations into a single execution.
+
+    The first caller for a key becomes the leader and runs the computation in
+    the thread pool, while callers arriving with the same key before it ends
+    await the leader's result instead of hitting the database again. If the
+    leader is cancelled, one of the waiting callers becomes the new leader and
+    runs the computation again. State is guarded by a thread lock as every
+    request may run in its own event loop.
+
+    Web server's worker processes handle one request at a time, so leaders
+    are coalesced across processes too by the shared cache: the one adding
+    the key's lock computes and caches the result for a few seconds, while
+    the others wait for that result.
+
+    :var SingleFlight._lock: lock guarding in-flight calls collection
+    :type SingleFlight._lock: :class:`threading.Lock`
+    :var SingleFlight._calls: in-flight futures keyed by computation key
+    :type SingleFlight._calls: dict
+    """
+
+    def __init__(self):
+        """Initialize lock and in-flight calls collection."""
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def _forget(self, key, future):
+        """Remove `future` from in-flight calls unless replaced by a new leader.
+
+        :param key: computation identifier
+        :type key: str
+        :param future: leader's shared future
+        :type future: :class:`concurrent.futures.Future`
+        """
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    @staticmethod
+    def shared(key, func):
+        """Return `func` result cached for `key` or compute it under cache lock.
+
+        Result is keyed by the data version too, so writes aren't hidden. If
+        the lock isn't released in time, the result is computed regardless.
+
+        :param key: computation identifier
+        :type key: str
+        :param func: synchronous callable performing the computation
+        :type func: callable
+        :var result_key: cache key of the computation's result
+        :type result_key: str
+        :var lock_key: cache key of the computation's lock
+        :type lock_key: str
+        :var deadline: monotonic time until the lock is waited for
+        :type deadline: float
+        :var locked: has this call added the lock or not
+        :type locked: Boolean
+        :var result: computation result
+        :type result: object
+        :return: computation result
+        """
+        result_key = f"single-flight:{data_version()}:{key}"
+        lock_key = f"{result_key}:lock"
+        deadline = time.monotonic() + SINGLE_FLIGHT_LOCK_TIMEOUT
+        while True:
+            result = cache.get(result_key)
+            if result is not None:
+                return result
+
+            locked = cache.add(lock_key, 1, SINGLE_FLIGHT_LOCK_TIMEOUT)
+            if locked or time.monotonic() > deadline:
+                break
+
+            time.sleep(SINGLE_FLIGHT_POLL_INTERVAL)
+
+        try:
+            result = func()
+            cache.set(result_key, result, SINGLE_FLIGHT_RESULT_TIMEOUT)
+
+        finally:
+            if locked:
+                cache.delete(lock_key)
+
+        return result
+
+    async def do(self, key, func):
+        """Return result of `func` shared between all concurrent `key` callers.
+
+        :param key: computation identifier
+        :type key: str
+        :param func: synchronous callable performing the computation
+        :type func: callable
+        :var future: shared future holding the computation's result
+        :type future: :class:`concurrent.futures.Future`
+        :var leader: is this call the one running the computation
+        :type leader: Boolean
+        :return: computation result
+        """
+        while True:
+            with self._lock:
+                future = self._calls.get(key)
+                leader = future is None
+                if leader:
+                    future = self._calls[key] = Future()
+
+            if leader:
+                try:
+                    result = await sync_to_async(partial(self.shared, key, func))()
+
+                except Exception as exc:
+                    self._forget(key, future)
+                    future.set_exception(exc)
+
+                except BaseException:
+                    # waiting callers elect a new leader
+                    self._forget(key, future)
+                    future.cancel()
+                    raise
+
+                else:
+                    self._forget(key, future)
+                    future.set_result(result)
+
+            try:
+                # shielded so a cancelled caller doesn't cancel the shared future
+                return await asyncio.shield(asyncio.wrap_future(future))
+
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+
+
+single_flight = SingleFlight()
+
+
 # # HELPERS
 async def aggregated_cycle_response(cycle: Cycle):
     """Generate aggregated cycle response with contributor rewards data.
@@ -58,8 +212,9 @@ async def aggregated_cycle_response(cycle: Cycle):
     if not cycle:
         return Response({"error": "Cycle not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    contributor_rewards = await sync_to_async(lambda: cycle.contributor_rewards)()
-    total_rewards = await sync_to_async(lambda: cycle.total_rewards)()
+    contributor_rewards, total_rewards = await single_flight.do(
+        f"cycle-{cycle.id}", lambda: (cycle.contributor_rewards, cycle.total_rewards)
+    )
 
     data = {
         "id": cycle.id,
@@ -74,17 +229,27 @@ async def aggregated_cycle_response(cycle: Cycle):
     return Response(serializer.data)
 
 
-async def contributions_response(contributions):
+async def contributions_response(contributions, key=None):
     """Fetch, humanize, serialize, and return contributions.
 
+    Concurrent calls with the same provided `key` share a single humanization.
+
     :param contributions: QuerySet of Contribution objects
     :type contributions: :class:`django.db.models.QuerySet`
+    :param key: identifier used for coalescing concurrent identical requests
+    :type key: str
     :return: DRF Response with humanized contributions data
     :rtype: :class:`rest_framework.response.Response`
     """
 
     # Run DB-dependent humanization on a thread pool
-    data = await sync_to_async(lambda: humanize_contributions(contributions))()
+    if key:
+        data = await single_flight.do(
+            key, lambda: humanize_contributions(contributions)
+        )
+
+    else:
+        data = await sync_to_async(lambda: humanize_contributions(contributions))()
     serializer = HumanizedContributionSerializer(data=data, many=True)
     serializer.is_valid()
     return Response(serializer.data)
@@ -199,13 +364,17 @@ class ContributionsView(LocalhostAPIView):
             contributor = await sync_to_async(
                 lambda: Contributor.objects.from_handle(username)
             )()
-            queryset = Contribution.objects.filter(contributor=contributor)
+            queryset = Contribution.objects.filter(
+                contributor=contributor
+            ).select_related(*HUMANIZED_CONTRIBUTION_RELATED)
         else:
-            queryset = Contribution.objects.order_by("-id")[
-                : CONTRIBUTIONS_TAIL_SIZE * 2
-            ]
+            queryset = Contribution.objects.order_by("-id").select_related(
+                *HUMANIZED_CONTRIBUTION_RELATED
+            )[: CONTRIBUTIONS_TAIL_SIZE * 2]
 
-        return await contributions_response(queryset)
+        return await contributions_response(
+            queryset, key=f"contributions-{username or ''}"
+        )
 
 
 class ContributionsTailView(LocalhostAPIView):
@@ -219,8 +388,98 @@ class ContributionsTailView(LocalhostAPIView):
         :return: recent contributions data response
         :rtype: :class:`rest_framework.response.Response`
         """
-        queryset = Contribution.objects.order_by("-id")[:CONTRIBUTIONS_TAIL_SIZE]
-        return await contributions_response(queryset)
+        queryset = Contribution.objects.order_by("-id").select_related(
+            *HUMANIZED_CONTRIBUTION_RELATED
+        )[:CONTRIBUTIONS_TAIL_SIZE]
+        return await contributions_response(queryset, key="contributions-tail")
+
+
+class ContributorSummaryView(LocalhostAPIView):
+    """API view to retrieve contributor's totals and the most recent contributions.
+
+    :var handle: URL parameter specifying contributor's handle
+    :type handle: str
+    """
+
+    async def get(self, request, handle):
+        """Handle GET request for contributor's summary.
+
+        :param request: HTTP request object with optional 'size' query parameter
+        :type request: :class:`rest_framework.request.Request`
+        :param handle: contributor's handle from URL
+        :type handle: str
+        :var size: number of the most recent contributions to return
+        :type size: int
+        :var contributor: contributor's model instance
+        :type contributor: :class:`core.models.Contributor`
+        :var summary: contributor's summary data
+        :type summary: dict
+        :return: contributor's summary data response
+        :rtype: :class:`rest_framework.response.Response`
+        """
+        try:
+            size = int(request.GET.get("size", CONTRIBUTIONS_TAIL_SIZE))
+
+        except ValueError:
+            size = 0
+
+        if not 0 < size <= CONTRIBUTOR_SUMMARY_MAX_SIZE:
+            return Response(
+                {"error": "Invalid size"}, status=status.HTTP_400_BAD_REQUEST
+            )
+
+        try:
+            contributor = await sync_to_async(
+                lambda: Contributor.objects.from_handle(handle)
+            )()
+
+        except ValueError:
+            contributor = None
+
+        if not contributor:
+            return Response(
+                {"error": "Contributor not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+
+        summary = await sync_to_async(lambda: contributor.summary(size=size))()
+        return Response(ContributorSummarySerializer(summary).data)
+
+
+class ContributionsExportView(LocalhostAPIView):
+    """API view streaming the whole contributions ledger as NDJSON or CSV.
+
+    Handler is synchronous on purpose so that the streamed iterator is consumed
+    lazily by the WSGI server instead of being collected in memory.
+
+    :var export_format: URL parameter specifying output format
+    :type export_format: str
+    """
+
+    def get(self, request, export_format):
+        """Handle GET request for contributions ledger export.
+
+        :param request: HTTP request object
+        :type request: :class:`rest_framework.request.Request`
+        :param export_format: output format, either "ndjson" or "csv"
+        :type export_format: str
+        :var content_type: response's content type for provided format
+        :type content_type: str
+        :var response: streaming HTTP response instance
+        :type response: :class:`django.http.StreamingHttpResponse`
+        :return: streaming response with contributions ledger
+        :rtype: :class:`django.http.StreamingHttpResponse`
+        """
+        if export_format not in EXPORT_FORMATS:
+            raise Http404
+
+        content_type = "text/csv" if export_format == "csv" else "application/x-ndjson"
+        response = StreamingHttpResponse(
+            export_lines(export_format), content_type=content_type
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="contributions.{export_format}"'
+        )
+        return response
 
 
 class AddContributionView(LocalhostAPIView):
@@ -283,6 +542,15 @@ class AddContributionView(LocalhostAPIView):
                 with transaction.atomic():
                     serializer.save()
 
+                message = raw_data.get("message")
+                if message and raw_data.get("url"):
+                    cache_message(
+                        raw_data.get("url"),
+                        message.get("content"),
+                        message.get("author"),
+                        message.get("timestamp"),
+                    )
+
                 return serializer.data, None
 
             return None, serializer.errors
@@ -0,0 +1,33 @@
+"""Module with fixtures shared by all the packages' unit tests."""
+
+from contextlib import contextmanager
+
+import pytest
+
+from core.middleware import QueryStats
+
+
+@pytest.fixture
+def query_budget():
+    """Return context manager failing the test if block exceeds its SQL budget.
+
+    Usage: ``with query_budget(5, max_repeated=1): client.get(url)``
+    """
+
+    @contextmanager
+    def budget(max_queries, max_repeated=0):
+        with QueryStats() as stats:
+            yield stats
+
+        repeated = "\n".join(
+            f"{count}x {shape}" for shape, count in stats.duplicates.items()
+        )
+        assert (
+            stats.count <= max_queries
+        ), f"Query budget of {max_queries} exceeded: {stats.summary()}\n{repeated}"
+        assert stats.redundant <= max_repeated, (
+            f"Repeated queries budget of {max_repeated} exceeded: "
+            f"{stats.summary()}\n{repeated}"
+        )
+
+    return budget
@@ -20,6 +20,7 @@ from django.forms import (
     ValidationError,
 )
 from django.forms.models import ModelForm, inlineformset_factory
+from django.urls import reverse_lazy
 
 from core.models import (
     Contribution,
@@ -132,6 +133,8 @@ class ContributionCreateForm(ModelForm):
 
     :var ContributionCreateForm.contributor: contribution's contributor instance
     :type ContributionCreateForm.contributor: :class:`django.forms.ModelChoiceField`
+    :var ContributionCreateForm.contributor_search: contributor autocomplete input
+    :type ContributionCreateForm.contributor_search: :class:`django.forms.CharField`
     :var ContributionCreateForm.cycle: contribution's cycle instance
     :type ContributionCreateForm.cycle: :class:`django.forms.ModelChoiceField`
     :var ContributionCreateForm.platform: contribution's social platform instance
@@ -148,9 +151,25 @@ class ContributionCreateForm(ModelForm):
     :type ContributionCreateForm.issue_status: :class:`django.forms.ChoiceField`
     """
 
+    # selected by autocomplete, so queryset is used only for validation
     contributor = ModelChoiceField(
         queryset=Contributor.objects.all(),
-        widget=Select(attrs={"class": "select select-bordered w-full"}),
+        widget=HiddenInput(),
+        error_messages={"required": "Select a contributor from the suggestions."},
+    )
+    contributor_search = CharField(
+        label="Contributor",
+        required=False,
+        widget=TextInput(
+            attrs={
+                "class": TEXTINPUT_CLASS,
+                "placeholder": "Start typing contributor's name or handle",
+                "autocomplete": "off",
+                "data-autocomplete-url": reverse_lazy("contributor_autocomplete"),
+                "data-autocomplete-target": "id_contributor",
+                "data-autocomplete-list": "contributor-suggestions",
+            }
+        ),
     )
     cycle = ModelChoiceField(
         queryset=Cycle.objects.all(),
@@ -0,0 +1,68 @@
+"""Module containing website's rendered template fragments caching.
+
+Cached fragments are keyed by template name, request parameters and data
+version stamp, which is replaced on every write of the records fragments
+are rendered from, so stale fragments are simply never read again.
+"""
+
+import hashlib
+import json
+import uuid
+
+from django.core.cache import cache
+
+from utils.constants.core import DATA_VERSION_CACHE_KEY, FRAGMENT_CACHE_TIMEOUT
+
+
+def data_version():
+    """Return current data version stamp, creating it if it doesn't exist.
+
+    :return: str
+    """
+    return cache.get_or_set(DATA_VERSION_CACHE_KEY, lambda: uuid.uuid4().hex, None)
+
+
+def bump_data_version():
+    """Replace data version stamp, invalidating all the cached fragments."""
+    cache.set(DATA_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def fragment_cache_key(template_name, **parts):
+    """Return cache key for fragment of `template_name` rendered for `parts`.
+
+    :param template_name: name of the template or template partial
+    :type template_name: str
+    :param parts: request parameters the fragment depends on
+    :type parts: dict
+    :var digest: hash of template name, parameters and data version
+    :type digest: str
+    :return: str
+    """
+    digest = hashlib.sha1(
+        json.dumps([template_name, parts, data_version()], sort_keys=True).encode()
+    ).hexdigest()
+    return f"fragment:{digest}"
+
+
+def cached_fragment(template_name, render, **parts):
+    """Return cached fragment of `template_name` or render and cache it.
+
+    :param template_name: name of the template or template partial
+    :type template_name: str
+    :param render: callable returning the fragment
+    :type render: callable
+    :param parts: request parameters the fragment depends on
+    :type parts: dict
+    :var key: fragment's cache key
+    :type key: str
+    :var fragment: rendered fragment
+    :type fragment: object
+    :return: object
+    """
+    key = fragment_cache_key(template_name, **parts)
+    fragment = cache.get(key)
+    if fragment is None:
+        fragment = render()
+        cache.set(key, fragment, FRAGMENT_CACHE_TIMEOUT)
+
+    return fragment
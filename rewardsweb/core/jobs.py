@@ -0,0 +1,307 @@
+"""Module containing website's background jobs and their runner.
+
+Slow side effects of request handlers, like GitHub and Discord API calls and
+on-chain transactions, are queued as :class:`core.models.Job` records and
+performed by the workers started with the ``run_jobs`` management command.
+The number of workers bounds the number of concurrent outbound requests.
+
+:var logger: module's logger instance
+:type logger: :class:`logging.Logger`
+:var JOB_HANDLERS: job handler functions by job names
+:type JOB_HANDLERS: dict
+"""
+
+import logging
+
+from django.db import transaction
+
+from contract.network import process_allocations_for_contributions
+from core.models import (
+    Contribution,
+    GitHubIssueMirror,
+    Issue,
+    IssueStatus,
+    Job,
+)
+from utils.bot import (
+    add_reaction_to_message,
+    add_reactions_to_messages,
+    add_reply_to_message,
+)
+from utils.constants.core import DISCORD_EMOJIS
+from utils.issues import close_issue_with_labels
+
+logger = logging.getLogger(__name__)
+
+JOB_HANDLERS = {}
+
+
+class JobError(Exception):
+    """Job's operation failed and the job should be run again."""
+
+
+def job_handler(name):
+    """Return decorator registering decorated function as `name` job's handler.
+
+    Handler is called with the job instance and returns JSON serializable
+    result; a raised exception makes the job run again later.
+
+    :param name: job's name
+    :type name: str
+    :return: function
+    """
+
+    def decorator(function):
+        JOB_HANDLERS[name] = function
+        return function
+
+    return decorator
+
+
+def _log_action(job, action, details):
+    """Log `action` with `details` to the profile of the user who queued `job`.
+
+    :param job: job instance
+    :type job: :class:`core.models.Job`
+    :param action: action name
+    :type action: str
+    :param details: action details
+    :type details: str
+    """
+    if job.user is not None:
+        job.user.profile.log_action(action, details)
+
+
+# # RUNNER
+def run_job(job):
+    """Run claimed `job` by its handler and record the outcome.
+
+    :param job: claimed job instance
+    :type job: :class:`core.models.Job`
+    :var handler: job's handler function
+    :type handler: function
+    :var result: handler's result
+    :type result: dict
+    :return: :class:`core.models.Job`
+    """
+    handler = JOB_HANDLERS.get(job.name)
+    if handler is None:
+        job.fail(f"Unknown job: {job.name}")
+        return job
+
+    try:
+        result = handler(job)
+
+    except Exception as exc:
+        logger.error(f"Job {job} failed: {exc}")
+        job.retry_or_fail(str(exc))
+
+    else:
+        job.succeed(result)
+
+    return job
+
+
+def run_pending_jobs(max_jobs=None):
+    """Claim and run jobs until the queue is empty or `max_jobs` are run.
+
+    :param max_jobs: maximum number of jobs to run
+    :type max_jobs: int or None
+    :var count: number of jobs run
+    :type count: int
+    :var job: claimed job instance
+    :type job: :class:`core.models.Job`
+    :return: int
+    """
+    count = 0
+    while max_jobs is None or count < max_jobs:
+        job = Job.objects.claim()
+        if job is None:
+            break
+
+        run_job(job)
+        count += 1
+
+    return count
+
+
+# # HANDLERS
+@job_handler("close_issue")
+def close_issue(job):
+    """Close GitHub issue, set its status and queue the follow-up jobs.
+
+    GitHub's result is stored in the job's payload as soon as the issue is
+    closed, so a retried job doesn't close it and comment on it again. The
+    database updates and the follow-up jobs are committed together, so a
+    retry never queues the on-chain allocations twice.
+
+    :param job: job instance with issue ID, close action, labels and comment
+    :type job: :class:`core.models.Job`
+    :var issue: issue instance
+    :type issue: :class:`core.models.Issue`
+    :var action: close action, either "addressed" or "wontfix"
+    :type action: str
+    :var result: GitHub operation result
+    :type result: dict
+    :var message: success message
+    :type message: str
+    :var urls: URLs of issue's contributions
+    :type urls: list
+    :raises JobError: if issue can't be closed on GitHub
+    :return: dict
+    """
+    issue = Issue.objects.get(pk=job.payload["issue_id"])
+    action = job.payload["action"]
+    message = f"Issue #{issue.number} closed as {action} successfully."
+    result = job.payload.get("github_result")
+    if result is None:
+        result = close_issue_with_labels(
+            user=job.user,
+            issue_number=issue.number,
+            labels_to_set=job.payload["labels_to_set"],
+            comment=job.payload.get("comment", ""),
+        )
+        if not result["success"]:
+            raise JobError(result.get("error", "Failed to close issue on GitHub"))
+
+        job.payload["github_result"] = result
+        job.save(update_fields=["payload", "updated_at"])
+        _log_action(job, "issue_closed", message)
+
+    with transaction.atomic():
+        GitHubIssueMirror.objects.filter(number=issue.number).update(
+            state=result.get("issue_state", "closed"),
+            labels=result.get("current_labels", job.payload["labels_to_set"]),
+        )
+        issue.status = (
+            IssueStatus.ADDRESSED if action == "addressed" else IssueStatus.WONTFIX
+        )
+        issue.save()
+        _log_action(job, "issue_status_set", str(issue))
+
+        urls = list(
+            issue.contribution_set.exclude(url__isnull=True).values_list(
+                "url", flat=True
+            )
+        )
+        if urls:
+            Job.objects.enqueue(
+                "add_reactions",
+                user=job.user,
+                urls=urls,
+                emoji=DISCORD_EMOJIS.get(action),
+            )
+
+        if action == "addressed":
+            # on-chain transactions must not be repeated
+            Job.objects.enqueue(
+                "process_issue_allocations",
+                user=job.user,
+                max_attempts=1,
+                issue_id=issue.id,
+            )
+
+    return {"message": message}
+
+
+@job_handler("add_reactions")
+def add_reactions(job):
+    """Add reaction to every Discord message from the job's URLs concurrently.
+
+    Messages the reaction can't be added to, like the ones from other
+    platforms, are reported in the result.
+
+    :param job: job instance with messages' URLs and reaction emoji
+    :type job: :class:`core.models.Job`
+    :var results: reaction's success by message URL
+    :type results: dict
+    :var failed: URLs of the messages without added reaction
+    :type failed: list
+    :return: dict
+    """
+    results = add_reactions_to_messages(job.payload["urls"], job.payload["emoji"])
+    failed = [url for url, added in results.items() if not added]
+    return {
+        "message": f"Reactions added to {len(results) - len(failed)} messages.",
+        "failed": failed,
+    }
+
+
+@job_handler("process_issue_allocations")
+def process_issue_allocations(job):
+    """Allocate rewards for issue's contributions and set issue as claimable.
+
+    :param job: job instance with issue ID
+    :type job: :class:`core.models.Job`
+    :var issue: issue instance
+    :type issue: :class:`core.models.Issue`
+    :var txids: IDs of successful allocation transactions
+    :type txids: list
+    :return: dict
+    """
+    issue = Issue.objects.get(pk=job.payload["issue_id"])
+    txids = [
+        str(result)
+        for result, _ in process_allocations_for_contributions(
+            issue.contribution_set.all(),
+            Contribution.objects.addresses_and_amounts_from_contributions,
+        )
+        if result
+    ]
+    if not txids:
+        return {"message": f"No allocations made for issue #{issue.number}."}
+
+    issue.status = IssueStatus.CLAIMABLE
+    issue.save()
+    _log_action(job, "issue_status_set", str(issue))
+    return {"message": f"Issue #{issue.number} is claimable.", "txids": txids}
+
+
+@job_handler("invalidate_contribution")
+def invalidate_contribution(job):
+    """Reply and react to contribution's Discord message and confirm contribution.
+
+    Sent reply is recorded in the job's payload, so it isn't sent again when
+    the job is run again after the failed reaction.
+
+    :param job: job instance with contribution ID, reaction and comment
+    :type job: :class:`core.models.Job`
+    :var contribution: contribution instance
+    :type contribution: :class:`core.models.Contribution`
+    :var reaction: invalidation type, like "duplicate" or "wontfix"
+    :type reaction: str
+    :var comment: reply text
+    :type comment: str
+    :var actions: performed actions' descriptions
+    :type actions: list
+    :raises JobError: if reply or reaction can't be added
+    :return: dict
+    """
+    contribution = Contribution.objects.get(pk=job.payload["contribution_id"])
+    reaction = job.payload["reaction"]
+    comment = job.payload.get("comment")
+    if comment and not job.payload.get("replied"):
+        if not add_reply_to_message(contribution.url, comment):
+            raise JobError(
+                f"Failed to add reply. Contribution was not confirmed as {reaction}."
+            )
+
+        job.payload["replied"] = True
+        job.save(update_fields=["payload"])
+
+    if not add_reaction_to_message(contribution.url, DISCORD_EMOJIS.get(reaction)):
+        raise JobError(
+            f"Failed to add reaction. Contribution was not confirmed as {reaction}."
+        )
+
+    contribution.comment = comment
+    contribution.confirmed = True
+    contribution.save()
+    _log_action(job, "contribution_invalidated", contribution.info())
+
+    actions = [f"Confirmed as {reaction}"]
+    if comment:
+        actions.append("reply sent")
+
+    actions.append("reaction added")
+    return {"message": f"Contribution {' and '.join(actions)} successfully!"}
@@ -6,6 +6,7 @@ from pathlib import Path
 from django.conf import settings
 from django.core.management.base import BaseCommand
 
+from utils.constants.core import GITHUB_MAPPING_WORKERS
 from utils.helpers import convert_and_clean_excel
 from utils.importers import import_from_csv
 from utils.mappers import map_github_issues
@@ -20,6 +21,23 @@ class Command(BaseCommand):
         parser.add_argument("input", type=str, nargs="?", default="")
         parser.add_argument("output", type=str, nargs="?", default="")
         parser.add_argument("legacy", type=str, nargs="?", default="")
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Map all the GitHub issues instead of only the changed ones.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=GITHUB_MAPPING_WORKERS,
+            help="Number of processes classifying GitHub issues.",
+        )
+        parser.add_argument(
+            "--report",
+            type=str,
+            default="",
+            help="Path to the JSON file the issues mapping report is written to.",
+        )
 
     def handle(self, *args, **options):
         """Call `convert_and_clean_excel` script to export Excel file to CSV."""
@@ -52,12 +70,16 @@ class Command(BaseCommand):
         response = import_from_csv(output_file, legacy_file)
         if not response:
             self.stdout.write("Records successfully imported!")
-            response = map_github_issues(github_token=github_token)
-            if not response:
-                self.stdout.write("Issues successfully mapped!")
-
-            else:
-                self.stdout.write(response)
+            report = map_github_issues(
+                github_token=github_token,
+                full=options.get("full"),
+                workers=options.get("workers"),
+                report_path=options.get("report") or None,
+            )
+            self.stdout.write(
+                "Issues successfully mapped in %.1fs with %d queries!"
+                % (report["seconds"], report["queries"])
+            )
 
         else:
             self.stdout.write(response)
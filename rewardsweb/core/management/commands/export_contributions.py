@@ -0,0 +1,38 @@
+"""Django management command for exporting the whole contributions ledger."""
+
+from django.core.management.base import BaseCommand
+
+from utils.constants.core import EXPORT_CHUNK_SIZE
+from utils.exporters import EXPORT_FORMATS, export_lines
+
+
+class Command(BaseCommand):
+    help = "Stream all contributions to standard output or file as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        """Add optional format, output file and chunk size arguments to command."""
+        parser.add_argument(
+            "--format", type=str, choices=EXPORT_FORMATS, default="ndjson"
+        )
+        parser.add_argument("--output", type=str, default="")
+        parser.add_argument("--chunk-size", type=int, default=EXPORT_CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        """Write contributions ledger lines to provided output file or stdout.
+
+        :var output: output file path
+        :type output: str
+        :var lines: contributions ledger lines iterator
+        :type lines: iterator
+        """
+        output = options.get("output")
+        lines = export_lines(options.get("format"), chunk_size=options["chunk_size"])
+        if output:
+            with open(output, "w", newline="") as output_file:
+                output_file.writelines(lines)
+
+            self.stdout.write("Contributions exported into %s file!" % (output,))
+
+        else:
+            for line in lines:
+                self.stdout.write(line, ending="")
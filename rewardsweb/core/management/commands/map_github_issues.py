@@ -0,0 +1,48 @@
+"""Django management command for mapping GitHub issues to existing database records."""
+
+from django.core.management.base import BaseCommand
+
+from utils.constants.core import GITHUB_MAPPING_WORKERS
+from utils.mappers import map_github_issues
+
+
+class Command(BaseCommand):
+    help = "Map GitHub issues changed since the last mapping to database records."
+
+    def add_arguments(self, parser):
+        """Add optional GitHub token argument and mapping options to command."""
+        parser.add_argument("token", type=str, nargs="?", default="")
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Map all the GitHub issues instead of only the changed ones.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=GITHUB_MAPPING_WORKERS,
+            help="Number of processes classifying GitHub issues.",
+        )
+        parser.add_argument(
+            "--report",
+            type=str,
+            default="",
+            help="Path to the JSON file the issues mapping report is written to.",
+        )
+
+    def handle(self, *args, **options):
+        """Map GitHub issues and write mapping's duration and number of queries.
+
+        :var report: mapping run's report
+        :type report: dict
+        """
+        report = map_github_issues(
+            github_token=options.get("token"),
+            full=options.get("full"),
+            workers=options.get("workers"),
+            report_path=options.get("report") or None,
+        )
+        self.stdout.write(
+            "Issues successfully mapped in %.1fs with %d queries!"
+            % (report["seconds"], report["queries"])
+        )
@@ -0,0 +1,23 @@
+"""Django management command for reconciling site-wide statistics snapshot."""
+
+from django.core.management.base import BaseCommand
+
+from core.models import StatisticsSnapshot
+
+
+class Command(BaseCommand):
+    help = "Recalculate statistics snapshot from the database and report drift."
+
+    def handle(self, *args, **options):
+        """Reconcile statistics snapshot and write differences if there are any.
+
+        :var differences: fields' names and related previous and current values
+        :type differences: dict
+        """
+        _, differences = StatisticsSnapshot.objects.reconcile()
+        if not differences:
+            self.stdout.write("Statistics snapshot is up to date!")
+            return
+
+        for field, (previous, current) in differences.items():
+            self.stdout.write("%s: %s -> %s" % (field, previous, current))
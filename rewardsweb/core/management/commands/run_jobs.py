@@ -0,0 +1,41 @@
+"""Django management command for running queued background jobs."""
+
+import time
+
+from django.core.management.base import BaseCommand
+
+from core.jobs import run_pending_jobs
+from utils.constants.core import JOB_WORKER_SLEEP
+
+
+class Command(BaseCommand):
+    help = "Run queued background jobs, waiting for new ones unless --once is set."
+
+    def add_arguments(self, parser):
+        """Add options for single pass and idle sleep to command."""
+        parser.add_argument(
+            "--once",
+            action="store_true",
+            help="Exit after the queue is empty instead of waiting for new jobs.",
+        )
+        parser.add_argument(
+            "--sleep",
+            type=float,
+            default=JOB_WORKER_SLEEP,
+            help="Number of seconds to wait for new jobs when the queue is empty.",
+        )
+
+    def handle(self, *args, **options):
+        """Run jobs until the queue is empty and then wait for new ones.
+
+        :var count: number of jobs run in the last pass
+        :type count: int
+        """
+        while True:
+            count = run_pending_jobs()
+            if options["once"]:
+                self.stdout.write("%d jobs run!" % (count))
+                return
+
+            if not count:
+                time.sleep(options["sleep"])
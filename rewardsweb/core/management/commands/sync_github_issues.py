@@ -0,0 +1,26 @@
+"""Django management command for syncing local mirror of GitHub issues."""
+
+from django.core.management.base import BaseCommand
+
+from utils.issues import sync_issues_mirror
+
+
+class Command(BaseCommand):
+    help = "Update local GitHub issues mirror with recently updated issues."
+
+    def add_arguments(self, parser):
+        """Add optional GitHub token argument to command."""
+        parser.add_argument("token", type=str, nargs="?", default="")
+
+    def handle(self, *args, **options):
+        """Sync issues mirror and write the number of updated issues or error.
+
+        :var result: mirror syncing result
+        :type result: dict
+        """
+        result = sync_issues_mirror(github_token=options.get("token"))
+        if not result["success"]:
+            self.stdout.write("Issues mirror sync failed: %s" % (result["error"]))
+            return
+
+        self.stdout.write("%d issues mirrored!" % (result["updated"]))
@@ -0,0 +1,177 @@
+"""Module containing website's SQL queries instrumentation middleware.
+
+:var logger: module's logger instance
+:type logger: :class:`logging.Logger`
+:var IN_LIST_RE: regex matching SQL `IN` lists of placeholders
+:type IN_LIST_RE: :class:`re.Pattern`
+:var LITERAL_RE: regex matching SQL string and number literals
+:type LITERAL_RE: :class:`re.Pattern`
+"""
+
+import logging
+import re
+import time
+from collections import Counter
+
+from django.db import connection
+
+from utils.constants.core import SQL_DUPLICATES_WARNING_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+IN_LIST_RE = re.compile(r"\bIN \((?:%s, )*%s\)")
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+def query_shape(sql):
+    """Return provided `sql` with literals and `IN` lists replaced by placeholders.
+
+    Queries of the same shape differ only in their parameters, so the same
+    shape repeated within a request is a sign of an N+1 query pattern.
+
+    :param sql: SQL statement
+    :type sql: str
+    :return: str
+    """
+    return IN_LIST_RE.sub("IN (...)", LITERAL_RE.sub("%s", sql))
+
+
+class QueryStats:
+    """Record number, total time and shapes of SQL queries run in a block.
+
+    Used as a context manager installing itself as database execute wrapper.
+
+    :ivar count: number of run queries
+    :type count: int
+    :ivar duration: total queries' time in seconds
+    :type duration: float
+    :ivar shapes: number of run queries by their shapes
+    :type shapes: :class:`collections.Counter`
+    """
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.duration = 0.0
+        self.shapes = Counter()
+        self._wrapper = None
+
+    def __enter__(self):
+        """Start recording queries run by default database connection.
+
+        :return: :class:`QueryStats`
+        """
+        self._wrapper = connection.execute_wrapper(self)
+        self._wrapper.__enter__()
+        return self
+
+    def __exit__(self, *args):
+        """Stop recording queries."""
+        self._wrapper.__exit__(*args)
+        self._wrapper = None
+
+    def __call__(self, execute, sql, params, many, context):
+        """Run and record query as database execute wrapper.
+
+        :param execute: wrapped execute function
+        :type execute: callable
+        :param sql: SQL statement
+        :type sql: str
+        :param params: SQL statement parameters
+        :type params: list
+        :param many: True if `executemany` is called
+        :type many: bool
+        :param context: execution context
+        :type context: dict
+        :var start: query's start time
+        :type start: float
+        :return: object
+        """
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+
+        finally:
+            self.duration += time.perf_counter() - start
+            self.count += 1
+            self.shapes[query_shape(sql)] += 1
+
+    @property
+    def duplicates(self):
+        """Return number of runs of every query shape run more than once.
+
+        :return: dict
+        """
+        return {shape: count for shape, count in self.shapes.items() if count > 1}
+
+    @property
+    def redundant(self):
+        """Return number of queries repeating an already run query shape.
+
+        :return: int
+        """
+        return sum(count - 1 for count in self.shapes.values())
+
+    def summary(self):
+        """Return short human readable statistics summary.
+
+        :return: str
+        """
+        return (
+            f"{self.count} queries in {self.duration * 1000:.1f}ms, "
+            f"{self.redundant} repeated"
+        )
+
+
+class QueryCountMiddleware:
+    """Record SQL queries run by every request.
+
+    Superusers get the statistics in the `X-SQL-*` response headers and in
+    the `Server-Timing` header shown by browsers' developer tools. Requests
+    repeating a query shape `SQL_DUPLICATES_WARNING_THRESHOLD` times or more
+    are logged. Middleware is enabled only by the development settings.
+
+    Queries run while a :class:`django.http.StreamingHttpResponse` body is
+    iterated, like the contributions export's, run after the middleware has
+    returned and aren't counted.
+    """
+
+    def __init__(self, get_response):
+        """Initialize middleware with next handler in the chain.
+
+        :param get_response: next middleware or view
+        :type get_response: callable
+        """
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Return response of provided `request` with SQL statistics.
+
+        :param request: HTTP request object
+        :type request: :class:`django.http.HttpRequest`
+        :var stats: request's SQL statistics
+        :type stats: :class:`QueryStats`
+        :var response: HTTP response object
+        :type response: :class:`django.http.HttpResponse`
+        :return: :class:`django.http.HttpResponse`
+        """
+        with QueryStats() as stats:
+            response = self.get_response(request)
+
+        request.query_stats = stats
+        if any(
+            count >= SQL_DUPLICATES_WARNING_THRESHOLD
+            for count in stats.duplicates.values()
+        ):
+            logger.warning(f"{request.path}: {stats.summary()}")
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_superuser:
+            response.headers["X-SQL-Queries"] = str(stats.count)
+            response.headers["X-SQL-Time"] = f"{stats.duration * 1000:.1f}"
+            response.headers["X-SQL-Duplicates"] = str(stats.redundant)
+            response.headers["Server-Timing"] = (
+                f'sql;dur={stats.duration * 1000:.1f};desc="{stats.count} queries"'
+            )
+
+        return response
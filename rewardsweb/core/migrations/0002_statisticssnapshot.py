@@ -0,0 +1,32 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="StatisticsSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("num_cycles", models.IntegerField(default=0)),
+                ("num_contributors", models.IntegerField(default=0)),
+                ("num_contributions", models.IntegerField(default=0)),
+                ("total_rewards", models.BigIntegerField(default=0)),
+                ("reconciled_at", models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
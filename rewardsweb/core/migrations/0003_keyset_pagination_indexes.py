@@ -0,0 +1,36 @@
+# Generated by Django 5.2.18 on 2026-10-18 22:51
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_statisticssnapshot"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="contribution",
+            index=models.Index(
+                condition=models.Q(("confirmed", False)),
+                fields=["-id"],
+                name="contribution_unconfirmed_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="contributor",
+            index=models.Index(
+                django.db.models.functions.text.Lower("name"),
+                models.F("id"),
+                name="contributor_lname_id_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="issue",
+            index=models.Index(
+                fields=["status", "-number"], name="issue_status_number_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:14
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0003_keyset_pagination_indexes"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name="contributor",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("name"), name="gin_trgm_ops"
+                ),
+                name="contributor_name_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="handle",
+            index=django.contrib.postgres.indexes.GinIndex(
+                django.contrib.postgres.indexes.OpClass(
+                    django.db.models.functions.text.Upper("handle"), name="gin_trgm_ops"
+                ),
+                name="handle_handle_trgm_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="handle",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["handle"],
+                name="handle_handle_similar_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.18 on 2026-10-18 23:24
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_contributor_trigram_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GitHubIssueMirror",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("number", models.IntegerField(unique=True)),
+                ("title", models.CharField(max_length=256)),
+                ("body", models.TextField(blank=True, default="")),
+                ("state", models.CharField(max_length=10)),
+                ("labels", models.JSONField(default=list)),
+                ("assignees", models.JSONField(default=list)),
+                ("user", models.CharField(blank=True, max_length=50, null=True)),
+                ("html_url", models.URLField(max_length=255)),
+                ("comments", models.IntegerField(default=0)),
+                ("created_at", models.DateTimeField()),
+                ("updated_at", models.DateTimeField()),
+                ("closed_at", models.DateTimeField(blank=True, null=True)),
+                ("synced_at", models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                "ordering": ["-number"],
+            },
+        ),
+    ]
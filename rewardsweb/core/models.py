@@ -1,17 +1,46 @@
 """Module containing website's ORM models."""
 
+from datetime import timedelta
+
 from algosdk.encoding import is_valid_address
 from django.contrib.auth.models import User
-from django.db import models
-from django.db.models import BooleanField, Case, F, Min, Sum, Value, When
-from django.db.models.functions import Lower
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import models, transaction
+from django.db.models import (
+    BooleanField,
+    Case,
+    Count,
+    F,
+    FloatField,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Value,
+    When,
+)
+from django.db.models.functions import Coalesce, Greatest, Lower, Upper
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from django.utils.functional import cached_property
 
-from utils.constants.core import ADDRESS_LEN, HANDLE_EXCEPTIONS
-from utils.helpers import parse_full_handle
+from utils.constants.core import (
+    ADDRESS_LEN,
+    CONTRIBUTIONS_TAIL_SIZE,
+    GITHUB_MIRROR_MAX_AGE,
+    HANDLE_EXCEPTIONS,
+    HUMANIZED_CONTRIBUTION_RELATED,
+    JOB_MAX_ATTEMPTS,
+    JOB_RETRY_DELAY,
+    JOB_VISIBILITY_TIMEOUT,
+    STATISTICS_SNAPSHOT_ID,
+)
+from utils.helpers import humanize_contributions, parse_full_handle
 
 
 class ContributorManager(models.Manager):
@@ -78,6 +107,42 @@ class ContributorManager(models.Manager):
             f"Can't locate a single contributor for {handle} {str(handles)}"
         )
 
+    def search(self, query):
+        """Return contributors matching `query` by name or handle, best first.
+
+        Case-insensitive substring filters are served by GIN trigram indexes,
+        so only the matched contributors are ranked by the trigram similarity
+        of their name or their most similar handle.
+
+        :param query: search term
+        :type query: str
+        :var handles: contributors' ids of the matched handles
+        :type handles: :class:`django.db.models.query.QuerySet`
+        :var handle_similarity: similarity of contributor's most similar handle
+        :type handle_similarity: :class:`django.db.models.Subquery`
+        :return: :class:`django.db.models.query.QuerySet`
+        """
+        handles = Handle.objects.filter(handle__icontains=query).values(
+            "contributor_id"
+        )
+        handle_similarity = Subquery(
+            Handle.objects.filter(contributor=OuterRef("pk"))
+            .annotate(similarity=TrigramSimilarity("handle", query))
+            .order_by("-similarity")
+            .values("similarity")[:1],
+            output_field=FloatField(),
+        )
+        return (
+            self.filter(Q(name__icontains=query) | Q(pk__in=handles))
+            .annotate(
+                similarity=Greatest(
+                    TrigramSimilarity("name", query),
+                    Coalesce(handle_similarity, Value(0.0)),
+                )
+            )
+            .order_by("-similarity", Lower("name"))
+        )
+
 
 class Contributor(models.Model):
     """ASA Stats contributor's data model."""
@@ -103,6 +168,13 @@ class Contributor(models.Model):
                 name="unique_contributor_address",
             ),
         ]
+        indexes = [
+            models.Index(Lower("name"), "id", name="contributor_lname_id_idx"),
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="contributor_name_trgm_idx",
+            ),
+        ]
         ordering = [Lower("name")]
 
     def __str__(self):
@@ -308,6 +380,36 @@ class Contributor(models.Model):
         """
         return self.optimized_contribution_data["total_rewards"]
 
+    def summary(self, size=CONTRIBUTIONS_TAIL_SIZE):
+        """Return contributor's first cycle end, totals and last `size` contributions.
+
+        Totals are calculated by a single aggregate query and only the most
+        recent contributions are fetched from the database.
+
+        :param size: number of the most recent contributions to return
+        :type size: int
+        :var totals: first cycle end, contributions count and rewards sum
+        :type totals: dict
+        :var last_contributions: the most recent contributions
+        :type last_contributions: :class:`django.db.models.query.QuerySet`
+        :return: dict
+        """
+        totals = self.contribution_set.aggregate(
+            first_cycle_end=Min("cycle__end"),
+            total_contributions=Count("id"),
+            total_rewards=Sum("reward__amount"),
+        )
+        last_contributions = self.contribution_set.select_related(
+            *HUMANIZED_CONTRIBUTION_RELATED
+        ).order_by("-id")[:size]
+        return {
+            "name": self.name,
+            "first_cycle_end": totals["first_cycle_end"],
+            "total_contributions": totals["total_contributions"],
+            "total_rewards": totals["total_rewards"] or 0,
+            "last_contributions": humanize_contributions(last_contributions),
+        }
+
 
 class Profile(models.Model):
     """App's connection to main Django user model and optionally to Contributor."""
@@ -472,6 +574,18 @@ class Handle(models.Model):
                 fields=["platform", "handle"], name="unique_social_handle"
             )
         ]
+        indexes = [
+            # serves case-insensitive substring and trigram similarity lookups
+            GinIndex(
+                OpClass(Upper("handle"), name="gin_trgm_ops"),
+                name="handle_handle_trgm_idx",
+            ),
+            GinIndex(
+                fields=["handle"],
+                name="handle_handle_similar_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
         ordering = [Lower("handle")]
 
     def __str__(self):
@@ -682,6 +796,9 @@ class Issue(models.Model):
         """Define ordering and fields that make unique indexes."""
 
         constraints = [models.UniqueConstraint("number", name="unique_issue_number")]
+        indexes = [
+            models.Index(fields=["status", "-number"], name="issue_status_number_idx")
+        ]
         ordering = ["-number"]
 
     def __str__(self):
@@ -825,8 +942,15 @@ class Contribution(models.Model):
     objects = ContributionManager()
 
     class Meta:
-        """Define model's ordering."""
+        """Define model's ordering and indexes."""
 
+        indexes = [
+            models.Index(
+                fields=["-id"],
+                condition=models.Q(confirmed=False),
+                name="contribution_unconfirmed_idx",
+            )
+        ]
         ordering = ["cycle", "created_at"]
 
     def __str__(self):
@@ -865,3 +989,405 @@ class Contribution(models.Model):
             main_text += " // " + self.comment
 
         return main_text
+
+
+class StatisticsSnapshotManager(models.Manager):
+    """Custom manager for the `StatisticsSnapshot` model."""
+
+    def adjust(self, **deltas):
+        """Atomically add provided `deltas` to the snapshot's counters.
+
+        Nothing is changed if snapshot doesn't exist yet, as it is going to be
+        created from scratch by the first read.
+
+        :param deltas: collection of counters' names and related deltas
+        :type deltas: dict
+        """
+        self.filter(pk=STATISTICS_SNAPSHOT_ID).update(
+            **{field: F(field) + delta for field, delta in deltas.items()}
+        )
+
+    def compute(self):
+        """Return statistics values calculated from the database tables.
+
+        :return: dict
+        """
+        return {
+            "num_cycles": Cycle.objects.count(),
+            "num_contributors": Contributor.objects.count(),
+            "num_contributions": Contribution.objects.count(),
+            "total_rewards": Contribution.objects.aggregate(
+                total_rewards=Sum("reward__amount")
+            ).get("total_rewards")
+            or 0,
+        }
+
+    def current(self):
+        """Return statistics snapshot, creating it if it doesn't exist yet.
+
+        :return: :class:`StatisticsSnapshot`
+        """
+        snapshot = self.filter(pk=STATISTICS_SNAPSHOT_ID).first()
+        return snapshot or self.reconcile()[0]
+
+    def reconcile(self):
+        """Recalculate snapshot from the database tables and return differences.
+
+        :var values: statistics values calculated from the database tables
+        :type values: dict
+        :var previous: snapshot's values before reconciliation
+        :type previous: dict
+        :var snapshot: reconciled statistics snapshot
+        :type snapshot: :class:`StatisticsSnapshot`
+        :return: two-tuple
+        """
+        values = self.compute()
+        previous = self.filter(pk=STATISTICS_SNAPSHOT_ID).values(*values).first()
+        snapshot, _ = self.update_or_create(pk=STATISTICS_SNAPSHOT_ID, defaults=values)
+        return snapshot, {
+            field: ((previous or {}).get(field), value)
+            for field, value in values.items()
+            if previous is None or previous[field] != value
+        }
+
+
+class StatisticsSnapshot(models.Model):
+    """Site-wide statistics maintained incrementally from models' signals."""
+
+    num_cycles = models.IntegerField(default=0)
+    num_contributors = models.IntegerField(default=0)
+    num_contributions = models.IntegerField(default=0)
+    total_rewards = models.BigIntegerField(default=0)
+    reconciled_at = models.DateTimeField(auto_now=True)
+
+    objects = StatisticsSnapshotManager()
+
+    def __str__(self):
+        """Return statistics snapshot's instance string representation.
+
+        :return: str
+        """
+        return (
+            f"{self.num_cycles} cycles, {self.num_contributors} contributors, "
+            f"{self.num_contributions} contributions, {self.total_rewards} rewards"
+        )
+
+
+class GitHubIssueMirrorManager(models.Manager):
+    """Custom manager for the `GitHubIssueMirror` model."""
+
+    def update_from_github(self, issues):
+        """Create or update mirrored issues from GitHub REST API `issues` data.
+
+        Pull requests, that GitHub returns among the issues, are skipped, as are
+        the issues updated before their already mirrored versions, so a delayed
+        webhook delivery or sync page doesn't overwrite newer data.
+
+        :param issues: collection of GitHub REST API issue objects
+        :type issues: list
+        :var now: time of the update
+        :type now: :class:`datetime.datetime`
+        :var latest: the most recently updated issue objects by their numbers
+        :type latest: dict
+        :var stored: mirrored issues' update times by their numbers
+        :type stored: dict
+        :var mirrors: mirrored issues instances to insert or update
+        :type mirrors: list
+        :return: int
+        """
+        now = timezone.now()
+        latest = {}
+        for issue in issues:
+            if "pull_request" in issue:
+                continue
+
+            updated_at = parse_datetime(issue["updated_at"])
+            if (
+                issue["number"] not in latest
+                or latest[issue["number"]][1] <= updated_at
+            ):
+                latest[issue["number"]] = (issue, updated_at)
+
+        stored = dict(
+            self.filter(number__in=latest).values_list("number", "updated_at")
+        )
+        mirrors = [
+            self.model(
+                number=issue["number"],
+                title=issue["title"],
+                body=issue.get("body") or "",
+                state=issue["state"],
+                labels=[label["name"] for label in issue.get("labels", [])],
+                assignees=[
+                    assignee["login"] for assignee in issue.get("assignees", [])
+                ],
+                user=(issue.get("user") or {}).get("login"),
+                html_url=issue["html_url"],
+                comments=issue.get("comments", 0),
+                created_at=parse_datetime(issue["created_at"]),
+                updated_at=updated_at,
+                closed_at=(
+                    parse_datetime(issue["closed_at"])
+                    if issue.get("closed_at")
+                    else None
+                ),
+                synced_at=now,
+            )
+            for number, (issue, updated_at) in latest.items()
+            if number not in stored or stored[number] <= updated_at
+        ]
+        self.bulk_create(
+            mirrors,
+            update_conflicts=True,
+            unique_fields=["number"],
+            update_fields=[
+                field.name
+                for field in self.model._meta.concrete_fields
+                if not field.primary_key and field.name != "number"
+            ],
+        )
+        return len(mirrors)
+
+
+class GitHubIssueMirror(models.Model):
+    """Local copy of GitHub issue, kept up to date by webhook and sync command.
+
+    Timestamps other than `synced_at` are GitHub's timestamps of the issue.
+    """
+
+    number = models.IntegerField(unique=True)
+    title = models.CharField(max_length=256)
+    body = models.TextField(blank=True, default="")
+    state = models.CharField(max_length=10)
+    labels = models.JSONField(default=list)
+    assignees = models.JSONField(default=list)
+    user = models.CharField(max_length=50, blank=True, null=True)
+    html_url = models.URLField(max_length=255)
+    comments = models.IntegerField(default=0)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    closed_at = models.DateTimeField(null=True, blank=True)
+    synced_at = models.DateTimeField(default=timezone.now)
+
+    objects = GitHubIssueMirrorManager()
+
+    class Meta:
+        """Define model's ordering."""
+
+        ordering = ["-number"]
+
+    def __str__(self):
+        """Return mirrored issue's instance string representation.
+
+        :return: str
+        """
+        return f"#{self.number} {self.title}"
+
+    def is_fresh(self, max_age=GITHUB_MIRROR_MAX_AGE):
+        """Return True if issue has been synced in the last `max_age` seconds.
+
+        :param max_age: number of seconds mirrored issue is considered fresh
+        :type max_age: int
+        :return: Boolean
+        """
+        return timezone.now() - self.synced_at < timedelta(seconds=max_age)
+
+    def as_issue_data(self):
+        """Return mirrored issue in the format returned by GitHub issue fetching.
+
+        :return: dict
+        """
+        return {
+            "number": self.number,
+            "title": self.title,
+            "body": self.body,
+            "state": self.state,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+            "closed_at": self.closed_at,
+            "labels": self.labels,
+            "assignees": self.assignees,
+            "user": self.user,
+            "html_url": self.html_url,
+            "comments": self.comments,
+        }
+
+
+class JobManager(models.Manager):
+    """Custom manager for the `Job` model."""
+
+    def enqueue(self, name, user=None, max_attempts=JOB_MAX_ATTEMPTS, **payload):
+        """Create and return queued job of provided `name` and `payload`.
+
+        :param name: name of the job handler
+        :type name: str
+        :param user: user on whose behalf the job is performed
+        :type user: :class:`django.contrib.auth.models.User`
+        :param max_attempts: maximum number of job's runs
+        :type max_attempts: int
+        :param payload: JSON serializable job handler's arguments
+        :type payload: dict
+        :return: :class:`Job`
+        """
+        return self.create(
+            name=name, user=user, max_attempts=max_attempts, payload=payload
+        )
+
+    def claim(self, visibility_timeout=JOB_VISIBILITY_TIMEOUT):
+        """Lock and return the next job to run, or None if there's no such job.
+
+        Running jobs whose lock expired, because their worker died, are claimed
+        again if they have attempts left and failed otherwise. Locked rows are
+        skipped so concurrent workers never claim the same job.
+
+        :param visibility_timeout: seconds the job is hidden from other workers
+        :type visibility_timeout: int
+        :var now: time of the claim
+        :type now: :class:`datetime.datetime`
+        :var job: claimed job instance
+        :type job: :class:`Job`
+        :return: :class:`Job` or None
+        """
+        now = timezone.now()
+        self.filter(
+            status=JobStatus.RUNNING,
+            locked_until__lt=now,
+            attempts__gte=F("max_attempts"),
+        ).update(
+            status=JobStatus.FAILED,
+            error="Visibility timeout expired.",
+            locked_until=None,
+            finished_at=now,
+        )
+        with transaction.atomic():
+            job = (
+                self.select_for_update(skip_locked=True)
+                .filter(
+                    Q(status=JobStatus.QUEUED, run_at__lte=now)
+                    | Q(status=JobStatus.RUNNING, locked_until__lt=now)
+                )
+                .order_by("run_at", "id")
+                .first()
+            )
+            if job is None:
+                return None
+
+            job.status = JobStatus.RUNNING
+            job.attempts += 1
+            job.locked_until = now + timedelta(seconds=visibility_timeout)
+            job.save(update_fields=["status", "attempts", "locked_until", "updated_at"])
+
+        return job
+
+
+class JobStatus(models.TextChoices):
+    """Background job status choices."""
+
+    QUEUED = "queued", "Queued"
+    RUNNING = "running", "Running"
+    SUCCEEDED = "succeeded", "Succeeded"
+    FAILED = "failed", "Failed"
+
+
+class Job(models.Model):
+    """Background job queued by request handler and run by `run_jobs` worker.
+
+    Job is hidden from other workers until `locked_until` while it is running,
+    and queued again with increasing delay after a failed run until it has
+    been run `max_attempts` times.
+    """
+
+    name = models.CharField(max_length=50)
+    payload = models.JSONField(default=dict)
+    user = models.ForeignKey(User, null=True, blank=True, on_delete=models.SET_NULL)
+    status = models.CharField(
+        max_length=10, choices=JobStatus.choices, default=JobStatus.QUEUED
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    max_attempts = models.PositiveSmallIntegerField(default=JOB_MAX_ATTEMPTS)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_until = models.DateTimeField(null=True, blank=True)
+    result = models.JSONField(null=True, blank=True)
+    error = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    objects = JobManager()
+
+    class Meta:
+        """Define ordering and index used for claiming jobs."""
+
+        indexes = [
+            models.Index(fields=["status", "run_at"], name="job_status_run_at_idx")
+        ]
+        ordering = ["-id"]
+
+    def __str__(self):
+        """Return job's instance string representation.
+
+        :return: str
+        """
+        return f"{self.name} #{self.id} [{self.status}]"
+
+    @property
+    def is_finished(self):
+        """Return True if job has succeeded or failed for good.
+
+        :return: Boolean
+        """
+        return self.status in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+    @property
+    def message(self):
+        """Return job's result message or error.
+
+        :return: str
+        """
+        if self.status == JobStatus.SUCCEEDED:
+            return (self.result or {}).get("message", "")
+
+        return self.error
+
+    def succeed(self, result=None):
+        """Mark job as succeeded with provided `result`.
+
+        :param result: JSON serializable job handler's result
+        :type result: dict
+        """
+        self.status = JobStatus.SUCCEEDED
+        self.result = result
+        self.error = ""
+        self.locked_until = None
+        self.finished_at = timezone.now()
+        self.save()
+
+    def fail(self, error):
+        """Mark job as failed for good with provided `error`.
+
+        :param error: error message
+        :type error: str
+        """
+        self.status = JobStatus.FAILED
+        self.error = error
+        self.locked_until = None
+        self.finished_at = timezone.now()
+        self.save()
+
+    def retry_or_fail(self, error):
+        """Queue job again with exponential delay or fail it if out of attempts.
+
+        :param error: error message of the failed run
+        :type error: str
+        """
+        if self.attempts >= self.max_attempts:
+            self.fail(error)
+            return
+
+        self.status = JobStatus.QUEUED
+        self.error = error
+        self.locked_until = None
+        self.run_at = timezone.now() + timedelta(
+            seconds=JOB_RETRY_DELAY * 2 ** (self.attempts - 1)
+        )
+        self.save()
@@ -0,0 +1,299 @@
+"""Module containing keyset (seek) pagination for website's list views.
+
+Instead of counting all the records and skipping `OFFSET` rows, keyset
+pagination filters the next page by the ordering values of the last record
+on the previous page, so every page costs the same as the first one.
+
+:var CURSOR_SALT: salt used for signing cursor tokens
+:type CURSOR_SALT: str
+"""
+
+import operator
+from functools import reduce
+
+from django.core import signing
+from django.db.models import Q
+from django.http import Http404, HttpResponse
+from django.template.loader import render_to_string
+from django.utils.functional import cached_property
+
+CURSOR_SALT = "core.pagination.cursor"
+
+
+class InvalidCursor(Exception):
+    """Provided cursor token is malformed or tampered with."""
+
+
+def encode_cursor(values):
+    """Return opaque signed token holding provided ordering `values`.
+
+    :param values: ordering fields' values of the last record on a page
+    :type values: list
+    :return: str
+    """
+    return signing.dumps(values, salt=CURSOR_SALT, compress=True)
+
+
+def decode_cursor(token, length):
+    """Return ordering values from provided cursor `token`.
+
+    :param token: cursor token created by :func:`encode_cursor`
+    :type token: str
+    :param length: number of ordering fields
+    :type length: int
+    :var values: ordering fields' values
+    :type values: list
+    :raises InvalidCursor: if token is invalid or doesn't match ordering
+    :return: list
+    """
+    try:
+        values = signing.loads(token, salt=CURSOR_SALT)
+
+    except signing.BadSignature as exc:
+        raise InvalidCursor("Invalid cursor") from exc
+
+    if not isinstance(values, list) or len(values) != length:
+        raise InvalidCursor("Invalid cursor")
+
+    return values
+
+
+class KeysetPage:
+    """Single page of records retrieved by :class:`KeysetPaginator`.
+
+    :ivar object_list: page records
+    :type object_list: list
+    :ivar paginator: paginator instance the page belongs to
+    :type paginator: :class:`KeysetPaginator`
+    :ivar cursor: cursor token the page was retrieved with
+    :type cursor: str or None
+    :ivar next_cursor: cursor token for retrieving the next page
+    :type next_cursor: str or None
+    """
+
+    def __init__(self, object_list, paginator, cursor, next_cursor):
+        """Initialize page with its records and cursors.
+
+        :param object_list: page records
+        :type object_list: list
+        :param paginator: paginator instance the page belongs to
+        :type paginator: :class:`KeysetPaginator`
+        :param cursor: cursor token the page was retrieved with
+        :type cursor: str or None
+        :param next_cursor: cursor token for retrieving the next page
+        :type next_cursor: str or None
+        """
+        self.object_list = object_list
+        self.paginator = paginator
+        self.cursor = cursor
+        self.next_cursor = next_cursor
+
+    def __repr__(self):
+        """Return page's representation.
+
+        :return: str
+        """
+        return f"<KeysetPage of {len(self)} objects>"
+
+    def __len__(self):
+        """Return number of records on the page.
+
+        :return: int
+        """
+        return len(self.object_list)
+
+    def __iter__(self):
+        """Return iterator over page records.
+
+        :return: iterator
+        """
+        return iter(self.object_list)
+
+    def has_next(self):
+        """Return True if there are records after this page.
+
+        :return: Boolean
+        """
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        """Return True if this isn't the first page.
+
+        :return: Boolean
+        """
+        return self.cursor is not None
+
+
+class KeysetPaginator:
+    """Paginator seeking pages by the values of non-nullable ordering fields.
+
+    The last ordering field should be unique (like primary key) so the records
+    have a total order and no record is skipped or repeated between pages.
+    Provided ordering replaces queryset's ordering, so the queryset shouldn't
+    be reversed.
+
+    :ivar queryset: records queryset
+    :type queryset: :class:`django.db.models.QuerySet`
+    :ivar per_page: maximum number of records on a page
+    :type per_page: int
+    :ivar ordering: ordering field names, prefixed with "-" for descending
+    :type ordering: tuple
+    """
+
+    def __init__(self, queryset, per_page, ordering):
+        """Initialize paginator and order provided `queryset` by `ordering`.
+
+        :param queryset: records queryset
+        :type queryset: :class:`django.db.models.QuerySet`
+        :param per_page: maximum number of records on a page
+        :type per_page: int
+        :param ordering: ordering field names, prefixed with "-" for descending
+        :type ordering: tuple
+        """
+        self.queryset = queryset.order_by(*ordering)
+        self.per_page = int(per_page)
+        self.ordering = tuple(ordering)
+
+    @cached_property
+    def count(self):
+        """Return total number of records, evaluated only when accessed.
+
+        :return: int
+        """
+        return self.queryset.count()
+
+    def _field_values(self, instance):
+        """Return ordering fields' values of provided model `instance`.
+
+        :param instance: model instance
+        :type instance: :class:`django.db.models.Model`
+        :return: list
+        """
+        return [getattr(instance, field.lstrip("-")) for field in self.ordering]
+
+    def _seek_filter(self, values):
+        """Return filter selecting records positioned after provided `values`.
+
+        :param values: ordering fields' values of the last record on a page
+        :type values: list
+        :var conditions: conditions for every ordering field being the first
+                         one that differs from provided values
+        :type conditions: list
+        :var equal: lookups for all the preceding ordering fields being equal
+        :type equal: dict
+        :return: :class:`django.db.models.Q`
+        """
+        conditions = []
+        equal = {}
+        for field, value in zip(self.ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            conditions.append(Q(**equal, **{f"{name}__{lookup}": value}))
+            equal[name] = value
+
+        return reduce(operator.or_, conditions)
+
+    def page(self, cursor=None):
+        """Return page of records positioned after provided `cursor`.
+
+        :param cursor: cursor token of the previous page's last record
+        :type cursor: str or None
+        :var queryset: records queryset filtered by cursor
+        :type queryset: :class:`django.db.models.QuerySet`
+        :var object_list: page records with one record more if next page exists
+        :type object_list: list
+        :var next_cursor: cursor token for retrieving the next page
+        :type next_cursor: str or None
+        :raises InvalidCursor: if cursor is invalid
+        :return: :class:`KeysetPage`
+        """
+        queryset = self.queryset
+        if cursor:
+            queryset = queryset.filter(
+                self._seek_filter(decode_cursor(cursor, len(self.ordering)))
+            )
+
+        object_list = list(queryset[: self.per_page + 1])
+        next_cursor = None
+        if len(object_list) > self.per_page:
+            object_list = object_list[: self.per_page]
+            next_cursor = encode_cursor(self._field_values(object_list[-1]))
+
+        return KeysetPage(object_list, self, cursor or None, next_cursor)
+
+
+class KeysetPaginationMixin:
+    """Mixin replacing list view's offset pagination with keyset pagination.
+
+    HTMX requests with cursor get only the `load_more_template` partial
+    holding the next page's records and the next "load more" button.
+
+    :ivar keyset_ordering: ordering field names, prefixed with "-" for descending
+    :type keyset_ordering: tuple
+    :ivar cursor_kwarg: name of GET parameter holding cursor token
+    :type cursor_kwarg: str
+    :ivar load_more_template: template partial rendered for the following pages
+    :type load_more_template: str
+    """
+
+    keyset_ordering = ("-id",)
+    cursor_kwarg = "cursor"
+    load_more_template = None
+
+    def get_keyset_ordering(self):
+        """Return fields the records are ordered and paginated by.
+
+        :return: tuple
+        """
+        return self.keyset_ordering
+
+    def is_load_more_request(self):
+        """Return True if instance request is HTMX request for the next page.
+
+        :return: Boolean
+        """
+        return self.request.headers.get("HX-Request") == "true" and bool(
+            self.request.GET.get(self.cursor_kwarg)
+        )
+
+    def paginate_queryset(self, queryset, page_size):
+        """Paginate provided `queryset` by cursor from the request.
+
+        :param queryset: records queryset
+        :type queryset: :class:`django.db.models.QuerySet`
+        :param page_size: maximum number of records on a page
+        :type page_size: int
+        :var paginator: keyset paginator instance
+        :type paginator: :class:`KeysetPaginator`
+        :var page: requested page
+        :type page: :class:`KeysetPage`
+        :raises Http404: if cursor is invalid
+        :return: four-tuple
+        """
+        paginator = KeysetPaginator(queryset, page_size, self.get_keyset_ordering())
+        try:
+            page = paginator.page(self.request.GET.get(self.cursor_kwarg))
+
+        except InvalidCursor as exc:
+            raise Http404("Invalid cursor") from exc
+
+        return (
+            paginator,
+            page,
+            page.object_list,
+            page.has_next() or page.has_previous(),
+        )
+
+    def render_to_response(self, context, **response_kwargs):
+        """Return "load more" partial for HTMX next page request or full template.
+
+        :param context: template context data
+        :type context: dict
+        :return: :class:`django.http.HttpResponse`
+        """
+        if self.load_more_template and self.is_load_more_request():
+            return HttpResponse(
+                render_to_string(self.load_more_template, context, request=self.request)
+            )
+
+        return super().render_to_response(context, **response_kwargs)
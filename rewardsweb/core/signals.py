@@ -1,10 +1,20 @@
 """Module containing core app signals."""
 
 from django.contrib.auth.models import User
-from django.db.models.signals import post_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
-from core.models import Profile
+from core.fragments import bump_data_version
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Issue,
+    Profile,
+    Reward,
+    StatisticsSnapshot,
+)
 
 
 @receiver(post_save, sender=User)
@@ -38,3 +48,202 @@ def save_user_profile(sender, instance, **kwargs):
     :type instance: object of :class:`User`
     """
     instance.profile.save()
+
+
+# # STATISTICS SNAPSHOT
+@receiver(post_save, sender=Cycle)
+def cycle_saved_statistics(sender, instance, created, **kwargs):
+    """Increase cycles count in statistics snapshot for created cycle.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Cycle`
+    :param instance: instance of the sender class
+    :type instance: :class:`Cycle`
+    :param created: value that determines is sender is created or not
+    :type created: boolean
+    """
+    if created:
+        StatisticsSnapshot.objects.adjust(num_cycles=1)
+
+
+@receiver(post_delete, sender=Cycle)
+def cycle_deleted_statistics(sender, instance, **kwargs):
+    """Decrease cycles count in statistics snapshot for deleted cycle.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Cycle`
+    :param instance: instance of the sender class
+    :type instance: :class:`Cycle`
+    """
+    StatisticsSnapshot.objects.adjust(num_cycles=-1)
+
+
+@receiver(post_save, sender=Contributor)
+def contributor_saved_statistics(sender, instance, created, **kwargs):
+    """Increase contributors count in statistics snapshot for created contributor.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Contributor`
+    :param instance: instance of the sender class
+    :type instance: :class:`Contributor`
+    :param created: value that determines is sender is created or not
+    :type created: boolean
+    """
+    if created:
+        StatisticsSnapshot.objects.adjust(num_contributors=1)
+
+
+@receiver(post_delete, sender=Contributor)
+def contributor_deleted_statistics(sender, instance, **kwargs):
+    """Decrease contributors count in statistics snapshot for deleted contributor.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Contributor`
+    :param instance: instance of the sender class
+    :type instance: :class:`Contributor`
+    """
+    StatisticsSnapshot.objects.adjust(num_contributors=-1)
+
+
+@receiver(pre_save, sender=Contribution)
+def contribution_presave_statistics(sender, instance, update_fields=None, **kwargs):
+    """Remember contribution's stored reward before existing contribution is saved.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Contribution`
+    :param instance: instance of the sender class
+    :type instance: :class:`Contribution`
+    :param update_fields: fields to be updated, or None for all fields
+    :type update_fields: frozenset
+    """
+    instance._stored_reward = None
+    if not instance._state.adding and (
+        update_fields is None or "reward" in update_fields
+    ):
+        instance._stored_reward = (
+            Contribution.objects.filter(pk=instance.pk)
+            .values_list("reward_id", "reward__amount")
+            .first()
+        )
+
+
+@receiver(post_save, sender=Contribution)
+def contribution_saved_statistics(sender, instance, created, **kwargs):
+    """Update contributions count and rewards total in statistics snapshot.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Contribution`
+    :param instance: instance of the sender class
+    :type instance: :class:`Contribution`
+    :param created: value that determines is sender is created or not
+    :type created: boolean
+    :var stored_reward: contribution's reward identifier and amount before saving
+    :type stored_reward: two-tuple
+    """
+    if created:
+        StatisticsSnapshot.objects.adjust(
+            num_contributions=1, total_rewards=instance.reward.amount
+        )
+        return
+
+    stored_reward = getattr(instance, "_stored_reward", None)
+    if stored_reward and stored_reward[0] != instance.reward_id:
+        StatisticsSnapshot.objects.adjust(
+            total_rewards=instance.reward.amount - stored_reward[1]
+        )
+
+
+@receiver(pre_delete, sender=Contribution)
+def contribution_predelete_statistics(sender, instance, **kwargs):
+    """Remember contribution's reward amount before contribution is deleted.
+
+    Already fetched reward is used, so only the amount is queried otherwise.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Contribution`
+    :param instance: instance of the sender class
+    :type instance: :class:`Contribution`
+    """
+    instance._stored_reward_amount = (
+        instance.reward.amount
+        if Contribution.reward.is_cached(instance)
+        else Reward.objects.filter(pk=instance.reward_id)
+        .values_list("amount", flat=True)
+        .first()
+    ) or 0
+
+
+@receiver(post_delete, sender=Contribution)
+def contribution_deleted_statistics(sender, instance, **kwargs):
+    """Decrease contributions count and rewards total in statistics snapshot.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Contribution`
+    :param instance: instance of the sender class
+    :type instance: :class:`Contribution`
+    """
+    StatisticsSnapshot.objects.adjust(
+        num_contributions=-1,
+        total_rewards=-getattr(instance, "_stored_reward_amount", 0),
+    )
+
+
+@receiver(pre_save, sender=Reward)
+def reward_presave_statistics(sender, instance, update_fields=None, **kwargs):
+    """Remember reward's stored amount before existing reward is saved.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Reward`
+    :param instance: instance of the sender class
+    :type instance: :class:`Reward`
+    :param update_fields: fields to be updated, or None for all fields
+    :type update_fields: frozenset
+    """
+    instance._stored_amount = None
+    if not instance._state.adding and (
+        update_fields is None or "amount" in update_fields
+    ):
+        instance._stored_amount = (
+            Reward.objects.filter(pk=instance.pk)
+            .values_list("amount", flat=True)
+            .first()
+        )
+
+
+@receiver(post_save, sender=Reward)
+def reward_saved_statistics(sender, instance, created, **kwargs):
+    """Update rewards total in statistics snapshot for changed reward's amount.
+
+    :param sender: class responsible for signal sending
+    :type sender: :class:`Reward`
+    :param instance: instance of the sender class
+    :type instance: :class:`Reward`
+    :param created: value that determines is sender is created or not
+    :type created: boolean
+    :var stored_amount: reward's amount before saving
+    :type stored_amount: int
+    """
+    stored_amount = getattr(instance, "_stored_amount", None)
+    if not created and stored_amount is not None and stored_amount != instance.amount:
+        StatisticsSnapshot.objects.adjust(
+            total_rewards=(instance.amount - stored_amount)
+            * Contribution.objects.filter(reward=instance).count()
+        )
+
+
+# # FRAGMENTS CACHE
+@receiver([post_save, post_delete], sender=Contribution)
+@receiver([post_save, post_delete], sender=Contributor)
+@receiver([post_save, post_delete], sender=Cycle)
+@receiver([post_save, post_delete], sender=Handle)
+@receiver([post_save, post_delete], sender=Issue)
+@receiver([post_save, post_delete], sender=Reward)
+def records_changed_data_version(sender, instance, **kwargs):
+    """Bump data version stamp so cached fragments aren't served anymore.
+
+    :param sender: class responsible for signal sending
+    :type sender: type
+    :param instance: saved or deleted instance of the sender class
+    :type instance: :class:`django.db.models.Model`
+    """
+    bump_data_version()
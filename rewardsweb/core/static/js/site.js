@@ -182,6 +182,98 @@ function processDaisyUITheme() {
   });
 }
 
+/******************************************************************************
+ *
+ *  Contributor Autocomplete
+ *
+ *****************************************************************************/
+
+var autocompleteState = { timeout: null, delay: 250, minLength: 2 };
+
+/**
+ * Stores selected contributor in the hidden input and clears the suggestions.
+ * @param {HTMLInputElement} input - The autocomplete search input.
+ * @param {{id: number, info: string}} contributor - The selected contributor.
+ */
+function selectContributorSuggestion(input, contributor) {
+  const target = document.getElementById(input.dataset.autocompleteTarget);
+  if (target) target.value = contributor.id;
+  input.value = contributor.info;
+  renderContributorSuggestions(input, []);
+}
+
+/**
+ * Replaces the suggestions list content with buttons for provided contributors.
+ * @param {HTMLInputElement} input - The autocomplete search input.
+ * @param {Array<{id: number, info: string}>} results - The matched contributors.
+ */
+function renderContributorSuggestions(input, results) {
+  const list = document.getElementById(input.dataset.autocompleteList);
+  if (!list) return;
+
+  list.innerHTML = "";
+  results.forEach((contributor) => {
+    const item = document.createElement("li");
+    const button = document.createElement("button");
+    button.type = "button";
+    button.textContent = contributor.info;
+    button.dataset.id = contributor.id;
+    button.addEventListener("click", () =>
+      selectContributorSuggestion(input, contributor)
+    );
+    item.appendChild(button);
+    list.appendChild(item);
+  });
+  list.classList.toggle("hidden", results.length === 0);
+}
+
+/**
+ * Fetches contributors matching the input's value and renders them.
+ * Typing invalidates the previously selected contributor.
+ * @param {HTMLInputElement} input - The autocomplete search input.
+ */
+async function fetchContributorSuggestions(input) {
+  const target = document.getElementById(input.dataset.autocompleteTarget);
+  if (target) target.value = "";
+
+  const query = input.value.trim();
+  if (query.length < autocompleteState.minLength) {
+    renderContributorSuggestions(input, []);
+    return;
+  }
+
+  try {
+    const response = await fetch(
+      `${input.dataset.autocompleteUrl}?q=${encodeURIComponent(query)}`,
+      { headers: { Accept: "application/json" } }
+    );
+    if (!response.ok) return;
+
+    const data = await response.json();
+    // skip stale responses if the input has changed in the meantime
+    if (input.value.trim() === query) {
+      renderContributorSuggestions(input, data.results);
+    }
+  } catch (error) {
+    console.error("Contributor autocomplete failed:", error);
+  }
+}
+
+/**
+ * Debounces fetching contributors' suggestions while the user is typing.
+ * @param {Event} event - The input event.
+ */
+function handleAutocompleteInput(event) {
+  const input = event.target;
+  if (!input.dataset || !input.dataset.autocompleteUrl) return;
+
+  clearTimeout(autocompleteState.timeout);
+  autocompleteState.timeout = setTimeout(
+    () => fetchContributorSuggestions(input),
+    autocompleteState.delay
+  );
+}
+
 /******************************************************************************
  *
  *  Global Event Listeners
@@ -264,6 +356,11 @@ document.body.addEventListener("htmx:error", () => {
   finishProgressBar(htmxState.requestBlocking);
 });
 
+/**
+ * Contributor autocomplete listener, delegated so it works after HTMX swaps.
+ */
+document.body.addEventListener("input", handleAutocompleteInput);
+
 /******************************************************************************
  *
  *  Module Exports (for testing)
@@ -283,5 +380,10 @@ if (typeof exports !== "undefined") {
     processDaisyUITheme,
     htmxState,
     initializeDomReadyListeners,
+    autocompleteState,
+    selectContributorSuggestion,
+    renderContributorSuggestions,
+    fetchContributorSuggestions,
+    handleAutocompleteInput,
   };
 }
\ No newline at end of file
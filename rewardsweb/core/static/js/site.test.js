@@ -7,6 +7,11 @@ const {
   finishProgressBar,
   processActiveNetwork,
   processDaisyUITheme,
+  autocompleteState,
+  selectContributorSuggestion,
+  renderContributorSuggestions,
+  fetchContributorSuggestions,
+  handleAutocompleteInput,
 } = require("./site.js");
 
 // JSDOM doesn't implement showModal, so we'll mock it.
@@ -398,6 +403,132 @@ describe("Global Event Listeners", () => {
   });
 });
 
+describe("Contributor Autocomplete Functions", () => {
+  let input;
+
+  beforeEach(() => {
+    document.body.innerHTML = `
+      <input type="hidden" id="id_contributor" value="7">
+      <input type="text" id="search" data-autocomplete-url="/contributors/autocomplete/"
+             data-autocomplete-target="id_contributor" data-autocomplete-list="suggestions">
+      <ul id="suggestions" class="hidden"></ul>
+    `;
+    input = document.getElementById("search");
+    global.fetch = jest.fn();
+  });
+
+  afterEach(() => {
+    delete global.fetch;
+  });
+
+  test("renderContributorSuggestions should render a button per contributor", () => {
+    renderContributorSuggestions(input, [
+      { id: 1, info: "Alice" },
+      { id: 2, info: "Bob (g@bob, d@bobby)" },
+    ]);
+    const buttons = document.querySelectorAll("#suggestions button");
+    expect(buttons.length).toBe(2);
+    expect(buttons[1].textContent).toBe("Bob (g@bob, d@bobby)");
+    expect(buttons[1].dataset.id).toBe("2");
+    expect(document.getElementById("suggestions").classList.contains("hidden")).toBe(false);
+  });
+
+  test("renderContributorSuggestions should hide empty list", () => {
+    renderContributorSuggestions(input, [{ id: 1, info: "Alice" }]);
+    renderContributorSuggestions(input, []);
+    const list = document.getElementById("suggestions");
+    expect(list.children.length).toBe(0);
+    expect(list.classList.contains("hidden")).toBe(true);
+  });
+
+  test("renderContributorSuggestions should not fail if list is not found", () => {
+    document.getElementById("suggestions").remove();
+    expect(() => renderContributorSuggestions(input, [])).not.toThrow();
+  });
+
+  test("clicking a suggestion should select the contributor", () => {
+    renderContributorSuggestions(input, [{ id: 5, info: "Alice" }]);
+    document.querySelector("#suggestions button").click();
+    expect(document.getElementById("id_contributor").value).toBe("5");
+    expect(input.value).toBe("Alice");
+    expect(document.getElementById("suggestions").children.length).toBe(0);
+  });
+
+  test("selectContributorSuggestion should not fail if target is not found", () => {
+    document.getElementById("id_contributor").remove();
+    selectContributorSuggestion(input, { id: 5, info: "Alice" });
+    expect(input.value).toBe("Alice");
+  });
+
+  test("fetchContributorSuggestions should skip short queries", async () => {
+    input.value = "a";
+    await fetchContributorSuggestions(input);
+    expect(global.fetch).not.toHaveBeenCalled();
+    expect(document.getElementById("id_contributor").value).toBe("");
+  });
+
+  test("fetchContributorSuggestions should render fetched results", async () => {
+    input.value = " ali ";
+    global.fetch.mockResolvedValue({
+      ok: true,
+      json: () => Promise.resolve({ results: [{ id: 1, info: "Alice" }] }),
+    });
+    await fetchContributorSuggestions(input);
+    expect(global.fetch).toHaveBeenCalledWith("/contributors/autocomplete/?q=ali", {
+      headers: { Accept: "application/json" },
+    });
+    expect(document.querySelectorAll("#suggestions button").length).toBe(1);
+  });
+
+  test("fetchContributorSuggestions should ignore stale responses", async () => {
+    input.value = "ali";
+    global.fetch.mockImplementation(() => {
+      input.value = "alice";
+      return Promise.resolve({
+        ok: true,
+        json: () => Promise.resolve({ results: [{ id: 1, info: "Alice" }] }),
+      });
+    });
+    await fetchContributorSuggestions(input);
+    expect(document.querySelectorAll("#suggestions button").length).toBe(0);
+  });
+
+  test("fetchContributorSuggestions should ignore failed responses", async () => {
+    input.value = "ali";
+    global.fetch.mockResolvedValue({ ok: false });
+    await fetchContributorSuggestions(input);
+    expect(document.querySelectorAll("#suggestions button").length).toBe(0);
+  });
+
+  test("fetchContributorSuggestions should log network errors", async () => {
+    const consoleSpy = jest.spyOn(console, "error").mockImplementation(() => {});
+    input.value = "ali";
+    global.fetch.mockRejectedValue(new Error("offline"));
+    await fetchContributorSuggestions(input);
+    expect(consoleSpy).toHaveBeenCalled();
+    consoleSpy.mockRestore();
+  });
+
+  test("handleAutocompleteInput should debounce fetching", () => {
+    jest.useFakeTimers();
+    global.fetch.mockResolvedValue({ ok: false });
+    input.value = "alice";
+    handleAutocompleteInput({ target: input });
+    handleAutocompleteInput({ target: input });
+    jest.advanceTimersByTime(autocompleteState.delay);
+    expect(global.fetch).toHaveBeenCalledTimes(1);
+    jest.useRealTimers();
+  });
+
+  test("handleAutocompleteInput should ignore other inputs", () => {
+    jest.useFakeTimers();
+    handleAutocompleteInput({ target: document.getElementById("id_contributor") });
+    jest.advanceTimersByTime(autocompleteState.delay);
+    expect(global.fetch).not.toHaveBeenCalled();
+    jest.useRealTimers();
+  });
+});
+
 describe("initializeDomReadyListeners Isolation Test", () => {
   let mockProcessActiveNetwork;
   let mockProcessDaisyUITheme;
@@ -1,5 +1,6 @@
 """Testing module for :py:mod:`core.management.commands` module."""
 
+from io import StringIO
 from pathlib import Path
 from unittest import mock
 
@@ -9,6 +10,7 @@ from django.core.management import call_command
 from django.db import connection
 
 from core.management.commands import migrate
+from utils.constants.core import GITHUB_MAPPING_WORKERS
 
 
 class TestDeployDappCommand:
@@ -60,7 +62,8 @@ class TestExcel2DbCommand:
             "core.management.commands.excel2db.import_from_csv", return_value=False
         )
         mocked_map = mocker.patch(
-            "core.management.commands.excel2db.map_github_issues", return_value=False
+            "core.management.commands.excel2db.map_github_issues",
+            return_value={"seconds": 1.5, "queries": 10},
         )
         with mock.patch(
             "django.core.management.base.OutputWrapper.write"
@@ -69,7 +72,7 @@ class TestExcel2DbCommand:
             calls = [
                 mocker.call("CSV successfully exported into contributions.csv file!"),
                 mocker.call("Records successfully imported!"),
-                mocker.call("Issues successfully mapped!"),
+                mocker.call("Issues successfully mapped in 1.5s with 10 queries!"),
             ]
             output_log.assert_has_calls(calls, any_order=True)
             assert output_log.call_count == 3
@@ -84,7 +87,12 @@ class TestExcel2DbCommand:
             fixtures_dir / "contributions.csv",
             fixtures_dir / "legacy_contributions.csv",
         )
-        mocked_map.assert_called_once_with(github_token="")
+        mocked_map.assert_called_once_with(
+            github_token="",
+            full=False,
+            workers=GITHUB_MAPPING_WORKERS,
+            report_path=None,
+        )
 
     def test_excel2db_command_output_for_default_values_on_import_response(
         self, mocker
@@ -120,44 +128,6 @@ class TestExcel2DbCommand:
         )
         mocked_map.assert_not_called()
 
-    def test_excel2db_command_output_for_default_values_on_mapping_response(
-        self, mocker
-    ):
-        mocked_convert = mocker.patch(
-            "core.management.commands.excel2db.convert_and_clean_excel"
-        )
-        response = "response2"
-        mocked_import = mocker.patch(
-            "core.management.commands.excel2db.import_from_csv", return_value=False
-        )
-        mocked_map = mocker.patch(
-            "core.management.commands.excel2db.map_github_issues",
-            return_value=response,
-        )
-        with mock.patch(
-            "django.core.management.base.OutputWrapper.write"
-        ) as output_log:
-            call_command("excel2db")
-            calls = [
-                mocker.call("CSV successfully exported into contributions.csv file!"),
-                mocker.call("Records successfully imported!"),
-                mocker.call(response),
-            ]
-            output_log.assert_has_calls(calls, any_order=True)
-            assert output_log.call_count == 3
-
-        fixtures_dir = settings.BASE_DIR.parent / "fixtures"
-        mocked_convert.assert_called_once_with(
-            fixtures_dir / "contributions.xlsx",
-            fixtures_dir / "contributions.csv",
-            fixtures_dir / "legacy_contributions.csv",
-        )
-        mocked_import.assert_called_once_with(
-            fixtures_dir / "contributions.csv",
-            fixtures_dir / "legacy_contributions.csv",
-        )
-        mocked_map.assert_called_once_with(github_token="")
-
     def test_excel2db_command_output_for_provided_arguments(self, mocker):
         mocked_convert = mocker.patch(
             "core.management.commands.excel2db.convert_and_clean_excel"
@@ -166,7 +136,8 @@ class TestExcel2DbCommand:
             "core.management.commands.excel2db.import_from_csv", return_value=False
         )
         mocked_map = mocker.patch(
-            "core.management.commands.excel2db.map_github_issues", return_value=False
+            "core.management.commands.excel2db.map_github_issues",
+            return_value={"seconds": 1.5, "queries": 10},
         )
         input_file, output_file, legacy_file, token = (
             "input_file",
@@ -183,11 +154,14 @@ class TestExcel2DbCommand:
                 output=output_file,
                 legacy=legacy_file,
                 token=token,
+                full=True,
+                workers=4,
+                report="report.json",
             )
             calls = [
                 mocker.call(f"CSV successfully exported into {output_file} file!"),
                 mocker.call("Records successfully imported!"),
-                mocker.call("Issues successfully mapped!"),
+                mocker.call("Issues successfully mapped in 1.5s with 10 queries!"),
             ]
             output_log.assert_has_calls(calls, any_order=True)
             assert output_log.call_count == 3
@@ -195,7 +169,169 @@ class TestExcel2DbCommand:
             Path(input_file), Path(output_file), Path(legacy_file)
         )
         mocked_import.assert_called_once_with(Path(output_file), Path(legacy_file))
-        mocked_map.assert_called_once_with(github_token=token)
+        mocked_map.assert_called_once_with(
+            github_token=token, full=True, workers=4, report_path="report.json"
+        )
+
+
+class TestExportContributionsCommand:
+    """Testing class for management command
+
+    :py:mod:`core.management.commands.export_contributions`."""
+
+    def test_export_contributions_command_output_to_stdout(self, mocker):
+        mocked_lines = mocker.patch(
+            "core.management.commands.export_contributions.export_lines",
+            return_value=iter(["line1\n", "line2\n"]),
+        )
+        stdout = StringIO()
+        call_command("export_contributions", stdout=stdout)
+        assert stdout.getvalue() == "line1\nline2\n"
+        mocked_lines.assert_called_once_with("ndjson", chunk_size=2000)
+
+    def test_export_contributions_command_output_to_file(self, mocker, tmp_path):
+        mocked_lines = mocker.patch(
+            "core.management.commands.export_contributions.export_lines",
+            return_value=iter(["a,b\r\n", "1,2\r\n"]),
+        )
+        output = tmp_path / "ledger.csv"
+        stdout = StringIO()
+        call_command(
+            "export_contributions",
+            format="csv",
+            output=str(output),
+            chunk_size=50,
+            stdout=stdout,
+        )
+        assert output.read_bytes() == b"a,b\r\n1,2\r\n"
+        assert stdout.getvalue() == f"Contributions exported into {output} file!\n"
+        mocked_lines.assert_called_once_with("csv", chunk_size=50)
+
+
+class TestMapGithubIssuesCommand:
+    """Testing class for management command
+
+    :py:mod:`core.management.commands.map_github_issues`."""
+
+    def test_map_github_issues_command_output(self, mocker):
+        mocked_map = mocker.patch(
+            "core.management.commands.map_github_issues.map_github_issues",
+            return_value={"seconds": 1.25, "queries": 42},
+        )
+        stdout = StringIO()
+        call_command("map_github_issues", stdout=stdout)
+        assert (
+            stdout.getvalue() == "Issues successfully mapped in 1.2s with 42 queries!\n"
+        )
+        mocked_map.assert_called_once_with(
+            github_token="",
+            full=False,
+            workers=GITHUB_MAPPING_WORKERS,
+            report_path=None,
+        )
+
+    def test_map_github_issues_command_passes_options(self, mocker):
+        mocked_map = mocker.patch(
+            "core.management.commands.map_github_issues.map_github_issues",
+            return_value={"seconds": 0.0, "queries": 0},
+        )
+        call_command(
+            "map_github_issues",
+            "token",
+            "--full",
+            "--workers",
+            "4",
+            "--report",
+            "report.json",
+            stdout=StringIO(),
+        )
+        mocked_map.assert_called_once_with(
+            github_token="token", full=True, workers=4, report_path="report.json"
+        )
+
+
+class TestReconcileStatisticsCommand:
+    """Testing class for management command
+
+    :py:mod:`core.management.commands.reconcile_statistics`."""
+
+    def test_reconcile_statistics_command_for_no_differences(self, mocker):
+        mocked_reconcile = mocker.patch(
+            "core.management.commands.reconcile_statistics."
+            "StatisticsSnapshot.objects.reconcile",
+            return_value=(mocker.MagicMock(), {}),
+        )
+        stdout = StringIO()
+        call_command("reconcile_statistics", stdout=stdout)
+        assert stdout.getvalue() == "Statistics snapshot is up to date!\n"
+        mocked_reconcile.assert_called_once_with()
+
+    def test_reconcile_statistics_command_for_differences(self, mocker):
+        mocker.patch(
+            "core.management.commands.reconcile_statistics."
+            "StatisticsSnapshot.objects.reconcile",
+            return_value=(
+                mocker.MagicMock(),
+                {"num_contributions": (10, 12), "total_rewards": (None, 500)},
+            ),
+        )
+        stdout = StringIO()
+        call_command("reconcile_statistics", stdout=stdout)
+        assert stdout.getvalue() == (
+            "num_contributions: 10 -> 12\ntotal_rewards: None -> 500\n"
+        )
+
+
+class TestSyncGithubIssuesCommand:
+    """Testing class for management command
+
+    :py:mod:`core.management.commands.sync_github_issues`."""
+
+    def test_sync_github_issues_command_output_for_success(self, mocker):
+        mocked_sync = mocker.patch(
+            "core.management.commands.sync_github_issues.sync_issues_mirror",
+            return_value={"success": True, "updated": 3},
+        )
+        stdout = StringIO()
+        call_command("sync_github_issues", stdout=stdout)
+        assert stdout.getvalue() == "3 issues mirrored!\n"
+        mocked_sync.assert_called_once_with(github_token="")
+
+    def test_sync_github_issues_command_output_for_error(self, mocker):
+        mocked_sync = mocker.patch(
+            "core.management.commands.sync_github_issues.sync_issues_mirror",
+            return_value={"success": False, "error": "error"},
+        )
+        stdout = StringIO()
+        call_command("sync_github_issues", "token", stdout=stdout)
+        assert stdout.getvalue() == "Issues mirror sync failed: error\n"
+        mocked_sync.assert_called_once_with(github_token="token")
+
+
+class TestRunJobsCommand:
+    """Testing class for management command
+
+    :py:mod:`core.management.commands.run_jobs`."""
+
+    def test_run_jobs_command_once_output(self, mocker):
+        mocked_run = mocker.patch(
+            "core.management.commands.run_jobs.run_pending_jobs", return_value=3
+        )
+        stdout = StringIO()
+        call_command("run_jobs", "--once", stdout=stdout)
+        assert stdout.getvalue() == "3 jobs run!\n"
+        mocked_run.assert_called_once_with()
+
+    def test_run_jobs_command_sleeps_when_queue_is_empty(self, mocker):
+        mocker.patch(
+            "core.management.commands.run_jobs.run_pending_jobs",
+            side_effect=[2, 0, KeyboardInterrupt],
+        )
+        mocked_sleep = mocker.patch("core.management.commands.run_jobs.time.sleep")
+        with pytest.raises(KeyboardInterrupt):
+            call_command("run_jobs", "--sleep", "5", stdout=StringIO())
+
+        mocked_sleep.assert_called_once_with(5)
 
 
 class TestMigrateCommand:
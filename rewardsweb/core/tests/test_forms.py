@@ -21,6 +21,7 @@ from django.forms import (
     TextInput,
     ValidationError,
 )
+from django.urls import reverse
 
 from core.forms import (
     ContributionCreateForm,
@@ -182,7 +183,18 @@ class TestContributionCreateForm:
     def test_contributor_field(self):
         form = ContributionCreateForm()
         assert isinstance(form.base_fields["contributor"], ModelChoiceField)
-        assert isinstance(form.base_fields["contributor"].widget, Select)
+        assert isinstance(form.base_fields["contributor"].widget, HiddenInput)
+
+    @pytest.mark.django_db
+    def test_contributor_search_field(self):
+        form = ContributionCreateForm()
+        field = form.base_fields["contributor_search"]
+        assert isinstance(field, CharField)
+        assert field.required is False
+        assert field.widget.attrs["data-autocomplete-target"] == "id_contributor"
+        assert str(field.widget.attrs["data-autocomplete-url"]) == reverse(
+            "contributor_autocomplete"
+        )
 
     @pytest.mark.django_db
     def test_cycle_field(self):
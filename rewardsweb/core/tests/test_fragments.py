@@ -0,0 +1,137 @@
+"""Testing module for :py:mod:`core.fragments` module."""
+
+from unittest import mock
+
+import pytest
+from django.core.cache import cache
+from django.urls import reverse
+
+from core.fragments import (
+    bump_data_version,
+    cached_fragment,
+    data_version,
+    fragment_cache_key,
+)
+from core.models import Contributor
+from utils.constants.core import DATA_VERSION_CACHE_KEY, FRAGMENT_CACHE_TIMEOUT
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """Use local memory cache instead of development's dummy cache."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+class TestCoreFragmentsFunctions:
+    """Testing class for :py:mod:`core.fragments` functions."""
+
+    def test_core_fragments_data_version_is_created_once(self, locmem_cache):
+        version = data_version()
+        assert len(version) == 32
+        assert data_version() == version
+        assert locmem_cache.get(DATA_VERSION_CACHE_KEY) == version
+
+    def test_core_fragments_bump_data_version_replaces_version(self, locmem_cache):
+        version = data_version()
+        bump_data_version()
+        assert data_version() != version
+
+    def test_core_fragments_fragment_cache_key_depends_on_all_parts(self, locmem_cache):
+        key = fragment_cache_key("template#partial", query="a", cursor="")
+        assert key.startswith("fragment:")
+        assert key == fragment_cache_key("template#partial", cursor="", query="a")
+        assert key != fragment_cache_key("template#other", query="a", cursor="")
+        assert key != fragment_cache_key("template#partial", query="b", cursor="")
+        assert key != fragment_cache_key("template#partial", query="a", cursor="x")
+        bump_data_version()
+        assert key != fragment_cache_key("template#partial", query="a", cursor="")
+
+    def test_core_fragments_cached_fragment_renders_once(self, locmem_cache):
+        render = mock.MagicMock(return_value="<p>html</p>")
+        assert cached_fragment("template", render, page=1) == "<p>html</p>"
+        assert cached_fragment("template", render, page=1) == "<p>html</p>"
+        render.assert_called_once_with()
+
+    def test_core_fragments_cached_fragment_uses_timeout(self, mocker):
+        mocked_cache = mocker.patch("core.fragments.cache")
+        mocked_cache.get.return_value = None
+        mocker.patch("core.fragments.fragment_cache_key", return_value="key")
+        render = mock.MagicMock(return_value="html")
+        assert cached_fragment("template", render) == "html"
+        mocked_cache.set.assert_called_once_with("key", "html", FRAGMENT_CACHE_TIMEOUT)
+
+    def test_core_fragments_cached_fragment_rerenders_after_bump(self, locmem_cache):
+        render = mock.MagicMock(side_effect=["first", "second"])
+        assert cached_fragment("template", render) == "first"
+        bump_data_version()
+        assert cached_fragment("template", render) == "second"
+
+
+@pytest.mark.django_db
+class TestCoreFragmentsViews:
+    """Testing class for views serving cached fragments."""
+
+    def test_core_fragments_contributorlistview_htmx_search_is_cached(
+        self, client, locmem_cache, django_assert_num_queries, mocker
+    ):
+        Contributor.objects.create(name="Alice")
+        mocker.patch("django.http.request.HttpRequest.htmx", True, create=True)
+        url = reverse("contributors")
+        first = client.get(url, {"q": "ali"}).content.decode()
+        assert "Alice" in first
+        assert "<html" not in first
+        with django_assert_num_queries(0):
+            second = client.get(url, {"q": "ali"}).content.decode()
+
+        assert second == first
+
+    def test_core_fragments_contributorlistview_write_invalidates_cache(
+        self, client, locmem_cache, mocker
+    ):
+        Contributor.objects.create(name="Alice")
+        mocker.patch("django.http.request.HttpRequest.htmx", True, create=True)
+        url = reverse("contributors")
+        client.get(url, {"q": "al"})
+        Contributor.objects.create(name="Alan")
+        assert "Alan" in client.get(url, {"q": "al"}).content.decode()
+
+    def test_core_fragments_contributordetailview_contributions_are_cached(
+        self, client, locmem_cache, contribution, mocker
+    ):
+        url = reverse("contributor_detail", args=[contribution.contributor.id])
+        response = client.get(url)
+        fragment = response.context["contributions_fragment"]
+        assert fragment["total_rewards"] == contribution.reward.amount
+        assert fragment["num_groups"] == 6
+        assert contribution.get_absolute_url() in fragment["html"]
+
+        render = mocker.patch("core.views.ContributorDetailView.render_contributions")
+        response = client.get(url)
+        render.assert_not_called()
+        assert response.context["contributions_fragment"] == fragment
+
+    def test_core_fragments_contributordetailview_reward_write_invalidates_cache(
+        self, client, locmem_cache, contribution
+    ):
+        url = reverse("contributor_detail", args=[contribution.contributor.id])
+        client.get(url)
+        reward = contribution.reward
+        reward.amount += 1000
+        reward.save()
+        response = client.get(url)
+        assert response.context["contributions_fragment"]["total_rewards"] == (
+            reward.amount
+        )
+
+    def test_core_fragments_contributordetailview_without_cache(
+        self, client, contribution
+    ):
+        url = reverse("contributor_detail", args=[contribution.contributor.id])
+        content = client.get(url).content.decode()
+        assert contribution.get_absolute_url() in content
+        assert "No Contributions Found" not in content
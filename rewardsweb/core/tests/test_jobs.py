@@ -0,0 +1,268 @@
+"""Testing module for :py:mod:`core.jobs` module."""
+
+import pytest
+from django.utils import timezone
+
+from core.jobs import (
+    JOB_HANDLERS,
+    JobError,
+    add_reactions,
+    close_issue,
+    invalidate_contribution,
+    job_handler,
+    process_issue_allocations,
+    run_job,
+    run_pending_jobs,
+)
+from core.models import GitHubIssueMirror, IssueStatus, Job, JobStatus
+from utils.constants.core import DISCORD_EMOJIS
+
+
+class TestCoreJobsFunctions:
+    """Testing class for :py:mod:`core.jobs` helper functions."""
+
+    def test_core_jobs_job_handlers_registered(self):
+        assert JOB_HANDLERS["close_issue"] == close_issue
+        assert JOB_HANDLERS["add_reactions"] == add_reactions
+        assert JOB_HANDLERS["process_issue_allocations"] == process_issue_allocations
+        assert JOB_HANDLERS["invalidate_contribution"] == invalidate_contribution
+
+    def test_core_jobs_job_handler_registers_function(self, mocker):
+        mocker.patch.dict(JOB_HANDLERS, {}, clear=True)
+
+        @job_handler("test_job")
+        def handler(job):
+            return {}
+
+        assert JOB_HANDLERS == {"test_job": handler}
+
+
+@pytest.mark.django_db
+class TestCoreJobsRunner:
+    """Testing class for :py:mod:`core.jobs` runner functions."""
+
+    def test_core_jobs_run_job_for_unknown_job(self):
+        job = Job.objects.enqueue("unknown")
+        run_job(Job.objects.claim())
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "Unknown job: unknown"
+
+    def test_core_jobs_run_job_succeeds(self, mocker):
+        mocker.patch.dict(JOB_HANDLERS, {"test_job": lambda job: {"message": "OK"}})
+        job = Job.objects.enqueue("test_job")
+        returned = run_job(Job.objects.claim())
+        assert returned == job
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.message == "OK"
+
+    def test_core_jobs_run_job_retries_and_fails(self, mocker):
+        handler = mocker.MagicMock(side_effect=JobError("error"))
+        mocker.patch.dict(JOB_HANDLERS, {"test_job": handler})
+        job = Job.objects.enqueue("test_job", max_attempts=2)
+        run_job(Job.objects.claim())
+        job.refresh_from_db()
+        assert job.status == JobStatus.QUEUED
+        assert job.error == "error"
+        Job.objects.filter(pk=job.pk).update(run_at=job.created_at)
+        run_job(Job.objects.claim())
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert handler.call_count == 2
+
+    def test_core_jobs_run_pending_jobs_runs_all_jobs(self, mocker):
+        mocker.patch.dict(JOB_HANDLERS, {"test_job": lambda job: {}})
+        for _ in range(3):
+            Job.objects.enqueue("test_job")
+
+        assert run_pending_jobs() == 3
+        assert Job.objects.filter(status=JobStatus.SUCCEEDED).count() == 3
+        assert run_pending_jobs() == 0
+
+    def test_core_jobs_run_pending_jobs_for_max_jobs(self, mocker):
+        mocker.patch.dict(JOB_HANDLERS, {"test_job": lambda job: {}})
+        for _ in range(3):
+            Job.objects.enqueue("test_job")
+
+        assert run_pending_jobs(max_jobs=2) == 2
+        assert Job.objects.filter(status=JobStatus.QUEUED).count() == 1
+
+
+@pytest.mark.django_db
+class TestCoreJobsHandlers:
+    """Testing class for :py:mod:`core.jobs` job handlers."""
+
+    def test_core_jobs_close_issue_queues_follow_up_jobs(
+        self, superuser, contribution_with_issue, mocker
+    ):
+        issue = contribution_with_issue.issue
+        GitHubIssueMirror.objects.create(
+            number=issue.number,
+            title="Title",
+            created_at=timezone.now(),
+            updated_at=timezone.now(),
+        )
+        mocked_close = mocker.patch(
+            "core.jobs.close_issue_with_labels",
+            return_value={
+                "success": True,
+                "issue_state": "closed",
+                "current_labels": ["addressed"],
+            },
+        )
+        mocked_log = mocker.patch("core.models.Profile.log_action")
+        job = Job.objects.enqueue(
+            "close_issue",
+            user=superuser,
+            issue_id=issue.id,
+            action="addressed",
+            labels_to_set=["addressed"],
+            comment="Done",
+        )
+        result = close_issue(job)
+        assert result == {
+            "message": f"Issue #{issue.number} closed as addressed successfully."
+        }
+        mocked_close.assert_called_once_with(
+            user=superuser,
+            issue_number=issue.number,
+            labels_to_set=["addressed"],
+            comment="Done",
+        )
+        issue.refresh_from_db()
+        assert issue.status == IssueStatus.ADDRESSED
+        mirror = GitHubIssueMirror.objects.get()
+        assert mirror.state == "closed"
+        assert mirror.labels == ["addressed"]
+        assert mocked_log.call_count == 2
+        reactions = Job.objects.get(name="add_reactions")
+        assert reactions.payload == {
+            "urls": [contribution_with_issue.url],
+            "emoji": DISCORD_EMOJIS.get("addressed"),
+        }
+        allocations = Job.objects.get(name="process_issue_allocations")
+        assert allocations.payload == {"issue_id": issue.id}
+        assert allocations.max_attempts == 1
+
+    def test_core_jobs_close_issue_as_wontfix(self, superuser, issue, mocker):
+        mocker.patch(
+            "core.jobs.close_issue_with_labels", return_value={"success": True}
+        )
+        job = Job.objects.enqueue(
+            "close_issue",
+            issue_id=issue.id,
+            action="wontfix",
+            labels_to_set=["wontfix"],
+        )
+        close_issue(job)
+        issue.refresh_from_db()
+        assert issue.status == IssueStatus.WONTFIX
+        assert not Job.objects.exclude(pk=job.pk).exists()
+
+    def test_core_jobs_close_issue_for_github_failure(self, issue, mocker):
+        mocker.patch(
+            "core.jobs.close_issue_with_labels",
+            return_value={"success": False, "error": "GitHub error"},
+        )
+        job = Job.objects.enqueue(
+            "close_issue", issue_id=issue.id, action="addressed", labels_to_set=[]
+        )
+        with pytest.raises(JobError, match="GitHub error"):
+            close_issue(job)
+
+        issue.refresh_from_db()
+        assert issue.status != IssueStatus.ADDRESSED
+
+    def test_core_jobs_close_issue_stores_github_result(self, issue, mocker):
+        mocker.patch(
+            "core.jobs.close_issue_with_labels", return_value={"success": True}
+        )
+        mocker.patch("core.jobs.Job.objects.enqueue", side_effect=Exception("error"))
+        job = Job.objects.create(
+            name="close_issue",
+            payload={"issue_id": issue.id, "action": "addressed", "labels_to_set": []},
+        )
+        with pytest.raises(Exception, match="error"):
+            close_issue(job)
+
+        job.refresh_from_db()
+        assert job.payload["github_result"] == {"success": True}
+        issue.refresh_from_db()
+        assert issue.status != IssueStatus.ADDRESSED
+
+    def test_core_jobs_close_issue_retry_skips_closing_on_github(self, issue, mocker):
+        mocked_close = mocker.patch("core.jobs.close_issue_with_labels")
+        job = Job.objects.enqueue(
+            "close_issue",
+            issue_id=issue.id,
+            action="addressed",
+            labels_to_set=["addressed"],
+            github_result={"success": True},
+        )
+        close_issue(job)
+        mocked_close.assert_not_called()
+        issue.refresh_from_db()
+        assert issue.status == IssueStatus.ADDRESSED
+        assert Job.objects.filter(name="process_issue_allocations").count() == 1
+
+    def test_core_jobs_add_reactions_reports_failed_urls(self, mocker):
+        mocked_add = mocker.patch(
+            "core.jobs.add_reactions_to_messages",
+            return_value={"url1": True, "url2": False},
+        )
+        job = Job(payload={"urls": ["url1", "url2"], "emoji": "emoji:1"})
+        assert add_reactions(job) == {
+            "message": "Reactions added to 1 messages.",
+            "failed": ["url2"],
+        }
+        mocked_add.assert_called_once_with(["url1", "url2"], "emoji:1")
+
+    def test_core_jobs_process_issue_allocations_sets_claimable(
+        self, contribution_with_issue, mocker
+    ):
+        issue = contribution_with_issue.issue
+        mocker.patch(
+            "core.jobs.process_allocations_for_contributions",
+            return_value=iter([("txid", [])]),
+        )
+        job = Job.objects.enqueue("process_issue_allocations", issue_id=issue.id)
+        result = process_issue_allocations(job)
+        assert result == {
+            "message": f"Issue #{issue.number} is claimable.",
+            "txids": ["txid"],
+        }
+        issue.refresh_from_db()
+        assert issue.status == IssueStatus.CLAIMABLE
+
+    def test_core_jobs_process_issue_allocations_for_no_allocations(
+        self, contribution_with_issue, mocker
+    ):
+        issue = contribution_with_issue.issue
+        mocker.patch(
+            "core.jobs.process_allocations_for_contributions",
+            return_value=iter([(False, [])]),
+        )
+        job = Job.objects.enqueue("process_issue_allocations", issue_id=issue.id)
+        result = process_issue_allocations(job)
+        assert result == {"message": f"No allocations made for issue #{issue.number}."}
+        issue.refresh_from_db()
+        assert issue.status != IssueStatus.CLAIMABLE
+
+    def test_core_jobs_invalidate_contribution_records_sent_reply(
+        self, contribution, mocker
+    ):
+        mocked_reply = mocker.patch("core.jobs.add_reply_to_message", return_value=True)
+        mocker.patch("core.jobs.add_reaction_to_message", return_value=False)
+        job = Job.objects.enqueue(
+            "invalidate_contribution",
+            contribution_id=contribution.id,
+            reaction="wontfix",
+            comment="reply",
+        )
+        with pytest.raises(JobError, match="Failed to add reaction"):
+            invalidate_contribution(job)
+
+        job.refresh_from_db()
+        assert job.payload["replied"] is True
+        mocked_reply.assert_called_once_with(contribution.url, "reply")
@@ -0,0 +1,134 @@
+"""Testing module for :py:mod:`core.middleware` module."""
+
+import pytest
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from core.middleware import QueryCountMiddleware, QueryStats, query_shape
+from core.models import Cycle
+from utils.constants.core import SQL_DUPLICATES_WARNING_THRESHOLD
+
+
+def _view(queries):
+    def view(request):
+        for pk in range(queries):
+            Cycle.objects.filter(pk=pk).first()
+
+        return HttpResponse("OK")
+
+    return view
+
+
+class TestCoreMiddlewareFunctions:
+    """Testing class for :py:mod:`core.middleware` functions."""
+
+    def test_core_middleware_query_shape_replaces_literals(self):
+        assert query_shape(
+            "SELECT * FROM t WHERE id = 12 AND name = 'it''s' LIMIT 21"
+        ) == ("SELECT * FROM t WHERE id = %s AND name = %s LIMIT %s")
+
+    def test_core_middleware_query_shape_collapses_in_lists(self):
+        assert query_shape("SELECT * FROM t WHERE id IN (%s, %s, %s)") == query_shape(
+            "SELECT * FROM t WHERE id IN (%s)"
+        )
+        assert query_shape("SELECT * FROM t WHERE id IN (1, 2)").endswith("IN (...)")
+
+    def test_core_middleware_query_shape_keeps_identifiers(self):
+        assert query_shape('SELECT "core_cycle"."id" FROM "core_cycle"') == (
+            'SELECT "core_cycle"."id" FROM "core_cycle"'
+        )
+
+
+@pytest.mark.django_db
+class TestCoreMiddlewareQueryStats:
+    """Testing class for :py:class:`core.middleware.QueryStats`."""
+
+    def test_core_middleware_querystats_init(self):
+        stats = QueryStats()
+        assert stats.count == 0
+        assert stats.duration == 0.0
+        assert stats.shapes == {}
+
+    def test_core_middleware_querystats_records_queries(self):
+        with QueryStats() as stats:
+            _view(3)(None)
+            Cycle.objects.count()
+
+        assert stats.count == 4
+        assert stats.duration > 0
+        assert len(stats.shapes) == 2
+        assert list(stats.duplicates.values()) == [3]
+        assert stats.redundant == 2
+
+    def test_core_middleware_querystats_stops_recording_on_exit(self):
+        with QueryStats() as stats:
+            Cycle.objects.count()
+
+        Cycle.objects.count()
+        assert stats.count == 1
+
+    def test_core_middleware_querystats_records_failed_query(self):
+        with QueryStats() as stats:
+            with pytest.raises(Exception):
+                Cycle.objects.raw("SELECT * FROM missing_table")[0]
+
+        assert stats.count == 1
+
+    def test_core_middleware_querystats_summary(self):
+        stats = QueryStats()
+        stats.count, stats.duration = 5, 0.0123
+        stats.shapes.update({"a": 3, "b": 2})
+        assert stats.summary() == "5 queries in 12.3ms, 3 repeated"
+
+
+@pytest.mark.django_db
+class TestCoreMiddlewareQueryCountMiddleware:
+    """Testing class for :py:class:`core.middleware.QueryCountMiddleware`."""
+
+    def _request(self, user):
+        request = RequestFactory().get("/cycles/")
+        request.user = user
+        return request
+
+    def test_core_middleware_querycountmiddleware_sets_request_stats(self):
+        request = self._request(AnonymousUser())
+        QueryCountMiddleware(_view(2))(request)
+        assert request.query_stats.count == 2
+
+    def test_core_middleware_querycountmiddleware_headers_for_superuser(self, mocker):
+        user = mocker.MagicMock(is_superuser=True)
+        response = QueryCountMiddleware(_view(2))(self._request(user))
+        assert response["X-SQL-Queries"] == "2"
+        assert float(response["X-SQL-Time"]) >= 0
+        assert response["X-SQL-Duplicates"] == "1"
+        assert response["Server-Timing"].startswith("sql;dur=")
+        assert response["Server-Timing"].endswith('desc="2 queries"')
+
+    def test_core_middleware_querycountmiddleware_no_headers_for_regular_user(
+        self, mocker
+    ):
+        user = mocker.MagicMock(is_superuser=False)
+        response = QueryCountMiddleware(_view(2))(self._request(user))
+        assert not response.has_header("X-SQL-Queries")
+        assert not response.has_header("Server-Timing")
+
+    def test_core_middleware_querycountmiddleware_no_headers_without_user(self):
+        request = RequestFactory().get("/cycles/")
+        response = QueryCountMiddleware(_view(1))(request)
+        assert not response.has_header("X-SQL-Queries")
+
+    def test_core_middleware_querycountmiddleware_logs_repeated_queries(self, mocker):
+        mocked_log = mocker.patch("core.middleware.logger.warning")
+        QueryCountMiddleware(_view(SQL_DUPLICATES_WARNING_THRESHOLD))(
+            self._request(AnonymousUser())
+        )
+        mocked_log.assert_called_once()
+        assert mocked_log.call_args[0][0].startswith("/cycles/: ")
+
+    def test_core_middleware_querycountmiddleware_no_log_below_threshold(self, mocker):
+        mocked_log = mocker.patch("core.middleware.logger.warning")
+        QueryCountMiddleware(_view(SQL_DUPLICATES_WARNING_THRESHOLD - 1))(
+            self._request(AnonymousUser())
+        )
+        mocked_log.assert_not_called()
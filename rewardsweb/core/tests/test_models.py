@@ -16,18 +16,30 @@ from core.models import (
     Contributor,
     ContributorManager,
     Cycle,
+    GitHubIssueMirror,
+    GitHubIssueMirrorManager,
     Handle,
     HandleManager,
     Issue,
     IssueManager,
     IssueStatus,
+    Job,
+    JobManager,
+    JobStatus,
     Profile,
     Reward,
     RewardType,
     SocialPlatform,
+    StatisticsSnapshot,
+    StatisticsSnapshotManager,
     SuperuserLog,
 )
-from utils.constants.core import HANDLE_EXCEPTIONS
+from utils.constants.core import (
+    HANDLE_EXCEPTIONS,
+    JOB_MAX_ATTEMPTS,
+    JOB_RETRY_DELAY,
+    STATISTICS_SNAPSHOT_ID,
+)
 
 user_model = get_user_model()
 
@@ -179,6 +191,39 @@ class TestCoreContributorManager:
             Contributor.objects.from_handle(handle)
             assert "Can't locate a single contributor" in str(exception.value)
 
+    # # search
+    @pytest.mark.django_db
+    def test_core_contributormanager_search_matches_name_and_handle(self):
+        platform = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        contributor1 = Contributor.objects.create(name="Charlie")
+        contributor2 = Contributor.objects.create(name="Bob")
+        contributor3 = Contributor.objects.create(name="Alice")
+        Handle.objects.create(
+            contributor=contributor2, platform=platform, handle="charlie_fan"
+        )
+        Handle.objects.create(
+            contributor=contributor2, platform=platform, handle="charlie_fan2"
+        )
+        Handle.objects.create(
+            contributor=contributor3, platform=platform, handle="alice_dev"
+        )
+        returned = list(Contributor.objects.search("CHARLIE"))
+        assert returned == [contributor1, contributor2]
+
+    @pytest.mark.django_db
+    def test_core_contributormanager_search_ranks_by_similarity(self):
+        platform = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        contributor1 = Contributor.objects.create(name="Bob Johnson")
+        contributor2 = Contributor.objects.create(name="John")
+        contributor3 = Contributor.objects.create(name="Jane")
+        Handle.objects.create(
+            contributor=contributor3, platform=platform, handle="johnny"
+        )
+        returned = list(Contributor.objects.search("john"))
+        assert returned == [contributor2, contributor3, contributor1]
+        assert returned[0].similarity > returned[1].similarity
+        assert returned[1].similarity > returned[2].similarity
+
 
 class TestCoreContributorModel:
     """Testing class for :class:`core.models.Contributor` model."""
@@ -606,6 +651,57 @@ class TestCoreContributorModel:
         )
         assert contributor.total_rewards == amount1 + amount2 + amount3
 
+    # # summary
+    @pytest.mark.django_db
+    def test_core_contributor_model_summary(self, django_assert_num_queries):
+        contributor = Contributor.objects.create(name="MyNamesu")
+        contributor2 = Contributor.objects.create(name="OtherNamesu")
+        cycle1 = Cycle.objects.create(start=datetime(2025, 3, 3), end="2025-05-31")
+        cycle2 = Cycle.objects.create(start=datetime(2024, 3, 3), end="2024-05-31")
+        platform = SocialPlatform.objects.create(name="platformsu", prefix="su")
+        reward_type = RewardType.objects.create(label="s1", name="s1")
+        reward1 = Reward.objects.create(type=reward_type, level=1, amount=50000)
+        reward2 = Reward.objects.create(type=reward_type, level=2, amount=15000)
+        contributions = [
+            Contribution.objects.create(
+                contributor=contributor,
+                cycle=cycle,
+                platform=platform,
+                reward=reward,
+                url=f"https://example.com/{index}",
+            )
+            for index, (cycle, reward) in enumerate(
+                [(cycle1, reward1), (cycle2, reward2), (cycle1, reward2)]
+            )
+        ]
+        Contribution.objects.create(
+            contributor=contributor2, cycle=cycle2, platform=platform, reward=reward1
+        )
+        with django_assert_num_queries(2):
+            returned = contributor.summary(size=2)
+
+        assert returned["name"] == "MyNamesu"
+        assert str(returned["first_cycle_end"]) == "2024-05-31"
+        assert returned["total_contributions"] == 3
+        assert returned["total_rewards"] == 80000
+        assert [c["id"] for c in returned["last_contributions"]] == [
+            contributions[2].id,
+            contributions[1].id,
+        ]
+        assert returned["last_contributions"][0]["contributor_name"] == "MyNamesu"
+        assert returned["last_contributions"][0]["reward"] == 15000
+
+    @pytest.mark.django_db
+    def test_core_contributor_model_summary_for_no_contributions(self):
+        contributor = Contributor.objects.create(name="MyNamesn")
+        assert contributor.summary() == {
+            "name": "MyNamesn",
+            "first_cycle_end": None,
+            "total_contributions": 0,
+            "total_rewards": 0,
+            "last_contributions": [],
+        }
+
 
 class TestCoreProfileModel:
     """Testing class for :class:`core.models.Profile` model."""
@@ -3690,3 +3786,474 @@ class TestCoreContributionModel:
         created_at = datetime.strptime(split[0][1:], "%d %b %H:%M")
         assert created_at <= datetime.now()
         assert split[1] == " Reward46 by MyName6"
+
+
+@pytest.fixture
+def statistics_records():
+    """Create cycle, contributor and two contributions with rewards."""
+    contributor = Contributor.objects.create(name="MyNamest")
+    cycle = Cycle.objects.create(start=datetime(2025, 3, 26))
+    platform = SocialPlatform.objects.create(name="platformst", prefix="st")
+    reward_type = RewardType.objects.create(label="st", name="Rewardst")
+    reward1 = Reward.objects.create(type=reward_type, level=1, amount=20000)
+    reward2 = Reward.objects.create(type=reward_type, level=2, amount=50000)
+    return [
+        Contribution.objects.create(
+            contributor=contributor, cycle=cycle, platform=platform, reward=reward
+        )
+        for reward in (reward1, reward2)
+    ]
+
+
+class TestCoreStatisticsSnapshotManager:
+    """Testing class for :class:`core.models.StatisticsSnapshotManager` class."""
+
+    def test_core_statisticssnapshotmanager_is_default_manager(self):
+        assert isinstance(StatisticsSnapshot.objects, StatisticsSnapshotManager)
+
+    # # adjust
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_adjust(self):
+        StatisticsSnapshot.objects.create(
+            pk=STATISTICS_SNAPSHOT_ID, num_contributions=5, total_rewards=100
+        )
+        StatisticsSnapshot.objects.adjust(num_contributions=-1, total_rewards=50)
+        snapshot = StatisticsSnapshot.objects.get(pk=STATISTICS_SNAPSHOT_ID)
+        assert snapshot.num_contributions == 4
+        assert snapshot.total_rewards == 150
+
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_adjust_for_missing_snapshot(self):
+        StatisticsSnapshot.objects.adjust(num_contributions=1)
+        assert StatisticsSnapshot.objects.count() == 0
+
+    # # compute
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_compute(self, statistics_records):
+        assert StatisticsSnapshot.objects.compute() == {
+            "num_cycles": 1,
+            "num_contributors": 1,
+            "num_contributions": 2,
+            "total_rewards": 70000,
+        }
+
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_compute_for_empty_database(self):
+        assert StatisticsSnapshot.objects.compute() == {
+            "num_cycles": 0,
+            "num_contributors": 0,
+            "num_contributions": 0,
+            "total_rewards": 0,
+        }
+
+    # # current
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_current_creates_snapshot(
+        self, statistics_records
+    ):
+        snapshot = StatisticsSnapshot.objects.current()
+        assert snapshot.pk == STATISTICS_SNAPSHOT_ID
+        assert snapshot.num_contributions == 2
+        assert snapshot.total_rewards == 70000
+
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_current_reads_snapshot(
+        self, django_assert_num_queries
+    ):
+        StatisticsSnapshot.objects.create(pk=STATISTICS_SNAPSHOT_ID, num_cycles=7)
+        with django_assert_num_queries(1):
+            snapshot = StatisticsSnapshot.objects.current()
+
+        assert snapshot.num_cycles == 7
+
+    # # reconcile
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_reconcile_for_new_snapshot(
+        self, statistics_records
+    ):
+        snapshot, differences = StatisticsSnapshot.objects.reconcile()
+        assert snapshot.num_cycles == 1
+        assert differences == {
+            "num_cycles": (None, 1),
+            "num_contributors": (None, 1),
+            "num_contributions": (None, 2),
+            "total_rewards": (None, 70000),
+        }
+
+    @pytest.mark.django_db
+    def test_core_statisticssnapshotmanager_reconcile_for_drift(
+        self, statistics_records
+    ):
+        StatisticsSnapshot.objects.reconcile()
+        StatisticsSnapshot.objects.filter(pk=STATISTICS_SNAPSHOT_ID).update(
+            num_contributions=7
+        )
+        snapshot, differences = StatisticsSnapshot.objects.reconcile()
+        assert snapshot.num_contributions == 2
+        assert differences == {"num_contributions": (7, 2)}
+        assert StatisticsSnapshot.objects.reconcile()[1] == {}
+
+
+class TestCoreStatisticsSnapshotModel:
+    """Testing class for :class:`core.models.StatisticsSnapshot` model."""
+
+    # # fields characteristics
+    @pytest.mark.parametrize(
+        "name,typ",
+        [
+            ("num_cycles", models.IntegerField),
+            ("num_contributors", models.IntegerField),
+            ("num_contributions", models.IntegerField),
+            ("total_rewards", models.BigIntegerField),
+            ("reconciled_at", models.DateTimeField),
+        ],
+    )
+    def test_core_statisticssnapshot_model_fields(self, name, typ):
+        assert hasattr(StatisticsSnapshot, name)
+        assert isinstance(StatisticsSnapshot._meta.get_field(name), typ)
+
+    def test_core_statisticssnapshot_model_reconciled_at_is_auto_now(self):
+        assert StatisticsSnapshot._meta.get_field("reconciled_at").auto_now
+
+    # # __str__
+    def test_core_statisticssnapshot_model_string_representation(self):
+        snapshot = StatisticsSnapshot(
+            num_cycles=1, num_contributors=2, num_contributions=3, total_rewards=4
+        )
+        assert str(snapshot) == ("1 cycles, 2 contributors, 3 contributions, 4 rewards")
+
+
+def _github_issue(number, **kwargs):
+    """Return GitHub REST API issue object with provided `number`."""
+    issue = {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": None,
+        "state": "open",
+        "labels": [{"name": "bug"}, {"name": "high priority"}],
+        "assignees": [{"login": "user1"}],
+        "user": {"login": "author"},
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "comments": 2,
+        "created_at": "2025-01-01T10:00:00Z",
+        "updated_at": "2025-01-02T10:00:00Z",
+        "closed_at": None,
+    }
+    issue.update(kwargs)
+    return issue
+
+
+@pytest.mark.django_db
+class TestCoreGitHubIssueMirrorManager:
+    """Testing class for :class:`core.models.GitHubIssueMirrorManager` class."""
+
+    def test_core_githubissuemirror_objects_is_githubissuemirrormanager_instance(
+        self,
+    ):
+        assert isinstance(GitHubIssueMirror.objects, GitHubIssueMirrorManager)
+
+    def test_core_githubissuemirrormanager_update_from_github_creates_mirrors(self):
+        returned = GitHubIssueMirror.objects.update_from_github(
+            [_github_issue(5), _github_issue(6, pull_request={})]
+        )
+        assert returned == 1
+        mirror = GitHubIssueMirror.objects.get()
+        assert mirror.number == 5
+        assert mirror.body == ""
+        assert mirror.labels == ["bug", "high priority"]
+        assert mirror.assignees == ["user1"]
+        assert mirror.user == "author"
+        assert mirror.comments == 2
+        assert mirror.updated_at == datetime.fromisoformat("2025-01-02T10:00:00+00:00")
+        assert mirror.closed_at is None
+
+    def test_core_githubissuemirrormanager_update_from_github_updates_mirrors(self):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(5)])
+        synced_at = GitHubIssueMirror.objects.get().synced_at
+        returned = GitHubIssueMirror.objects.update_from_github(
+            [
+                _github_issue(
+                    5,
+                    state="closed",
+                    labels=[{"name": "addressed"}],
+                    user=None,
+                    closed_at="2025-01-03T10:00:00Z",
+                ),
+                _github_issue(7),
+            ]
+        )
+        assert returned == 2
+        assert GitHubIssueMirror.objects.count() == 2
+        mirror = GitHubIssueMirror.objects.get(number=5)
+        assert mirror.state == "closed"
+        assert mirror.labels == ["addressed"]
+        assert mirror.user is None
+        assert mirror.closed_at == datetime.fromisoformat("2025-01-03T10:00:00+00:00")
+        assert mirror.synced_at >= synced_at
+
+    def test_core_githubissuemirrormanager_update_from_github_skips_stale_issues(
+        self,
+    ):
+        GitHubIssueMirror.objects.update_from_github(
+            [_github_issue(5, state="closed", updated_at="2025-01-03T10:00:00Z")]
+        )
+        returned = GitHubIssueMirror.objects.update_from_github(
+            [
+                _github_issue(5, updated_at="2025-01-02T10:00:00Z"),
+                _github_issue(7, state="closed", updated_at="2025-01-03T10:00:00Z"),
+                _github_issue(7, updated_at="2025-01-02T10:00:00Z"),
+            ]
+        )
+        assert returned == 1
+        assert GitHubIssueMirror.objects.get(number=5).state == "closed"
+        assert GitHubIssueMirror.objects.get(number=7).state == "closed"
+
+
+class TestCoreGitHubIssueMirrorModel:
+    """Testing class for :class:`core.models.GitHubIssueMirror` model."""
+
+    # # fields characteristics
+    @pytest.mark.parametrize(
+        "name,typ",
+        [
+            ("number", models.IntegerField),
+            ("title", models.CharField),
+            ("body", models.TextField),
+            ("state", models.CharField),
+            ("labels", models.JSONField),
+            ("assignees", models.JSONField),
+            ("user", models.CharField),
+            ("html_url", models.URLField),
+            ("comments", models.IntegerField),
+            ("created_at", models.DateTimeField),
+            ("updated_at", models.DateTimeField),
+            ("closed_at", models.DateTimeField),
+            ("synced_at", models.DateTimeField),
+        ],
+    )
+    def test_core_githubissuemirror_model_fields(self, name, typ):
+        assert hasattr(GitHubIssueMirror, name)
+        assert isinstance(GitHubIssueMirror._meta.get_field(name), typ)
+
+    def test_core_githubissuemirror_model_number_is_unique(self):
+        assert GitHubIssueMirror._meta.get_field("number").unique
+
+    def test_core_githubissuemirror_model_ordering(self):
+        assert GitHubIssueMirror._meta.ordering == ["-number"]
+
+    # # __str__
+    def test_core_githubissuemirror_model_string_representation(self):
+        assert str(GitHubIssueMirror(number=5, title="Title")) == "#5 Title"
+
+    # # is_fresh
+    def test_core_githubissuemirror_model_is_fresh(self):
+        mirror = GitHubIssueMirror(synced_at=timezone.now() - timedelta(seconds=30))
+        assert mirror.is_fresh() is True
+        assert mirror.is_fresh(max_age=20) is False
+
+    # # as_issue_data
+    def test_core_githubissuemirror_model_as_issue_data(self):
+        created_at = datetime.fromisoformat("2025-01-01T00:00:00+00:00")
+        mirror = GitHubIssueMirror(
+            number=5,
+            title="Title",
+            body="Body",
+            state="open",
+            labels=["bug"],
+            assignees=["user1"],
+            user="author",
+            html_url="https://github.com/owner/repo/issues/5",
+            comments=1,
+            created_at=created_at,
+            updated_at=created_at,
+        )
+        assert mirror.as_issue_data() == {
+            "number": 5,
+            "title": "Title",
+            "body": "Body",
+            "state": "open",
+            "created_at": created_at,
+            "updated_at": created_at,
+            "closed_at": None,
+            "labels": ["bug"],
+            "assignees": ["user1"],
+            "user": "author",
+            "html_url": "https://github.com/owner/repo/issues/5",
+            "comments": 1,
+        }
+
+
+@pytest.mark.django_db
+class TestCoreJobManager:
+    """Testing class for :class:`core.models.JobManager` class."""
+
+    def test_core_job_objects_is_jobmanager_instance(self):
+        assert isinstance(Job.objects, JobManager)
+
+    # # enqueue
+    def test_core_jobmanager_enqueue_creates_queued_job(self):
+        user = user_model.objects.create(username="jobuser")
+        job = Job.objects.enqueue("name", user=user, issue_id=5, action="addressed")
+        assert job.name == "name"
+        assert job.user == user
+        assert job.payload == {"issue_id": 5, "action": "addressed"}
+        assert job.status == JobStatus.QUEUED
+        assert job.attempts == 0
+        assert job.max_attempts == JOB_MAX_ATTEMPTS
+
+    def test_core_jobmanager_enqueue_for_provided_max_attempts(self):
+        assert Job.objects.enqueue("name", max_attempts=1).max_attempts == 1
+
+    # # claim
+    def test_core_jobmanager_claim_for_no_jobs(self):
+        assert Job.objects.claim() is None
+
+    def test_core_jobmanager_claim_locks_oldest_queued_job(self):
+        first = Job.objects.enqueue("first")
+        Job.objects.enqueue("second")
+        job = Job.objects.claim(visibility_timeout=60)
+        assert job == first
+        job.refresh_from_db()
+        assert job.status == JobStatus.RUNNING
+        assert job.attempts == 1
+        assert job.locked_until > timezone.now() + timedelta(seconds=50)
+
+    def test_core_jobmanager_claim_skips_delayed_and_running_jobs(self):
+        Job.objects.create(name="delayed", run_at=timezone.now() + timedelta(hours=1))
+        Job.objects.create(
+            name="running",
+            status=JobStatus.RUNNING,
+            locked_until=timezone.now() + timedelta(hours=1),
+        )
+        assert Job.objects.claim() is None
+
+    def test_core_jobmanager_claim_reclaims_job_with_expired_lock(self):
+        job = Job.objects.create(
+            name="running",
+            status=JobStatus.RUNNING,
+            attempts=1,
+            locked_until=timezone.now() - timedelta(seconds=1),
+        )
+        assert Job.objects.claim() == job
+        job.refresh_from_db()
+        assert job.attempts == 2
+
+    def test_core_jobmanager_claim_fails_expired_job_out_of_attempts(self):
+        job = Job.objects.create(
+            name="running",
+            status=JobStatus.RUNNING,
+            attempts=1,
+            max_attempts=1,
+            locked_until=timezone.now() - timedelta(seconds=1),
+        )
+        assert Job.objects.claim() is None
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "Visibility timeout expired."
+        assert job.finished_at is not None
+
+
+class TestCoreJobModel:
+    """Testing class for :class:`core.models.Job` model."""
+
+    # # fields characteristics
+    @pytest.mark.parametrize(
+        "name,typ",
+        [
+            ("name", models.CharField),
+            ("payload", models.JSONField),
+            ("user", models.ForeignKey),
+            ("status", models.CharField),
+            ("attempts", models.PositiveSmallIntegerField),
+            ("max_attempts", models.PositiveSmallIntegerField),
+            ("run_at", models.DateTimeField),
+            ("locked_until", models.DateTimeField),
+            ("result", models.JSONField),
+            ("error", models.TextField),
+            ("created_at", models.DateTimeField),
+            ("updated_at", models.DateTimeField),
+            ("finished_at", models.DateTimeField),
+        ],
+    )
+    def test_core_job_model_fields(self, name, typ):
+        assert hasattr(Job, name)
+        assert isinstance(Job._meta.get_field(name), typ)
+
+    def test_core_job_model_ordering(self):
+        assert Job._meta.ordering == ["-id"]
+
+    def test_core_job_model_status_index(self):
+        index = Job._meta.indexes[0]
+        assert index.fields == ["status", "run_at"]
+        assert index.name == "job_status_run_at_idx"
+
+    # # __str__
+    def test_core_job_model_string_representation(self):
+        assert str(Job(id=5, name="close_issue")) == "close_issue #5 [queued]"
+
+    # # is_finished
+    @pytest.mark.parametrize(
+        "status,expected",
+        [
+            (JobStatus.QUEUED, False),
+            (JobStatus.RUNNING, False),
+            (JobStatus.SUCCEEDED, True),
+            (JobStatus.FAILED, True),
+        ],
+    )
+    def test_core_job_model_is_finished(self, status, expected):
+        assert Job(status=status).is_finished is expected
+
+    # # message
+    def test_core_job_model_message_for_succeeded_job(self):
+        job = Job(status=JobStatus.SUCCEEDED, result={"message": "Done."})
+        assert job.message == "Done."
+        assert Job(status=JobStatus.SUCCEEDED).message == ""
+
+    def test_core_job_model_message_for_unfinished_job(self):
+        assert Job(status=JobStatus.QUEUED, error="error").message == "error"
+
+    # # succeed
+    @pytest.mark.django_db
+    def test_core_job_model_succeed(self):
+        job = Job.objects.create(name="name", status=JobStatus.RUNNING, error="old")
+        job.succeed({"message": "Done."})
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.result == {"message": "Done."}
+        assert job.error == ""
+        assert job.locked_until is None
+        assert job.finished_at is not None
+
+    # # fail
+    @pytest.mark.django_db
+    def test_core_job_model_fail(self):
+        job = Job.objects.create(name="name", status=JobStatus.RUNNING)
+        job.fail("error")
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "error"
+        assert job.finished_at is not None
+
+    # # retry_or_fail
+    @pytest.mark.django_db
+    def test_core_job_model_retry_or_fail_queues_job_with_backoff(self):
+        job = Job.objects.create(name="name", status=JobStatus.RUNNING, attempts=2)
+        start = timezone.now()
+        job.retry_or_fail("error")
+        job.refresh_from_db()
+        assert job.status == JobStatus.QUEUED
+        assert job.error == "error"
+        assert job.locked_until is None
+        assert job.run_at >= start + timedelta(seconds=JOB_RETRY_DELAY * 2)
+        assert job.finished_at is None
+
+    @pytest.mark.django_db
+    def test_core_job_model_retry_or_fail_fails_job_out_of_attempts(self):
+        job = Job.objects.create(
+            name="name", status=JobStatus.RUNNING, attempts=1, max_attempts=1
+        )
+        job.retry_or_fail("error")
+        job.refresh_from_db()
+        assert job.status == JobStatus.FAILED
+        assert job.error == "error"
@@ -0,0 +1,261 @@
+"""Testing module for :py:mod:`core.pagination` module."""
+
+import pytest
+from django.core import signing
+from django.db.models.functions import Lower
+from django.http import Http404
+from django.urls import reverse
+from django.views.generic import ListView
+
+from core.models import Contribution, Contributor, Issue, IssueStatus
+from core.pagination import (
+    CURSOR_SALT,
+    InvalidCursor,
+    KeysetPage,
+    KeysetPaginationMixin,
+    KeysetPaginator,
+    decode_cursor,
+    encode_cursor,
+)
+from core.views import ContributorListView
+
+
+@pytest.fixture
+def contributors():
+    """Create five contributors with mixed case names."""
+    return [
+        Contributor.objects.create(name=name)
+        for name in ["delta", "Alpha", "charlie", "Echo", "bravo"]
+    ]
+
+
+@pytest.fixture
+def unconfirmed_contributions(contribution):
+    """Create 25 unconfirmed and one confirmed contribution."""
+    contributions = [contribution]
+    for index in range(24):
+        contributions.append(
+            Contribution.objects.create(
+                contributor=contribution.contributor,
+                cycle=contribution.cycle,
+                platform=contribution.platform,
+                reward=contribution.reward,
+                url=f"https://example.com/{index}",
+            )
+        )
+
+    Contribution.objects.create(
+        contributor=contribution.contributor,
+        cycle=contribution.cycle,
+        platform=contribution.platform,
+        reward=contribution.reward,
+        confirmed=True,
+    )
+    return contributions
+
+
+class TestCorePaginationCursorFunctions:
+    """Testing class for :py:mod:`core.pagination` cursor functions."""
+
+    def test_core_pagination_encode_cursor_is_signed(self):
+        token = encode_cursor(["name", 5])
+        assert "name" not in token
+        assert signing.loads(token, salt=CURSOR_SALT) == ["name", 5]
+
+    def test_core_pagination_decode_cursor_returns_values(self):
+        assert decode_cursor(encode_cursor(["name", 5]), 2) == ["name", 5]
+
+    def test_core_pagination_decode_cursor_for_tampered_token(self):
+        token = encode_cursor([5])
+        with pytest.raises(InvalidCursor):
+            decode_cursor(token[:-1] + ("a" if token[-1] != "a" else "b"), 1)
+
+    def test_core_pagination_decode_cursor_for_other_salt(self):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(signing.dumps([5]), 1)
+
+    def test_core_pagination_decode_cursor_for_wrong_length(self):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(encode_cursor([5]), 2)
+
+    def test_core_pagination_decode_cursor_for_non_list(self):
+        with pytest.raises(InvalidCursor):
+            decode_cursor(signing.dumps({"id": 5}, salt=CURSOR_SALT), 1)
+
+
+class TestCorePaginationKeysetPage:
+    """Testing class for :class:`core.pagination.KeysetPage`."""
+
+    def test_core_pagination_keysetpage_sequence_behavior(self):
+        page = KeysetPage([1, 2, 3], None, None, None)
+        assert len(page) == 3
+        assert list(page) == [1, 2, 3]
+        assert repr(page) == "<KeysetPage of 3 objects>"
+
+    def test_core_pagination_keysetpage_for_first_and_last_page(self):
+        page = KeysetPage([1], None, None, None)
+        assert page.has_next() is False
+        assert page.has_previous() is False
+
+    def test_core_pagination_keysetpage_for_middle_page(self):
+        page = KeysetPage([1], None, "previous", "next")
+        assert page.has_next() is True
+        assert page.has_previous() is True
+
+
+@pytest.mark.django_db
+class TestCorePaginationKeysetPaginator:
+    """Testing class for :class:`core.pagination.KeysetPaginator`."""
+
+    def test_core_pagination_keysetpaginator_walks_all_pages(self, contributors):
+        paginator = KeysetPaginator(
+            Contributor.objects.annotate(lower_name=Lower("name")),
+            2,
+            ("lower_name", "id"),
+        )
+        names, cursor = [], None
+        for _ in range(3):
+            page = paginator.page(cursor)
+            names.extend(contributor.name for contributor in page)
+            cursor = page.next_cursor
+
+        assert names == ["Alpha", "bravo", "charlie", "delta", "Echo"]
+        assert cursor is None
+
+    def test_core_pagination_keysetpaginator_descending_ordering(self, contributors):
+        paginator = KeysetPaginator(Contributor.objects.all(), 3, ("-id",))
+        first = paginator.page()
+        second = paginator.page(first.next_cursor)
+        assert [c.id for c in first] == [c.id for c in contributors[::-1][:3]]
+        assert [c.id for c in second] == [c.id for c in contributors[::-1][3:]]
+        assert second.has_next() is False
+        assert second.has_previous() is True
+
+    def test_core_pagination_keysetpaginator_exact_page_size(self, contributors):
+        page = KeysetPaginator(Contributor.objects.all(), 5, ("id",)).page()
+        assert len(page) == 5
+        assert page.has_next() is False
+
+    def test_core_pagination_keysetpaginator_page_queries_once(
+        self, contributors, django_assert_num_queries
+    ):
+        paginator = KeysetPaginator(Contributor.objects.all(), 2, ("id",))
+        cursor = paginator.page().next_cursor
+        with django_assert_num_queries(1):
+            paginator.page(cursor)
+
+    def test_core_pagination_keysetpaginator_count(self, contributors):
+        assert KeysetPaginator(Contributor.objects.all(), 2, ("id",)).count == 5
+
+    def test_core_pagination_keysetpaginator_invalid_cursor(self):
+        with pytest.raises(InvalidCursor):
+            KeysetPaginator(Contributor.objects.all(), 2, ("id",)).page("invalid")
+
+
+class TestCorePaginationKeysetPaginationMixin:
+    """Testing class for :class:`core.pagination.KeysetPaginationMixin`."""
+
+    def test_core_pagination_keysetpaginationmixin_defaults(self):
+        assert KeysetPaginationMixin.keyset_ordering == ("-id",)
+        assert KeysetPaginationMixin.cursor_kwarg == "cursor"
+        assert KeysetPaginationMixin.load_more_template is None
+
+    def test_core_pagination_keysetpaginationmixin_get_keyset_ordering(self):
+        view = type("View", (KeysetPaginationMixin, ListView), {})()
+        assert view.get_keyset_ordering() == ("-id",)
+
+    def test_core_pagination_keysetpaginationmixin_is_load_more_request(self, rf):
+        view = type("View", (KeysetPaginationMixin, ListView), {})()
+        view.setup(rf.get("/", {"cursor": "abc"}))
+        assert view.is_load_more_request() is False
+        view.setup(rf.get("/", {"cursor": "abc"}, HTTP_HX_REQUEST="true"))
+        assert view.is_load_more_request() is True
+        view.setup(rf.get("/", HTTP_HX_REQUEST="true"))
+        assert view.is_load_more_request() is False
+
+    @pytest.mark.django_db
+    def test_core_pagination_keysetpaginationmixin_invalid_cursor_raises_404(self, rf):
+        view = type("View", (KeysetPaginationMixin, ListView), {})()
+        view.setup(rf.get("/", {"cursor": "invalid"}))
+        with pytest.raises(Http404):
+            view.paginate_queryset(Contributor.objects.all(), 2)
+
+
+@pytest.mark.django_db
+class TestCorePaginationViews:
+    """Testing class for keyset paginated views."""
+
+    def test_core_pagination_indexview_load_more(
+        self, client, unconfirmed_contributions
+    ):
+        response = client.get(reverse("index"))
+        page = response.context["page_obj"]
+        assert [c.id for c in page] == [
+            c.id for c in unconfirmed_contributions[::-1][:20]
+        ]
+        assert "Load more" in response.content.decode()
+
+        response = client.get(
+            reverse("index"), {"cursor": page.next_cursor}, HTTP_HX_REQUEST="true"
+        )
+        content = response.content.decode()
+        assert "<html" not in content
+        assert "Load more" not in content
+        assert content.count("Pending</span>") == 5
+
+    def test_core_pagination_indexview_invalid_cursor(self, client):
+        response = client.get(reverse("index"), {"cursor": "invalid"})
+        assert response.status_code == 404
+
+    def test_core_pagination_unconfirmedcontributionsview_load_more(
+        self, client, superuser, unconfirmed_contributions
+    ):
+        client.force_login(superuser)
+        url = reverse("unconfirmed_contributions")
+        page = client.get(url).context["page_obj"]
+        response = client.get(url, {"cursor": page.next_cursor}, HTTP_HX_REQUEST="true")
+        content = response.content.decode()
+        assert "<html" not in content
+        assert content.count("Pending Review") == 5
+
+    def test_core_pagination_issuelistview_load_more(self, client, superuser):
+        for number in range(1, 24):
+            Issue.objects.create(number=number)
+
+        Issue.objects.create(number=100, status=IssueStatus.ARCHIVED)
+        client.force_login(superuser)
+        page = client.get(reverse("issues")).context["page_obj"]
+        assert [issue.number for issue in page] == list(range(23, 3, -1))
+        response = client.get(
+            reverse("issues"), {"cursor": page.next_cursor}, HTTP_HX_REQUEST="true"
+        )
+        content = response.content.decode()
+        assert "<html" not in content
+        assert "#3<" in content and "#1<" in content and "#4<" not in content
+
+    def test_core_pagination_contributorlistview_search_keyset_ordering(self, rf):
+        view = ContributorListView()
+        view.setup(rf.get("/"))
+        assert view.get_keyset_ordering() == ("lower_name", "id")
+        view.setup(rf.get("/", {"q": "user"}))
+        assert view.get_keyset_ordering() == ("-similarity", "lower_name", "id")
+
+    def test_core_pagination_contributorlistview_load_more_keeps_search(self, client):
+        for index in range(22):
+            Contributor.objects.create(name=f"User{index:02}")
+
+        Contributor.objects.create(name="other")
+        response = client.get(reverse("contributors"), {"q": "user"})
+        page = response.context["page_obj"]
+        assert page.paginator.count == 22
+        assert "q=user" in response.content.decode()
+
+        response = client.get(
+            reverse("contributors"),
+            {"cursor": page.next_cursor, "q": "user"},
+            HTTP_HX_REQUEST="true",
+        )
+        content = response.content.decode()
+        assert "Search Results" not in content
+        assert "User20" in content and "User21" in content
+        assert "other" not in content
@@ -0,0 +1,107 @@
+"""Testing module for SQL query budgets of :py:mod:`core.views` views."""
+
+import pytest
+from django.urls import reverse
+
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Issue,
+    IssueStatus,
+)
+
+
+@pytest.fixture
+def populated(superuser, social_platform, reward):
+    """Create cycles, contributors with handles, issues and contributions.
+
+    Every collection has several records, so views running a query per
+    record exceed their budgets.
+    """
+    cycles = [
+        Cycle.objects.create(start="2023-01-01", end="2023-01-31"),
+        Cycle.objects.create(start="2023-02-01", end="2023-02-28"),
+    ]
+    issues = [
+        Issue.objects.create(number=number, status=IssueStatus.CREATED)
+        for number in (1, 2)
+    ]
+    contributors = []
+    for index in range(4):
+        contributor = Contributor.objects.create(name=f"user{index}")
+        Handle.objects.create(
+            contributor=contributor, platform=social_platform, handle=f"user{index}"
+        )
+        contributors.append(contributor)
+        for cycle in cycles:
+            Contribution.objects.create(
+                contributor=contributor,
+                cycle=cycle,
+                platform=social_platform,
+                reward=reward,
+                issue=issues[index % 2],
+                percentage=50.0,
+                url=f"https://example.com/{index}/{cycle.id}",
+                confirmed=index % 2 == 0,
+            )
+
+    return {"cycles": cycles, "issues": issues, "contributors": contributors}
+
+
+def _url(name, populated):
+    kwargs = {
+        "cycle_detail": {"pk": populated["cycles"][0].pk},
+        "contributor_detail": {"pk": populated["contributors"][0].pk},
+        "contribution_detail": {
+            "pk": populated["contributors"][0].contribution_set.first().pk
+        },
+        "contribution_edit": {
+            "pk": populated["contributors"][0].contribution_set.first().pk
+        },
+        "issue_detail": {"pk": populated["issues"][0].pk},
+    }.get(name, {})
+    return reverse(name, kwargs=kwargs)
+
+
+@pytest.mark.django_db
+class TestCoreViewsQueryBudgets:
+    """Testing class for SQL query budgets of website's views."""
+
+    @pytest.mark.parametrize(
+        "name,max_queries,max_repeated",
+        [
+            ("index", 16, 0),
+            ("cycles", 5, 0),
+            ("cycle_detail", 5, 0),
+            ("contributors", 18, 0),
+            ("contributor_detail", 6, 0),
+            ("contribution_detail", 10, 0),
+            ("contribution_edit", 10, 0),
+            ("issues", 7, 0),
+            ("issue_detail", 6, 0),
+            ("unconfirmed_contributions", 4, 0),
+        ],
+    )
+    def test_core_views_query_budget(
+        self,
+        client,
+        superuser,
+        populated,
+        query_budget,
+        mocker,
+        name,
+        max_queries,
+        max_repeated,
+    ):
+        mocker.patch(
+            "core.views.issue_by_number",
+            return_value={"success": False, "error": "error"},
+        )
+        client.force_login(superuser)
+        url = _url(name, populated)
+        with query_budget(max_queries, max_repeated):
+            response = client.get(url)
+
+        assert response.status_code == 200
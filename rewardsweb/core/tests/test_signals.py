@@ -1,9 +1,22 @@
 """Testing module for :py:mod:`core.signals` module."""
 
+from datetime import datetime
+
 import pytest
 from django.contrib.auth import get_user_model
 
-from core.models import Profile
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Issue,
+    Profile,
+    Reward,
+    RewardType,
+    SocialPlatform,
+    StatisticsSnapshot,
+)
 
 user_model = get_user_model()
 
@@ -27,3 +40,185 @@ class TestCoreSignals:
         assert Profile.objects.get(pk=profile_id).github_token != github_token
         user.save()
         assert Profile.objects.get(pk=profile_id).github_token == github_token
+
+
+@pytest.fixture
+def snapshot():
+    """Create cycle, contributor and contribution and reconcile the snapshot."""
+    contributor = Contributor.objects.create(name="signalsuser")
+    cycle = Cycle.objects.create(start=datetime(2025, 3, 26))
+    platform = SocialPlatform.objects.create(name="signals", prefix="sg")
+    reward_type = RewardType.objects.create(label="sg", name="Signals")
+    reward = Reward.objects.create(type=reward_type, level=1, amount=20000)
+    Contribution.objects.create(
+        contributor=contributor, cycle=cycle, platform=platform, reward=reward
+    )
+    StatisticsSnapshot.objects.reconcile()
+    return StatisticsSnapshot.objects.current()
+
+
+def _assert_snapshot_is_reconciled():
+    """Assert incrementally maintained snapshot equals computed statistics."""
+    snapshot = StatisticsSnapshot.objects.current()
+    assert {
+        field: getattr(snapshot, field)
+        for field in StatisticsSnapshot.objects.compute()
+    } == StatisticsSnapshot.objects.compute()
+
+
+class TestCoreSignalsStatisticsSnapshot:
+    """Testing class for :py:mod:`core.signals` statistics snapshot receivers."""
+
+    @pytest.mark.django_db
+    def test_core_signals_cycle_creation_and_deletion(self, snapshot):
+        cycle = Cycle.objects.create(start=datetime(2025, 6, 26))
+        assert StatisticsSnapshot.objects.current().num_cycles == 2
+        cycle.save()
+        assert StatisticsSnapshot.objects.current().num_cycles == 2
+        cycle.delete()
+        assert StatisticsSnapshot.objects.current().num_cycles == 1
+
+    @pytest.mark.django_db
+    def test_core_signals_contributor_creation_and_deletion(self, snapshot):
+        contributor = Contributor.objects.create(name="signalsuser2")
+        assert StatisticsSnapshot.objects.current().num_contributors == 2
+        contributor.name = "signalsuser3"
+        contributor.save()
+        assert StatisticsSnapshot.objects.current().num_contributors == 2
+        contributor.delete()
+        assert StatisticsSnapshot.objects.current().num_contributors == 1
+
+    @pytest.mark.django_db
+    def test_core_signals_contribution_creation(self, snapshot):
+        contribution = Contribution.objects.first()
+        reward = Reward.objects.create(
+            type=contribution.reward.type, level=2, amount=30000
+        )
+        Contribution.objects.create(
+            contributor=contribution.contributor,
+            cycle=contribution.cycle,
+            platform=contribution.platform,
+            reward=reward,
+        )
+        current = StatisticsSnapshot.objects.current()
+        assert current.num_contributions == 2
+        assert current.total_rewards == 50000
+        _assert_snapshot_is_reconciled()
+
+    @pytest.mark.django_db
+    def test_core_signals_contribution_reward_change(self, snapshot):
+        contribution = Contribution.objects.first()
+        contribution.reward = Reward.objects.create(
+            type=contribution.reward.type, level=3, amount=35000
+        )
+        contribution.save()
+        assert StatisticsSnapshot.objects.current().total_rewards == 35000
+        contribution.confirmed = True
+        contribution.save(update_fields=["confirmed"])
+        assert StatisticsSnapshot.objects.current().total_rewards == 35000
+        _assert_snapshot_is_reconciled()
+
+    @pytest.mark.django_db
+    def test_core_signals_contribution_save_without_reward_change(
+        self, snapshot, django_assert_num_queries
+    ):
+        contribution = Contribution.objects.first()
+        contribution.confirmed = True
+        with django_assert_num_queries(1):
+            contribution.save(update_fields=["confirmed"])
+
+        assert StatisticsSnapshot.objects.current().total_rewards == 20000
+
+    @pytest.mark.django_db
+    def test_core_signals_contribution_deletion(self, snapshot):
+        Contribution.objects.first().delete()
+        current = StatisticsSnapshot.objects.current()
+        assert current.num_contributions == 0
+        assert current.total_rewards == 0
+
+    @pytest.mark.django_db
+    def test_core_signals_contribution_deletion_for_fetched_reward(
+        self, snapshot, django_assert_num_queries
+    ):
+        contribution = Contribution.objects.select_related("reward").first()
+        with django_assert_num_queries(2):
+            contribution.delete()
+
+        assert StatisticsSnapshot.objects.current().total_rewards == 0
+
+    @pytest.mark.django_db
+    def test_core_signals_reward_amount_change(self, snapshot):
+        contribution = Contribution.objects.first()
+        Contribution.objects.create(
+            contributor=contribution.contributor,
+            cycle=contribution.cycle,
+            platform=contribution.platform,
+            reward=contribution.reward,
+        )
+        reward = Reward.objects.get()
+        reward.amount = 25000
+        reward.save()
+        assert StatisticsSnapshot.objects.current().total_rewards == 50000
+        reward.active = False
+        reward.save(update_fields=["active"])
+        reward.save()
+        assert StatisticsSnapshot.objects.current().total_rewards == 50000
+        _assert_snapshot_is_reconciled()
+
+    @pytest.mark.django_db
+    def test_core_signals_reward_deletion(self, snapshot):
+        Reward.objects.get().delete()
+        _assert_snapshot_is_reconciled()
+
+    @pytest.mark.django_db
+    def test_core_signals_cascade_deletion(self, snapshot):
+        Contributor.objects.first().delete()
+        _assert_snapshot_is_reconciled()
+
+
+@pytest.mark.django_db
+class TestCoreSignalsDataVersion:
+    """Testing class for :py:mod:`core.signals` fragments cache data version."""
+
+    def test_core_signals_contributor_and_handle_writes_bump_data_version(self, mocker):
+        mocked_bump = mocker.patch("core.signals.bump_data_version")
+        contributor = Contributor.objects.create(name="contributor1")
+        platform = SocialPlatform.objects.create(name="Discord")
+        handle = Handle.objects.create(
+            contributor=contributor, platform=platform, handle="handle1"
+        )
+        assert mocked_bump.call_count == 2
+        handle.delete()
+        contributor.save()
+        assert mocked_bump.call_count == 4
+
+    def test_core_signals_issue_writes_bump_data_version(self, mocker):
+        mocked_bump = mocker.patch("core.signals.bump_data_version")
+        issue = Issue.objects.create(number=1)
+        issue.delete()
+        assert mocked_bump.call_count == 2
+
+    def test_core_signals_contribution_writes_bump_data_version(self, mocker):
+        contributor = Contributor.objects.create(name="contributor1")
+        platform = SocialPlatform.objects.create(name="Discord")
+        cycle = Cycle.objects.create(start=datetime(2025, 1, 1))
+        reward_type = RewardType.objects.create(label="F", name="Feature")
+        reward = Reward.objects.create(type=reward_type, level=1, amount=100)
+        mocked_bump = mocker.patch("core.signals.bump_data_version")
+        contribution = Contribution.objects.create(
+            contributor=contributor, cycle=cycle, platform=platform, reward=reward
+        )
+        contribution.delete()
+        assert mocked_bump.call_count == 2
+
+    def test_core_signals_cycle_and_reward_writes_bump_data_version(self, mocker):
+        mocked_bump = mocker.patch("core.signals.bump_data_version")
+        cycle = Cycle.objects.create(start=datetime(2025, 1, 1))
+        reward_type = RewardType.objects.create(label="F", name="Feature")
+        reward = Reward.objects.create(type=reward_type, level=1, amount=100)
+        assert mocked_bump.call_count == 2
+        reward.amount = 200
+        reward.save()
+        reward.delete()
+        cycle.delete()
+        assert mocked_bump.call_count == 5
@@ -41,6 +41,12 @@ class TestCoreUrls:
         assert url.lookup_str == "core.views.ContributorListView"
         assert url.name == "contributors"
 
+    def test_core_urls_contributor_autocomplete(self):
+        url = self._url_from_pattern("contributors/autocomplete/")
+        assert isinstance(url, URLPattern)
+        assert url.lookup_str == "core.views.ContributorAutocompleteView"
+        assert url.name == "contributor_autocomplete"
+
     def test_core_urls_contributor_detail(self):
         url = self._url_from_pattern("contributor/<int:pk>")
         assert isinstance(url, URLPattern)
@@ -101,6 +107,18 @@ class TestCoreUrls:
         assert url.lookup_str == "core.views.IssueModalView"
         assert url.name == "issue_modal"
 
+    def test_core_urls_job_status(self):
+        url = self._url_from_pattern("jobs/<int:pk>/")
+        assert isinstance(url, URLPattern)
+        assert url.lookup_str == "core.views.JobStatusView"
+        assert url.name == "job_status"
+
+    def test_core_urls_github_webhook(self):
+        url = self._url_from_pattern("github/webhook/")
+        assert isinstance(url, URLPattern)
+        assert url.lookup_str == "core.views.GitHubWebhookView"
+        assert url.name == "github_webhook"
+
     def test_core_urls_unconfirmed_contributions(self):
         url = self._url_from_pattern("unconfirmed-contributions/")
         assert isinstance(url, URLPattern)
@@ -108,4 +126,4 @@ class TestCoreUrls:
         assert url.name == "unconfirmed_contributions"
 
     def test_core_urls_patterns_count(self):
-        assert len(urls.urlpatterns) == 16
+        assert len(urls.urlpatterns) == 19
@@ -13,16 +13,27 @@ from django.views.generic import DetailView, ListView, UpdateView
 from django.views.generic.detail import SingleObjectMixin
 
 from core.forms import ProfileFormSet, UpdateUserForm
-from core.models import Contribution, Contributor, Cycle
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Job,
+    JobStatus,
+    StatisticsSnapshot,
+)
+from core.pagination import KeysetPaginationMixin
 from core.views import (
     IndexView,
+    JobStatusView,
     LoginView,
     ProfileDisplay,
     ProfileEditView,
     ProfileUpdate,
     SignupView,
     UnconfirmedContributionsView,
+    redirect_to_job_status,
 )
+from utils.constants.core import JOB_STATUS_POLL_INTERVAL, STATISTICS_SNAPSHOT_ID
 
 user_model = get_user_model()
 
@@ -106,6 +117,11 @@ class TestIndexView:
         view = IndexView()
         assert view.template_name == "index.html"
 
+    def test_indexview_is_keyset_paginated(self):
+        assert issubclass(IndexView, KeysetPaginationMixin)
+        assert IndexView.keyset_ordering == ("-id",)
+        assert IndexView.load_more_template == "index.html#contributions_partial"
+
 
 @pytest.mark.django_db
 class TestDbIndexView:
@@ -152,6 +168,29 @@ class TestDbIndexView:
         # When there are no contributions, total_rewards can be None
         assert context["total_rewards"] in [0, None]
 
+    def test_indexview_get_context_data_reads_statistics_snapshot(
+        self, rf, django_assert_num_queries
+    ):
+        request = rf.get("/")
+        StatisticsSnapshot.objects.create(
+            pk=STATISTICS_SNAPSHOT_ID,
+            num_cycles=3,
+            num_contributors=4,
+            num_contributions=5,
+            total_rewards=6,
+        )
+        view = IndexView()
+        view.setup(request)
+        view.object_list = Contribution.objects.none()
+
+        with django_assert_num_queries(1):
+            context = view.get_context_data()
+
+        assert context["num_cycles"] == 3
+        assert context["num_contributors"] == 4
+        assert context["num_contributions"] == 5
+        assert context["total_rewards"] == 6
+
 
 class EditProfilePageTest(TestCase):
     def setUp(self):
@@ -509,6 +548,14 @@ class TestUnconfirmedContributionsView:
         view = UnconfirmedContributionsView()
         assert view.template_name == "unconfirmed_contributions.html"
 
+    def test_unconfirmedcontributionsview_is_keyset_paginated(self):
+        assert issubclass(UnconfirmedContributionsView, KeysetPaginationMixin)
+        assert UnconfirmedContributionsView.keyset_ordering == ("-id",)
+        assert (
+            UnconfirmedContributionsView.load_more_template
+            == "unconfirmed_contributions.html#contributions_partial"
+        )
+
 
 @pytest.mark.django_db
 class TestDbUnconfirmedContributionsView:
@@ -531,3 +578,75 @@ class TestDbUnconfirmedContributionsView:
         # Should only include unconfirmed contributions
         assert queryset.filter(confirmed=True).count() == 0
         assert queryset.filter(confirmed=False).count() == 1
+
+
+class TestJobStatusView:
+    """Testing class for :class:`core.views.JobStatusView`."""
+
+    def test_jobstatusview_is_subclass_of_detailview(self):
+        assert issubclass(JobStatusView, DetailView)
+
+    def test_jobstatusview_model(self):
+        assert JobStatusView.model == Job
+
+    def test_jobstatusview_template_name(self):
+        assert JobStatusView.template_name == "snippets/job_status.html"
+
+    def test_jobstatusview_redirect_to_job_status(self):
+        response = redirect_to_job_status("/issue/5", Job(pk=7))
+        assert response.status_code == 302
+        assert response.url == "/issue/5?job=7"
+
+
+@pytest.mark.django_db
+class TestDbJobStatusView:
+    """Testing class for :class:`core.views.JobStatusView` with database."""
+
+    def test_jobstatusview_requires_superuser(self, client, regular_user):
+        job = Job.objects.enqueue("close_issue")
+        client.force_login(regular_user)
+        response = client.get(reverse("job_status", args=[job.pk]))
+        assert response.status_code == 302
+
+    def test_jobstatusview_polls_unfinished_job(self, client, superuser):
+        job = Job.objects.enqueue("close_issue")
+        client.force_login(superuser)
+        response = client.get(reverse("job_status", args=[job.pk]))
+        content = response.content.decode()
+        assert response.context["job_poll_interval"] == JOB_STATUS_POLL_INTERVAL
+        assert f'hx-get="{reverse("job_status", args=[job.pk])}"' in content
+        assert f"every {JOB_STATUS_POLL_INTERVAL}s" in content
+        assert "Queued" in content
+
+    def test_jobstatusview_stops_polling_finished_job(self, client, superuser):
+        job = Job.objects.create(
+            name="close_issue",
+            status=JobStatus.SUCCEEDED,
+            result={"message": "Issue #5 closed as addressed successfully."},
+        )
+        client.force_login(superuser)
+        content = client.get(reverse("job_status", args=[job.pk])).content.decode()
+        assert "hx-get" not in content
+        assert "Issue #5 closed as addressed successfully." in content
+
+    def test_jobstatusview_renders_failed_job_error(self, client, superuser):
+        job = Job.objects.create(
+            name="close_issue", status=JobStatus.FAILED, error="GitHub error"
+        )
+        client.force_login(superuser)
+        content = client.get(reverse("job_status", args=[job.pk])).content.decode()
+        assert "hx-get" not in content
+        assert "GitHub error" in content
+
+    def test_jobstatusmixin_adds_job_for_superuser_only(
+        self, client, superuser, regular_user, contribution
+    ):
+        job = Job.objects.enqueue("invalidate_contribution")
+        url = reverse("contribution_detail", args=[contribution.pk])
+        client.force_login(regular_user)
+        assert "job" not in client.get(url, {"job": job.pk}).context
+        client.force_login(superuser)
+        response = client.get(url, {"job": job.pk})
+        assert response.context["job"] == job
+        assert f"job-status-{job.pk}" in response.content.decode()
+        assert "job" not in client.get(url, {"job": "invalid"}).context
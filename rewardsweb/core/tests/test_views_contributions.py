@@ -8,6 +8,7 @@ from django.urls import reverse
 from django.views.generic import CreateView, DetailView, ListView, UpdateView
 
 from core.forms import ContributionEditForm, ContributionInvalidateForm
+from core.jobs import run_pending_jobs
 from core.models import (
     Contribution,
     Contributor,
@@ -15,10 +16,13 @@ from core.models import (
     Handle,
     Issue,
     IssueStatus,
+    Job,
+    JobStatus,
     Reward,
     RewardType,
     SocialPlatform,
 )
+from core.pagination import KeysetPaginationMixin
 from core.views import (
     ContributionCreateView,
     ContributionDetailView,
@@ -611,15 +615,37 @@ class TestContributionInvalidateViewDb:
         client.force_login(superuser)
 
         mock_add_reply = mocker.patch(
-            "core.views.add_reply_to_message", return_value=True
+            "core.jobs.add_reply_to_message", return_value=True
         )
         mock_add_reaction = mocker.patch(
-            "core.views.add_reaction_to_message", return_value=True
+            "core.jobs.add_reaction_to_message", return_value=True
         )
         mocked_log_action = mocker.patch("core.models.Profile.log_action")
 
         response = client.post(invalidate_url, {"comment": comment})
 
+        # Check that job is queued and contribution isn't confirmed yet
+        job = Job.objects.get()
+        assert job.name == "invalidate_contribution"
+        assert job.user == superuser
+        assert job.payload == {
+            "contribution_id": contribution.id,
+            "reaction": "duplicate",
+            "comment": expected_comment,
+        }
+        contribution.refresh_from_db()
+        assert contribution.confirmed is False
+        mock_add_reaction.assert_not_called()
+
+        # Check queued message and redirect
+        messages = list(get_messages(response.wsgi_request))
+        assert len(messages) == 1
+        assert messages[0].message == "Setting contribution as duplicate is queued."
+        expected_url = reverse("contribution_detail", kwargs={"pk": contribution.pk})
+        assert response.url == f"{expected_url}?job={job.pk}"
+
+        run_pending_jobs()
+
         # Check that operations were called appropriately
         if comment:
             mock_add_reply.assert_called_once_with(contribution.url, expected_comment)
@@ -633,15 +659,10 @@ class TestContributionInvalidateViewDb:
         # Check that contribution was confirmed
         contribution.refresh_from_db()
         assert contribution.confirmed is True
-
-        # Check success message
-        messages = list(get_messages(response.wsgi_request))
-        assert len(messages) == 1
-        assert "successfully" in messages[0].message
-
-        # Check redirect
-        expected_url = reverse("contribution_detail", kwargs={"pk": contribution.pk})
-        assert response.url == expected_url
+        assert contribution.comment == expected_comment
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert "successfully" in job.message
 
         mocked_log_action.assert_called_once_with(
             "contribution_invalidated", contribution.info()
@@ -650,113 +671,112 @@ class TestContributionInvalidateViewDb:
     def test_contributioninvalidateview_form_valid_reply_fails(
         self, client, superuser, contribution, invalidate_url, mocker
     ):
-        """Test form submission when reply operation fails."""
+        """Test queued job when reply operation fails."""
         client.force_login(superuser)
 
-        mocker.patch("core.views.add_reply_to_message", return_value=False)
-        mocker.patch("core.views.add_reaction_to_message", return_value=True)
+        mocker.patch("core.jobs.add_reply_to_message", return_value=False)
+        mock_add_reaction = mocker.patch(
+            "core.jobs.add_reaction_to_message", return_value=True
+        )
 
-        response = client.post(invalidate_url, {"comment": "This is a test reply"})
+        client.post(invalidate_url, {"comment": "This is a test reply"})
+        run_pending_jobs()
 
         # Check that contribution was NOT confirmed
         contribution.refresh_from_db()
         assert contribution.confirmed is False
+        mock_add_reaction.assert_not_called()
 
-        # Check that form has error and was re-rendered
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert "Failed to add reply" in content or "All operations failed" in content
+        # Check that job is queued again with the error
+        job = Job.objects.get()
+        assert job.status == JobStatus.QUEUED
+        assert job.error == (
+            "Failed to add reply. Contribution was not confirmed as duplicate."
+        )
 
     def test_contributioninvalidateview_form_valid_reaction_fails(
         self, client, superuser, contribution, invalidate_url, mocker
     ):
-        """Test form submission when reaction operation fails."""
+        """Test queued job when reaction operation fails."""
         client.force_login(superuser)
 
-        mocker.patch("core.views.add_reaction_to_message", return_value=False)
+        mocker.patch("core.jobs.add_reaction_to_message", return_value=False)
 
-        response = client.post(invalidate_url, {"comment": ""})
+        client.post(invalidate_url, {"comment": ""})
+        run_pending_jobs()
 
         # Check that contribution was NOT confirmed
         contribution.refresh_from_db()
         assert contribution.confirmed is False
 
-        # Check that form has error
-        assert response.status_code == 200
-        content = response.content.decode()
-        # Check for either specific error or general error message
-        assert any(
-            msg in content
-            for msg in ["Failed to add reaction", "All operations failed"]
+        job = Job.objects.get()
+        assert job.status == JobStatus.QUEUED
+        assert job.error == (
+            "Failed to add reaction. Contribution was not confirmed as duplicate."
         )
 
-    def test_contributioninvalidateview_form_valid_both_operations_fail(
+    def test_contributioninvalidateview_form_valid_reply_not_repeated_on_retry(
         self, client, superuser, contribution, invalidate_url, mocker
     ):
-        """Test form submission when both operations fail."""
+        """Test sent reply isn't sent again when failed reaction is retried."""
         client.force_login(superuser)
 
-        mocker.patch("core.views.add_reply_to_message", return_value=False)
-        mocker.patch("core.views.add_reaction_to_message", return_value=False)
+        mock_add_reply = mocker.patch(
+            "core.jobs.add_reply_to_message", return_value=True
+        )
+        mocker.patch("core.jobs.add_reaction_to_message", side_effect=[False, True])
 
-        response = client.post(invalidate_url, {"comment": "This is a test reply"})
+        client.post(invalidate_url, {"comment": "This is a test reply"})
+        run_pending_jobs()
+        job = Job.objects.get()
+        assert job.payload["replied"] is True
+        Job.objects.filter(pk=job.pk).update(run_at=job.created_at)
+        run_pending_jobs()
 
-        # Check that contribution was NOT confirmed
+        mock_add_reply.assert_called_once()
         contribution.refresh_from_db()
-        assert contribution.confirmed is False
-
-        # Check that form has error
-        assert response.status_code == 200
-        assert "All operations failed" in response.content.decode()
+        assert contribution.confirmed is True
+        job.refresh_from_db()
+        assert job.status == JobStatus.SUCCEEDED
+        assert job.attempts == 2
 
     def test_contributioninvalidateview_form_valid_reply_exception(
         self, client, superuser, contribution, invalidate_url, mocker
     ):
-        """Test form submission when reply operation raises exception."""
+        """Test queued job when reply operation raises exception."""
         client.force_login(superuser)
 
         mocker.patch(
-            "core.views.add_reply_to_message", side_effect=Exception("Reply failed")
+            "core.jobs.add_reply_to_message", side_effect=Exception("Reply failed")
         )
-        mocker.patch("core.views.add_reaction_to_message", return_value=True)
+        mocker.patch("core.jobs.add_reaction_to_message", return_value=True)
 
-        response = client.post(invalidate_url, {"comment": "This is a test reply"})
+        client.post(invalidate_url, {"comment": "This is a test reply"})
+        run_pending_jobs()
 
         # Check that contribution was NOT confirmed
         contribution.refresh_from_db()
         assert contribution.confirmed is False
-
-        # Check that form has error
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert any(
-            msg in content for msg in ["Failed to add reply", "All operations failed"]
-        )
+        assert Job.objects.get().error == "Reply failed"
 
     def test_contributioninvalidateview_form_valid_reaction_exception(
         self, client, superuser, contribution, invalidate_url, mocker
     ):
-        """Test form submission when reaction operation raises exception."""
+        """Test queued job when reaction operation raises exception."""
         client.force_login(superuser)
 
         mocker.patch(
-            "core.views.add_reaction_to_message",
+            "core.jobs.add_reaction_to_message",
             side_effect=Exception("Reaction failed"),
         )
 
-        response = client.post(invalidate_url, {"comment": ""})
+        client.post(invalidate_url, {"comment": ""})
+        run_pending_jobs()
 
         # Check that contribution was NOT confirmed
         contribution.refresh_from_db()
         assert contribution.confirmed is False
-
-        # Check that form has error
-        assert response.status_code == 200
-        content = response.content.decode()
-        assert any(
-            msg in content
-            for msg in ["Failed to add reaction", "All operations failed"]
-        )
+        assert Job.objects.get().error == "Reaction failed"
 
     @pytest.mark.parametrize("reaction", ["duplicate", "wontfix"])
     def test_contributioninvalidateview_different_types(
@@ -771,10 +791,11 @@ class TestContributionInvalidateViewDb:
         client.force_login(superuser)
 
         mock_add_reaction = mocker.patch(
-            "core.views.add_reaction_to_message", return_value=True
+            "core.jobs.add_reaction_to_message", return_value=True
         )
 
         client.post(url, {"comment": ""})
+        run_pending_jobs()
 
         # Check that reaction was called with correct type
         mock_add_reaction.assert_called_once_with(
@@ -833,13 +854,13 @@ class TestContributionInvalidateViewDb:
         """Test success message includes reply information when comment is provided."""
         client.force_login(superuser)
 
-        mocker.patch("core.views.add_reply_to_message", return_value=True)
-        mocker.patch("core.views.add_reaction_to_message", return_value=True)
+        mocker.patch("core.jobs.add_reply_to_message", return_value=True)
+        mocker.patch("core.jobs.add_reaction_to_message", return_value=True)
 
-        response = client.post(invalidate_url, {"comment": "Test reply"})
+        client.post(invalidate_url, {"comment": "Test reply"})
+        run_pending_jobs()
 
-        messages = list(get_messages(response.wsgi_request))
-        message_text = messages[0].message.lower()
+        message_text = Job.objects.get().message.lower()
 
         assert "reply" in message_text
         assert "reaction" in message_text
@@ -851,12 +872,12 @@ class TestContributionInvalidateViewDb:
         """Test success message excludes reply information when no comment is provided."""
         client.force_login(superuser)
 
-        mocker.patch("core.views.add_reaction_to_message", return_value=True)
+        mocker.patch("core.jobs.add_reaction_to_message", return_value=True)
 
-        response = client.post(invalidate_url, {"comment": ""})
+        client.post(invalidate_url, {"comment": ""})
+        run_pending_jobs()
 
-        messages = list(get_messages(response.wsgi_request))
-        message_text = messages[0].message.lower()
+        message_text = Job.objects.get().message.lower()
 
         assert "reply" not in message_text
         assert "reaction" in message_text
@@ -1081,111 +1102,96 @@ class TestDbContributionCreateView:
 
         return c1, c2, c3
 
-    def test_contributioncreateview_get_form_no_search_query_returns_all_contributors(
-        self, rf, superuser, contributors_with_handles
+    def test_contributioncreateview_get_doesnt_render_all_contributors(
+        self, client, superuser, contributors_with_handles
     ):
-        request = rf.get("/contribution/add/")  # no ?q parameter
-        request.user = superuser
-
-        view = ContributionCreateView()
-        view.setup(request)
-        view.request = request
-        view.url_issue_number = None
-
-        form = view.get_form()
-
-        # Should contain ALL contributors
-        qs = form.fields["contributor"].queryset
-        assert qs.count() == len(contributors_with_handles)
-
-    def test_contributioncreateview_get_form_with_search_query_filters_by_name(
-        self, rf, superuser, contributors_with_handles
+        client.force_login(superuser)
+        response = client.get(reverse("contribution_add"))
+        content = response.content.decode()
+        assert response.status_code == 200
+        assert 'type="hidden" name="contributor"' in content
+        assert reverse("contributor_autocomplete") in content
+        assert 'data-autocomplete-target="id_contributor"' in content
+        for contributor in contributors_with_handles:
+            assert contributor.name not in content
+
+    def test_contributioncreateview_post_without_contributor_shows_error(
+        self, client, superuser, contributors_with_handles
     ):
-        request = rf.get("/contribution/add/?q=ali")  # matches Alice
-        request.user = superuser
-
-        view = ContributionCreateView()
-        view.setup(request)
-        view.request = request
-        view.url_issue_number = None
+        client.force_login(superuser)
+        response = client.post(
+            reverse("contribution_add"), {"contributor_search": "Alice"}
+        )
+        assert response.status_code == 200
+        content = response.content.decode()
+        assert "Select a contributor from the suggestions." in content
+        assert 'value="Alice"' in content
 
-        form = view.get_form()
-        qs = form.fields["contributor"].queryset
 
-        assert qs.count() == 1
-        assert qs.first().name.startswith("Alice")
+@pytest.mark.django_db
+class TestDbContributorAutocompleteView:
+    """Testing class for :class:`core.views.ContributorAutocompleteView`."""
 
-    def test_contributioncreateview_get_form_with_search_query_filters_by_handle(
-        self, rf, superuser, contributors_with_handles
-    ):
-        request = rf.get("/contribution/add/?q=dev")  # matches bobdev
-        request.user = superuser
+    @pytest.fixture
+    def contributors_with_handles(self):
+        """Creates contributors + handles for testing autocomplete."""
+        platform = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        c1 = Contributor.objects.create(name="Alice Wonderland")
+        c2 = Contributor.objects.create(name="Bob Builder")
+        c3 = Contributor.objects.create(name="Charlie Alpha")
 
-        view = ContributionCreateView()
-        view.setup(request)
-        view.request = request
-        view.url_issue_number = None
+        Handle.objects.create(contributor=c1, platform=platform, handle="alice123")
+        Handle.objects.create(contributor=c2, platform=platform, handle="bobdev")
+        Handle.objects.create(contributor=c3, platform=platform, handle="alphacharlie")
 
-        form = view.get_form()
-        qs = form.fields["contributor"].queryset
+        return c1, c2, c3
 
-        assert qs.count() == 1
-        assert qs.first().name == "Bob Builder"
+    def test_contributorautocompleteview_requires_superuser(self, client, regular_user):
+        client.force_login(regular_user)
+        response = client.get(reverse("contributor_autocomplete"), {"q": "alice"})
+        assert response.status_code == 302
 
-    def test_contributioncreateview_get_form_reads_search_query_from_post(
-        self, rf, superuser, contributors_with_handles
+    def test_contributorautocompleteview_short_query_returns_no_results(
+        self, client, superuser, contributors_with_handles, django_assert_num_queries
     ):
-        request = rf.post("/contribution/add/", data={"q": "alpha"})
-        request.user = superuser
-
-        view = ContributionCreateView()
-        view.setup(request)
-        view.request = request
-        view.url_issue_number = None
-
-        form = view.get_form()
-        qs = form.fields["contributor"].queryset
+        client.force_login(superuser)
+        with django_assert_num_queries(2):  # session and user
+            response = client.get(reverse("contributor_autocomplete"), {"q": " a "})
 
-        assert qs.count() == 1
-        assert qs.first().name == "Charlie Alpha"
+        assert response.json() == {"results": []}
 
-    def test_contributioncreateview_get_form_search_is_case_insensitive(
-        self, rf, superuser, contributors_with_handles
+    def test_contributorautocompleteview_matches_name_and_handle(
+        self, client, superuser, contributors_with_handles
     ):
-        request = rf.get("/contribution/add/?q=ALICE")
-        request.user = superuser
-
-        view = ContributionCreateView()
-        view.setup(request)
-        view.request = request
-        view.url_issue_number = None
-
-        form = view.get_form()
-        qs = form.fields["contributor"].queryset
-
-        assert qs.count() == 1
-        assert qs.first().name == "Alice Wonderland"
+        client.force_login(superuser)
+        response = client.get(reverse("contributor_autocomplete"), {"q": "alpha"})
+        results = response.json()["results"]
+        assert [result["id"] for result in results] == [contributors_with_handles[2].id]
+        assert results[0]["name"] == "Charlie Alpha"
+        assert results[0]["info"] == "Charlie Alpha"
+
+        response = client.get(reverse("contributor_autocomplete"), {"q": "DEV"})
+        results = response.json()["results"]
+        assert [result["name"] for result in results] == ["Bob Builder"]
+
+    def test_contributorautocompleteview_ranks_by_similarity(self, client, superuser):
+        Contributor.objects.create(name="Alexander the Great")
+        Contributor.objects.create(name="Alex")
+        client.force_login(superuser)
+        response = client.get(reverse("contributor_autocomplete"), {"q": "alex"})
+        names = [result["name"] for result in response.json()["results"]]
+        assert names == ["Alex", "Alexander the Great"]
 
-    def test_contributioncreateview_get_form_distinct_removes_duplicates(
-        self, rf, superuser, contributors_with_handles
+    def test_contributorautocompleteview_returns_top_matches(
+        self, client, superuser, mocker
     ):
-        # Add second handle for same contributor → search should return only 1 result
-        platform = SocialPlatform.objects.first()
-        c1 = contributors_with_handles[0]
-        Handle.objects.create(contributor=c1, platform=platform, handle="aliceXYZ")
-
-        request = rf.get("/contribution/add/?q=alice")
-        request.user = superuser
-
-        view = ContributionCreateView()
-        view.setup(request)
-        view.request = request
-        view.url_issue_number = None
-
-        form = view.get_form()
-        qs = form.fields["contributor"].queryset
+        mocker.patch("core.views.CONTRIBUTOR_AUTOCOMPLETE_SIZE", 3)
+        for index in range(5):
+            Contributor.objects.create(name=f"user{index}")
 
-        assert qs.count() == 1  # distinct removes duplicates
+        client.force_login(superuser)
+        response = client.get(reverse("contributor_autocomplete"), {"q": "user"})
+        assert len(response.json()["results"]) == 3
 
 
 class TestContributorListView:
@@ -1202,6 +1208,14 @@ class TestContributorListView:
         view = ContributorListView()
         assert view.paginate_by == 20
 
+    def test_contributorlistview_is_keyset_paginated(self):
+        assert issubclass(ContributorListView, KeysetPaginationMixin)
+        assert ContributorListView.keyset_ordering == ("lower_name", "id")
+        assert (
+            ContributorListView.load_more_template
+            == "core/contributor_list.html#contributors_partial"
+        )
+
 
 @pytest.mark.django_db
 class TestDbContributorListView:
@@ -1,27 +1,38 @@
 """Testing module for :py:mod:`core.views` views related to issues."""
 
-from datetime import datetime
+import hashlib
+import hmac
+import json
+from datetime import datetime, timedelta
 
 import pytest
 from django.contrib.auth import get_user_model
 from django.contrib.messages import get_messages
 from django.db.models import QuerySet
 from django.urls import reverse
+from django.utils import timezone
+from django.views import View
 from django.views.generic import DetailView, ListView
 
 from core.forms import IssueLabelsForm
+from core.jobs import run_pending_jobs
 from core.models import (
     Contribution,
     Contributor,
     Cycle,
+    GitHubIssueMirror,
     Issue,
     IssueStatus,
+    Job,
+    JobStatus,
     Reward,
     RewardType,
     SocialPlatform,
 )
+from core.pagination import KeysetPaginationMixin
 from core.views import (
     CreateIssueView,
+    GitHubWebhookView,
     IssueDetailView,
     IssueListView,
     IssueModalView,
@@ -45,6 +56,11 @@ class TestIssueListView:
         view = IssueListView()
         assert view.paginate_by == 20
 
+    def test_issuelistview_is_keyset_paginated(self):
+        assert issubclass(IssueListView, KeysetPaginationMixin)
+        assert IssueListView.keyset_ordering == ("-number",)
+        assert IssueListView.load_more_template == "core/issue_list.html#issues_partial"
+
 
 @pytest.mark.django_db
 class TestDbIssueListView:
@@ -965,10 +981,11 @@ class TestIssueDetailViewSubmissionHandlers:
         """Test successful close as addressed submission."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
         mocked_log_action = mocker.patch("core.models.Profile.log_action")
         mocked_process = mocker.patch(
-            "core.views.process_allocations_for_contributions", return_value=(False, [])
+            "core.jobs.process_allocations_for_contributions",
+            return_value=[(False, [])],
         )
 
         mock_github_data = {
@@ -999,9 +1016,12 @@ class TestIssueDetailViewSubmissionHandlers:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that issue status was updated
         issue.refresh_from_db()
@@ -1018,12 +1038,16 @@ class TestIssueDetailViewSubmissionHandlers:
         assert "bug" in call_args["labels_to_set"]
         assert "feature" in call_args["labels_to_set"]
 
-        # Check success message
+        # Check queued and success messages
         messages = list(get_messages(response.wsgi_request))
         assert any(
-            f"Issue #{issue.number} closed as addressed successfully" in str(message)
+            f"Closing issue #{issue.number} as addressed is queued" in str(message)
             for message in messages
         )
+        assert (
+            Job.objects.get(name="close_issue").message
+            == f"Issue #{issue.number} closed as addressed successfully."
+        )
 
         calls = [
             mocker.call(
@@ -1046,12 +1070,12 @@ class TestIssueDetailViewSubmissionHandlers:
         """Test successful close as addressed submission without comment."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
-        mock_add_reaction = mocker.patch("core.views.add_reaction_to_message")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
+        mock_add_reaction = mocker.patch("core.jobs.add_reactions_to_messages")
         mocked_log_action = mocker.patch("core.models.Profile.log_action")
         mocked_process = mocker.patch(
-            "core.views.process_allocations_for_contributions",
-            return_value=("txid", ["addr1"]),
+            "core.jobs.process_allocations_for_contributions",
+            return_value=[("txid", ["addr1"])],
         )
         mock_github_data = {
             "success": True,
@@ -1083,13 +1107,14 @@ class TestIssueDetailViewSubmissionHandlers:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
 
         # Check that close_issue_with_labels was called with empty comment
         mock_close_issue.assert_called_once()
         mock_add_reaction.assert_called_once_with(
-            contribution.url, DISCORD_EMOJIS.get("addressed")
+            [contribution.url], DISCORD_EMOJIS.get("addressed")
         )
 
         calls = [
@@ -1118,7 +1143,7 @@ class TestIssueDetailViewSubmissionHandlers:
         """Test successful close as wontfix submission."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1148,9 +1173,12 @@ class TestIssueDetailViewSubmissionHandlers:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that issue status was updated
         issue.refresh_from_db()
@@ -1165,12 +1193,16 @@ class TestIssueDetailViewSubmissionHandlers:
         assert "wontfix" in call_args["labels_to_set"]
         assert "work in progress" not in call_args["labels_to_set"]
 
-        # Check success message
+        # Check queued and success messages
         messages = list(get_messages(response.wsgi_request))
         assert any(
-            f"Issue #{issue.number} closed as wontfix successfully" in str(message)
+            f"Closing issue #{issue.number} as wontfix is queued" in str(message)
             for message in messages
         )
+        assert (
+            Job.objects.get(name="close_issue").message
+            == f"Issue #{issue.number} closed as wontfix successfully."
+        )
 
     def test_issuedetailview_handle_close_submission_invalid_action(
         self, client, superuser, issue
@@ -1273,7 +1305,7 @@ class TestIssueDetailViewSubmissionHandlers:
         """Test close submission when GitHub close operation fails."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1306,19 +1338,22 @@ class TestIssueDetailViewSubmissionHandlers:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that local status was reverted
         issue.refresh_from_db()
         assert issue.status == IssueStatus.CREATED  # Reverted to original
 
-        # Check error message - the actual error message from the view
-        messages = list(get_messages(response.wsgi_request))
-        assert any(
-            "Failed to close issue on GitHub" in str(message) for message in messages
-        )
+        # Check that job is queued again with the error
+        job = Job.objects.get()
+        assert job.status == JobStatus.QUEUED
+        assert job.attempts == 1
+        assert job.error == "Failed to close issue on GitHub"
 
     def test_issuedetailview_handle_close_submission_exception_handling(
         self, client, superuser, issue, mocker
@@ -1354,7 +1389,7 @@ class TestIssueDetailViewSubmissionHandlers:
         """Test that labels are properly processed (remove work in progress, add correct label)."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1389,6 +1424,7 @@ class TestIssueDetailViewSubmissionHandlers:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
 
@@ -1410,7 +1446,7 @@ class TestIssueDetailViewSubmissionHandlers:
         """Test that existing addressed/wontfix label is not duplicated."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1440,6 +1476,7 @@ class TestIssueDetailViewSubmissionHandlers:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
 
@@ -1525,7 +1562,8 @@ class TestIssueDetailViewCloseFunctionality:
         # Mock GitHub issue as open
         mock_get_issue = mocker.patch("core.views.issue_by_number")
         mocker.patch(
-            "core.views.process_allocations_for_contributions", return_value=(False, [])
+            "core.jobs.process_allocations_for_contributions",
+            return_value=[(False, [])],
         )
         mock_github_data = {
             "success": True,
@@ -1558,9 +1596,10 @@ class TestIssueDetailViewCloseFunctionality:
         """Test successful close as addressed action."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
         mock_process = mocker.patch(
-            "core.views.process_allocations_for_contributions", return_value=(False, [])
+            "core.jobs.process_allocations_for_contributions",
+            return_value=[(False, [])],
         )
         mock_github_data = {
             "success": True,
@@ -1590,9 +1629,12 @@ class TestIssueDetailViewCloseFunctionality:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that issue status was updated
         issue.refresh_from_db()
@@ -1617,10 +1659,10 @@ class TestIssueDetailViewCloseFunctionality:
         """Test successful close as addressed action."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
         mock_process = mocker.patch(
-            "core.views.process_allocations_for_contributions",
-            return_value=("txid", ["addr"]),
+            "core.jobs.process_allocations_for_contributions",
+            return_value=[("txid", ["addr"])],
         )
         mock_github_data = {
             "success": True,
@@ -1650,9 +1692,12 @@ class TestIssueDetailViewCloseFunctionality:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that issue status was updated
         issue.refresh_from_db()
@@ -1677,7 +1722,7 @@ class TestIssueDetailViewCloseFunctionality:
         """Test successful close as wontfix action."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1707,9 +1752,12 @@ class TestIssueDetailViewCloseFunctionality:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that issue status was updated
         issue.refresh_from_db()
@@ -1730,7 +1778,7 @@ class TestIssueDetailViewCloseFunctionality:
         """Test successful close as wontfix action."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1760,9 +1808,12 @@ class TestIssueDetailViewCloseFunctionality:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
-        assert response.url == reverse("issue_detail", kwargs={"pk": issue.pk})
+        assert response.url == reverse(
+            "issue_detail", kwargs={"pk": issue.pk}
+        ) + "?job=%d" % (Job.objects.earliest("id").pk)
 
         # Check that issue status was updated
         issue.refresh_from_db()
@@ -1783,7 +1834,7 @@ class TestIssueDetailViewCloseFunctionality:
         """Test that local status is reverted when GitHub operation fails."""
         # Mock GitHub functions
         mock_get_issue = mocker.patch("core.views.issue_by_number")
-        mock_close_issue = mocker.patch("core.views.close_issue_with_labels")
+        mock_close_issue = mocker.patch("core.jobs.close_issue_with_labels")
 
         mock_github_data = {
             "success": True,
@@ -1813,6 +1864,7 @@ class TestIssueDetailViewCloseFunctionality:
                 "submit_close": "Confirm Close",
             },
         )
+        run_pending_jobs()
 
         assert response.status_code == 302
 
@@ -1951,6 +2003,199 @@ class TestIssueModalView:
         assert view.model == Issue
 
 
+def _github_issue(number, **kwargs):
+    """Return GitHub REST API issue object with provided `number`."""
+    issue = {
+        "number": number,
+        "title": f"Mirrored issue {number}",
+        "body": "Mirrored body",
+        "state": "open",
+        "labels": [{"name": "bug"}, {"name": "work in progress"}],
+        "assignees": [{"login": "user1"}],
+        "user": {"login": "author"},
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "comments": 0,
+        "created_at": "2025-01-01T10:00:00Z",
+        "updated_at": "2025-01-02T10:00:00Z",
+        "closed_at": None,
+    }
+    issue.update(kwargs)
+    return issue
+
+
+@pytest.mark.django_db
+class TestDbIssueDetailViewMirror:
+    """Testing class for :class:`core.views.IssueDetailView` issues mirror usage."""
+
+    def test_issuedetailview_github_issue_data_from_fresh_mirror(
+        self, client, superuser, issue, mocker
+    ):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(issue.number)])
+        mock_get_issue = mocker.patch("core.views.issue_by_number")
+        client.force_login(superuser)
+        response = client.get(reverse("issue_detail", kwargs={"pk": issue.pk}))
+        assert response.status_code == 200
+        assert response.context["issue_title"] == "Mirrored issue 123"
+        assert response.context["issue_labels"] == ["bug", "work in progress"]
+        assert response.context["current_custom_labels"] == [
+            "bug",
+            "work in progress",
+        ]
+        mock_get_issue.assert_not_called()
+
+    def test_issuedetailview_github_issue_data_for_stale_mirror(
+        self, rf, superuser, issue, mocker
+    ):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(issue.number)])
+        GitHubIssueMirror.objects.update(synced_at=timezone.now() - timedelta(days=1))
+        issue_data = {"success": True, "issue": {"title": "Live"}}
+        mock_get_issue = mocker.patch(
+            "core.views.issue_by_number", return_value=issue_data
+        )
+        request = rf.get("/")
+        request.user = superuser
+        view = IssueDetailView()
+        view.setup(request)
+        assert view.github_issue_data(issue.number) == issue_data
+        mock_get_issue.assert_called_once_with(superuser, issue.number)
+
+    def test_issuedetailview_github_issue_data_for_stale_mirror_and_error(
+        self, rf, superuser, issue, mocker
+    ):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(issue.number)])
+        GitHubIssueMirror.objects.update(synced_at=timezone.now() - timedelta(days=1))
+        mocker.patch(
+            "core.views.issue_by_number",
+            return_value={"success": False, "error": "timeout"},
+        )
+        request = rf.get("/")
+        request.user = superuser
+        view = IssueDetailView()
+        view.setup(request)
+        returned = view.github_issue_data(issue.number)
+        assert returned["success"] is True
+        assert returned["issue"]["title"] == "Mirrored issue 123"
+
+    def test_issuedetailview_github_issue_data_for_no_mirror_and_error(
+        self, rf, superuser, issue, mocker
+    ):
+        issue_data = {"success": False, "error": "timeout"}
+        mocker.patch("core.views.issue_by_number", return_value=issue_data)
+        request = rf.get("/")
+        request.user = superuser
+        view = IssueDetailView()
+        view.setup(request)
+        assert view.github_issue_data(issue.number) == issue_data
+
+    def test_issuedetailview_close_updates_mirror(
+        self, client, superuser, issue, mocker
+    ):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(issue.number)])
+        mock_close_issue = mocker.patch(
+            "core.jobs.close_issue_with_labels",
+            return_value={
+                "success": True,
+                "issue_state": "closed",
+                "current_labels": ["bug", "wontfix"],
+            },
+        )
+        mocker.patch("core.jobs.add_reactions_to_messages")
+        client.force_login(superuser)
+        client.post(
+            reverse("issue_detail", kwargs={"pk": issue.pk}),
+            {"close_action": "wontfix", "submit_close": "Confirm Close"},
+        )
+        run_pending_jobs()
+        assert mock_close_issue.call_args[1]["labels_to_set"] == ["bug", "wontfix"]
+        mirror = GitHubIssueMirror.objects.get()
+        assert mirror.state == "closed"
+        assert mirror.labels == ["bug", "wontfix"]
+
+    def test_issuedetailview_labels_submission_updates_mirror(
+        self, client, superuser, issue, mocker
+    ):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(issue.number)])
+        mocker.patch(
+            "core.views.set_labels_to_issue",
+            return_value={"success": True, "current_labels": ["feature", "blocker"]},
+        )
+        client.force_login(superuser)
+        client.post(
+            reverse("issue_detail", kwargs={"pk": issue.pk}),
+            {"labels": ["feature"], "priority": "blocker", "submit_labels": "Save"},
+        )
+        assert GitHubIssueMirror.objects.get().labels == ["feature", "blocker"]
+
+
+@pytest.mark.django_db
+class TestDbGitHubWebhookView:
+    """Testing class for :class:`core.views.GitHubWebhookView`."""
+
+    @pytest.fixture(autouse=True)
+    def webhook_secret(self, monkeypatch):
+        """Set webhook's secret environment variable."""
+        monkeypatch.setenv("GITHUB_WEBHOOK_SECRET", "secret")
+
+    def _post(self, client, event, payload, secret=b"secret"):
+        body = json.dumps(payload).encode()
+        signature = "sha256=" + hmac.new(secret, body, hashlib.sha256).hexdigest()
+        return client.post(
+            reverse("github_webhook"),
+            body,
+            content_type="application/json",
+            HTTP_X_GITHUB_EVENT=event,
+            HTTP_X_HUB_SIGNATURE_256=signature,
+        )
+
+    def test_githubwebhookview_is_subclass_of_view(self):
+        assert issubclass(GitHubWebhookView, View)
+
+    def test_githubwebhookview_for_invalid_signature(self, client):
+        payload = {"action": "opened", "issue": _github_issue(5)}
+        response = self._post(client, "issues", payload, secret=b"other")
+        assert response.status_code == 403
+        assert not GitHubIssueMirror.objects.exists()
+
+    def test_githubwebhookview_get_is_not_allowed(self, client):
+        assert client.get(reverse("github_webhook")).status_code == 405
+
+    def test_githubwebhookview_mirrors_issue(self, client):
+        response = self._post(
+            client, "issues", {"action": "opened", "issue": _github_issue(5)}
+        )
+        assert response.status_code == 204
+        mirror = GitHubIssueMirror.objects.get()
+        assert mirror.number == 5
+        assert mirror.labels == ["bug", "work in progress"]
+
+    def test_githubwebhookview_mirrors_issue_from_comment_event(self, client):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(5)])
+        response = self._post(
+            client,
+            "issue_comment",
+            {"action": "created", "issue": _github_issue(5, comments=1)},
+        )
+        assert response.status_code == 204
+        assert GitHubIssueMirror.objects.get().comments == 1
+
+    def test_githubwebhookview_deletes_deleted_issue(self, client):
+        GitHubIssueMirror.objects.update_from_github([_github_issue(5)])
+        response = self._post(
+            client, "issues", {"action": "deleted", "issue": _github_issue(5)}
+        )
+        assert response.status_code == 204
+        assert not GitHubIssueMirror.objects.exists()
+
+    def test_githubwebhookview_ignores_other_events(self, client):
+        response = self._post(client, "ping", {"zen": "Keep it simple."})
+        assert response.status_code == 204
+        assert not GitHubIssueMirror.objects.exists()
+
+    def test_githubwebhookview_for_invalid_payload(self, client):
+        response = self._post(client, "issues", {"action": "opened"})
+        assert response.status_code == 400
+
+
 @pytest.mark.django_db
 class TestDbCreateIssueView:
     """Testing class for :class:`core.views.CreateIssueView` with database."""
@@ -2071,7 +2316,7 @@ class TestDbCreateIssueView:
         mock_confirm_contribution = mocker.patch(
             "core.views.Issue.objects.confirm_contribution_with_issue"
         )
-        mock_add_reaction = mocker.patch("core.views.add_reaction_to_message")
+        mock_add_reaction = mocker.patch("core.jobs.add_reactions_to_messages")
         mocked_log_action = mocker.patch("core.models.Profile.log_action")
 
         # Create mock form with valid data
@@ -2084,6 +2329,13 @@ class TestDbCreateIssueView:
         }
 
         response = view.form_valid(mock_form)
+        job = Job.objects.get()
+        assert job.name == "add_reactions"
+        assert job.payload == {
+            "urls": [contribution.url],
+            "emoji": DISCORD_EMOJIS.get("noted"),
+        }
+        run_pending_jobs()
 
         # Verify GitHub issue creation was called with correct data
         mock_create_github_issue.assert_called_once_with(
@@ -2097,7 +2349,7 @@ class TestDbCreateIssueView:
         mock_confirm_contribution.assert_called_once_with(123, contribution)
 
         # Verify Discord reaction was added
-        mock_add_reaction.assert_called_once_with(contribution.url, mocker.ANY)
+        mock_add_reaction.assert_called_once_with([contribution.url], mocker.ANY)
 
         # Verify response is successful
         assert response.status_code == 302
@@ -10,6 +10,11 @@ urlpatterns = [
     path("cycles/", views.CycleListView.as_view(), name="cycles"),
     path("cycle/<int:pk>", views.CycleDetailView.as_view(), name="cycle_detail"),
     path("contributors/", views.ContributorListView.as_view(), name="contributors"),
+    path(
+        "contributors/autocomplete/",
+        views.ContributorAutocompleteView.as_view(),
+        name="contributor_autocomplete",
+    ),
     path(
         "contributor/<int:pk>",
         views.ContributorDetailView.as_view(),
@@ -52,6 +57,12 @@ urlpatterns = [
         name="issue_detail",
     ),
     path("issue/<int:pk>/modal/", views.IssueModalView.as_view(), name="issue_modal"),
+    path("jobs/<int:pk>/", views.JobStatusView.as_view(), name="job_status"),
+    path(
+        "github/webhook/",
+        views.GitHubWebhookView.as_view(),
+        name="github_webhook",
+    ),
     path(
         "unconfirmed-contributions/",
         views.UnconfirmedContributionsView.as_view(),
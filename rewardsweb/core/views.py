@@ -1,5 +1,6 @@
 """Module containing website's views."""
 
+import json
 import logging
 from datetime import datetime
 
@@ -12,12 +13,13 @@ from django.contrib.auth.models import User
 from django.db.models import Count, Prefetch, Q, Sum
 from django.db.models.functions import Lower
 from django.forms import ValidationError
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseRedirect, JsonResponse
 from django.shortcuts import redirect
 from django.template.loader import render_to_string
-from django.urls import reverse_lazy
+from django.urls import reverse, reverse_lazy
 from django.utils.decorators import method_decorator
 from django.views import View
+from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import (
     CreateView,
     DetailView,
@@ -27,7 +29,6 @@ from django.views.generic import (
 )
 from django.views.generic.detail import SingleObjectMixin
 
-from contract.network import process_allocations_for_contributions
 from core.forms import (
     ContributionCreateForm,
     ContributionEditForm,
@@ -37,29 +38,33 @@ from core.forms import (
     ProfileFormSet,
     UpdateUserForm,
 )
+from core.fragments import cached_fragment
 from core.models import (
     Contribution,
     Contributor,
     Cycle,
+    GitHubIssueMirror,
     Handle,
     Issue,
     IssueStatus,
+    Job,
+    StatisticsSnapshot,
 )
-from utils.bot import (
-    add_reaction_to_message,
-    add_reply_to_message,
-    message_from_url,
-)
+from core.pagination import KeysetPaginationMixin
+from utils.bot import message_from_url
 from utils.constants.core import (
     ALGORAND_WALLETS,
+    CONTRIBUTOR_AUTOCOMPLETE_MIN_LENGTH,
+    CONTRIBUTOR_AUTOCOMPLETE_SIZE,
     DISCORD_EMOJIS,
     ISSUE_CREATION_LABEL_CHOICES,
     ISSUE_PRIORITY_CHOICES,
+    JOB_STATUS_POLL_INTERVAL,
 )
 from utils.constants.ui import MISSING_TOKEN_TEXT
 from utils.issues import (
-    close_issue_with_labels,
     create_github_issue,
+    is_valid_webhook_signature,
     issue_by_number,
     issue_data_for_contribution,
     set_labels_to_issue,
@@ -68,7 +73,37 @@ from utils.issues import (
 logger = logging.getLogger(__name__)
 
 
-class IndexView(ListView):
+class JobStatusMixin:
+    """Mixin adding background job from the request's `job` parameter to context.
+
+    Detail pages the user is redirected to after queuing a job render the job's
+    status, which is then polled by HTMX until the job is finished.
+    """
+
+    def get_context_data(self, *args, **kwargs):
+        """Add queued job and status polling interval to template context."""
+        context = super().get_context_data(*args, **kwargs)
+        job_id = self.request.GET.get("job", "")
+        if self.request.user.is_superuser and job_id.isdigit():
+            context["job"] = Job.objects.filter(pk=job_id).first()
+            context["job_poll_interval"] = JOB_STATUS_POLL_INTERVAL
+
+        return context
+
+
+def redirect_to_job_status(url, job):
+    """Return redirect to provided `url` rendering the status of queued `job`.
+
+    :param url: URL of the page rendering job's status
+    :type url: str
+    :param job: queued job instance
+    :type job: :class:`core.models.Job`
+    :return: :class:`django.http.HttpResponseRedirect`
+    """
+    return HttpResponseRedirect(f"{url}?job={job.pk}")
+
+
+class IndexView(KeysetPaginationMixin, ListView):
     """View for displaying the main index page with contribution statistics.
 
     Displays a paginated list of unconfirmed contributions along with
@@ -80,14 +115,17 @@ class IndexView(ListView):
     :type paginate_by: int
     :ivar template_name: HTML template for the index page
     :type template_name: str
+    :ivar load_more_template: HTML template partial for the following pages
+    :type load_more_template: str
     """
 
     model = Contribution
     paginate_by = 20
     template_name = "index.html"
+    load_more_template = "index.html#contributions_partial"
 
     def get_context_data(self, *args, **kwargs):
-        """Update context with the database records count.
+        """Update context with the database records count from statistics snapshot.
 
         :param args: Additional positional arguments
         :param kwargs: Additional keyword arguments
@@ -96,30 +134,29 @@ class IndexView(ListView):
         """
         context = super().get_context_data(*args, **kwargs)
 
-        num_cycles = Cycle.objects.all().count()
-        num_contributors = Contributor.objects.all().count()
-        num_contributions = Contribution.objects.all().count()
-        total_rewards = Contribution.objects.aggregate(
-            total_rewards=Sum("reward__amount")
-        ).get("total_rewards", 0)
+        statistics = StatisticsSnapshot.objects.current()
 
-        context["num_cycles"] = num_cycles
-        context["num_contributors"] = num_contributors
-        context["num_contributions"] = num_contributions
-        context["total_rewards"] = total_rewards
+        context["num_cycles"] = statistics.num_cycles
+        context["num_contributors"] = statistics.num_contributors
+        context["num_contributions"] = statistics.num_contributions
+        context["total_rewards"] = statistics.total_rewards
 
         return context
 
     def get_queryset(self):
-        """Return queryset of unconfirmed contributions in reverse order.
+        """Return queryset of unconfirmed contributions.
+
+        Newest contributions come first as they are paginated by descending id.
 
         :return: QuerySet of unconfirmed contributions
         :rtype: :class:`django.db.models.QuerySet`
         """
-        return Contribution.objects.filter(confirmed=False).reverse()
+        return Contribution.objects.filter(confirmed=False).select_related(
+            "contributor", "reward__type"
+        )
 
 
-class ContributionDetailView(DetailView):
+class ContributionDetailView(JobStatusMixin, DetailView):
     """View for displaying detailed information about a single contribution.
 
     :ivar model: Model class for contributions
@@ -234,82 +271,17 @@ class ContributionInvalidateView(UpdateView):
         return context
 
     def form_valid(self, form):
-        """Set contribution as confirmed with reaction and optional reply."""
+        """Queue job confirming contribution with reaction and optional reply."""
         reaction = self.kwargs.get("reaction")
-        comment = form.cleaned_data.get("comment")
-
-        # Track operations that need to be performed
-        operations = []
-        if comment:
-            operations.append("reply")
-        operations.append("reaction")
-
-        # Perform operations and track failures
-        failed_operations = []
-
-        # Add reply if comment exists
-        reply_success = True
-        if comment:
-            try:
-                reply_success = add_reply_to_message(self.object.url, comment)
-                if not reply_success:
-                    failed_operations.append("reply")
-            except Exception as e:
-                logger = logging.getLogger(__name__)
-                logger.error(f"Failed to add reply: {str(e)}")
-                failed_operations.append("reply")
-
-        # Add reaction
-        reaction_success = True
-        try:
-
-            reaction_success = add_reaction_to_message(
-                self.object.url, DISCORD_EMOJIS.get(reaction)
-            )
-            if not reaction_success:
-                failed_operations.append("reaction")
-
-        except Exception as e:
-            logger = logging.getLogger(__name__)
-            logger.error(f"Failed to add reaction: {str(e)}")
-            failed_operations.append("reaction")
-
-        # If any operation failed, don't confirm and show error
-        if failed_operations:
-            error_msg = self._get_error_message(failed_operations, operations, reaction)
-            form.add_error(None, error_msg)
-            return self.form_invalid(form)
-
-        # All operations successful - confirm the contribution
-        self.object.confirmed = True
-        self.object.save()
-        self.request.user.profile.log_action(
-            "contribution_invalidated", self.object.info()
+        job = Job.objects.enqueue(
+            "invalidate_contribution",
+            user=self.request.user,
+            contribution_id=self.object.id,
+            reaction=reaction,
+            comment=form.cleaned_data.get("comment"),
         )
-
-        # Success message
-        success_msg = self._get_success_message(comment, reaction)
-        messages.success(self.request, success_msg)
-
-        return super().form_valid(form)
-
-    def _get_error_message(self, failed_operations, attempted_operations, reaction):
-        """Generate appropriate error message based on failed operations."""
-        if len(failed_operations) == len(attempted_operations):
-            return f"Failed to set contribution as {reaction}. All operations failed."
-
-        failed_ops_str = " and ".join(failed_operations)
-        return f"Failed to add {failed_ops_str}. Contribution was not confirmed as {reaction}."
-
-    def _get_success_message(self, comment, reaction):
-        """Generate appropriate success message."""
-        actions = [f"Confirmed as {reaction}"]
-        if comment:
-            actions.append("reply sent")
-        actions.append("reaction added")
-
-        actions_str = " and ".join(actions)
-        return f"Contribution {actions_str} successfully!"
+        messages.info(self.request, f"Setting contribution as {reaction} is queued.")
+        return redirect_to_job_status(self.get_success_url(), job)
 
     def get_success_url(self):
         """Return URL to redirect after successful update."""
@@ -337,25 +309,6 @@ class ContributionCreateView(CreateView):
         self.url_issue_number = kwargs.get("issue_number")
         return super().dispatch(request, *args, **kwargs)
 
-    def get_form(self, form_class=None):
-        """Filters contributors by serch query inputed by the user."""
-
-        form = super().get_form(form_class)
-
-        # Read q from GET or POST
-        search_query = self.request.GET.get("q") or self.request.POST.get("q")
-
-        queryset = Contributor.objects.all()
-
-        if search_query:
-            queryset = queryset.filter(
-                Q(name__icontains=search_query)
-                | Q(handle__handle__icontains=search_query)
-            ).distinct()
-
-        form.fields["contributor"].queryset = queryset
-        return form
-
     def get_form_kwargs(self):
         kwargs = super().get_form_kwargs()
 
@@ -397,17 +350,68 @@ class ContributionCreateView(CreateView):
         return reverse_lazy("contribution_detail", args=[self.object.pk])
 
 
-class ContributorListView(ListView):
+class ContributorListView(KeysetPaginationMixin, ListView):
     """View for displaying a paginated list of all contributors.
 
     :ivar model: Model class for contributors
     :type model: :class:`core.models.Contributor`
     :ivar paginate_by: Number of items per page
     :type paginate_by: int
+    :ivar keyset_ordering: fields contributors are ordered and paginated by
+    :type keyset_ordering: tuple
+    :ivar search_keyset_ordering: fields search results are ordered and paginated by
+    :type search_keyset_ordering: tuple
+    :ivar load_more_template: HTML template partial for the following pages
+    :type load_more_template: str
+    :ivar results_template: HTML template partial for HTMX search results
+    :type results_template: str
     """
 
     model = Contributor
     paginate_by = 20
+    keyset_ordering = ("lower_name", "id")
+    search_keyset_ordering = ("-similarity", "lower_name", "id")
+    load_more_template = "core/contributor_list.html#contributors_partial"
+    results_template = "core/contributor_list.html#results_partial"
+
+    def get(self, request, *args, **kwargs):
+        """Return cached partial for HTMX request or full template otherwise.
+
+        :param request: HTTP request object
+        :type request: :class:`django.http.HttpRequest`
+        :var template_name: HTML template partial to render
+        :type template_name: str
+        :return: :class:`django.http.HttpResponse`
+        """
+        if self.is_load_more_request():
+            template_name = self.load_more_template
+
+        elif getattr(request, "htmx", False):
+            template_name = self.results_template
+
+        else:
+            return super().get(request, *args, **kwargs)
+
+        return HttpResponse(
+            cached_fragment(
+                template_name,
+                lambda: self.render_partial(template_name),
+                query=request.GET.get("q", ""),
+                cursor=request.GET.get(self.cursor_kwarg, ""),
+            )
+        )
+
+    def render_partial(self, template_name):
+        """Return provided template partial rendered with the list's context.
+
+        :param template_name: HTML template partial to render
+        :type template_name: str
+        :return: str
+        """
+        self.object_list = self.get_queryset()
+        return render_to_string(
+            template_name, self.get_context_data(), request=self.request
+        )
 
     def get_queryset(self):
         """Return filtered queryset based on search query.
@@ -415,18 +419,15 @@ class ContributorListView(ListView):
         :return: QuerySet of contributors filtered by search term
         :rtype: :class:`django.db.models.QuerySet`
         """
-        queryset = super().get_queryset()
+        queryset = super().get_queryset().annotate(lower_name=Lower("name"))
 
         # Get search query from GET parameters
         search_query = self.request.GET.get("q")
         if search_query:
             # For search results, we can't use the complex prefetch
             return (
-                queryset.filter(
-                    Q(name__icontains=search_query)
-                    | Q(handle__handle__icontains=search_query)
-                )
-                .distinct()
+                self.model.objects.search(search_query)
+                .annotate(lower_name=Lower("name"))
                 .prefetch_related(
                     Prefetch(
                         "handle_set",
@@ -456,25 +457,18 @@ class ContributorListView(ListView):
             ),
         )
 
-    def render_to_response(self, context, **response_kwargs):
-        """Return full template or partial based on instance request.
+    def get_keyset_ordering(self):
+        """Return similarity based ordering for search results.
 
-        :param context: template context data
-        :type context: dict
-        :return: :class:`django.http.HttpResponse`
+        :return: tuple
         """
-        if getattr(self.request, "htmx", False):
-            html = render_to_string(
-                "core/contributor_list.html#results_partial",
-                context,
-                request=self.request,
-            )
-            return HttpResponse(html)
+        if self.request.GET.get("q"):
+            return self.search_keyset_ordering
 
-        return super().render_to_response(context, **response_kwargs)
+        return self.keyset_ordering
 
     def get_context_data(self, *args, **kwargs):
-        """Add search query to template context.
+        """Add search query and total number of contributors to template context.
 
         :param kwargs: Additional keyword arguments
         :return: Context dictionary with search data
@@ -482,22 +476,88 @@ class ContributorListView(ListView):
         """
         context = super().get_context_data(*args, **kwargs)
         context["search_query"] = self.request.GET.get("q", "")
+        context["num_contributors"] = (
+            StatisticsSnapshot.objects.current().num_contributors
+        )
         return context
 
 
+@method_decorator(user_passes_test(lambda user: user.is_superuser), name="dispatch")
+class ContributorAutocompleteView(View):
+    """JSON view returning the best matching contributors (superusers only).
+
+    Used by contribution create form instead of rendering all the contributors.
+    """
+
+    def get(self, request, *args, **kwargs):
+        """Return the top contributors matching search query.
+
+        :param request: HTTP request object
+        :type request: :class:`django.http.HttpRequest`
+        :var search_query: search term
+        :type search_query: str
+        :var contributors: the best matching contributors
+        :type contributors: :class:`django.db.models.QuerySet`
+        :return: :class:`django.http.JsonResponse`
+        """
+        search_query = request.GET.get("q", "").strip()
+        if len(search_query) < CONTRIBUTOR_AUTOCOMPLETE_MIN_LENGTH:
+            return JsonResponse({"results": []})
+
+        contributors = Contributor.objects.search(search_query).prefetch_related(
+            Prefetch(
+                "handle_set",
+                queryset=Handle.objects.select_related("platform"),
+                to_attr="prefetched_handles",
+            )
+        )[:CONTRIBUTOR_AUTOCOMPLETE_SIZE]
+        return JsonResponse(
+            {
+                "results": [
+                    {
+                        "id": contributor.id,
+                        "name": contributor.name,
+                        "info": contributor.info,
+                    }
+                    for contributor in contributors
+                ]
+            }
+        )
+
+
 class ContributorDetailView(DetailView):
     """View for displaying detailed information about a single contributor.
 
     :ivar model: Model class for contributors
     :type model: :class:`core.models.Contributor`
+    :ivar contributions_template: HTML template partial for contribution groups
+    :type contributions_template: str
     """
 
     model = Contributor
+    contributions_template = "core/contributor_detail.html#contribution_groups_partial"
+
+    def get_context_data(self, *args, **kwargs):
+        """Add cached contribution groups fragment and totals to template context.
+
+        :param kwargs: Additional keyword arguments
+        :return: dict
+        """
+        context = super().get_context_data(*args, **kwargs)
+        context["contributions_fragment"] = cached_fragment(
+            self.contributions_template,
+            self.render_contributions,
+            contributor=self.object.pk,
+        )
+        return context
 
     def get_queryset(self):
-        """Prefetch all related data to avoid N+1 queries.
+        """Prefetch handles data to avoid N+1 queries.
 
-        :return: QuerySet of this cycle's contributions ordered by ID in reverse
+        Contributions are fetched only when contribution groups fragment
+        isn't cached.
+
+        :return: QuerySet of contributors with prefetched handles
         :rtype: :class:`django.db.models.QuerySet`
         """
         return Contributor.objects.prefetch_related(
@@ -508,15 +568,26 @@ class ContributorDetailView(DetailView):
                 ),
                 to_attr="prefetched_handles",
             ),
-            Prefetch(
-                "contribution_set",
-                queryset=Contribution.objects.select_related(
-                    "cycle", "reward", "reward__type", "issue"
-                ).order_by("cycle__start", "created_at"),
-                to_attr="prefetched_contributions",
-            ),
         )
 
+    def render_contributions(self):
+        """Return rendered contribution groups together with contributor's totals.
+
+        :var contribution_groups: contributor's contribution groups
+        :type contribution_groups: list
+        :return: dict
+        """
+        contribution_groups = self.object.contribution_groups
+        return {
+            "html": render_to_string(
+                self.contributions_template,
+                {"contribution_groups": contribution_groups},
+                request=self.request,
+            ),
+            "total_rewards": self.object.total_rewards,
+            "num_groups": len(contribution_groups),
+        }
+
 
 class CycleListView(ListView):
     """View for displaying a paginated list of all cycles in reverse order.
@@ -537,7 +608,7 @@ class CycleListView(ListView):
         :return: dict
         """
         context = super().get_context_data(*args, **kwargs)
-        context["total_cycles"] = self.object_list.count()
+        context["total_cycles"] = context["paginator"].count
         return context
 
     def get_queryset(self):
@@ -598,17 +669,23 @@ class CycleDetailView(DetailView):
         )
 
 
-class IssueListView(ListView):
+class IssueListView(KeysetPaginationMixin, ListView):
     """View for displaying a paginated list of all open issues in reverse order.
 
     :ivar model: Model class for cycles
     :type model: :class:`core.models.Cycle`
     :ivar paginate_by: Number of items per page
     :type paginate_by: int
+    :ivar keyset_ordering: fields issues are ordered and paginated by
+    :type keyset_ordering: tuple
+    :ivar load_more_template: HTML template partial for the following pages
+    :type load_more_template: str
     """
 
     model = Issue
     paginate_by = 20
+    keyset_ordering = ("-number",)
+    load_more_template = "core/issue_list.html#issues_partial"
 
     def get_context_data(self, *args, **kwargs):
         """Add open issues' context data to template.
@@ -647,16 +724,56 @@ class IssueListView(ListView):
         )
 
 
-class IssueDetailView(DetailView):
+class IssueDetailView(JobStatusMixin, DetailView):
     """View for displaying detailed information about a single issue."""
 
     model = Issue
 
+    def get_queryset(self):
+        """Return issues queryset with prefetched contributions and their relations.
+
+        :return: :class:`django.db.models.QuerySet`
+        """
+        return Issue.objects.prefetch_related(
+            Prefetch(
+                "contribution_set",
+                queryset=Contribution.objects.select_related(
+                    "contributor", "platform", "reward__type"
+                ),
+            )
+        )
+
+    def github_issue_data(self, issue_number):
+        """Return GitHub issue data from the local mirror or from GitHub if stale.
+
+        Stale mirrored issue is still returned if GitHub issue can't be fetched.
+
+        :param issue_number: unique issue's number
+        :type issue_number: int
+        :var mirror: mirrored GitHub issue
+        :type mirror: :class:`core.models.GitHubIssueMirror`
+        :var issue_data: GitHub issue fetching result
+        :type issue_data: dict
+        :return: dict
+        """
+        mirror = GitHubIssueMirror.objects.filter(number=issue_number).first()
+        if mirror and mirror.is_fresh():
+            return {"success": True, "issue": mirror.as_issue_data()}
+
+        issue_data = issue_by_number(self.request.user, issue_number)
+        if not issue_data["success"] and mirror:
+            logger.warning(
+                f"Serving stale issue #{issue_number}: {issue_data.get('error')}"
+            )
+            return {"success": True, "issue": mirror.as_issue_data()}
+
+        return issue_data
+
     def get_context_data(self, *args, **kwargs):
         """Add GitHub issue data and form to template context."""
         context = super().get_context_data(*args, **kwargs)
 
-        issue = self.get_object()
+        issue = self.object
         context["issue_html_url"] = (
             f"https://github.com/{settings.GITHUB_REPO_OWNER}/"
             f"{settings.GITHUB_REPO_NAME}/issues/{issue.number}"
@@ -665,7 +782,7 @@ class IssueDetailView(DetailView):
         # Only fetch GitHub data and show form for superusers
         if self.request.user.is_superuser:
             # Retrieve GitHub issue data if issue number exists
-            issue_data = issue_by_number(self.request.user, issue.number)
+            issue_data = self.github_issue_data(issue.number)
 
             if issue_data["success"]:
                 context["github_issue"] = issue_data["issue"]
@@ -757,6 +874,9 @@ class IssueDetailView(DetailView):
                     f"{', '.join(labels_to_add)}"
                 )
                 messages.success(request, "Labels updated successfully")
+                GitHubIssueMirror.objects.filter(number=issue.number).update(
+                    labels=result.get("current_labels", labels_to_add)
+                )
 
                 request.user.profile.log_action("issue_labels_set", success_message)
 
@@ -787,7 +907,7 @@ class IssueDetailView(DetailView):
 
         try:
             # Get current labels from GitHub
-            issue_data = issue_by_number(request.user, issue.number)
+            issue_data = self.github_issue_data(issue.number)
             if not issue_data["success"]:
                 messages.error(
                     request, f"Failed to fetch GitHub issue: {issue_data.get('error')}"
@@ -811,47 +931,20 @@ class IssueDetailView(DetailView):
             if action not in labels_to_set:
                 labels_to_set.append(action)
 
-            success_message = f"Issue #{issue.number} closed as {action} successfully."
-
-            # Call the function to close issue on GitHub
-            result = close_issue_with_labels(
+            job = Job.objects.enqueue(
+                "close_issue",
                 user=request.user,
-                issue_number=issue.number,
+                issue_id=issue.id,
+                action=action,
                 labels_to_set=labels_to_set,
                 comment=comment,
             )
-
-            if result["success"]:
-                self.request.user.profile.log_action("issue_closed", success_message)
-                messages.success(request, success_message)
-                for contribution in self.get_object().contribution_set.all():
-                    add_reaction_to_message(
-                        contribution.url, DISCORD_EMOJIS.get(action)
-                    )
-
-                issue.status = (
-                    IssueStatus.ADDRESSED
-                    if action == "addressed"
-                    else IssueStatus.WONTFIX
-                )
-                issue.save()
-                self.request.user.profile.log_action("issue_status_set", str(issue))
-
-                if (
-                    action == "addressed"
-                    and process_allocations_for_contributions(
-                        self.get_object().contribution_set.all(),
-                        Contribution.objects.addresses_and_amounts_from_contributions,
-                    )[0]
-                ):
-                    issue.status = IssueStatus.CLAIMABLE
-                    issue.save()
-                    self.request.user.profile.log_action("issue_status_set", str(issue))
-
-            else:
-                messages.error(
-                    request, result.get("error", "Failed to close issue on GitHub")
-                )
+            messages.info(
+                request, f"Closing issue #{issue.number} as {action} is queued."
+            )
+            return redirect_to_job_status(
+                reverse("issue_detail", kwargs={"pk": issue.pk}), job
+            )
 
         except Exception as e:
             messages.error(request, f"Error closing issue: {str(e)}")
@@ -933,6 +1026,73 @@ class IssueModalView(DetailView):
         return HttpResponse(html)
 
 
+@method_decorator(user_passes_test(lambda user: user.is_superuser), name="dispatch")
+class JobStatusView(DetailView):
+    """View rendering background job's status, polled by HTMX until job finishes.
+
+    :ivar model: Model class for background jobs
+    :type model: :class:`core.models.Job`
+    :ivar template_name: HTML template for the job's status
+    :type template_name: str
+    """
+
+    model = Job
+    template_name = "snippets/job_status.html"
+
+    def get_context_data(self, *args, **kwargs):
+        """Add status polling interval to template context."""
+        context = super().get_context_data(*args, **kwargs)
+        context["job_poll_interval"] = JOB_STATUS_POLL_INTERVAL
+        return context
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class GitHubWebhookView(View):
+    """View receiving GitHub webhook deliveries for updating issues mirror.
+
+    Deliveries are authenticated by their `X-Hub-Signature-256` signature
+    made with the `GITHUB_WEBHOOK_SECRET` secret.
+
+    :ivar mirrored_events: webhook events carrying an issue to mirror
+    :type mirrored_events: tuple
+    """
+
+    mirrored_events = ("issues", "issue_comment")
+
+    def post(self, request, *args, **kwargs):
+        """Update mirrored issue from signed webhook delivery's payload.
+
+        :param request: HTTP request object
+        :type request: :class:`django.http.HttpRequest`
+        :var event: name of the webhook event
+        :type event: str
+        :var payload: webhook event's payload
+        :type payload: dict
+        :return: :class:`django.http.HttpResponse`
+        """
+        if not is_valid_webhook_signature(
+            request.body, request.headers.get("X-Hub-Signature-256", "")
+        ):
+            return HttpResponse(status=403)
+
+        event = request.headers.get("X-GitHub-Event", "")
+        if event in self.mirrored_events:
+            try:
+                payload = json.loads(request.body)
+                if event == "issues" and payload.get("action") == "deleted":
+                    GitHubIssueMirror.objects.filter(
+                        number=payload["issue"]["number"]
+                    ).delete()
+
+                else:
+                    GitHubIssueMirror.objects.update_from_github([payload["issue"]])
+
+            except (ValueError, KeyError, TypeError):
+                return HttpResponse(status=400)
+
+        return HttpResponse(status=204)
+
+
 @method_decorator(user_passes_test(lambda user: user.is_superuser), name="dispatch")
 class CreateIssueView(FormView):
     """View for creating GitHub issues from contributions.
@@ -1051,7 +1211,13 @@ class CreateIssueView(FormView):
         self.request.user.profile.log_action(
             "contribution_created", contribution.info()
         )
-        add_reaction_to_message(contribution.url, DISCORD_EMOJIS.get("noted"))
+        if contribution.url:
+            Job.objects.enqueue(
+                "add_reactions",
+                user=self.request.user,
+                urls=[contribution.url],
+                emoji=DISCORD_EMOJIS.get("noted"),
+            )
 
         return super().form_valid(form)
 
@@ -1228,7 +1394,7 @@ class SignupView(AllauthSignupView):
         return context
 
 
-class UnconfirmedContributionsView(ListView):
+class UnconfirmedContributionsView(KeysetPaginationMixin, ListView):
     """View for displaying unconfirmed contribution links.
 
     :ivar model: Model class for contributions
@@ -1237,16 +1403,23 @@ class UnconfirmedContributionsView(ListView):
     :type paginate_by: int
     :ivar template_name: HTML template for the page
     :type template_name: str
+    :ivar load_more_template: HTML template partial for the following pages
+    :type load_more_template: str
     """
 
     model = Contribution
     paginate_by = 20
     template_name = "unconfirmed_contributions.html"
+    load_more_template = "unconfirmed_contributions.html#contributions_partial"
 
     def get_queryset(self):
-        """Return queryset of unconfirmed contributions in reverse order.
+        """Return queryset of unconfirmed contributions.
+
+        Newest contributions come first as they are paginated by descending id.
 
         :return: QuerySet of unconfirmed contributions
         :rtype: :class:`django.db.models.QuerySet`
         """
-        return Contribution.objects.filter(confirmed=False).reverse()
+        return Contribution.objects.filter(confirmed=False).select_related(
+            "contributor", "reward__type"
+        )
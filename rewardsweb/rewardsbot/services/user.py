@@ -9,6 +9,9 @@ user contribution summaries and statistics.
 
 import logging
 from datetime import datetime
+from http import HTTPStatus
+
+import aiohttp
 
 from rewardsbot.models.contribution import Contribution
 
@@ -30,51 +33,43 @@ class UserService:
         :type api_service: :class:`APIService`
         :param username: Username to generate summary for
         :type username: str
+        :var summary: user's totals and the most recent contributions
+        :type summary: dict
         :return: Formatted user summary or error message
         :rtype: str
         """
         try:
-            contributions = await api_service.fetch_user_contributions(username)
-            if not contributions:
+            summary = await api_service.fetch_user_summary(username)
+            if not summary.get("total_contributions"):
                 return f"No contributions for {username}."
 
-            # Get first contribution cycle dates
-            first_contribution_cycle = await api_service.fetch_cycle_by_id_plain(
-                contributions[0]["cycle_id"]
-            )
-            first_contribution_date = first_contribution_cycle.get("end")
-
-            if first_contribution_date:
-                end_date = datetime.fromisoformat(
-                    first_contribution_date.replace("Z", "+00:00")
-                )
+            first_cycle_end = summary.get("first_cycle_end")
+            if first_cycle_end:
+                end_date = datetime.fromisoformat(first_cycle_end)
                 first_contribution_formatted = f"{end_date.year}/{end_date.month:02d}"
 
             else:
                 first_contribution_formatted = "Unknown"
 
-            total_contributions = len(contributions)
-            total_rewards = sum(
-                contribution.get("reward", 0) for contribution in contributions
-            )
-
-            last_five_contributions = sorted(
-                contributions, key=lambda x: x.get("id", 0), reverse=True
-            )[:5]
-
             contributions_text = "\n".join(
                 Contribution(contribution).formatted_contributions(True)
-                for contribution in last_five_contributions
+                for contribution in summary.get("last_contributions", [])
             )
 
             return (
                 f"**{username}**\n\n"
                 f"First contribution cycle: {first_contribution_formatted}\n"
-                f"Total contributions: {total_contributions}\n"
-                f"Total rewards: {total_rewards:,}\n\n"
+                f"Total contributions: {summary['total_contributions']}\n"
+                f"Total rewards: {summary.get('total_rewards', 0):,}\n\n"
                 f"Last contributions:\n\n{contributions_text}"
             )
 
         except Exception as error:
+            if (
+                isinstance(error, aiohttp.ClientResponseError)
+                and error.status == HTTPStatus.NOT_FOUND
+            ):
+                return f"No contributions for {username}."
+
             logger.error(f"❌ User Summary Error: {error}", exc_info=True)
             return f"❌ Failed to generate user summary for {username}."
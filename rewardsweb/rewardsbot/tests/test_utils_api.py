@@ -4,12 +4,19 @@ This module contains tests for the ApiService class and its
 HTTP request functionality.
 """
 
+import asyncio
 from unittest import mock
 
 import aiohttp
 import pytest
 
-from rewardsbot.utils.api import BASE_URL, ApiService
+from rewardsbot.utils.api import (
+    BASE_URL,
+    CACHE_DEFAULT_TTL,
+    ApiService,
+    cache_ttl,
+)
+from rewardsbot.utils.cache import TTLCache
 
 
 class TestUtilsApi:
@@ -21,6 +28,9 @@ class TestUtilsApi:
         """Test ApiService initialization without session."""
         api_service = ApiService()
         assert api_service.session is None
+        assert api_service.in_flight == {}
+        assert isinstance(api_service.cache, TTLCache)
+        assert api_service.generation == 0
 
     @pytest.mark.asyncio
     async def test_utils_api_initialize_success(self, mocker):
@@ -117,14 +127,15 @@ class TestUtilsApi:
         returned = await api_service.make_request(endpoint, params=params)
         assert returned == data
         calls = [
-            mocker.call(f"🌐 API Request: GET {url} with params: {params}"),
-            mocker.call(f"📡 API Response Status: {status} for {url}"),
             mocker.call(
-                f"✅ API Response received for {endpoint}: {len(str(data))} bytes"
+                f"💾 Cache miss for {endpoint} " "(hits=0 stale=0 misses=1 size=0)"
             ),
+            mocker.call(f"🌐 API Request: GET {url} with params: {params}"),
+            mocker.call(f"📡 API Response Status: {status} for {url}"),
+            mocker.call(f"✅ API Response received for {endpoint}"),
         ]
         mocked_logger.info.assert_has_calls(calls, any_order=True)
-        assert mocked_logger.info.call_count == 3
+        assert mocked_logger.info.call_count == 4
         mocked_response.raise_for_status.assert_called_once_with()
         mocked_response.json.assert_called_once_with()
 
@@ -154,9 +165,7 @@ class TestUtilsApi:
         calls = [
             mocker.call(f"🌐 API Request: POST {url} with params: {params}"),
             mocker.call(f"📡 API Response Status: {status} for {url}"),
-            mocker.call(
-                f"✅ API Response received for {endpoint}: {len(str(data))} bytes"
-            ),
+            mocker.call(f"✅ API Response received for {endpoint}"),
         ]
         mocked_logger.info.assert_has_calls(calls, any_order=True)
         assert mocked_logger.info.call_count == 3
@@ -190,6 +199,178 @@ class TestUtilsApi:
             f"❌ Unexpected API error for {endpoint}: error 1"
         )
 
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_coalesces_concurrent_gets(self, mocker):
+        api_service = ApiService()
+        release = asyncio.Event()
+
+        async def send_request(endpoint, params, method):
+            await release.wait()
+            return {"endpoint": endpoint}
+
+        mocked_send = mocker.patch.object(
+            api_service, "_send_request", side_effect=send_request
+        )
+        mocked_logger = mocker.patch("rewardsbot.utils.api.logger")
+        tasks = [
+            asyncio.ensure_future(api_service.make_request("cycles/current"))
+            for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        assert len(api_service.in_flight) == 1
+        release.set()
+        returned = await asyncio.gather(*tasks)
+        assert returned == [{"endpoint": "cycles/current"}] * 3
+        mocked_send.assert_called_once_with("cycles/current", {}, "GET")
+        assert mocked_logger.info.call_count == 5
+        mocked_logger.info.assert_called_with(
+            "🔁 Joining in-flight request for cycles/current"
+        )
+        await asyncio.sleep(0)
+        assert api_service.in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_for_different_params(self, mocker):
+        api_service = ApiService()
+        mocked_send = mocker.patch.object(
+            api_service, "_send_request", new_callable=mock.AsyncMock
+        )
+        await asyncio.gather(
+            api_service.make_request("contributions", {"name": "user1"}),
+            api_service.make_request("contributions", {"name": "user2"}),
+        )
+        assert mocked_send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_propagates_error_to_all_callers(self, mocker):
+        api_service = ApiService()
+
+        async def send_request(endpoint, params, method):
+            await asyncio.sleep(0)
+            raise aiohttp.ClientError("error 1")
+
+        mocked_send = mocker.patch.object(
+            api_service, "_send_request", side_effect=send_request
+        )
+        returned = await asyncio.gather(
+            api_service.make_request("cycles/current"),
+            api_service.make_request("cycles/current"),
+            return_exceptions=True,
+        )
+        assert all(isinstance(error, aiohttp.ClientError) for error in returned)
+        mocked_send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_does_not_coalesce_posts(self, mocker):
+        api_service = ApiService()
+        mocked_send = mocker.patch.object(
+            api_service, "_send_request", new_callable=mock.AsyncMock
+        )
+        await asyncio.gather(
+            api_service.make_request("addcontribution", {"a": 1}, "POST"),
+            api_service.make_request("addcontribution", {"a": 1}, "POST"),
+        )
+        assert mocked_send.call_count == 2
+        assert api_service.in_flight == {}
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_for_fresh_cached_response(self, mocker):
+        api_service = ApiService()
+        mocked_send = mocker.patch.object(
+            api_service, "_send_request", new_callable=mock.AsyncMock
+        )
+        mocked_send.return_value = {"id": 5}
+        assert await api_service.make_request("cycles/current") == {"id": 5}
+        mocked_logger = mocker.patch("rewardsbot.utils.api.logger")
+        assert await api_service.make_request("cycles/current") == {"id": 5}
+        mocked_send.assert_called_once_with("cycles/current", {}, "GET")
+        mocked_logger.info.assert_called_once_with(
+            "💾 Cache hit for cycles/current (hits=1 stale=0 misses=1 size=1)"
+        )
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_for_stale_cached_response(self, mocker):
+        api_service = ApiService()
+        api_service.cache.get = mocker.MagicMock(return_value=({"id": 4}, True))
+        mocked_send = mocker.patch.object(
+            api_service, "_send_request", new_callable=mock.AsyncMock
+        )
+        mocked_send.return_value = {"id": 5}
+        mocked_logger = mocker.patch("rewardsbot.utils.api.logger")
+        assert await api_service.make_request("cycles/current") == {"id": 4}
+        assert len(api_service.in_flight) == 1
+        mocked_logger.info.assert_called_once_with(
+            "💾 Cache stale hit for cycles/current " "(hits=0 stale=0 misses=0 size=0)"
+        )
+        await asyncio.gather(*api_service.in_flight.values())
+        mocked_send.assert_called_once_with("cycles/current", {}, "GET")
+        assert api_service.cache.entries[("cycles/current", ())][0] == {"id": 5}
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_for_failed_background_refresh(self, mocker):
+        api_service = ApiService()
+        api_service.cache.get = mocker.MagicMock(return_value=({"id": 4}, True))
+        mocker.patch.object(
+            api_service,
+            "_send_request",
+            new_callable=mock.AsyncMock,
+            side_effect=aiohttp.ClientError("error 1"),
+        )
+        assert await api_service.make_request("cycles/current") == {"id": 4}
+        task = next(iter(api_service.in_flight.values()))
+        await asyncio.gather(task, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert api_service.in_flight == {}
+        assert len(api_service.cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_for_write_during_get(self, mocker):
+        api_service = ApiService()
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def send_request(endpoint, params, method):
+            if method == "GET":
+                generation = api_service.generation
+                started.set()
+                await release.wait()
+                return {"id": generation}
+
+        mocker.patch.object(api_service, "_send_request", side_effect=send_request)
+        stale = asyncio.ensure_future(api_service.make_request("cycles/current"))
+        await started.wait()
+        await api_service.post_suggestion("F", "1", "user", "", "url")
+        fresh = asyncio.ensure_future(api_service.make_request("cycles/current"))
+        await asyncio.sleep(0)
+        assert len(api_service.in_flight) == 1
+        release.set()
+        assert await stale == {"id": 0}
+        assert await fresh == {"id": 1}
+        await asyncio.sleep(0)
+        assert api_service.in_flight == {}
+        assert api_service.cache.entries[("cycles/current", ())][0] == {"id": 1}
+
+    @pytest.mark.asyncio
+    async def test_utils_api_make_request_does_not_cache_posts(self, mocker):
+        api_service = ApiService()
+        mocker.patch.object(api_service, "_send_request", new_callable=mock.AsyncMock)
+        await api_service.make_request("addcontribution", {"a": 1}, "POST")
+        assert len(api_service.cache) == 0
+
+    @pytest.mark.parametrize(
+        "endpoint,ttl",
+        [
+            ("cycles/current/plain", 300),
+            ("cycles/current", 60),
+            ("cycles/5", 300),
+            ("cycles/5/plain", 300),
+            ("contributions/tail", 30),
+            ("contributions", CACHE_DEFAULT_TTL),
+            ("contributors/user1/summary", CACHE_DEFAULT_TTL),
+        ],
+    )
+    def test_utils_api_cache_ttl(self, endpoint, ttl):
+        assert cache_ttl(endpoint) == ttl
+
     # # ApiService specific endpoint methods - test these instead of make_request directly
     @pytest.mark.asyncio
     async def test_utils_api_fetch_cycle(self, mocker):
@@ -312,11 +493,32 @@ class TestUtilsApi:
             )
             assert result == expected_response
 
+    @pytest.mark.asyncio
+    async def test_utils_api_fetch_user_summary(self, mocker):
+        """Test fetch_user_summary calls correct endpoint for quoted username."""
+        api_service = ApiService()
+        api_service.make_request = mocker.AsyncMock()
+        username = "u/test user"
+        expected_response = {"name": "test_user", "total_contributions": 0}
+        api_service.make_request.return_value = expected_response
+
+        with mock.patch("rewardsbot.utils.api.logger") as mock_logger:
+            result = await api_service.fetch_user_summary(username)
+
+            api_service.make_request.assert_called_once_with(
+                "contributors/u%2Ftest%20user/summary"
+            )
+            mock_logger.info.assert_called_once_with(
+                f"🔗 fetch_user_summary called for {username}"
+            )
+            assert result == expected_response
+
     @pytest.mark.asyncio
     async def test_utils_api_post_suggestion(self, mocker):
         """Test post_suggestion calls correct endpoint with data."""
         api_service = ApiService()
         api_service.make_request = mocker.AsyncMock()
+        api_service.cache.set(("cycles/current", ()), {"id": 5}, 60)
 
         contribution_type = "Forum Post"
         level = "2"
@@ -347,6 +549,7 @@ class TestUtilsApi:
                 f"🔗 post_suggestion called for {username}"
             )
             assert result == expected_response
+            assert len(api_service.cache) == 0
 
     @pytest.mark.asyncio
     async def test_utils_api_post_suggestion_empty_comment(self, mocker):
@@ -0,0 +1,84 @@
+"""Unit tests for :py:mod:`rewardsbot.utils.cache` module.
+
+This module contains tests for the TTLCache class.
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+from rewardsbot.utils.cache import CACHE_MAX_SIZE, CACHE_STALE_TTL, TTLCache
+
+
+class TestUtilsCache:
+    """Testing class for :py:class:`rewardsbot.utils.cache.TTLCache`."""
+
+    @pytest.fixture
+    def monotonic(self, mocker):
+        return mocker.patch("rewardsbot.utils.cache.time.monotonic", return_value=0)
+
+    def test_utils_cache_ttlcache_init(self):
+        cache = TTLCache()
+        assert cache.maxsize == CACHE_MAX_SIZE
+        assert cache.stale_ttl == CACHE_STALE_TTL
+        assert cache.entries == OrderedDict()
+        assert (cache.hits, cache.stale_hits, cache.misses) == (0, 0, 0)
+        assert len(cache) == 0
+
+    def test_utils_cache_ttlcache_stats(self):
+        cache = TTLCache()
+        cache.hits, cache.stale_hits, cache.misses = 3, 2, 1
+        cache.set("key", "value", 10)
+        assert cache.stats == "hits=3 stale=2 misses=1 size=1"
+
+    def test_utils_cache_ttlcache_get_for_missing_key(self):
+        cache = TTLCache()
+        assert cache.get("key") is None
+        assert cache.misses == 1
+
+    def test_utils_cache_ttlcache_get_for_fresh_entry(self, monotonic):
+        cache = TTLCache(stale_ttl=20)
+        cache.set("key", "value", 10)
+        monotonic.return_value = 9.9
+        assert cache.get("key") == ("value", False)
+        assert cache.hits == 1
+
+    def test_utils_cache_ttlcache_get_for_stale_entry(self, monotonic):
+        cache = TTLCache(stale_ttl=20)
+        cache.set("key", "value", 10)
+        monotonic.return_value = 10
+        assert cache.get("key") == ("value", True)
+        monotonic.return_value = 29.9
+        assert cache.get("key") == ("value", True)
+        assert cache.stale_hits == 2
+
+    def test_utils_cache_ttlcache_get_for_expired_entry(self, monotonic):
+        cache = TTLCache(stale_ttl=20)
+        cache.set("key", "value", 10)
+        monotonic.return_value = 30
+        assert cache.get("key") is None
+        assert cache.misses == 1
+        assert len(cache) == 0
+
+    def test_utils_cache_ttlcache_set_replaces_entry(self, monotonic):
+        cache = TTLCache()
+        cache.set("key", "value", 10)
+        cache.set("key", "value2", 10)
+        assert len(cache) == 1
+        assert cache.get("key") == ("value2", False)
+
+    def test_utils_cache_ttlcache_set_evicts_least_recently_used(self):
+        cache = TTLCache(maxsize=2)
+        cache.set("key1", "value1", 10)
+        cache.set("key2", "value2", 10)
+        cache.get("key1")
+        cache.set("key3", "value3", 10)
+        assert list(cache.entries) == ["key1", "key3"]
+
+    def test_utils_cache_ttlcache_clear(self):
+        cache = TTLCache()
+        cache.set("key", "value", 10)
+        cache.hits = 1
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.hits == 1
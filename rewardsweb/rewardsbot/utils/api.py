@@ -5,16 +5,44 @@ to the rewards backend API with proper session management and error handling.
 
 :var logger: API service logger instance
 :type logger: :class:`logging.Logger`
+:var CACHE_TTLS: seconds GET responses are fresh, by endpoint prefix
+:type CACHE_TTLS: tuple
+:var CACHE_DEFAULT_TTL: seconds GET responses of other endpoints are fresh
+:type CACHE_DEFAULT_TTL: int
 """
 
+import asyncio
 import logging
+from urllib.parse import quote
 
 import aiohttp
 
 from rewardsbot.config import BASE_URL
+from rewardsbot.utils.cache import TTLCache
 
 logger = logging.getLogger("discord.api")
 
+CACHE_TTLS = (
+    ("cycles/current/plain", 300),
+    ("cycles/current", 60),
+    ("cycles/", 300),
+    ("contributions/tail", 30),
+)
+CACHE_DEFAULT_TTL = 60
+
+
+def cache_ttl(endpoint):
+    """Return number of seconds the response of provided `endpoint` is fresh.
+
+    :param endpoint: API endpoint (without base URL)
+    :type endpoint: str
+    :return: int
+    """
+    return next(
+        (ttl for prefix, ttl in CACHE_TTLS if endpoint.startswith(prefix)),
+        CACHE_DEFAULT_TTL,
+    )
+
 
 class ApiService:
     """Service class for API interactions with the rewards backend.
@@ -24,11 +52,20 @@ class ApiService:
 
     :ivar session: aiohttp client session for making requests
     :type session: :class:`aiohttp.ClientSession` or None
+    :ivar in_flight: pending GET requests' tasks keyed by endpoint and params
+    :type in_flight: dict
+    :ivar cache: GET responses keyed by endpoint and params
+    :type cache: :class:`rewardsbot.utils.cache.TTLCache`
+    :ivar generation: number of writes invalidating cached responses
+    :type generation: int
     """
 
     def __init__(self):
         """Initialize ApiService without an active session."""
         self.session = None
+        self.in_flight = {}
+        self.cache = TTLCache()
+        self.generation = 0
 
     async def initialize(self):
         """Initialize the aiohttp session.
@@ -54,12 +91,21 @@ class ApiService:
     async def make_request(self, endpoint, params=None, method="GET"):
         """Make an HTTP request to the API.
 
+        GET responses are cached for endpoint's time-to-live and served stale
+        for a while after that, when they are refreshed in the background.
+        Concurrent identical GET requests are coalesced, so only the first one
+        hits the backend and the others await its result.
+
         :param endpoint: API endpoint to call (without base URL)
         :type endpoint: str
         :param params: Query parameters for GET or JSON data for POST
         :type params: dict or None
         :param method: HTTP method (GET or POST)
         :type method: str
+        :var key: identifier of the request among cached and in-flight requests
+        :type key: tuple
+        :var cached: cached response and its staleness flag
+        :type cached: tuple or None
         :return: JSON response from the API
         :rtype: dict or list
         :raises aiohttp.ClientError: For HTTP-related errors
@@ -68,6 +114,114 @@ class ApiService:
         if params is None:
             params = {}
 
+        if method.upper() != "GET":
+            return await self._send_request(endpoint, params, method)
+
+        key = (endpoint, tuple(sorted(params.items())))
+        cached = self.cache.get(key)
+        if cached is not None:
+            data, stale = cached
+            logger.info(
+                f"💾 Cache {'stale hit' if stale else 'hit'} for {endpoint} "
+                f"({self.cache.stats})"
+            )
+            if stale:
+                self._fetch(key, endpoint, params)
+
+            return data
+
+        logger.info(f"💾 Cache miss for {endpoint} ({self.cache.stats})")
+        # shielded so a cancelled caller doesn't cancel the request for others
+        return await asyncio.shield(self._fetch(key, endpoint, params))
+
+    def _fetch(self, key, endpoint, params):
+        """Return task fetching and caching GET response, reusing in-flight one.
+
+        :param key: identifier of the request among in-flight requests
+        :type key: tuple
+        :param endpoint: API endpoint to call (without base URL)
+        :type endpoint: str
+        :param params: Query parameters
+        :type params: dict
+        :var task: task performing the HTTP request
+        :type task: :class:`asyncio.Task`
+        :return: :class:`asyncio.Task`
+        """
+        task = self.in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_and_cache(key, endpoint, params))
+            self.in_flight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+
+        else:
+            logger.info(f"🔁 Joining in-flight request for {endpoint}")
+
+        return task
+
+    async def _fetch_and_cache(self, key, endpoint, params):
+        """Send GET request to the API and cache its JSON response.
+
+        Response isn't cached if a write has invalidated the cache while the
+        request was in flight, as it may be outdated already.
+
+        :param key: cache key of the request
+        :type key: tuple
+        :param endpoint: API endpoint to call (without base URL)
+        :type endpoint: str
+        :param params: Query parameters
+        :type params: dict
+        :var generation: cache generation at the time the request is sent
+        :type generation: int
+        :var data: JSON response from the API
+        :type data: dict or list
+        :return: dict or list
+        """
+        generation = self.generation
+        data = await self._send_request(endpoint, params, "GET")
+        if generation == self.generation:
+            self.cache.set(key, data, cache_ttl(endpoint))
+
+        return data
+
+    def _forget(self, key, task):
+        """Remove finished `task` from in-flight requests if it's still there.
+
+        Exception is retrieved so failed background refreshes don't produce
+        "exception was never retrieved" warnings; it is already logged.
+
+        :param key: identifier of the request among in-flight requests
+        :type key: tuple
+        :param task: finished task
+        :type task: :class:`asyncio.Task`
+        """
+        if self.in_flight.get(key) is task:
+            del self.in_flight[key]
+
+        if not task.cancelled():
+            task.exception()
+
+    def _invalidate(self):
+        """Drop cached responses and stop sharing the requests in flight.
+
+        Generation is increased, so the requests in flight don't cache
+        responses that may predate the write.
+        """
+        self.generation += 1
+        self.cache.clear()
+        self.in_flight.clear()
+
+    async def _send_request(self, endpoint, params, method):
+        """Send an HTTP request to the API and return its JSON response.
+
+        :param endpoint: API endpoint to call (without base URL)
+        :type endpoint: str
+        :param params: Query parameters for GET or JSON data for POST
+        :type params: dict
+        :param method: HTTP method (GET or POST)
+        :type method: str
+        :return: JSON response from the API
+        :rtype: dict or list
+        """
         url = f"{BASE_URL}/{endpoint}"
         logger.info(f"🌐 API Request: {method} {url} with params: {params}")
 
@@ -77,18 +231,14 @@ class ApiService:
                     logger.info(f"📡 API Response Status: {response.status} for {url}")
                     response.raise_for_status()
                     data = await response.json()
-                    logger.info(
-                        f"✅ API Response received for {endpoint}: {len(str(data))} bytes"
-                    )
+                    logger.info(f"✅ API Response received for {endpoint}")
                     return data
             else:
                 async with self.session.post(url, json=params) as response:
                     logger.info(f"📡 API Response Status: {response.status} for {url}")
                     response.raise_for_status()
                     data = await response.json()
-                    logger.info(
-                        f"✅ API Response received for {endpoint}: {len(str(data))} bytes"
-                    )
+                    logger.info(f"✅ API Response received for {endpoint}")
                     return data
 
         except Exception as error:
@@ -166,6 +316,19 @@ class ApiService:
         logger.info(f"🔗 fetch_user_contributions called for {username}")
         return await self.make_request("contributions", {"name": username})
 
+    async def fetch_user_summary(self, username):
+        """Fetch totals and the most recent contributions for a specific user.
+
+        :param username: Username to fetch summary for
+        :type username: str
+        :return: User summary data
+        :rtype: dict
+        """
+        logger.info(f"🔗 fetch_user_summary called for {username}")
+        return await self.make_request(
+            f"contributors/{quote(username, safe='')}/summary"
+        )
+
     async def post_suggestion(
         self, contribution_type, level, username, comment, message_url
     ):
@@ -181,11 +344,13 @@ class ApiService:
         :type comment: str
         :param message_url: URL of the Discord message
         :type message_url: str
+        :var response: API response from suggestion creation
+        :type response: dict
         :return: API response from suggestion creation
         :rtype: dict
         """
         logger.info(f"🔗 post_suggestion called for {username}")
-        return await self.make_request(
+        response = await self.make_request(
             "addcontribution",
             {
                 "type": contribution_type,
@@ -197,3 +362,6 @@ class ApiService:
             },
             "POST",
         )
+        # new contribution changes cycles' and contributors' data
+        self._invalidate()
+        return response
@@ -0,0 +1,117 @@
+"""Bounded in-memory cache with time-to-live and stale-while-revalidate support.
+
+This module provides the TTLCache class used by the API service for
+keeping recently fetched API responses in memory.
+
+:var CACHE_MAX_SIZE: default maximum number of cached entries
+:type CACHE_MAX_SIZE: int
+:var CACHE_STALE_TTL: seconds an expired entry is still served while refreshed
+:type CACHE_STALE_TTL: int
+"""
+
+import time
+from collections import OrderedDict
+
+CACHE_MAX_SIZE = 256
+CACHE_STALE_TTL = 300
+
+
+class TTLCache:
+    """Least recently used cache with fresh and stale expiry for every entry.
+
+    An entry is fresh until its time-to-live passes, then it is stale for
+    `stale_ttl` more seconds, during which it is still returned so the caller
+    can serve it and refresh it in the background.
+
+    :ivar maxsize: maximum number of cached entries
+    :type maxsize: int
+    :ivar stale_ttl: seconds an expired entry is still returned as stale
+    :type stale_ttl: int
+    :ivar entries: cached values with their fresh and stale expiry times
+    :type entries: :class:`collections.OrderedDict`
+    :ivar hits: number of fresh entry lookups
+    :type hits: int
+    :ivar stale_hits: number of stale entry lookups
+    :type stale_hits: int
+    :ivar misses: number of lookups without usable entry
+    :type misses: int
+    """
+
+    def __init__(self, maxsize=CACHE_MAX_SIZE, stale_ttl=CACHE_STALE_TTL):
+        """Initialize empty cache and its counters.
+
+        :param maxsize: maximum number of cached entries
+        :type maxsize: int
+        :param stale_ttl: seconds an expired entry is still returned as stale
+        :type stale_ttl: int
+        """
+        self.maxsize = maxsize
+        self.stale_ttl = stale_ttl
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Return number of cached entries.
+
+        :return: int
+        """
+        return len(self.entries)
+
+    @property
+    def stats(self):
+        """Return cache counters formatted for logging.
+
+        :return: str
+        """
+        return (
+            f"hits={self.hits} stale={self.stale_hits} "
+            f"misses={self.misses} size={len(self)}"
+        )
+
+    def get(self, key):
+        """Return two-tuple of cached value and staleness flag for `key`.
+
+        :param key: cache key
+        :type key: hashable
+        :var entry: cached value with its fresh and stale expiry times
+        :type entry: tuple
+        :var now: current monotonic time
+        :type now: float
+        :return: two-tuple or None
+        """
+        entry = self.entries.get(key)
+        now = time.monotonic()
+        if entry is None or now >= entry[2]:
+            self.entries.pop(key, None)
+            self.misses += 1
+            return None
+
+        self.entries.move_to_end(key)
+        if now < entry[1]:
+            self.hits += 1
+            return entry[0], False
+
+        self.stale_hits += 1
+        return entry[0], True
+
+    def set(self, key, value, ttl):
+        """Cache `value` under `key` for `ttl` seconds, evicting the oldest entries.
+
+        :param key: cache key
+        :type key: hashable
+        :param value: value to cache
+        :type value: object
+        :param ttl: seconds the value is considered fresh
+        :type ttl: int
+        """
+        fresh_until = time.monotonic() + ttl
+        self.entries[key] = (value, fresh_until, fresh_until + self.stale_ttl)
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all cached entries."""
+        self.entries.clear()
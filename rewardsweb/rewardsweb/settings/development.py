@@ -16,6 +16,12 @@ MIDDLEWARE.insert(3, "debug_toolbar.middleware.DebugToolbarMiddleware")
 INTERNAL_IPS = ("127.0.0.1",)
 # # debug_toolbar
 
+# SQL queries instrumentation, after authentication that it reports to superusers
+MIDDLEWARE.insert(
+    MIDDLEWARE.index("django.contrib.auth.middleware.AuthenticationMiddleware") + 1,
+    "core.middleware.QueryCountMiddleware",
+)
+
 # Database
 # https://docs.djangoproject.com/en/4.2/ref/settings/#databases
 
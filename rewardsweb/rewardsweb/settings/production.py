@@ -14,6 +14,10 @@ ALLOWED_HOSTS = [
 ]
 
 MIDDLEWARE.insert(2, "django.middleware.gzip.GZipMiddleware")
+MIDDLEWARE.insert(3, "api.middleware.BrotliMiddleware")
+
+REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"] = ["api.renderers.ORJSONRenderer"]
+REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"] = ["api.renderers.ORJSONParser"]
 """
 NOTE: nginx setup:
 
@@ -43,6 +47,14 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://127.0.0.1:6379/1",
+        "OPTIONS": {"PASSWORD": get_env_variable("REDIS_PASSWORD", "")},
+    }
+}
+
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 
 MESSAGE_STORAGE = "django.contrib.messages.storage.session.SessionStorage"
@@ -22,6 +22,14 @@ DATABASES = {
     }
 }
 
+CACHES = {
+    "default": {
+        "BACKEND": "django_redis.cache.RedisCache",
+        "LOCATION": "redis://127.0.0.1:6379/1",
+        "OPTIONS": {"PASSWORD": get_env_variable("REDIS_PASSWORD", "")},
+    }
+}
+
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
 
 MESSAGE_STORAGE = "django.contrib.messages.storage.session.SessionStorage"
@@ -190,6 +190,8 @@ class BaseMentionTracker:
         :type prefix: str
         :var username: contributor's username/handle in the platform
         :type username: str
+        :var contribution_data: formatted contribution data
+        :type contribution_data: dict
         :return: dict
         """
         platform = self.platform_name.capitalize()
@@ -198,12 +200,17 @@ class BaseMentionTracker:
         )
         username = message_data.get("contributor")
 
-        return {
+        contribution_data = {
             **parsed_message,
             "username": f"{prefix}{username}",
             "url": message_data.get("contribution_url"),
             "platform": platform,
         }
+        if message_data.get("contribution_message"):
+            # lets website cache the message instead of fetching it again
+            contribution_data["message"] = message_data["contribution_message"]
+
+        return contribution_data
 
     def post_new_contribution(self, contribution_data):
         """Send add contribution POST request to the Request API.
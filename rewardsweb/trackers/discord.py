@@ -551,6 +551,8 @@ class DiscordTracker(BaseMentionTracker):
         :type author: :class:`discord.User`
         :var referenced_message: message that this message replies to
         :type referenced_message: :class:`discord.Message` or None
+        :var contribution_message: message that is the contribution
+        :type contribution_message: :class:`discord.Message`
         :var channel: channel where message was sent
         :type channel: :class:`discord.TextChannel`
         :var guild: Discord server where message was sent
@@ -566,9 +568,11 @@ class DiscordTracker(BaseMentionTracker):
         message_url = message.jump_url
 
         if referenced_message and hasattr(referenced_message, "jump_url"):
+            contribution_message = referenced_message
             contribution_url = referenced_message.jump_url
             contributor = referenced_message.author
         else:
+            contribution_message = message
             contribution_url = message_url
             contributor = author
 
@@ -589,6 +593,13 @@ class DiscordTracker(BaseMentionTracker):
             "content_preview": message.content[:200] if message.content else "",
             "timestamp": message.created_at.isoformat(),
             "item_id": f"discord_{message.guild.id}_{message.channel.id}_{message.id}",
+            "contribution_message": {
+                "content": contribution_message.content or "",
+                "author": contributor.name,
+                "timestamp": contribution_message.created_at.isoformat(
+                    timespec="microseconds"
+                ),
+            },
         }
 
         return data
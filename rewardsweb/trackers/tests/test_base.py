@@ -241,6 +241,32 @@ class TestTrackersBaseMentionTracker:
         }
         assert result == expected
 
+    def test_base_basementiontracker_prepare_contribution_data_with_message(
+        self, mocker
+    ):
+        mock_social_platform_prefixes = mocker.patch(
+            "trackers.base.social_platform_prefixes"
+        )
+        mock_social_platform_prefixes.return_value = [("Testplatform", "TP_")]
+
+        instance = BaseMentionTracker("testplatform", lambda x: None)
+
+        message = {"content": "content", "author": "testuser", "timestamp": "now"}
+        message_data = {
+            "contributor": "testuser",
+            "contribution_url": "http://example.com",
+            "contribution_message": message,
+        }
+
+        result = instance.prepare_contribution_data({}, message_data)
+
+        assert result == {
+            "username": "TP_testuser",
+            "url": "http://example.com",
+            "platform": "Testplatform",
+            "message": message,
+        }
+
     # post_new_contribution
     def test_base_basementiontracker_post_new_contribution_success(self, mocker):
         mock_get_env_variable = mocker.patch("trackers.base.get_env_variable")
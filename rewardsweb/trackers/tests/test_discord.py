@@ -1,6 +1,6 @@
 """Testing module for :py:mod:`trackers.discord` module."""
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from unittest import mock
 
 import discord
@@ -1227,6 +1227,8 @@ class TestDiscordTracker:
         mock_replied.author.id = 555555555555555555
         mock_replied.author.name = "replied_user"
         mock_replied.author.display_name = "Replied User"
+        mock_replied.content = "Replied content"
+        mock_replied.created_at = datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)
 
         mock_message.reference = mock.MagicMock()
         mock_message.reference.resolved = mock_replied
@@ -1238,6 +1240,11 @@ class TestDiscordTracker:
         assert result["contribution_url"] == mock_replied.jump_url
         assert result["discord_guild"] == "Test Guild"
         assert result["discord_channel"] == "test-channel"
+        assert result["contribution_message"] == {
+            "content": "Replied content",
+            "author": "replied_user",
+            "timestamp": "2025-01-01T10:00:00.000000+00:00",
+        }
 
     @pytest.mark.asyncio
     async def test_trackers_discord_extract_mention_data_no_reply(
@@ -1258,6 +1265,8 @@ class TestDiscordTracker:
         assert result["suggester"] == mock_message.author.id
         assert result["contributor"] == mock_message.author.id
         assert result["contribution_url"] == mock_message.jump_url
+        assert result["contribution_message"]["content"] == mock_message.content
+        assert result["contribution_message"]["author"] == mock_message.author.name
 
     @pytest.mark.asyncio
     async def test_trackers_discord_extract_mention_data_reply_no_jump_url(
@@ -1305,6 +1314,7 @@ class TestDiscordTracker:
         result = await instance.extract_mention_data(mock_message)
 
         assert result["content_preview"] == ""
+        assert result["contribution_message"]["content"] == ""
 
     # Channel history checking tests
     def test_trackers_discord_is_rate_limited_true(
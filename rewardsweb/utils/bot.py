@@ -2,14 +2,232 @@
 
 import logging
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import requests
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
 
+from utils.constants.core import (
+    DISCORD_API_TIMEOUT,
+    DISCORD_API_URL,
+    DISCORD_BULK_WORKERS,
+    DISCORD_MAX_RETRIES,
+    DISCORD_MESSAGE_CACHE_TIMEOUT,
+)
 from utils.helpers import get_env_variable
 
 logger = logging.getLogger(__name__)
 
 
+class DiscordClient:
+    """Discord REST API client respecting Discord's rate limits.
+
+    HTTP session and rate limit buckets are shared by all the instances in
+    the process. Requests are delayed while their route's bucket or the
+    global limit is exhausted, and requests answered with HTTP 429 are sent
+    again after the returned `retry_after` seconds.
+
+    :ivar lock: lock guarding session's creation and rate limit state
+    :type lock: :class:`threading.Lock`
+    :ivar session: HTTP session with pooled connections
+    :type session: :class:`requests.Session` or None
+    :ivar route_buckets: Discord bucket IDs by route keys
+    :type route_buckets: dict
+    :ivar buckets: remaining requests, limit and reset time by bucket IDs
+    :type buckets: dict
+    :ivar global_reset_at: monotonic time the global rate limit resets at
+    :type global_reset_at: float
+    """
+
+    lock = threading.Lock()
+    session = None
+    route_buckets = {}
+    buckets = {}
+    global_reset_at = 0.0
+
+    @classmethod
+    def reset(cls):
+        """Forget HTTP session and rate limit state."""
+        with cls.lock:
+            if cls.session is not None:
+                cls.session.close()
+                cls.session = None
+
+            cls.route_buckets = {}
+            cls.buckets = {}
+            cls.global_reset_at = 0.0
+
+    def _session(self):
+        """Return shared HTTP session authenticated with bot's token.
+
+        :var session: HTTP session instance
+        :type session: :class:`requests.Session`
+        :return: :class:`requests.Session`
+        """
+        with DiscordClient.lock:
+            if DiscordClient.session is None:
+                session = requests.Session()
+                session.mount(
+                    "https://", HTTPAdapter(pool_maxsize=DISCORD_BULK_WORKERS)
+                )
+                session.headers["Authorization"] = (
+                    f"Bot {get_env_variable('DISCORD_BOT_TOKEN', '')}"
+                )
+                DiscordClient.session = session
+
+            return DiscordClient.session
+
+    def route_key(self, method, path):
+        """Return rate limit route key of request with `method` to `path`.
+
+        Discord shares a bucket between all the messages and reactions of
+        a channel, so only the channel ID is kept in the key.
+
+        :param method: HTTP method
+        :type method: str
+        :param path: API path
+        :type path: str
+        :return: str
+        """
+        path = re.sub(r"/messages/\d+", "/messages/{message_id}", path)
+        path = re.sub(r"/reactions/[^/]+", "/reactions/{emoji}", path)
+        return f"{method} {path}"
+
+    def _acquire(self, route):
+        """Wait until a request to `route` is allowed by the rate limits.
+
+        :param route: rate limit route key
+        :type route: str
+        :var now: current monotonic time
+        :type now: float
+        :var delay: seconds to wait before the next check
+        :type delay: float
+        :var bucket: route's rate limit bucket
+        :type bucket: dict
+        """
+        while True:
+            with DiscordClient.lock:
+                now = time.monotonic()
+                delay = DiscordClient.global_reset_at - now
+                bucket = DiscordClient.buckets.get(
+                    DiscordClient.route_buckets.get(route)
+                )
+                if delay <= 0:
+                    if bucket is None:
+                        return
+
+                    if now >= bucket["reset_at"]:
+                        # the new window's reset time comes with the response
+                        bucket["remaining"] = bucket["limit"]
+                        bucket["reset_at"] = now + DISCORD_API_TIMEOUT
+
+                    if bucket["remaining"] > 0:
+                        bucket["remaining"] -= 1
+                        return
+
+                    delay = bucket["reset_at"] - now
+
+            time.sleep(min(delay, DISCORD_API_TIMEOUT))
+
+    def _update_limits(self, route, response):
+        """Update route's rate limit bucket from provided `response` headers.
+
+        :param route: rate limit route key
+        :type route: str
+        :param response: HTTP response instance
+        :type response: :class:`requests.Response`
+        :var bucket_id: Discord bucket ID
+        :type bucket_id: str
+        """
+        bucket_id = response.headers.get("X-RateLimit-Bucket")
+        if not bucket_id or "X-RateLimit-Remaining" not in response.headers:
+            return
+
+        with DiscordClient.lock:
+            DiscordClient.route_buckets[route] = bucket_id
+            DiscordClient.buckets[bucket_id] = {
+                "limit": int(response.headers.get("X-RateLimit-Limit", 1)),
+                "remaining": int(response.headers["X-RateLimit-Remaining"]),
+                "reset_at": time.monotonic()
+                + float(response.headers.get("X-RateLimit-Reset-After", 0)),
+            }
+
+    def _handle_rate_limited(self, route, response):
+        """Postpone requests after HTTP 429 response and return seconds to wait.
+
+        :param route: rate limit route key
+        :type route: str
+        :param response: HTTP 429 response instance
+        :type response: :class:`requests.Response`
+        :var data: response's JSON data
+        :type data: dict
+        :var retry_after: seconds to wait before sending request again
+        :type retry_after: float
+        :var reset_at: monotonic time the limit resets at
+        :type reset_at: float
+        :return: float
+        """
+        try:
+            data = response.json()
+
+        except ValueError:
+            data = {}
+
+        retry_after = float(
+            data.get("retry_after") or response.headers.get("Retry-After") or 1
+        )
+        reset_at = time.monotonic() + retry_after
+        with DiscordClient.lock:
+            if data.get("global") or response.headers.get("X-RateLimit-Global"):
+                DiscordClient.global_reset_at = reset_at
+
+            elif route in DiscordClient.route_buckets:
+                bucket = DiscordClient.buckets[DiscordClient.route_buckets[route]]
+                bucket["remaining"] = 0
+                bucket["reset_at"] = reset_at
+
+        logger.warning(f"Discord rate limited {route}, retrying in {retry_after}s")
+        return retry_after
+
+    def request(self, method, path, **kwargs):
+        """Send request with `method` to Discord API `path` and return response.
+
+        :param method: HTTP method
+        :type method: str
+        :param path: API path starting with slash
+        :type path: str
+        :param kwargs: additional keyword arguments for request
+        :type kwargs: dict
+        :var route: rate limit route key
+        :type route: str
+        :var session: HTTP session instance
+        :type session: :class:`requests.Session`
+        :var response: HTTP response instance
+        :type response: :class:`requests.Response`
+        :return: :class:`requests.Response`
+        """
+        route = self.route_key(method, path)
+        session = self._session()
+        for attempt in range(DISCORD_MAX_RETRIES + 1):
+            self._acquire(route)
+            response = session.request(
+                method,
+                f"{DISCORD_API_URL}{path}",
+                timeout=DISCORD_API_TIMEOUT,
+                **kwargs,
+            )
+            self._update_limits(route, response)
+            if response.status_code != 429 or attempt == DISCORD_MAX_RETRIES:
+                break
+
+            time.sleep(self._handle_rate_limited(route, response))
+
+        return response
+
+
 def _parse_discord_url(url):
     """Return Discord server, channel, and message IDs parsed from provided `url`.
 
@@ -42,18 +260,14 @@ def _parse_discord_url(url):
 def add_reaction_to_message(url, emoji):
     """Add a reaction to an existing Discord message
 
-    :param channel_id: ID of the channel containing the message
-    :type channel_id: str
-    :param message_id: ID of the message to react to
-    :type message_id: str
+    :param url: Discord message URL
+    :type url: str
     :param emoji: emoji in format name:ID
     :type emoji: str
-    :var bot_token: Discord bot API access token
-    :type bot_token: str
-    :var headers: headers instance carrying bot token
-    :type headers: dict
-    :var api_url: fully formatted API URL to add reaction to the message
-    :type api_url: str
+    :var channel_id: ID of the channel containing the message
+    :type channel_id: str
+    :var message_id: ID of the message to react to
+    :type message_id: str
     :var response: HTTP response instance
     :type response: :class:`requests.Response`
     :return: Boolean
@@ -62,13 +276,9 @@ def add_reaction_to_message(url, emoji):
     if not channel_id:
         return False
 
-    bot_token = get_env_variable("DISCORD_BOT_TOKEN", "")
-    headers = {"Authorization": f"Bot {bot_token}"}
-    url = (
-        f"https://discord.com/api/v10/channels/{channel_id}/"
-        f"messages/{message_id}/reactions/{emoji}/@me"
+    response = DiscordClient().request(
+        "PUT", f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
     )
-    response = requests.put(url, headers=headers)
     if response.status_code == 204:
         logger.info(f"Emoji {emoji} added successfully!")
         return True
@@ -80,7 +290,49 @@ def add_reaction_to_message(url, emoji):
         return False
 
 
-# utils/bot.py
+def add_reactions_to_messages(urls, emoji):
+    """Add a reaction to all the Discord messages from `urls` concurrently.
+
+    Requests are sent by a bounded thread pool and delayed by the shared
+    client's rate limits, so the reactions in different channels are added
+    in a single round trip time.
+
+    :param urls: Discord messages URLs
+    :type urls: list
+    :param emoji: emoji in format name:ID
+    :type emoji: str
+    :var urls: unique messages URLs
+    :type urls: list
+    :var executor: thread pool executor instance
+    :type executor: :class:`concurrent.futures.ThreadPoolExecutor`
+    :var futures: reaction's future by message URL
+    :type futures: dict
+    :var results: reaction's success by message URL
+    :type results: dict
+    :return: dict
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+
+    results = {}
+    with ThreadPoolExecutor(
+        max_workers=min(DISCORD_BULK_WORKERS, len(urls))
+    ) as executor:
+        futures = {
+            url: executor.submit(add_reaction_to_message, url, emoji) for url in urls
+        }
+        for url, future in futures.items():
+            try:
+                results[url] = future.result()
+
+            except requests.RequestException as exc:
+                logger.error(f"Failed to add reaction to {url}: {exc}")
+                results[url] = False
+
+    return results
+
+
 def add_reply_to_message(url, comment):
     """Add a reply to an existing Discord message
 
@@ -88,12 +340,10 @@ def add_reply_to_message(url, comment):
     :type url: str
     :param comment: reply message content
     :type comment: str
-    :var bot_token: Discord bot API access token
-    :type bot_token: str
-    :var headers: headers instance carrying bot token and content type
-    :type headers: dict
-    :var api_url: fully formatted API URL to create message in channel
-    :type api_url: str
+    :var channel_id: ID of the channel containing the message
+    :type channel_id: str
+    :var message_id: ID of the message to reply to
+    :type message_id: str
     :var payload: request payload containing reply message data
     :type payload: dict
     :var response: HTTP response instance
@@ -105,16 +355,14 @@ def add_reply_to_message(url, comment):
     if not channel_id:
         return False
 
-    bot_token = get_env_variable("DISCORD_BOT_TOKEN", "")
-    headers = {"Authorization": f"Bot {bot_token}", "Content-Type": "application/json"}
-    api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
-
     payload = {
         "content": comment,
         "message_reference": {"channel_id": channel_id, "message_id": message_id},
     }
 
-    response = requests.post(api_url, headers=headers, json=payload)
+    response = DiscordClient().request(
+        "POST", f"/channels/{channel_id}/messages", json=payload
+    )
     if response.status_code == 200:
         logger.info(f"Reply added successfully to message {message_id}!")
         return True
@@ -123,37 +371,95 @@ def add_reply_to_message(url, comment):
         return False
 
 
+def _message_cache_key(channel_id, message_id):
+    """Return cache key of Discord message defined by provided IDs.
+
+    :param channel_id: ID of the channel containing the message
+    :type channel_id: str
+    :param message_id: ID of the message
+    :type message_id: str
+    :return: str
+    """
+    return f"discord-message:{channel_id}:{message_id}"
+
+
+def cache_message(url, content, author, timestamp):
+    """Cache provided Discord message data for :func:`message_from_url`.
+
+    Trackers already have the content of the messages they ingest, so
+    caching it spares the Discord API call when contribution is reviewed.
+
+    :param url: Discord message URL
+    :type url: str
+    :param content: message content
+    :type content: str
+    :param author: username of the message author
+    :type author: str
+    :param timestamp: message creation time in ISO format
+    :type timestamp: str
+    :var channel_id: ID of the channel containing the message
+    :type channel_id: str
+    :var message_id: ID of the message
+    :type message_id: str
+    :return: Boolean
+    """
+    channel_id, message_id = _parse_discord_url(url)
+    if not channel_id:
+        return False
+
+    cache.set(
+        _message_cache_key(channel_id, message_id),
+        {
+            "success": True,
+            "content": content or "",
+            "author": author or "Unknown",
+            "timestamp": timestamp or "",
+            "channel_id": channel_id,
+            "message_id": message_id,
+            "raw_data": {},
+        },
+        DISCORD_MESSAGE_CACHE_TIMEOUT,
+    )
+    return True
+
+
 def message_from_url(url):
     """Retrieve message content from provided Discord `url`.
 
+    Successfully retrieved messages are cached for
+    `DISCORD_MESSAGE_CACHE_TIMEOUT` seconds.
+
+    :param url: Discord message URL
+    :type url: str
     :var channel_id: ID of the channel containing the message
     :type channel_id: str
-    :param message_id: ID of the message to react to
+    :var message_id: ID of the message to retrieve
     :type message_id: str
-    :var bot_token: Discord bot API access token
-    :type bot_token: str
-    :var headers: headers instance carrying bot token
-    :type headers: dict
-    :var api_url: fully formatted API URL to retrieve message
-    :type api_url: str
+    :var key: message's cache key
+    :type key: str
+    :var message: cached or retrieved message
+    :type message: dict
     :var response: HTTP response instance
     :type response: :class:`requests.Response`
     :var message_data: Discord message data
-    :type message_data: cict
-    :return: Boolean
+    :type message_data: dict
+    :return: dict
     """
     channel_id, message_id = _parse_discord_url(url)
     if not channel_id:
         return {"success": False, "error": "Invalid URL"}
 
-    bot_token = get_env_variable("DISCORD_BOT_TOKEN", "")
-    headers = {"Authorization": f"Bot {bot_token}"}
-    api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
+    key = _message_cache_key(channel_id, message_id)
+    message = cache.get(key)
+    if message is not None:
+        return message
 
-    response = requests.get(api_url, headers=headers)
+    response = DiscordClient().request(
+        "GET", f"/channels/{channel_id}/messages/{message_id}"
+    )
     if response.status_code == 200:
         message_data = response.json()
-        return {
+        message = {
             "success": True,
             "content": message_data.get("content", ""),
             "author": message_data.get("author", {}).get("username", "Unknown"),
@@ -162,6 +468,9 @@ def message_from_url(url):
             "message_id": message_id,
             "raw_data": message_data,
         }
+        cache.set(key, message, DISCORD_MESSAGE_CACHE_TIMEOUT)
+        return message
+
     else:
         return {
             "success": False,
@@ -9,6 +9,27 @@ MISSING_ENVIRONMENT_VARIABLE_ERROR = "Environment variable is not set"
 HANDLE_EXCEPTIONS = ("RR", "Di")
 
 CONTRIBUTIONS_TAIL_SIZE = 5
+CONTRIBUTOR_SUMMARY_MAX_SIZE = 100
+
+HUMANIZED_CONTRIBUTION_RELATED = ("contributor", "cycle", "platform", "reward__type")
+
+CONTRIBUTOR_AUTOCOMPLETE_MIN_LENGTH = 2
+CONTRIBUTOR_AUTOCOMPLETE_SIZE = 10
+
+EXPORT_CHUNK_SIZE = 2000
+IMPORT_CHUNK_SIZE = 2000
+
+STATISTICS_SNAPSHOT_ID = 1
+
+DATA_VERSION_CACHE_KEY = "data-version"
+FRAGMENT_CACHE_TIMEOUT = 60 * 60
+SINGLE_FLIGHT_RESULT_TIMEOUT = 5
+SINGLE_FLIGHT_LOCK_TIMEOUT = 30
+SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+SQL_DUPLICATES_WARNING_THRESHOLD = 10
+
+BROTLI_MIN_LENGTH = 200
+BROTLI_QUALITY = 5
 
 REWARDS_COLLECTION = (
     ("[F] Feature Request", 30000, 60000, 135000),
@@ -21,6 +42,12 @@ REWARDS_COLLECTION = (
     ("[ER] Ecosystem Research", 50000, 100000, 200000),
 )
 
+DISCORD_API_URL = "https://discord.com/api/v10"
+DISCORD_API_TIMEOUT = 10
+DISCORD_MAX_RETRIES = 3
+DISCORD_BULK_WORKERS = 8
+DISCORD_MESSAGE_CACHE_TIMEOUT = 60 * 60
+
 DISCORD_EMOJIS = {
     "noted": "noted:930825381974523954",
     "addressed": "addressed:930825322654470204",
@@ -50,7 +77,25 @@ ISSUE_PRIORITY_CHOICES = [
     ("blocker", "Blocker"),
 ]
 
+JOB_MAX_ATTEMPTS = 3
+JOB_RETRY_DELAY = 30
+JOB_VISIBILITY_TIMEOUT = 10 * 60
+JOB_WORKER_SLEEP = 2
+JOB_STATUS_POLL_INTERVAL = 2
+
 GITHUB_ISSUES_START_DATE = datetime(2022, 4, 15, 0, 0, 0, tzinfo=timezone.utc)
+GITHUB_API_URL = "https://api.github.com"
+GITHUB_API_TIMEOUT = 30
+GITHUB_CLIENTS_POOL_SIZE = 16
+GITHUB_TOKEN_EXPIRY_MARGIN = 5 * 60
+GITHUB_ISSUES_PER_PAGE = 100
+GITHUB_FETCH_WORKERS = 8
+GITHUB_FETCH_PAGES_AHEAD = 2
+GITHUB_RATE_LIMIT_RESERVE = 50
+GITHUB_MAPPING_WORKERS = 1
+GITHUB_MAPPING_CHUNK_SIZE = 100
+GITHUB_MIRROR_ETAG_CACHE_KEY = "github-issues-mirror-etag"
+GITHUB_MIRROR_MAX_AGE = 60 * 60
 
 GITHUB_LABELS = (
     "blocker",
@@ -0,0 +1,150 @@
+"""Module containing functions for exporting contributions ledger data."""
+
+import csv
+import json
+from itertools import islice
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from core.models import Contribution, Handle
+from utils.constants.core import EXPORT_CHUNK_SIZE
+
+CONTRIBUTION_EXPORT_FIELDS = [
+    "id",
+    "contributor",
+    "handles",
+    "cycle_id",
+    "cycle_start",
+    "cycle_end",
+    "platform",
+    "reward_type",
+    "reward_level",
+    "reward_amount",
+    "percentage",
+    "issue_number",
+    "issue_status",
+    "confirmed",
+    "url",
+    "created_at",
+]
+CONTRIBUTION_EXPORT_VALUES = {
+    "id": "id",
+    "contributor": "contributor__name",
+    "contributor_id": "contributor_id",
+    "cycle_id": "cycle_id",
+    "cycle_start": "cycle__start",
+    "cycle_end": "cycle__end",
+    "platform": "platform__name",
+    "reward_type": "reward__type__label",
+    "reward_level": "reward__level",
+    "reward_amount": "reward__amount",
+    "percentage": "percentage",
+    "issue_number": "issue__number",
+    "issue_status": "issue__status",
+    "confirmed": "confirmed",
+    "url": "url",
+    "created_at": "created_at",
+}
+EXPORT_FORMATS = ("ndjson", "csv")
+
+
+class _EchoBuffer:
+    """Pseudo-buffer returning written value instead of storing it."""
+
+    def write(self, value):
+        """Return provided `value` so csv writer output can be yielded directly.
+
+        :param value: formatted CSV line
+        :type value: str
+        :return: str
+        """
+        return value
+
+
+def _handles_for_contributors(contributor_ids):
+    """Return collection of formatted handles for provided `contributor_ids`.
+
+    :param contributor_ids: collection of contributors' identifiers
+    :type contributor_ids: set
+    :var handles: collection of contributors' IDs and related full handles
+    :type handles: dict
+    :return: dict
+    """
+    handles = {}
+    for contributor_id, prefix, handle in (
+        Handle.objects.filter(contributor_id__in=contributor_ids)
+        .order_by("contributor_id", "platform__prefix", "handle")
+        .values_list("contributor_id", "platform__prefix", "handle")
+    ):
+        handles.setdefault(contributor_id, []).append(f"{prefix}{handle}")
+
+    return {key: " ".join(value) for key, value in handles.items()}
+
+
+def contribution_export_rows(chunk_size=EXPORT_CHUNK_SIZE):
+    """Yield flat projection of all contributions ordered by their ID.
+
+    Rows are read from database by server-side cursor in chunks of `chunk_size`
+    and contributors' handles are fetched with a single query per chunk, so
+    memory usage doesn't depend on the ledger size.
+
+    :param chunk_size: number of rows fetched from database at once
+    :type chunk_size: int
+    :var rows: database rows iterator
+    :type rows: iterator
+    :var chunk: collection of rows fetched in a single round-trip
+    :type chunk: list
+    :var handles: contributors' IDs and related handles for the chunk
+    :type handles: dict
+    :yield: dict
+    """
+    rows = (
+        dict(zip(CONTRIBUTION_EXPORT_VALUES, values))
+        for values in Contribution.objects.order_by("id")
+        .values_list(*CONTRIBUTION_EXPORT_VALUES.values())
+        .iterator(chunk_size=chunk_size)
+    )
+    while chunk := list(islice(rows, chunk_size)):
+        handles = _handles_for_contributors({row["contributor_id"] for row in chunk})
+        for row in chunk:
+            row["handles"] = handles.get(row.pop("contributor_id"), "")
+            yield {field: row[field] for field in CONTRIBUTION_EXPORT_FIELDS}
+
+
+def csv_lines(rows):
+    """Yield CSV formatted lines, starting with header, for provided `rows`.
+
+    :param rows: collection of contribution export rows
+    :type rows: iterable
+    :var writer: CSV writer instance
+    :type writer: :class:`csv.DictWriter`
+    :yield: str
+    """
+    writer = csv.DictWriter(_EchoBuffer(), fieldnames=CONTRIBUTION_EXPORT_FIELDS)
+    yield writer.writeheader()
+    for row in rows:
+        yield writer.writerow(row)
+
+
+def ndjson_lines(rows):
+    """Yield newline-delimited JSON lines for provided `rows`.
+
+    :param rows: collection of contribution export rows
+    :type rows: iterable
+    :yield: str
+    """
+    for row in rows:
+        yield json.dumps(row, cls=DjangoJSONEncoder) + "\n"
+
+
+def export_lines(export_format, chunk_size=EXPORT_CHUNK_SIZE):
+    """Return lines iterator of the contributions ledger in provided `export_format`.
+
+    :param export_format: output format, either "ndjson" or "csv"
+    :type export_format: str
+    :param chunk_size: number of rows fetched from database at once
+    :type chunk_size: int
+    :return: iterator
+    """
+    rows = contribution_export_rows(chunk_size=chunk_size)
+    return csv_lines(rows) if export_format == "csv" else ndjson_lines(rows)
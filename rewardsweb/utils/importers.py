@@ -1,6 +1,7 @@
 """Module containing functions for importing existing data to database."""
 
 import re
+from collections import defaultdict
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -11,6 +12,7 @@ from django.db.utils import IntegrityError
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 
+from core.fragments import bump_data_version
 from core.models import (
     Contribution,
     Contributor,
@@ -19,9 +21,14 @@ from core.models import (
     Reward,
     RewardType,
     SocialPlatform,
+    StatisticsSnapshot,
+)
+from utils.constants.core import IMPORT_CHUNK_SIZE, REWARDS_COLLECTION
+from utils.helpers import (
+    get_env_variable,
+    parse_full_handle,
+    social_platform_prefixes,
 )
-from utils.constants.core import REWARDS_COLLECTION
-from utils.helpers import get_env_variable, social_platform_prefixes
 
 ADDRESSES_CSV_COLUMNS = ["handle", "address"]
 CONTRIBUTION_CSV_COLUMNS = [
@@ -180,40 +187,210 @@ def _dataframe_from_csv(filename, columns=CONTRIBUTION_CSV_COLUMNS):
     return data
 
 
+def _contributor_ids(full_handles):
+    """Return contributors' IDs by provided distinct `full_handles`.
+
+    Handles belonging to a single contributor are resolved from all the handles
+    fetched in one query. The rest are located or created by contributors'
+    manager in the provided order, so the following handles are matched to the
+    created contributors.
+
+    :param full_handles: distinct contributors' full handles
+    :type full_handles: list of str
+    :var contributors: contributors' IDs by their handles
+    :type contributors: :class:`collections.defaultdict`
+    :var contributor_ids: contributors' IDs by their full handles
+    :type contributor_ids: dict of str: int
+    :var handle: contributor's handle/username
+    :type handle: str
+    :var contributor: located or created contributor
+    :type contributor: :class:`core.models.Contributor`
+    :return: dict of str: int
+    """
+    contributors = defaultdict(set)
+    for handle, contributor_id in Handle.objects.values_list(
+        "handle", "contributor_id"
+    ):
+        contributors[handle].add(contributor_id)
+
+    contributor_ids = {}
+    for full_handle in full_handles:
+        _, handle = parse_full_handle(full_handle)
+        if len(contributors.get(handle, ())) == 1:
+            contributor_ids[full_handle] = next(iter(contributors[handle]))
+            continue
+
+        contributor = Contributor.objects.from_full_handle(full_handle)
+        contributor_ids[full_handle] = contributor.id
+        if not contributors.get(handle):
+            contributors[handle] = {contributor.id}
+
+    return contributor_ids
+
+
 def _import_contributions(data, parse_callback, amount_callback):
     """Import contributions from DataFrame to database.
 
+    Cycles, platforms and rewards are fetched once and their IDs are resolved
+    by merging them with the data, while reward types are parsed once per
+    distinct type. Contributions are then created in chunks of
+    `IMPORT_CHUNK_SIZE` and, as bulk creation doesn't send model signals,
+    statistics snapshot is adjusted and cached fragments are invalidated here.
+
     :param data: DataFrame containing contribution data
     :type data: :class:`pandas.DataFrame`
     :param parse_callback: Function to parse reward type from string
     :type parse_callback: callable
     :param amount_callback: Function to calculate reward amount
     :type amount_callback: callable
+    :var frame: contributions' data with resolved foreign keys
+    :type frame: :class:`pandas.DataFrame`
+    :var types: distinct reward types with parsed labels and names
+    :type types: :class:`pandas.DataFrame`
+    :var missing: values of the rows without resolved foreign key
+    :type missing: :class:`pandas.Series`
+    :var contributions: contribution instances to create in bulk
+    :type contributions: list of :class:`core.models.Contribution`
     """
-    for _, row in data.iterrows():
-        contributor = Contributor.objects.from_full_handle(row["contributor"])
-        cycle = Cycle.objects.get(start=row["cycle_start"])
-        platform = SocialPlatform.objects.get(name__iexact=row["platform"])
-        label, name = parse_callback(row["type"])
-        reward_type = get_object_or_404(RewardType, label=label, name=name)
-        reward = Reward.objects.get(
-            type=reward_type,
-            level=row["level"] if not pd.isna(row["level"]) else 1,
-            amount=amount_callback(row["reward"]),
+    if data.empty:
+        return
+
+    frame = data.reset_index(drop=True)
+    frame["contributor_id"] = frame["contributor"].map(
+        _contributor_ids(frame["contributor"].drop_duplicates().tolist())
+    )
+    frame["cycle_start"] = frame["cycle_start"].astype(str)
+    frame["platform_name"] = frame["platform"].str.lower()
+    frame["level"] = frame["level"].fillna(1).astype(int)
+    frame["amount"] = frame["reward"].map(amount_callback).astype(int)
+
+    types = pd.DataFrame(
+        [(typ, *parse_callback(typ)) for typ in frame["type"].drop_duplicates()],
+        columns=["type", "label", "name"],
+    )
+
+    frame = (
+        frame.merge(types, on="type", how="left")
+        .merge(
+            pd.DataFrame(
+                [
+                    (str(start), pk)
+                    for pk, start in Cycle.objects.values_list("id", "start")
+                ],
+                columns=["cycle_start", "cycle_id"],
+            ),
+            on="cycle_start",
+            how="left",
+        )
+        .merge(
+            pd.DataFrame(
+                [
+                    (name.lower(), pk)
+                    for pk, name in SocialPlatform.objects.values_list("id", "name")
+                ],
+                columns=["platform_name", "platform_id"],
+            ),
+            on="platform_name",
+            how="left",
         )
-        percentage = row["percentage"] if not pd.isna(row["percentage"]) else 1
-        url = row["url"] if not pd.isna(row["url"]) else None
-        comment = row["comment"] if not pd.isna(row["comment"]) else None
-        Contribution.objects.create(
-            contributor=contributor,
-            cycle=cycle,
-            platform=platform,
-            reward=reward,
-            percentage=percentage,
-            url=url,
-            comment=comment,
-            confirmed=True,
+        .merge(
+            pd.DataFrame(
+                Reward.objects.values_list(
+                    "type__label", "type__name", "level", "amount", "id"
+                ),
+                columns=["label", "name", "level", "amount", "reward_id"],
+            ),
+            on=["label", "name", "level", "amount"],
+            how="left",
         )
+    )
+
+    for column, model, key in (
+        ("cycle_id", Cycle, "cycle_start"),
+        ("platform_id", SocialPlatform, "platform"),
+        ("reward_id", Reward, "type"),
+    ):
+        missing = frame.loc[frame[column].isna(), key]
+        if not missing.empty:
+            raise model.DoesNotExist(
+                f"{model.__name__} matching {missing.iloc[0]} does not exist."
+            )
+
+    frame["percentage"] = frame["percentage"].fillna(1)
+    for column in ("url", "comment"):
+        frame[column] = frame[column].astype(object).where(frame[column].notna(), None)
+
+    contributions = [
+        Contribution(**fields, confirmed=True)
+        for fields in frame.astype(
+            {
+                "contributor_id": int,
+                "cycle_id": int,
+                "platform_id": int,
+                "reward_id": int,
+            }
+        )[
+            [
+                "contributor_id",
+                "cycle_id",
+                "platform_id",
+                "reward_id",
+                "percentage",
+                "url",
+                "comment",
+            ]
+        ].to_dict(
+            "records"
+        )
+    ]
+    Contribution.objects.bulk_create(contributions, batch_size=IMPORT_CHUNK_SIZE)
+    StatisticsSnapshot.objects.adjust(
+        num_contributions=len(contributions), total_rewards=int(frame["amount"].sum())
+    )
+    bump_data_version()
+
+
+def _import_handles(addresses):
+    """Create handles of provided addresses' contributors in bulk.
+
+    :param addresses: addresses with their contributors' full handles
+    :type addresses: list
+    :var contributors: contributors' IDs by their addresses
+    :type contributors: dict of str: int
+    :var platforms: social platforms' IDs by their prefixes
+    :type platforms: dict of str: int
+    :var handles: handle instances to create in bulk
+    :type handles: list of :class:`core.models.Handle`
+    :var prefix: unique social platform's prefix
+    :type prefix: str
+    :var handle: contributor's handle/username
+    :type handle: str
+    """
+    contributors = dict(Contributor.objects.values_list("address", "id"))
+    platforms = dict(SocialPlatform.objects.values_list("prefix", "id"))
+    handles = []
+    for address, full_handles in addresses:
+        for full_handle in full_handles:
+            prefix, handle = parse_full_handle(full_handle)
+            if address not in contributors:
+                contributors[address] = Contributor.objects.from_full_handle(
+                    full_handle, address=address
+                ).id
+
+            if prefix not in platforms:
+                raise SocialPlatform.DoesNotExist(
+                    f"SocialPlatform with prefix {prefix} does not exist."
+                )
+
+            handles.append(
+                Handle(
+                    contributor_id=contributors[address],
+                    platform_id=platforms[prefix],
+                    handle=handle,
+                )
+            )
+
+    Handle.objects.bulk_create(handles, batch_size=IMPORT_CHUNK_SIZE)
 
 
 def _import_rewards(data, parse_callback, amount_callback):
@@ -369,19 +546,16 @@ def import_from_csv(contributions_path, legacy_contributions_path):
         SocialPlatform(name=name, prefix=prefix)
         for name, prefix in social_platform_prefixes()
     )
-    print("Social platforms created: ", len(SocialPlatform.objects.all()))
+    print("Social platforms created: ", SocialPlatform.objects.count())
 
     # # ADDRESSES
     addresses = _parse_addresses()
     Contributor.objects.bulk_create(
         Contributor(name=handles[0], address=address) for address, handles in addresses
     )
-    print("Contributors imported: ", len(Contributor.objects.all()))
-    for address, handles in addresses:
-        for full_handle in handles:
-            handle = Handle.objects.from_address_and_full_handle(address, full_handle)
-            handle.save()
-    print("Handles imported: ", len(Handle.objects.all()))
+    print("Contributors imported: ", Contributor.objects.count())
+    _import_handles(addresses)
+    print("Handles imported: ", Handle.objects.count())
 
     # # CONTRIBUTIONS
     data = _dataframe_from_csv(contributions_path)
@@ -402,7 +576,7 @@ def import_from_csv(contributions_path, legacy_contributions_path):
         Cycle(start=start, end=end) for start, end in all_cycles_data.values.tolist()
     )
     _check_current_cycle(Cycle.objects.latest("end"))
-    print("Cycles imported: ", len(Cycle.objects.all()))
+    print("Cycles imported: ", Cycle.objects.count())
 
     _import_rewards(
         data[["type", "level", "reward"]],
@@ -415,7 +589,7 @@ def import_from_csv(contributions_path, legacy_contributions_path):
         _reward_amount_legacy,
     )
     _create_active_rewards()
-    print("Rewards imported: ", len(Reward.objects.all()))
+    print("Rewards imported: ", Reward.objects.count())
 
     _import_contributions(
         legacy_data,
@@ -427,7 +601,7 @@ def import_from_csv(contributions_path, legacy_contributions_path):
         _parse_label_and_name_from_reward_type,
         _reward_amount,
     )
-    print("Contributions imported: ", len(Contribution.objects.all()))
+    print("Contributions imported: ", Contribution.objects.count())
 
     _create_superusers()
 
@@ -1,24 +1,97 @@
 """Module containing functions for GitHub issues management."""
 
+import hashlib
+import hmac
 import logging
+import threading
+import time
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 import jwt
 import requests
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Max
+from django.utils import timezone
 from github import Auth, Github
 
-from core.models import Contributor
+from core.models import Contributor, GitHubIssueMirror
 from utils.bot import message_from_url
-from utils.constants.core import GITHUB_ISSUES_START_DATE
+from utils.constants.core import (
+    GITHUB_API_TIMEOUT,
+    GITHUB_API_URL,
+    GITHUB_CLIENTS_POOL_SIZE,
+    GITHUB_FETCH_PAGES_AHEAD,
+    GITHUB_FETCH_WORKERS,
+    GITHUB_ISSUES_PER_PAGE,
+    GITHUB_ISSUES_START_DATE,
+    GITHUB_MIRROR_ETAG_CACHE_KEY,
+    GITHUB_RATE_LIMIT_RESERVE,
+    GITHUB_TOKEN_EXPIRY_MARGIN,
+)
 from utils.constants.ui import MISSING_TOKEN_TEXT
 from utils.helpers import get_env_variable
+from utils.issues_cache import IssueRecord
 
 logger = logging.getLogger(__name__)
 
 
 class GitHubApp:
-    """Helper class for instantiating GitHub client using GitHub bot."""
+    """Helper class for instantiating GitHub client using GitHub bot.
+
+    Bot's signing key, installation access token and HTTP session are shared
+    by all the instances in the process, so the token is requested again only
+    shortly before it expires.
+
+    :ivar lock: lock guarding installation token's refresh
+    :type lock: :class:`threading.Lock`
+    :ivar signing_keys: loaded private keys by their filenames
+    :type signing_keys: dict
+    :ivar token: cached installation access token
+    :type token: str or None
+    :ivar token_expires_at: token's expiration time as POSIX timestamp
+    :type token_expires_at: float
+    :ivar session: HTTP session used for requesting installation tokens
+    :type session: :class:`requests.Session` or None
+    """
+
+    lock = threading.Lock()
+    signing_keys = {}
+    token = None
+    token_expires_at = 0.0
+    session = None
+
+    @classmethod
+    def reset(cls):
+        """Forget cached signing keys, installation token and HTTP session."""
+        with cls.lock:
+            cls.signing_keys = {}
+            cls.token = None
+            cls.token_expires_at = 0.0
+            if cls.session is not None:
+                cls.session.close()
+                cls.session = None
+
+    def signing_key(self, filename):
+        """Return bot's private key loaded from file defined by `filename`.
+
+        :param filename: filename of the bot's private key
+        :type filename: str
+        :var pem_path: path to the bot's private key
+        :type pem_path: :class:`pathlib.Path`
+        :return: :class:`cryptography.hazmat.primitives.asymmetric.rsa.RSAPrivateKey`
+        """
+        if filename not in GitHubApp.signing_keys:
+            pem_path = settings.BASE_DIR.parent / "fixtures" / filename
+            with open(pem_path, "rb") as pem_file:
+                GitHubApp.signing_keys[filename] = load_pem_private_key(
+                    pem_file.read(), password=None
+                )
+
+        return GitHubApp.signing_keys[filename]
 
     def jwt_token(self):
         """Generate JWT token for GitHub bot.
@@ -27,10 +100,6 @@ class GitHubApp:
         :type bot_private_key_filename: str
         :var bot_client_id: client ID of the bot
         :type bot_client_id: str
-        :var pem_path: path to the bot's private key
-        :type pem_path: :class:`pathlib.Path`
-        :var signing_key: bot's private key
-        :type signing_key: bytes
         :var now: current time
         :type now: :class:`datetime.datetime`
         :var expiration: expiration time for the token
@@ -47,10 +116,6 @@ class GitHubApp:
         if not (bot_private_key_filename and bot_client_id):
             return None
 
-        pem_path = settings.BASE_DIR.parent / "fixtures" / bot_private_key_filename
-        with open(pem_path, "rb") as pem_file:
-            signing_key = pem_file.read()
-
         now = datetime.now()
         expiration = now + timedelta(minutes=8)
         payload = {
@@ -58,41 +123,74 @@ class GitHubApp:
             "exp": int(expiration.timestamp()),
             "iss": bot_client_id,
         }
-        return jwt.encode(payload, signing_key, algorithm="RS256")
+        return jwt.encode(
+            payload, self.signing_key(bot_private_key_filename), algorithm="RS256"
+        )
 
     def installation_token(self):
-        """Retrieve installation access token for GitHub bot.
+        """Return cached or newly retrieved installation access token for GitHub bot.
 
         :var installation_id: ID of the bot's installation
         :type installation_id: str
+        :return: installation access token
+        :rtype: str
+        """
+        installation_id = get_env_variable("GITHUB_BOT_INSTALLATION_ID", "")
+        if not installation_id:
+            return None
+
+        with GitHubApp.lock:
+            if time.time() < GitHubApp.token_expires_at - GITHUB_TOKEN_EXPIRY_MARGIN:
+                return GitHubApp.token
+
+            return self._refresh_installation_token(installation_id)
+
+    def _refresh_installation_token(self, installation_id):
+        """Request new installation access token and cache it until it expires.
+
+        Pooled client of the replaced token is discarded.
+
+        :param installation_id: ID of the bot's installation
+        :type installation_id: str
         :var jwt_token: JWT token for the bot
         :type jwt_token: str
-        :var headers: headers for the request
-        :type headers: dict
         :var url: URL for the request
         :type url: str
         :var response: response from the request
         :type response: :class:`requests.Response`
+        :var data: response's JSON data
+        :type data: dict
         :return: installation access token
         :rtype: str
         """
-        installation_id = get_env_variable("GITHUB_BOT_INSTALLATION_ID", "")
-        if not installation_id:
-            return None
-
         jwt_token = self.jwt_token()
         if not jwt_token:
             return None
 
-        headers = {
-            "Authorization": f"Bearer {jwt_token}",
-            "Accept": "application/vnd.github.v3+json",
-        }
-        url = (
-            f"https://api.github.com/app/installations/{installation_id}/access_tokens"
+        if GitHubApp.session is None:
+            GitHubApp.session = requests.Session()
+            GitHubApp.session.headers["Accept"] = "application/vnd.github.v3+json"
+
+        url = f"{GITHUB_API_URL}/app/installations/{installation_id}/access_tokens"
+        response = GitHubApp.session.post(
+            url,
+            headers={"Authorization": f"Bearer {jwt_token}"},
+            timeout=GITHUB_API_TIMEOUT,
         )
-        response = requests.post(url, headers=headers)
-        return response.json().get("token") if response.status_code == 201 else None
+        if response.status_code != 201:
+            return None
+
+        data = response.json()
+        if GitHubApp.token and GitHubApp.token != data.get("token"):
+            discard_client(GitHubApp.token)
+
+        GitHubApp.token = data.get("token")
+        GitHubApp.token_expires_at = (
+            datetime.fromisoformat(data["expires_at"]).timestamp()
+            if data.get("expires_at")
+            else time.time() + GITHUB_TOKEN_EXPIRY_MARGIN
+        )
+        return GitHubApp.token
 
     def client(self):
         """Get authenticated GitHub client using GitHub bot.
@@ -103,7 +201,63 @@ class GitHubApp:
         :rtype: :class:`github.Github`
         """
         token = self.installation_token()
-        return Github(token) if token else None
+        return pooled_client(token) if token else None
+
+
+_clients = OrderedDict()
+_clients_lock = threading.Lock()
+
+
+def pooled_client(token):
+    """Return reusable GitHub client authenticated with provided `token`.
+
+    Clients keep their HTTP connections open between calls, so they shouldn't
+    be closed by the callers. The least recently used clients are dropped and
+    closed when the pool is full.
+
+    :param token: GitHub authentication token
+    :type token: str
+    :var evicted: clients dropped from the pool
+    :type evicted: list
+    :var client: GitHub client instance
+    :type client: :class:`github.Github`
+    :return: :class:`github.Github`
+    """
+    evicted = []
+    with _clients_lock:
+        client = _clients.get(token)
+        if client is None:
+            client = Github(
+                auth=Auth.Token(token),
+                timeout=GITHUB_API_TIMEOUT,
+                per_page=GITHUB_ISSUES_PER_PAGE,
+                pool_size=GITHUB_FETCH_WORKERS,
+            )
+            _clients[token] = client
+            while len(_clients) > GITHUB_CLIENTS_POOL_SIZE:
+                evicted.append(_clients.popitem(last=False)[1])
+
+        _clients.move_to_end(token)
+
+    for evicted_client in evicted:
+        evicted_client.close()
+
+    return client
+
+
+def discard_client(token):
+    """Drop and close pooled GitHub client authenticated with `token` if any.
+
+    :param token: GitHub authentication token
+    :type token: str
+    :var client: GitHub client instance
+    :type client: :class:`github.Github` or None
+    """
+    with _clients_lock:
+        client = _clients.pop(token, None)
+
+    if client is not None:
+        client.close()
 
 
 # # HELPERS
@@ -128,6 +282,29 @@ def _contributor_link(handle):
     return f"[{handle}]({contributor.get_absolute_url()})"
 
 
+def is_valid_webhook_signature(payload, signature):
+    """Return True if `signature` is GitHub's signature of webhook `payload`.
+
+    :param payload: raw request body
+    :type payload: bytes
+    :param signature: value of the `X-Hub-Signature-256` header
+    :type signature: str
+    :var secret: webhook's secret
+    :type secret: str
+    :var expected: expected signature
+    :type expected: str
+    :return: Boolean
+    """
+    secret = get_env_variable("GITHUB_WEBHOOK_SECRET", "")
+    if not (secret and signature):
+        return False
+
+    expected = (
+        "sha256=" + hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    )
+    return hmac.compare_digest(expected, signature)
+
+
 # # CRUD
 def _github_client(user):
     """Instantiate and return GitHub client instance on behalf GitHub bot or `user`.
@@ -136,8 +313,6 @@ def _github_client(user):
     :type user: class:`django.contrib.auth.models.User`
     :var client: GitHub client instance
     :type client: :class:`github.Github`
-    :var auth: GitHub authentication token instance
-    :type auth: :class:`github.Github`
     :return: :class:`github.Github`
     """
     client = GitHubApp().client()
@@ -147,8 +322,7 @@ def _github_client(user):
     if not user.profile.github_token:
         return False
 
-    auth = Auth.Token(user.profile.github_token)
-    return Github(auth=auth)
+    return pooled_client(user.profile.github_token)
 
 
 def _github_repository(client):
@@ -161,33 +335,224 @@ def _github_repository(client):
     return client.get_repo(f"{settings.GITHUB_REPO_OWNER}/{settings.GITHUB_REPO_NAME}")
 
 
-def fetch_issues(github_token, state="all", since=GITHUB_ISSUES_START_DATE):
-    """Fetch all GitHub issues with provided `state` from the configured repository.
+def _wait_for_rate_limit(client):
+    """Sleep until rate limit's reset if `client` has almost no requests left.
+
+    Remaining requests and reset time are updated by the client from the
+    rate limit headers of every GitHub response.
+
+    :param client: GitHub client instance
+    :type client: :class:`github.Github`
+    :var remaining: number of requests left in the current rate limit window
+    :type remaining: int
+    :var delay: number of seconds until rate limit's reset
+    :type delay: float
+    """
+    remaining, _ = client.rate_limiting
+    if remaining > GITHUB_RATE_LIMIT_RESERVE:
+        return
+
+    delay = client.rate_limiting_resettime - time.time() + 1
+    if delay > 0:
+        logger.warning(f"GitHub rate limit almost reached, sleeping {delay:.0f}s")
+        time.sleep(delay)
+
+
+def _fetch_issues_page(client, issues, page):
+    """Return issues from provided zero-based `page` of paginated `issues`.
+
+    :param client: GitHub client instance
+    :type client: :class:`github.Github`
+    :param issues: paginated collection of GitHub issues
+    :type issues: :class:`github.PaginatedList`
+    :param page: zero-based page number
+    :type page: int
+    :return: list
+    """
+    _wait_for_rate_limit(client)
+    return issues.get_page(page)
+
+
+def _fetch_issue_record(client, issue):
+    """Return record of provided GitHub `issue` with all its comments' bodies.
+
+    :param client: GitHub client instance
+    :type client: :class:`github.Github`
+    :param issue: GitHub issue instance
+    :type issue: :class:`github.Issue.Issue`
+    :return: :class:`utils.issues_cache.IssueRecord`
+    """
+    if not issue.comments:
+        return IssueRecord.from_github(issue)
+
+    _wait_for_rate_limit(client)
+    return IssueRecord.from_github(
+        issue, [comment.body for comment in issue.get_comments()]
+    )
+
+
+def fetch_issue_records(
+    github_token,
+    since=GITHUB_ISSUES_START_DATE,
+    workers=GITHUB_FETCH_WORKERS,
+    counter=None,
+):
+    """Yield records of GitHub issues updated after `since` with their comments.
+
+    Issues' pages and comments are fetched concurrently by a pool of `workers`
+    threads, with at most `GITHUB_FETCH_PAGES_AHEAD` pages requested ahead of
+    the currently yielded one. Issues are yielded in the order of their update
+    time and pull requests are skipped. Requests for the issues' pages and for
+    the comments' pages are added to provided `counter`.
 
     :param github_token: GitHub authentication token
     :type github_token: str
     :param since: fetch only issues that have been updated after this date
     :type since: :class:`datetime.datetime`
-    :var auth: GitHub authentication instance
-    :type auth: :class:`github.Auth.Token`
+    :param workers: number of concurrently fetching threads
+    :type workers: int
+    :param counter: number of made requests by their kind
+    :type counter: :class:`collections.Counter`
     :var client: GitHub client instance
     :type client: :class:`github.Github`
-    :var repo: GitHub repository instance
-    :type repo: :class:`github.Repository.Repository`
-    :var issues: collection of GitHub issue instances
-    :type issues: list
-    :return: collection of GitHub issues
-    :rtype: :class:`github.PaginatedList`
+    :var issues: paginated collection of GitHub issues
+    :type issues: :class:`github.PaginatedList`
+    :var pages: fetched pages' futures in the pages order
+    :type pages: :class:`collections.deque`
+    :var next_page: zero-based number of the next page to request
+    :type next_page: int
+    :var page_issues: issues from the currently processed page
+    :type page_issues: list
+    :var records: records' futures of the issues from the current page
+    :type records: list
+    :yield: :class:`utils.issues_cache.IssueRecord`
     """
-    auth = Auth.Token(github_token)
-    client = Github(auth=auth)
-    if not client:
-        return []
+    client = pooled_client(github_token)
+    counter = Counter() if counter is None else counter
+    issues = _github_repository(client).get_issues(
+        state="all", sort="updated", direction="asc", since=since
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pages = deque(
+            executor.submit(_fetch_issues_page, client, issues, page)
+            for page in range(GITHUB_FETCH_PAGES_AHEAD)
+        )
+        next_page = len(pages)
+        while pages:
+            page_issues = pages.popleft().result()
+            counter["issues"] += 1
+            if len(page_issues) < GITHUB_ISSUES_PER_PAGE:
+                for future in pages:
+                    future.cancel()
+
+                pages.clear()
+
+            else:
+                pages.append(
+                    executor.submit(_fetch_issues_page, client, issues, next_page)
+                )
+                next_page += 1
+
+            records = [
+                executor.submit(_fetch_issue_record, client, issue)
+                for issue in page_issues
+                if not issue.pull_request
+            ]
+            counter["comments"] += sum(
+                -(-issue.comments // GITHUB_ISSUES_PER_PAGE)
+                for issue in page_issues
+                if not issue.pull_request
+            )
+            for future in records:
+                yield future.result()
+
+
+def sync_issues_mirror(github_token=None):
+    """Update local issues mirror with GitHub issues updated since the last sync.
+
+    Only the issues updated after the most recently updated mirrored issue are
+    requested, and the first page is requested conditionally with the ETag of
+    the previous sync, so an unchanged repository costs a single 304 response
+    that isn't counted against GitHub's rate limit.
+
+    :param github_token: GitHub authentication token, bot's token if not provided
+    :type github_token: str
+    :var token: GitHub authentication token
+    :type token: str
+    :var started_at: time the sync has started
+    :type started_at: :class:`datetime.datetime`
+    :var since: update time of the most recently updated mirrored issue
+    :type since: :class:`datetime.datetime`
+    :var etag: ETag of the first page from the previous sync
+    :type etag: str
+    :var session: HTTP session reused for all the pages
+    :type session: :class:`requests.Session`
+    :var response: GitHub API response
+    :type response: :class:`requests.Response`
+    :var first_etag: ETag of the first page
+    :type first_etag: str
+    :var updated: total number of mirrored issues created or updated
+    :type updated: int
+    :return: dict
+    """
+    token = github_token or GitHubApp().installation_token()
+    if not token:
+        return {"success": False, "error": MISSING_TOKEN_TEXT}
+
+    started_at = timezone.now()
+    since = (
+        GitHubIssueMirror.objects.aggregate(since=Max("updated_at"))["since"]
+        or GITHUB_ISSUES_START_DATE
+    )
+    etag = cache.get(GITHUB_MIRROR_ETAG_CACHE_KEY)
+    session = requests.Session()
+    session.headers.update(
+        {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        }
+    )
+    try:
+        response = session.get(
+            f"{GITHUB_API_URL}/repos/{settings.GITHUB_REPO_OWNER}/"
+            f"{settings.GITHUB_REPO_NAME}/issues",
+            params={
+                "state": "all",
+                "sort": "updated",
+                "direction": "asc",
+                "since": since.isoformat(),
+                "per_page": GITHUB_ISSUES_PER_PAGE,
+            },
+            headers={"If-None-Match": etag} if etag else {},
+            timeout=GITHUB_API_TIMEOUT,
+        )
+        first_etag = response.headers.get("ETag")
+        updated = 0
+        while response.status_code != 304:
+            response.raise_for_status()
+            updated += GitHubIssueMirror.objects.update_from_github(response.json())
+            if "next" not in response.links:
+                break
+
+            response = session.get(
+                response.links["next"]["url"], timeout=GITHUB_API_TIMEOUT
+            )
+
+    except requests.RequestException as exc:
+        logger.error(f"GitHub issues mirror sync failed: {exc}")
+        return {"success": False, "error": str(exc)}
 
-    repo = _github_repository(client)
-    issues = repo.get_issues(state=state, sort="updated", direction="asc", since=since)
+    finally:
+        session.close()
 
-    return issues
+    if first_etag:
+        cache.set(GITHUB_MIRROR_ETAG_CACHE_KEY, first_etag, None)
+
+    # all mirrored issues are confirmed current as of the sync start
+    GitHubIssueMirror.objects.filter(synced_at__lt=started_at).update(
+        synced_at=started_at
+    )
+    return {"success": True, "updated": updated}
 
 
 def close_issue_with_labels(user, issue_number, labels_to_set=None, comment=None):
@@ -230,8 +595,6 @@ def close_issue_with_labels(user, issue_number, labels_to_set=None, comment=None
         # Close the issue
         issue.edit(state="closed")
 
-        client.close()
-
         return {
             "success": True,
             "message": f"Closed issue #{issue_number} with labels {labels_to_set}",
@@ -272,8 +635,6 @@ def create_github_issue(user, title, body, labels=None):
         # Create issue
         issue = repo.create_issue(title=title, body=body, labels=labels or [])
 
-        client.close()
-
         return {
             "success": True,
             "issue_number": issue.number,
@@ -324,8 +685,6 @@ def issue_by_number(user, issue_number):
             "comments": issue.comments,
         }
 
-        client.close()
-
         return {
             "success": True,
             "message": f"Retrieved issue #{issue_number}",
@@ -366,8 +725,6 @@ def set_labels_to_issue(user, issue_number, labels_to_set):
         # refetch issue
         issue = repo.get_issue(issue_number)
 
-        client.close()
-
         return {
             "success": True,
             "message": f"Added labels {labels_to_set} to issue #{issue_number}",
@@ -0,0 +1,338 @@
+"""Module containing slim GitHub issue records and their SQLite cache.
+
+:var ISSUES_CACHE_PATH: default path to the cache's SQLite database file
+:type ISSUES_CACHE_PATH: :class:`pathlib.Path`
+:var ISSUE_FIELDS: names of cached issue's fields
+:type ISSUE_FIELDS: tuple
+:var ISSUE_MAPPED: mapping outcome of issues with database records
+:type ISSUE_MAPPED: str
+:var ISSUE_UNMAPPED: mapping outcome of issues without database records
+:type ISSUE_UNMAPPED: str
+"""
+
+import hashlib
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+
+ISSUES_CACHE_PATH = (
+    Path(__file__).resolve().parent.parent / "fixtures" / "github_issues.db"
+)
+ISSUE_FIELDS = (
+    "number",
+    "state",
+    "title",
+    "body",
+    "labels",
+    "author",
+    "closed_at",
+    "updated_at",
+    "comments",
+)
+ISSUE_MAPPED = "mapped"
+ISSUE_UNMAPPED = "unmapped"
+
+
+def _serialize(value):
+    """Return provided issue field's `value` in the form stored in database.
+
+    :param value: issue field's value
+    :type value: object
+    :return: object
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    if isinstance(value, (list, tuple)):
+        return json.dumps(list(value))
+
+    return value
+
+
+class IssueRecord:
+    """GitHub issue's fields used by the mappers together with its comments.
+
+    Records are created from PyGithub issues at fetch time, so the mappers and
+    the cache don't keep API objects and their raw data around.
+
+    :ivar number: issue's number
+    :type number: int
+    :ivar state: issue's state, either "open" or "closed"
+    :type state: str
+    :ivar title: issue's title
+    :type title: str or None
+    :ivar body: issue's body
+    :type body: str or None
+    :ivar labels: names of issue's labels
+    :type labels: tuple of str
+    :ivar author: login of issue's author
+    :type author: str or None
+    :ivar closed_at: issue's closing time
+    :type closed_at: :class:`datetime.datetime` or None
+    :ivar updated_at: issue's last update time
+    :type updated_at: :class:`datetime.datetime` or None
+    :ivar comments: bodies of issue's comments
+    :type comments: tuple of str
+    """
+
+    __slots__ = ISSUE_FIELDS
+
+    def __init__(
+        self,
+        number,
+        state,
+        title=None,
+        body=None,
+        labels=(),
+        author=None,
+        closed_at=None,
+        updated_at=None,
+        comments=(),
+    ):
+        """Initialize record with provided issue's fields."""
+        self.number = number
+        self.state = state
+        self.title = title
+        self.body = body
+        self.labels = tuple(labels)
+        self.author = author
+        self.closed_at = closed_at
+        self.updated_at = updated_at
+        self.comments = tuple(comments)
+
+    def __eq__(self, other):
+        """Return True if `other` is a record with the same fields.
+
+        :param other: compared object
+        :type other: object
+        :return: Boolean
+        """
+        if not isinstance(other, IssueRecord):
+            return NotImplemented
+
+        return self.fields() == other.fields()
+
+    def __repr__(self):
+        """Return record's short representation.
+
+        :return: str
+        """
+        return f"IssueRecord(number={self.number}, state={self.state!r})"
+
+    @classmethod
+    def from_github(cls, issue, comments=()):
+        """Return record created from provided PyGithub `issue` and `comments`.
+
+        :param issue: GitHub issue instance
+        :type issue: :class:`github.Issue.Issue`
+        :param comments: bodies of issue's comments
+        :type comments: list of str
+        :return: :class:`IssueRecord`
+        """
+        return cls(
+            number=issue.number,
+            state=issue.state,
+            title=issue.title,
+            body=issue.body,
+            labels=[label.name for label in issue.labels],
+            author=issue.user.login if issue.user else None,
+            closed_at=issue.closed_at,
+            updated_at=issue.updated_at,
+            comments=comments,
+        )
+
+    def fields(self):
+        """Return record's fields by their names.
+
+        :return: dict
+        """
+        return {field: getattr(self, field) for field in ISSUE_FIELDS}
+
+    def fingerprint(self):
+        """Return hash of all the record's fields.
+
+        :return: str
+        """
+        return hashlib.sha256(
+            json.dumps(
+                [_serialize(getattr(self, field)) for field in ISSUE_FIELDS]
+            ).encode()
+        ).hexdigest()
+
+
+class GitHubIssuesCache:
+    """Cache of the fields of GitHub issues used by the mappers.
+
+    Issues are upserted by their numbers, so syncing writes only the changed
+    issues, while the timestamp of the last synced update is kept separately.
+
+    :var GitHubIssuesCache.db_path: path to SQLite database file
+    :type GitHubIssuesCache.db_path: :class:`pathlib.Path` or str
+    :var GitHubIssuesCache.conn: database connection
+    :type GitHubIssuesCache.conn: :class:`sqlite3.Connection`
+    """
+
+    def __init__(self, db_path=ISSUES_CACHE_PATH):
+        """Initialize cache and create its database if it doesn't exist."""
+        self.db_path = db_path
+        self.conn = None
+        self.setup_database()
+
+    def setup_database(self):
+        """Setup database schema."""
+        Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS issues (
+                number INTEGER PRIMARY KEY,
+                state TEXT NOT NULL,
+                title TEXT,
+                body TEXT,
+                labels TEXT,
+                author TEXT,
+                closed_at TEXT,
+                updated_at TEXT,
+                comments TEXT
+            );
+            CREATE TABLE IF NOT EXISTS sync_state (
+                key TEXT PRIMARY KEY,
+                value TEXT
+            );
+            CREATE TABLE IF NOT EXISTS mapping_state (
+                number INTEGER PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                outcome TEXT NOT NULL,
+                mapped_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+        """)
+        self.conn.commit()
+
+    def clear(self):
+        """Remove all the cached issues and the sync timestamp."""
+        self.conn.execute("DELETE FROM issues")
+        self.conn.execute("DELETE FROM sync_state WHERE key = 'timestamp'")
+        self.conn.commit()
+
+    def upsert(self, records):
+        """Insert provided `records` or replace the cached ones with the same number.
+
+        :param records: collection of GitHub issue records
+        :type records: list of :class:`IssueRecord`
+        """
+        self.conn.executemany(
+            f"INSERT OR REPLACE INTO issues ({', '.join(ISSUE_FIELDS)}) "
+            f"VALUES ({', '.join('?' for _ in ISSUE_FIELDS)})",
+            [
+                tuple(_serialize(getattr(record, field)) for field in ISSUE_FIELDS)
+                for record in records
+            ],
+        )
+        self.conn.commit()
+
+    def issues(self):
+        """Return records of all the cached issues ordered by their update time.
+
+        :var row: database row with issue's fields
+        :type row: tuple
+        :var issue: issue's fields by their names
+        :type issue: dict
+        :return: list of :class:`IssueRecord`
+        """
+        issues = []
+        for row in self.conn.execute(
+            f"SELECT {', '.join(ISSUE_FIELDS)} FROM issues "
+            "ORDER BY updated_at, number"
+        ):
+            issue = dict(zip(ISSUE_FIELDS, row))
+            issue["labels"] = json.loads(issue["labels"] or "[]")
+            issue["comments"] = json.loads(issue["comments"] or "[]")
+            for field in ("closed_at", "updated_at"):
+                if issue[field]:
+                    issue[field] = datetime.fromisoformat(issue[field])
+
+            issues.append(IssueRecord(**issue))
+
+        return issues
+
+    def timestamp(self):
+        """Return time of the last synced issue's update or None if not synced.
+
+        :var row: database row with the timestamp
+        :type row: tuple or None
+        :return: :class:`datetime.datetime` or None
+        """
+        row = self.conn.execute(
+            "SELECT value FROM sync_state WHERE key = 'timestamp'"
+        ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def set_timestamp(self, timestamp):
+        """Record provided `timestamp` as time of the last synced issue's update.
+
+        :param timestamp: last synced issue's update time
+        :type timestamp: :class:`datetime.datetime`
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('timestamp', ?)",
+            (timestamp.isoformat(),),
+        )
+        self.conn.commit()
+
+    def contributions_fingerprint(self):
+        """Return contributions' fingerprint from the last mapping or None.
+
+        :var row: database row with the fingerprint
+        :type row: tuple or None
+        :return: str or None
+        """
+        row = self.conn.execute(
+            "SELECT value FROM sync_state WHERE key = 'contributions'"
+        ).fetchone()
+        return row[0] if row else None
+
+    def set_contributions_fingerprint(self, fingerprint):
+        """Record provided contributions' `fingerprint` from the last mapping.
+
+        :param fingerprint: hash of contributions' URLs and issues
+        :type fingerprint: str
+        """
+        self.conn.execute(
+            "INSERT OR REPLACE INTO sync_state (key, value) "
+            "VALUES ('contributions', ?)",
+            (fingerprint,),
+        )
+        self.conn.commit()
+
+    def mapping_state(self):
+        """Return fingerprints and outcomes of the last mapping by issues' numbers.
+
+        :return: dict of int: two-tuple
+        """
+        return {
+            number: (fingerprint, outcome)
+            for number, fingerprint, outcome in self.conn.execute(
+                "SELECT number, fingerprint, outcome FROM mapping_state"
+            )
+        }
+
+    def set_mapping_state(self, states):
+        """Record fingerprints and outcomes of provided mapped issues.
+
+        :param states: collection of issue number, fingerprint and outcome
+        :type states: list of three-tuple
+        """
+        self.conn.executemany(
+            "INSERT OR REPLACE INTO mapping_state (number, fingerprint, outcome) "
+            "VALUES (?, ?, ?)",
+            states,
+        )
+        self.conn.commit()
+
+    def cleanup(self):
+        """Cleanup resources.
+
+        Closes database connection if it exists.
+        """
+        if self.conn:
+            self.conn.close()
@@ -1,18 +1,24 @@
 """Module containing helper functions for GitHub issues mapping."""
 
-import pickle
+import hashlib
+import json
+import multiprocessing
 import re
-from collections import defaultdict
-from dataclasses import dataclass
+import time
+from collections import Counter, defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import timedelta
+from functools import partial
 from pathlib import Path
-from typing import Any, List
 
 from django.conf import settings
 from django.db import transaction
-from django.http import Http404
-from django.shortcuts import get_object_or_404
+from django.db.models import Prefetch
+from django.db.models.functions import Lower
+from django.utils import timezone
 
+from core.middleware import QueryStats
 from core.models import (
     Contribution,
     Contributor,
@@ -21,17 +27,22 @@ from core.models import (
     Issue,
     IssueStatus,
     Reward,
-    RewardType,
     SocialPlatform,
+    StatisticsSnapshot,
 )
+from core.fragments import bump_data_version
 from utils.constants.core import (
+    EXPORT_CHUNK_SIZE,
     GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS,
     GITHUB_ISSUES_START_DATE,
+    GITHUB_MAPPING_CHUNK_SIZE,
+    GITHUB_MAPPING_WORKERS,
     ISSUE_CREATION_LABEL_CHOICES,
     REWARDS_COLLECTION,
 )
-from utils.helpers import read_pickle
-from utils.issues import fetch_issues
+from utils.helpers import parse_full_handle
+from utils.issues import fetch_issue_records
+from utils.issues_cache import ISSUE_MAPPED, ISSUE_UNMAPPED, GitHubIssuesCache
 
 URL_EXCEPTIONS = ["discord.com/invite"]
 REWARD_LABELS = [
@@ -40,20 +51,417 @@ REWARD_LABELS = [
     if entry and isinstance(entry[0], str)
 ]
 REWARD_PATTERN = re.compile(rf"^\[({'|'.join(REWARD_LABELS)})(1|2|3)\]")
+MARKDOWN_URL_PATTERN = re.compile(r"\[[^\]]*\]\(([^)]+)\)")
+
+# lookups snapshot of the classification worker process
+_worker_context = None
 
 
 ## HELPERS
-@dataclass
-class CustomIssue:
-    """A simple data class for issues and comments."""
+def _contributor_info_parts(contributor_info):
+    """Return lowercase name and handles parsed from provided `contributor_info`.
+
+    Contributor info format is either "Name" or "Name (handle1, handle2, ...)".
+
+    :param contributor_info: contributor's info string
+    :type contributor_info: str
+    :var name: contributor's name part
+    :type name: str
+    :var handles_part: comma separated handles
+    :type handles_part: str
+    :return: two-tuple
+    """
+    if "(" not in contributor_info:
+        return contributor_info.lower(), []
+
+    name = contributor_info.split("(")[0].strip()
+    handles_part = contributor_info[contributor_info.index("(") + 1 : -1]
+    return name.lower(), [handle.strip().lower() for handle in handles_part.split(",")]
+
+
+class ContributorMatcher(dict):
+    """Mapping from contributor info to ID with compiled name and handle matchers.
 
-    issue: Any
-    comments: List[Any]
+    Text is matched by a single pass of the Aho-Corasick automaton built from
+    all the contributors' names and handles, and the first contributor in the
+    mapping's order that has any of them in the text is returned. Users are
+    located by a handle to ID dictionary, which also contains the handles
+    added from contributors' handle records. Both are built on first lookup
+    and rebuilt after the mapping changes.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize mapping and mark matchers for building.
+
+        :var _automaton: automaton's transitions, failure links and outputs
+        :type _automaton: tuple
+        :var _handles: contributor IDs by lowercase handles and names
+        :type _handles: dict
+        :var _records: contributor IDs by lowercase handles from handle records
+        :type _records: dict
+        """
+        super().__init__(*args, **kwargs)
+        self._automaton = None
+        self._handles = None
+        self._records = {}
+
+    def __setitem__(self, key, value):
+        """Set `key` contributor's ID and mark matchers for rebuilding."""
+        super().__setitem__(key, value)
+        self._automaton = self._handles = None
+
+    def __delitem__(self, key):
+        """Remove `key` contributor and mark matchers for rebuilding."""
+        super().__delitem__(key)
+        self._automaton = self._handles = None
+
+    def update(self, *args, **kwargs):
+        """Update mapping and mark matchers for rebuilding."""
+        super().update(*args, **kwargs)
+        self._automaton = self._handles = None
+
+    def add_handles(self, handles):
+        """Add contributors' handles from their handle records to handle lookups.
+
+        :param handles: collection of full handle and contributor ID pairs
+        :type handles: iterable of two-tuple
+        """
+        for full_handle, contributor_id in handles:
+            for handle in (full_handle, parse_full_handle(full_handle)[1]):
+                self._records.setdefault(handle.lower(), contributor_id)
+
+        self._handles = None
+
+    def _build_automaton(self):
+        """Build Aho-Corasick automaton from contributors' names and handles.
+
+        Every node's output is the lowest index of the contributors having any
+        of the patterns ending in that node or in its failure links chain.
+
+        :var ids: contributor IDs in mapping's order
+        :type ids: list
+        :var goto: transitions by character for every node
+        :type goto: list of dict
+        :var fail: failure link for every node
+        :type fail: list of int
+        :var output: lowest matching contributor index for every node
+        :type output: list of int
+        :var queue: nodes to process in breadth-first order
+        :type queue: :class:`collections.deque`
+        :return: four-tuple
+        """
+        ids = list(self.values())
+        goto, output = [{}], [len(ids)]
+        for index, contributor_info in enumerate(self):
+            name, handles = _contributor_info_parts(contributor_info)
+            for pattern in [name, *handles]:
+                node = 0
+                for char in pattern:
+                    if char not in goto[node]:
+                        goto[node][char] = len(goto)
+                        goto.append({})
+                        output.append(len(ids))
+
+                    node = goto[node][char]
+
+                output[node] = min(output[node], index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        for node in queue:
+            output[node] = min(output[node], output[0])
+
+        while queue:
+            node = queue.popleft()
+            for char, child in goto[node].items():
+                state = fail[node]
+                while state and char not in goto[state]:
+                    state = fail[state]
+
+                fail[child] = goto[state].get(char, 0)
+                output[child] = min(output[child], output[fail[child]])
+                queue.append(child)
+
+        return ids, goto, fail, output
+
+    def _build_handles(self):
+        """Build dictionary of contributor IDs by lowercase handles and names.
+
+        Names and handles are added both with and without their platform
+        prefix, as single-handle contributors are named by their full handle.
+        The first contributor in the mapping's order is kept for duplicates and
+        the handles from handle records are added last.
+
+        :var handles: contributor IDs by lowercase handles and names
+        :type handles: dict
+        :return: dict
+        """
+        handles = {}
+        for contributor_info, contributor_id in self.items():
+            name, full_handles = _contributor_info_parts(contributor_info)
+            handles.setdefault(name, contributor_id)
+            handles.setdefault(parse_full_handle(name)[1], contributor_id)
+            for full_handle in full_handles:
+                handles.setdefault(full_handle, contributor_id)
+                handles.setdefault(parse_full_handle(full_handle)[1], contributor_id)
+
+        for handle, contributor_id in self._records.items():
+            handles.setdefault(handle, contributor_id)
+
+        return handles
+
+    def from_text(self, text):
+        """Return ID of the first contributor with name or handle in `text`.
+
+        :param text: GitHub issue body and comments text
+        :type text: str
+        :var found: lowest matched contributor index
+        :type found: int
+        :var state: automaton's current node
+        :type state: int
+        :return: int or None
+        """
+        if self._automaton is None:
+            self._automaton = self._build_automaton()
+
+        ids, goto, fail, output = self._automaton
+        found, state = len(ids), 0
+        for char in text.lower():
+            while state and char not in goto[state]:
+                state = fail[state]
+
+            state = goto[state].get(char, 0)
+            if output[state] < found:
+                found = output[state]
+                if found == 0:
+                    break
+
+        return ids[found] if found < len(ids) else None
+
+    def from_handle(self, handle):
+        """Return ID of the contributor with provided `handle` or name.
+
+        :param handle: contributor's handle with or without platform prefix
+        :type handle: str
+        :return: int or None
+        """
+        if self._handles is None:
+            self._handles = self._build_handles()
+
+        return self._handles.get(handle.lower())
+
+
+class MappingContext:
+    """Lookups shared by all the mapping passes of a single run.
+
+    Contributors, platforms, rewards and cycles are fetched once when the
+    context is created, so the passes identify issues' data without queries.
+    Contributors created by the passes are added to the shared matcher.
+
+    :var MappingContext.contributors: mapping from contributor info to ID
+    :type MappingContext.contributors: :class:`ContributorMatcher`
+    :var MappingContext.platforms: mapping from platform name to ID
+    :type MappingContext.platforms: dict of str: int
+    :var MappingContext.platform_names: lowercase platform names by their IDs
+    :type MappingContext.platform_names: dict of int: str
+    :var MappingContext.rewards: rewards by type label, level and active flag
+    :type MappingContext.rewards: dict of tuple: :class:`core.models.Reward`
+    :var MappingContext.reward_mapping: mapping from label types to rewards
+    :type MappingContext.reward_mapping: dict of str: :class:`core.models.Reward`
+    :var MappingContext.cycles: all the cycles ordered by their start
+    :type MappingContext.cycles: list of :class:`core.models.Cycle`
+    :var MappingContext.issue_url_pattern: configured repository's issue URL
+    :type MappingContext.issue_url_pattern: :class:`re.Pattern`
+    """
 
+    def __init__(self):
+        """Fetch all the lookups used by the mapping passes.
+
+        :var contributors: contributors not excluded from mapping
+        :type contributors: list of :class:`core.models.Contributor`
+        :var platforms: all the social platforms
+        :type platforms: list of :class:`core.models.SocialPlatform`
+        :var rewards: all the rewards ordered by their IDs
+        :type rewards: list of :class:`core.models.Reward`
+        """
+        contributors = [
+            contributor
+            for contributor in Contributor.objects.prefetch_related(
+                Prefetch(
+                    "handle_set",
+                    queryset=Handle.objects.select_related("platform").order_by(
+                        Lower("handle")
+                    ),
+                    to_attr="prefetched_handles",
+                )
+            )
+            if not any(
+                username in contributor.info
+                for username in GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS
+            )
+        ]
+        self.contributors = ContributorMatcher(
+            (contributor.info, contributor.id) for contributor in contributors
+        )
+        self.contributors.add_handles(
+            (handle.platform.prefix + handle.handle, contributor.id)
+            for contributor in contributors
+            for handle in contributor.prefetched_handles
+        )
+
+        platforms = list(SocialPlatform.objects.all())
+        self.platforms = {platform.name: platform.id for platform in platforms}
+        self.platform_names = {
+            platform.id: platform.name.lower() for platform in platforms
+        }
+
+        rewards = list(Reward.objects.select_related("type").order_by("id"))
+        self.rewards = {}
+        for reward in rewards:
+            self.rewards.setdefault(
+                (reward.type.label, reward.level, reward.active), reward
+            )
+
+        self.reward_mapping = _build_reward_mapping(rewards)
+
+        self.cycles = list(Cycle.objects.all())
+        self._latest_cycles = {}
+
+        self.issue_url_pattern = _github_issue_url_pattern()
+
+    def latest_cycle(self, field):
+        """Return cycle with the latest value of provided `field`.
+
+        Cycle is fetched once per field, like :meth:`QuerySet.latest`.
+
+        :param field: name of cycle's date field
+        :type field: str
+        :raises Cycle.DoesNotExist: if there are no cycles
+        :return: :class:`core.models.Cycle`
+        """
+        if field not in self._latest_cycles:
+            self._latest_cycles[field] = Cycle.objects.latest(field)
+
+        return self._latest_cycles[field]
+
+    def cycle_for(self, moment):
+        """Return cycle containing provided `moment` or None if not found.
+
+        :param moment: issue's closing time
+        :type moment: :class:`datetime.datetime`
+        :var day: moment's date in the default timezone
+        :type day: :class:`datetime.date`
+        :return: :class:`core.models.Cycle` or None
+        """
+        day = timezone.localdate(moment) if timezone.is_aware(moment) else moment.date()
+        return next(
+            (
+                cycle
+                for cycle in self.cycles
+                if cycle.end is not None and cycle.start <= day <= cycle.end
+            ),
+            None,
+        )
 
-def _build_reward_mapping():
+
+class MappingReport:
+    """Stage timings and issue outcomes of a single mapping run.
+
+    Every issue examined by a pass is counted either as mapped or as skipped
+    for a reason, so the report shows where the mapping time goes and why
+    issues are left without database records.
+
+    :var MappingReport.stages: wall time and number of queries by stage name
+    :type MappingReport.stages: dict of str: dict
+    :var MappingReport.outcomes: number of issues by stage name and outcome
+    :type MappingReport.outcomes: :class:`collections.defaultdict`
+    :var MappingReport.github_requests: number of requests made to GitHub API
+    :type MappingReport.github_requests: :class:`collections.Counter`
+    """
+
+    def __init__(self):
+        """Initialize empty report."""
+        self.stages = {}
+        self.outcomes = defaultdict(Counter)
+        self.github_requests = Counter()
+
+    @contextmanager
+    def stage(self, name):
+        """Record wall time and number of queries of the block as `name` stage.
+
+        :param name: stage name
+        :type name: str
+        :var start: stage's start time
+        :type start: float
+        :var stats: stage's SQL queries statistics
+        :type stats: :class:`core.middleware.QueryStats`
+        """
+        start = time.perf_counter()
+        with QueryStats() as stats:
+            yield
+
+        self.stages[name] = {
+            "seconds": round(time.perf_counter() - start, 3),
+            "queries": stats.count,
+        }
+
+    def count(self, stage, outcome, number=1):
+        """Add `number` of issues with provided `outcome` to `stage` outcomes.
+
+        :param stage: stage name
+        :type stage: str
+        :param outcome: "examined", "mapped" or the reason for skipping issues
+        :type outcome: str
+        :param number: number of issues
+        :type number: int
+        """
+        self.outcomes[stage][outcome] += number
+
+    def as_dict(self):
+        """Return report's data in JSON serializable form.
+
+        :var issues: examined, mapped and skipped issues by stage name
+        :type issues: dict
+        :return: dict
+        """
+        issues = {
+            stage: {
+                "examined": outcomes["examined"],
+                "mapped": outcomes["mapped"],
+                "skipped": {
+                    reason: number
+                    for reason, number in sorted(outcomes.items())
+                    if reason not in ("examined", "mapped")
+                },
+            }
+            for stage, outcomes in self.outcomes.items()
+        }
+        return {
+            "seconds": round(
+                sum(stage["seconds"] for stage in self.stages.values()), 3
+            ),
+            "queries": sum(stage["queries"] for stage in self.stages.values()),
+            "github_requests": sum(self.github_requests.values()),
+            "stages": self.stages,
+            "issues": issues,
+        }
+
+    def write(self, path):
+        """Write report's data to the JSON file at provided `path`.
+
+        :param path: path to the report file
+        :type path: :class:`pathlib.Path` or str
+        """
+        Path(path).write_text(json.dumps(self.as_dict(), indent=2))
+
+
+def _build_reward_mapping(rewards):
     """Build mapping from issue detection labels to active rewards.
 
+    :param rewards: all the rewards
+    :type rewards: list of :class:`core.models.Reward`
+    :var candidates: active rewards with matching type label and amount
+    :type candidates: list of :class:`core.models.Reward`
     :return: mapping from label type to reward object
     :rtype: dict of str: :class:`core.models.Reward`
     """
@@ -77,21 +485,19 @@ def _build_reward_mapping():
             amount = reward_config[1]  # Get the amount
 
             # Find active reward with matching type label and amount
-            try:
-                reward = Reward.objects.get(
-                    type__label=label_code, amount=amount, active=True
-                )
-                reward_mapping[label_type] = reward
-
-            except Reward.DoesNotExist:
+            candidates = [
+                reward
+                for reward in rewards
+                if reward.active
+                and reward.type.label == label_code
+                and reward.amount == amount
+            ]
+            if not candidates:
                 print(f"No active reward found for {label_code} with amount {amount}")
                 continue
 
-            except Reward.MultipleObjectsReturned:
-                reward = Reward.objects.filter(
-                    type__label=label_code, amount=amount, active=True
-                ).first()
-                reward_mapping[label_type] = reward
+            reward_mapping[label_type] = candidates[0]
+            if len(candidates) > 1:
                 print(f"Multiple rewards found for {label_code}, using first one")
 
         else:
@@ -100,28 +506,21 @@ def _build_reward_mapping():
     return reward_mapping
 
 
-def _extract_url_text(body, platform_id):
+def _extract_url_text(body, platform_name):
     """Extract URL from issue body in markdown format.
 
     :param body: GitHub issue body text
     :type body: str
-    :param platform_id: platform ID to help identify relevant URLs
-    :type platform_id: int
+    :param platform_name: lowercase platform name to identify relevant URLs
+    :type platform_name: str or None
     :return: extracted URL if found, None otherwise
     :rtype: str or None
     """
-    # Get platform name for URL matching
-    try:
-        platform = SocialPlatform.objects.get(id=platform_id)
-        platform_name = platform.name.lower()
-    except SocialPlatform.DoesNotExist:
+    if not platform_name:
         return None
 
     # Look for markdown links [text](url)
-    url_pattern = r"\[[^\]]*\]\(([^)]+)\)"
-    matches = re.findall(url_pattern, body)
-
-    for url in matches:
+    for url in MARKDOWN_URL_PATTERN.findall(body):
         if (
             url.startswith("http")
             and platform_name in url.lower()
@@ -132,59 +531,59 @@ def _extract_url_text(body, platform_id):
     return None
 
 
-def _fetch_and_categorize_issues(github_token, refetch=False):
-    """Fetch all GitHub issues and return them categorized.
+def _fetch_and_categorize_issues(github_token, refetch=False, report=None):
+    """Sync GitHub issues cache and return cached issues categorized by state.
+
+    Only the issues updated after the cache's timestamp are fetched and
+    upserted, unless `refetch` clears the cache first.
 
     :param github_token: GitHub API token
     :type github_token: str
     :param refetch: should recorded issues be refetched or not
     :type refetch: Boolean
-    :var github_issues: collection of categorized GitHub issue instances
-    :type github_issues: dict
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
+    :var cache: GitHub issues cache
+    :type cache: :class:`utils.issues_cache.GitHubIssuesCache`
+    :var changed: fetched issues not saved to cache yet
+    :type changed: list of :class:`utils.issues_cache.IssueRecord`
     :var counter: currently processed issue ordinal
     :type counter: int
     :var issue: currently processed issue
-    :type issue: :class:`github.Issue.Issue`
-    :return: collection of categorized GitHub issue instances
+    :type issue: :class:`utils.issues_cache.IssueRecord`
+    :var github_issues: collection of categorized GitHub issue records
+    :type github_issues: dict
+    :return: collection of categorized GitHub issue records
     :rtype: dict
     """
-    github_issues = _load_saved_issues() if not refetch else defaultdict(list)
-
-    if not github_token:
-        return github_issues
-
-    issue = None
-    for counter, issue in enumerate(
-        fetch_issues(
-            github_token,
-            state="all",
-            since=github_issues.get("timestamp", GITHUB_ISSUES_START_DATE),
-        )
-    ):
-        if issue.pull_request:
-            continue
-
-        comments = (
-            [comment.body for comment in issue.get_comments()] if issue.comments else []
-        )
-        custom_issue = CustomIssue(issue, comments)
+    cache = GitHubIssuesCache()
+    try:
+        if refetch:
+            cache.clear()
+
+        if github_token:
+            changed = []
+            issue = None
+            for counter, issue in enumerate(
+                fetch_issue_records(
+                    github_token,
+                    since=cache.timestamp() or GITHUB_ISSUES_START_DATE,
+                    counter=report.github_requests if report else None,
+                )
+            ):
+                changed.append(issue)
+                if divmod(counter, 10)[1] == 0:
+                    print("Issue number: ", issue.number)
+                    _save_issues(cache, changed, issue.updated_at)
+                    changed = []
 
-        github_issues[issue.state].append(custom_issue)
-        if divmod(counter, 10)[1] == 0:
-            print("Issue number: ", issue.number)
-            _save_issues(github_issues, issue.updated_at)
+            if issue:
+                _save_issues(cache, changed, issue.updated_at + timedelta(seconds=10))
 
-    # # Remove duplicates
-    # github_issues["closed"] = sorted(
-    #     list(set(github_issues["closed"])), key=lambda i: getattr(i, "number")
-    # )
-    # github_issues["open"] = sorted(
-    #     list(set(github_issues["open"])), key=lambda i: getattr(i, "number")
-    # )
-    # _save_issues(github_issues, github_issues["timestamp"])
+        github_issues = _load_saved_issues(cache)
 
-    if issue:
-        _save_issues(github_issues, issue.updated_at + timedelta(seconds=10))
+    finally:
+        cache.cleanup()
 
     print(
         "Number of issues: "
@@ -199,7 +598,7 @@ def _identify_contributor_from_text(text, contributors):
     :param body: GitHub issue body and comments text
     :type body: str
     :param contributors: mapping from contributor info to ID
-    :type contributors: dict of str: int
+    :type contributors: :class:`ContributorMatcher` or dict of str: int
     :return: contributor ID if found, None otherwise
     :rtype: int or None
     """
@@ -207,44 +606,24 @@ def _identify_contributor_from_text(text, contributors):
     if not text:
         return None
 
-    # Convert body to lowercase for case-insensitive matching
-    text_lower = text.lower()
-
-    for contributor_info, contributor_id in contributors.items():
-        # If contributor info doesn't have parentheses, search for the whole info
-        if "(" not in contributor_info:
-            # For simple format, require exact word match to avoid false positives
-            if contributor_info.lower() in text_lower:
-                return contributor_id
-
-        else:
-            # If contributor info has parentheses, extract and search for handles
-            # Format: "Name (handle1, handle2, ...)"
-            name_part = contributor_info.split("(")[0].strip()
-            handles_part = contributor_info[contributor_info.index("(") + 1 : -1]
-
-            # Split handles by comma and clean up
-            handles = [handle.strip() for handle in handles_part.split(",")]
-
-            # Search for the name part in body - require exact word match
-            if name_part.lower() in text_lower:
-                return contributor_id
+    if not isinstance(contributors, ContributorMatcher):
+        contributors = ContributorMatcher(contributors)
 
-            # Search for individual handles in body - allow partial matches
-            for handle in handles:
-                if handle.lower() in text_lower:
-                    return contributor_id
-
-    return None
+    return contributors.from_text(text)
 
 
 def _identify_contributor_from_user(user, contributors, strict=True):
-    """Identify contributor from issue body by matching contributor info and handles.
+    """Identify contributor from GitHub username by matching contributor handles.
+
+    Strict matching requires GitHub platform's prefix in contributor's handle,
+    while non-strict matching also accepts contributor's name or any handle.
 
     :param user: GitHub username
     :type user: str
     :param contributors: mapping from contributor info to ID
-    :type contributors: dict of str: int
+    :type contributors: :class:`ContributorMatcher` or dict of str: int
+    :param strict: should GitHub handle be required
+    :type strict: Boolean
     :return: contributor ID if found, None otherwise
     :rtype: int or None
     """
@@ -252,15 +631,10 @@ def _identify_contributor_from_user(user, contributors, strict=True):
     if not user:
         return None
 
-    # Convert to lowercase for case-insensitive matching
-    user_lower = user.lower()
-    handle = "g@" + user_lower if strict else user_lower
+    if not isinstance(contributors, ContributorMatcher):
+        contributors = ContributorMatcher(contributors)
 
-    for contributor_info, contributor_id in contributors.items():
-        if handle in contributor_info.lower():
-            return contributor_id
-
-    return None
+    return contributors.from_handle("g@" + user if strict else user)
 
 
 def _identify_platform_from_text(text, platforms):
@@ -283,15 +657,15 @@ def _identify_platform_from_text(text, platforms):
 def _identify_reward_from_labels(labels, reward_mapping):
     """Identify reward based on GitHub issue labels.
 
-    :param labels: list of GitHub issue label objects
-    :type labels: list of :class:`github.Label.Label`
+    :param labels: names of GitHub issue labels
+    :type labels: tuple of str
     :param reward_mapping: mapping from label types to rewards
     :type reward_mapping: dict of str: :class:`core.models.Reward`
     :return: reward object if found, None otherwise
     :rtype: :class:`core.models.Reward` or None
     """
     for label in labels:
-        label_name = label.name.lower()
+        label_name = label.lower()
 
         # Check for exact matches first
         for label_type in reward_mapping.keys():
@@ -306,13 +680,15 @@ def _identify_reward_from_labels(labels, reward_mapping):
     return None
 
 
-def _identify_reward_from_issue_title(title, active=True):
+def _identify_reward_from_issue_title(title, rewards, active=True):
     """Checks if the provided title text starts with a valid reward pattern like:
 
     [F(1)], [B(2)], [ER(3)], etc.
 
     :param title: GitHub issue's title
     :type title: str
+    :param rewards: rewards by type label, level and active flag
+    :type rewards: dict of tuple: :class:`core.models.Reward`
     :param active: is reward active or not
     :type active: Boolean
     return: :class:`core.models.Reward`
@@ -325,29 +701,33 @@ def _identify_reward_from_issue_title(title, active=True):
         return None
 
     label, level = match.groups()
-    level = int(level)
+    return rewards.get((label, int(level), active))
+
+
+def _github_issue_url_pattern():
+    """Return compiled pattern of the configured repository's GitHub issue URL.
 
-    reward_type = get_object_or_404(RewardType, label=label)
-    return Reward.objects.filter(type=reward_type, level=level, active=active).first()
+    :return: :class:`re.Pattern`
+    """
+    return re.compile(
+        rf"^.*github\.com/{settings.GITHUB_REPO_OWNER}/"
+        rf"{settings.GITHUB_REPO_NAME}/issues/(\d+).*"
+    )
 
 
-def _is_url_github_issue(url):
+def _is_url_github_issue(url, pattern=None):
     """Check if a URL matches the pattern of a GitHub issue in the configured repository.
 
     :param url: URL to check
     :type url: str
+    :param pattern: compiled GitHub issue URL pattern
+    :type pattern: :class:`re.Pattern`
     :return: GitHub issue number if URL matches pattern, False otherwise
     :rtype: int or bool
-    :var pattern: regex pattern for GitHub issue URL matching
-    :type pattern: str
     :var match: regex match object
     :type match: :class:`re.Match` or None
     """
-    pattern = (
-        rf"^.*github\.com/{settings.GITHUB_REPO_OWNER}/"
-        rf"{settings.GITHUB_REPO_NAME}/issues/(\d+).*"
-    )
-    match = re.match(pattern, url)
+    match = (pattern or _github_issue_url_pattern()).match(url)
     if not match:
         return False
 
@@ -355,35 +735,140 @@ def _is_url_github_issue(url):
 
 
 ## I/O
-def _load_saved_issues():
-    """Load saved GitHub issues from pickle file.
-
-    :return: defaultdict containing GitHub issues data
+def _load_saved_issues(cache):
+    """Return GitHub issues from provided `cache` categorized by their state.
+
+    :param cache: GitHub issues cache
+    :type cache: :class:`utils.issues_cache.GitHubIssuesCache`
+    :var github_issues: collection of categorized GitHub issue records
+    :type github_issues: :class:`collections.defaultdict`
+    :var record: cached GitHub issue record
+    :type record: :class:`utils.issues_cache.IssueRecord`
+    :return: :class:`collections.defaultdict`
     """
     github_issues = defaultdict(list)
-    path = Path(__file__).resolve().parent.parent / "fixtures" / "github_issues.pkl"
-    data = read_pickle(path)
-
-    for key in data:
-        github_issues[key] = data[key]
+    for record in cache.issues():
+        github_issues[record.state].append(record)
 
     return github_issues
 
 
-def _save_issues(github_issues, timestamp):
-    """Save GitHub issues to pickle file with timestamp.
+def _save_issues(cache, github_issues, timestamp):
+    """Upsert provided `github_issues` to `cache` and record sync `timestamp`.
 
-    :param github_issues: dictionary containing GitHub issues data
-    :param timestamp: timestamp to include in the saved data
+    :param cache: GitHub issues cache
+    :type cache: :class:`utils.issues_cache.GitHubIssuesCache`
+    :param github_issues: GitHub issues changed since the last save
+    :type github_issues: list of :class:`utils.issues_cache.IssueRecord`
+    :param timestamp: last saved issue's update time
+    :type timestamp: :class:`datetime.datetime`
     """
-    path = Path(__file__).resolve().parent.parent / "fixtures" / "github_issues.pkl"
-    github_issues["timestamp"] = timestamp
+    cache.upsert(github_issues)
+    cache.set_timestamp(timestamp)
 
-    # Create directory if it doesn't exist
-    path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(path, "wb") as pickle_file:
-        pickle.dump(github_issues, pickle_file)
+def _contributions_fingerprint():
+    """Return hash of all the contributions' URLs and linked issues.
+
+    Closed archived issues are mapped by contributions' URLs, so any change
+    in those invalidates the outcomes of the last mapping.
+
+    :var digest: contributions' hash
+    :type digest: :class:`hashlib._Hash`
+    :return: str
+    """
+    digest = hashlib.sha256()
+    for contribution_id, url, issue_id in (
+        Contribution.objects.order_by("id")
+        .values_list("id", "url", "issue_id")
+        .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+    ):
+        digest.update(f"{contribution_id}|{url}|{issue_id}\n".encode())
+
+    return digest.hexdigest()
+
+
+def _issues_to_map(github_issues, full=False):
+    """Return categorized `github_issues` changed or unmapped since the last mapping.
+
+    Issue is skipped only if its fingerprint is unchanged since the mapping
+    that created its database record and that record still exists. All the
+    issues are mapped if contributions have changed since the last mapping.
+
+    :param github_issues: collection of categorized GitHub issue records
+    :type github_issues: dict
+    :param full: should all the issues be mapped or not
+    :type full: Boolean
+    :var cache: GitHub issues cache
+    :type cache: :class:`utils.issues_cache.GitHubIssuesCache`
+    :var mapping_state: last mapping's fingerprints and outcomes by numbers
+    :type mapping_state: dict
+    :var contributions_fingerprint: contributions' hash from the last mapping
+    :type contributions_fingerprint: str or None
+    :var existing: numbers of issues having database records
+    :type existing: set
+    :var changed: categorized GitHub issue records to map
+    :type changed: :class:`collections.defaultdict`
+    :return: :class:`collections.defaultdict`
+    """
+    if full:
+        return github_issues
+
+    cache = GitHubIssuesCache()
+    try:
+        mapping_state = cache.mapping_state()
+        contributions_fingerprint = cache.contributions_fingerprint()
+
+    finally:
+        cache.cleanup()
+
+    if contributions_fingerprint != _contributions_fingerprint():
+        return github_issues
+
+    existing = set(Issue.objects.values_list("number", flat=True))
+    changed = defaultdict(list)
+    for state, records in github_issues.items():
+        for record in records:
+            if record.number not in existing or mapping_state.get(record.number) != (
+                record.fingerprint(),
+                ISSUE_MAPPED,
+            ):
+                changed[state].append(record)
+
+    return changed
+
+
+def _save_mapping_state(github_issues):
+    """Record fingerprints and outcomes of provided mapped `github_issues`.
+
+    Contributions' fingerprint is recorded too, so the next mapping knows
+    whether the contributions have changed in between.
+
+    :param github_issues: collection of categorized GitHub issue records
+    :type github_issues: dict
+    :var existing: numbers of issues having database records
+    :type existing: set
+    :var cache: GitHub issues cache
+    :type cache: :class:`utils.issues_cache.GitHubIssuesCache`
+    """
+    existing = set(Issue.objects.values_list("number", flat=True))
+    cache = GitHubIssuesCache()
+    try:
+        cache.set_mapping_state(
+            [
+                (
+                    record.number,
+                    record.fingerprint(),
+                    ISSUE_MAPPED if record.number in existing else ISSUE_UNMAPPED,
+                )
+                for records in github_issues.values()
+                for record in records
+            ]
+        )
+        cache.set_contributions_fingerprint(_contributions_fingerprint())
+
+    finally:
+        cache.cleanup()
 
 
 ## MAPPING
@@ -525,165 +1010,373 @@ def _create_issues_bulk(issue_assignments):
         Contribution.objects.bulk_update(contributions, ["issue"])
 
 
-@transaction.atomic
-def _map_closed_addressed_issues(github_issues):
-    """Fetch GitHub issues with "addressed" label and create contributions.
+def _persist_mapped_issues(mapped_issues, status, cycle, update_statuses=()):
+    """Bulk create issues and their missing contributions from `mapped_issues`.
 
-    This function processes GitHub issues labeled as "addressed" and:
-    1. Creates Issue objects with ADDRESSED status
-    2. Identifies contributors from issue text and user
-    3. Creates new contributors from text patterns if none found
-    4. Identifies platforms from issue text
-    5. Determines rewards based on issue labels
-    6. Extracts URLs from issue bodies
-    7. Creates contributions for each identified contributor
+    Existing issues and contributions are fetched in one query each, so the
+    number of queries doesn't depend on the number of mapped issues. As bulk
+    operations don't send model signals, statistics snapshot is adjusted and
+    cached fragments are invalidated here.
 
-    :param github_issues: collection of GitHub issue instances
-    :type github_issues: list
-    :return: True if operation completed successfully, False if no issues found
-    :rtype: bool
+    :param mapped_issues: issue number, contributor IDs, platform ID, reward and URL
+    :type mapped_issues: list of tuple (int, list, int, :class:`core.models.Reward`, str)
+    :param status: status of the created issues
+    :type status: :class:`core.models.IssueStatus`
+    :param cycle: cycle of the created contributions
+    :type cycle: :class:`core.models.Cycle`
+    :param update_statuses: existing issues' statuses to be replaced by `status`
+    :type update_statuses: tuple
+    :var numbers: distinct mapped issue numbers
+    :type numbers: set of int
+    :var issues: mapping from issue number to issue instance
+    :type issues: dict of int: :class:`core.models.Issue`
+    :var issues_to_update: existing issues with changed status
+    :type issues_to_update: list of :class:`core.models.Issue`
+    :var issues_to_create: issue instances to create in bulk
+    :type issues_to_create: list of :class:`core.models.Issue`
+    :var existing: issue number and contributor ID pairs of existing contributions
+    :type existing: set of tuple (int, int)
+    :var contributions: contribution instances to create in bulk
+    :type contributions: list of :class:`core.models.Contribution`
+    :return: list
     """
-    # Filter issues with "addressed" label
-    addressed_issues = [
-        issue
-        for issue in github_issues
-        if hasattr(issue, "issue")
-        and hasattr(issue.issue, "labels")
-        and any(
-            (getattr(label, "name", label) or "").lower() == "addressed"
-            for label in issue.issue.labels or []
-        )
+    if not mapped_issues:
+        return []
+
+    numbers = {number for number, *_ in mapped_issues}
+    issues = {issue.number: issue for issue in Issue.objects.filter(number__in=numbers)}
+
+    issues_to_update = [
+        issue for issue in issues.values() if issue.status in update_statuses
     ]
+    for issue in issues_to_update:
+        issue.status = status
 
-    if not addressed_issues:
-        return False
+    if issues_to_update:
+        Issue.objects.bulk_update(issues_to_update, ["status"])
 
-    # Fetch existing rewards mapping
-    reward_mapping = _build_reward_mapping()
+    issues_to_create = [
+        Issue(number=number, status=status)
+        for number in sorted(numbers)
+        if number not in issues
+    ]
+    if issues_to_create:
+        Issue.objects.bulk_create(issues_to_create)
+        issues.update({issue.number: issue for issue in issues_to_create})
 
-    # Fetch all contributors and create info mapping
-    contributors = {
-        c.info: c.id
-        for c in Contributor.objects.all()
-        if not any(u in c.info for u in GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS)
-    }
+    existing = set(
+        Contribution.objects.filter(issue__number__in=numbers).values_list(
+            "issue__number", "contributor_id"
+        )
+    )
+    contributions = []
+    for number, contributor_ids, platform_id, reward, url in mapped_issues:
+        for contributor_id in contributor_ids:
+            if (number, contributor_id) in existing:
+                continue
 
-    # Fetch all platforms by name
-    platforms = {
-        platform.name: platform.id for platform in SocialPlatform.objects.all()
-    }
+            existing.add((number, contributor_id))
+            contributions.append(
+                Contribution(
+                    contributor_id=contributor_id,
+                    cycle=cycle,
+                    platform_id=platform_id,
+                    reward=reward,
+                    issue=issues[number],
+                    percentage=1,
+                    url=url,
+                    confirmed=True,
+                )
+            )
 
-    # Define current cycle (using latest end date as specified)
-    cycle = Cycle.objects.latest("end")
+    if contributions:
+        Contribution.objects.bulk_create(contributions)
+        StatisticsSnapshot.objects.adjust(
+            num_contributions=len(contributions),
+            total_rewards=sum(
+                contribution.reward.amount for contribution in contributions
+            ),
+        )
 
-    # Process each addressed issue
-    for github_issue in addressed_issues:
-        # Skip issues with no body/comments or internal titles
-        if not (github_issue.issue.body or github_issue.comments):
-            continue
+    if issues_to_update or issues_to_create or contributions:
+        bump_data_version()
 
-        if "[Internal]" in github_issue.issue.title:
-            continue
+    return contributions
 
-        number = github_issue.issue.number
 
-        # Combine body and comments for text analysis
-        search_text = "\n".join([github_issue.issue.body or "", *github_issue.comments])
+def _identify_contributors(github_issue, search_text, contributors):
+    """Return IDs of contributors identified from issue's author and text.
 
-        # Identify platform from issue body
-        platform_id = _identify_platform_from_text(search_text, platforms)
-        if not platform_id:
-            # Fallback to GitHub
-            platform_id = platforms.get("GitHub")
+    :param github_issue: GitHub issue record
+    :type github_issue: :class:`utils.issues_cache.IssueRecord`
+    :param search_text: issue body and comments
+    :type search_text: str
+    :param contributors: mapping from contributor info to ID
+    :type contributors: :class:`ContributorMatcher`
+    :var contributor_ids: identified contributors' IDs
+    :type contributor_ids: list of int
+    :return: list of int
+    """
+    contributor_ids = []
+    for contributor_id in (
+        _identify_contributor_from_user(
+            github_issue.author, contributors, strict=False
+        ),
+        _identify_contributor_from_text(search_text, contributors),
+    ):
+        if contributor_id and contributor_id not in contributor_ids:
+            contributor_ids.append(contributor_id)
 
-        reward = _identify_reward_from_issue_title(github_issue.issue.title)
-        if not reward:
-            reward = _identify_reward_from_labels(
-                github_issue.issue.labels, reward_mapping
-            )
-            if not reward:
-                continue  # Skip if no reward identified
+    return contributor_ids
+
+
+def _classify_issue(github_issue, context, active=True):
+    """Return issue number, contributors, platform, reward, URL and text for issue.
 
-        # Extract URL from issue body
-        url = _extract_url_text(search_text, platform_id)
+    Issues without body and comments and internal issues aren't classified.
+    Platform falls back to GitHub if not identified from the issue's text.
+
+    :param github_issue: GitHub issue record
+    :type github_issue: :class:`utils.issues_cache.IssueRecord`
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param active: should reward from the title be active or not
+    :type active: Boolean
+    :var search_text: issue body and comments
+    :type search_text: str
+    :var platform_id: identified platform's ID
+    :type platform_id: int or None
+    :var reward: identified reward
+    :type reward: :class:`core.models.Reward` or None
+    :return: tuple (int, list, int, :class:`core.models.Reward`, str, str) or None
+    """
+    if (
+        not (github_issue.body or github_issue.comments)
+        or "[Internal]" in github_issue.title
+    ):
+        return None
 
-        # Get or create issue with ADDRESSED status
-        try:
-            issue = Issue.objects.get(number=number)
-            # Update status to ADDRESSED if it was previously CREATED
-            if issue.status == IssueStatus.CREATED:
-                issue.status = IssueStatus.ADDRESSED
-                issue.save()
+    search_text = "\n".join([github_issue.body or "", *github_issue.comments])
 
-        except Issue.DoesNotExist:
-            issue = Issue.objects.create(number=number, status=IssueStatus.ADDRESSED)
+    platform_id = _identify_platform_from_text(
+        search_text, context.platforms
+    ) or context.platforms.get("GitHub")
 
-        # Identify contributors - try multiple methods
-        contributor_ids = set()
+    reward = _identify_reward_from_issue_title(
+        github_issue.title, context.rewards, active=active
+    ) or _identify_reward_from_labels(github_issue.labels, context.reward_mapping)
 
-        # Method 1: Identify from issue user
-        user_contributor_id = _identify_contributor_from_user(
-            github_issue.issue.user.login, contributors, strict=False
-        )
-        if user_contributor_id:
-            contributor_ids.add(user_contributor_id)
+    return (
+        github_issue.number,
+        _identify_contributors(github_issue, search_text, context.contributors),
+        platform_id,
+        reward,
+        _extract_url_text(search_text, context.platform_names.get(platform_id)),
+        search_text,
+    )
 
-        # Method 2: Identify from issue text
-        text_contributor_id = _identify_contributor_from_text(search_text, contributors)
-        if text_contributor_id:
-            contributor_ids.add(text_contributor_id)
 
-        # Method 3: Create new contributor from text patterns if none found
+def _init_classification_worker(context):
+    """Set provided `context` as the worker process' lookups snapshot.
+
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    """
+    global _worker_context
+    _worker_context = context
+
+
+def _classify_issues_chunk(github_issues, active=True):
+    """Return classifications of `github_issues` using worker's lookups snapshot.
+
+    :param github_issues: GitHub issue records
+    :type github_issues: list of :class:`utils.issues_cache.IssueRecord`
+    :param active: should rewards from the titles be active or not
+    :type active: Boolean
+    :return: list
+    """
+    return [
+        _classify_issue(github_issue, _worker_context, active=active)
+        for github_issue in github_issues
+    ]
+
+
+def _classify_issues(github_issues, context, active=True, workers=1):
+    """Return classifications of `github_issues` in the same order.
+
+    Classification only reads the context, so with more than one worker the
+    issues are classified in chunks by forked processes, each having its own
+    copy of the context taken when the pool is started.
+
+    :param github_issues: GitHub issue records
+    :type github_issues: list of :class:`utils.issues_cache.IssueRecord`
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param active: should rewards from the titles be active or not
+    :type active: Boolean
+    :param workers: number of classification processes
+    :type workers: int
+    :var chunks: issues split into chunks sent to workers
+    :type chunks: list of list
+    :return: list
+    """
+    if workers <= 1 or len(github_issues) <= GITHUB_MAPPING_CHUNK_SIZE:
+        return [
+            _classify_issue(github_issue, context, active=active)
+            for github_issue in github_issues
+        ]
+
+    chunks = [
+        github_issues[index : index + GITHUB_MAPPING_CHUNK_SIZE]
+        for index in range(0, len(github_issues), GITHUB_MAPPING_CHUNK_SIZE)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("fork"),
+        initializer=_init_classification_worker,
+        initargs=(context,),
+    ) as executor:
+        return [
+            classification
+            for chunk in executor.map(
+                partial(_classify_issues_chunk, active=active), chunks
+            )
+            for classification in chunk
+        ]
+
+
+def _classify_closed_addressed_issues(
+    addressed_issues, context, workers=1, report=None
+):
+    """Return issue number, contributors, platform, reward and URL for issues.
+
+    Issues without body and comments, internal issues and the ones without
+    identified reward are skipped. Contributors missing from the context's
+    contributors are created from text patterns and added to the mapping, so
+    the following issues are matched to them too.
+
+    :param addressed_issues: GitHub issues with "addressed" label
+    :type addressed_issues: list of :class:`utils.issues_cache.IssueRecord`
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param workers: number of classification processes
+    :type workers: int
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
+    :var mapped_issues: classified issues
+    :type mapped_issues: list of tuple
+    :var created: have contributors been created in this pass or not
+    :type created: Boolean
+    :return: list of tuple (int, list, int, :class:`core.models.Reward`, str)
+    """
+    report = report or MappingReport()
+    mapped_issues, created = [], False
+    for github_issue, classification in zip(
+        addressed_issues, _classify_issues(addressed_issues, context, workers=workers)
+    ):
+        if not classification:
+            report.count("closed_addressed", "unclassified")
+            continue
+
+        number, contributor_ids, platform_id, reward, url, search_text = classification
+        if not reward:
+            report.count("closed_addressed", "no_reward")
+            continue  # Skip if no reward identified
+
+        # Match again as the previous issues' contributors may match too
+        if created:
+            contributor_ids = _identify_contributors(
+                github_issue, search_text, context.contributors
+            )
+
+        # Create new contributor from text patterns if none found
         if not contributor_ids:
-            created_contributor_id, updated_contributors = (
-                _create_contributor_from_text(search_text, contributors)
+            created_contributor_id, _ = _create_contributor_from_text(
+                search_text, context.contributors
             )
             if created_contributor_id:
-                contributor_ids.add(created_contributor_id)
-                # Update the contributors dict with the new contributor
-                contributors.update(updated_contributors)
+                contributor_ids.append(created_contributor_id)
+                created = True
 
-            else:
-                continue
+        mapped_issues.append((number, contributor_ids, platform_id, reward, url))
 
-        # Create contributions for each identified contributor
-        for contributor_id in contributor_ids:
-            # Check if contribution already exists for this issue and contributor
-            existing_contribution = Contribution.objects.filter(
-                issue=issue, contributor_id=contributor_id
-            ).first()
+    report.count("closed_addressed", "mapped", len(mapped_issues))
+    return mapped_issues
 
-            if not existing_contribution:
-                Contribution.objects.create(
-                    contributor_id=contributor_id,
-                    cycle=cycle,
-                    platform_id=platform_id,
-                    reward=reward,
-                    issue=issue,
-                    percentage=1,  # Default as specified
-                    url=url,
-                    confirmed=True,  # As specified
-                )
 
+@transaction.atomic
+def _map_closed_addressed_issues(github_issues, context=None, workers=1, report=None):
+    """Fetch GitHub issues with "addressed" label and create contributions.
+
+    This function processes GitHub issues labeled as "addressed" in two phases.
+    The classify phase identifies platform, reward, URL and contributors from
+    the issue text and user, creating new contributors from text patterns if
+    none found. The persist phase then creates or updates Issue objects with
+    ADDRESSED status and creates the missing contributions in bulk.
+
+    :param github_issues: collection of GitHub issue records
+    :type github_issues: list
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param workers: number of classification processes
+    :type workers: int
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
+    :var addressed_issues: GitHub issues with "addressed" label
+    :type addressed_issues: list
+    :return: True if operation completed successfully, False if no issues found
+    :rtype: bool
+    """
+    # Filter issues with "addressed" label
+    addressed_issues = [
+        issue
+        for issue in github_issues
+        if any(label.lower() == "addressed" for label in issue.labels)
+    ]
+
+    report = report or MappingReport()
+    report.count("closed_addressed", "examined", len(github_issues))
+    report.count(
+        "closed_addressed", "not_addressed", len(github_issues) - len(addressed_issues)
+    )
+    if not addressed_issues:
+        return False
+
+    context = context or MappingContext()
+    _persist_mapped_issues(
+        _classify_closed_addressed_issues(
+            addressed_issues, context, workers=workers, report=report
+        ),
+        IssueStatus.ADDRESSED,
+        # Define current cycle (using latest end date as specified)
+        context.latest_cycle("end"),
+        update_statuses=(IssueStatus.CREATED,),
+    )
     return True
 
 
 @transaction.atomic
-def _map_closed_archived_issues(github_issues):
+def _map_closed_archived_issues(github_issues, context=None, report=None):
     """Fetch GitHub issues and assign them to contributions based on URL matching.
 
     This function traverses all closed GitHub issues and attempts to match them with
     existing contributions by searching for contribution URLs in the issue bodies.
     When a match is found, creates an Issue record and assigns it to the contribution.
 
-    :param github_issues: collection of GitHub issue instances
+    :param github_issues: collection of GitHub issue records
     :type github_issues: list
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
     :var contributions: all the existing contribution instances
     :type contributions: QuerySet of :class:`core.models.Contribution`
     :var url_to_contribution: mapping from URL to contribution instance
     :type url_to_contribution: dict of str: :class:`core.models.Contribution`
     :var issue_assignments: collection of issue number, ID and status to process
     :type issue_assignments: set of tuple (int, int)
+    :var matched: numbers of GitHub issues assigned to contributions
+    :type matched: set of int
     :var unprocessed_github_issues: collection of unprocessed GitHub issues
     :type unprocessed_github_issues: list
     :return: list
@@ -691,15 +1384,21 @@ def _map_closed_archived_issues(github_issues):
     if not github_issues:
         return []
 
+    report = report or MappingReport()
+    report.count("closed_archived", "examined", len(github_issues))
+
     # Get all contributions in one query
     contributions = Contribution.objects.all().only("id", "url")
     if not contributions:
+        report.count("closed_archived", "unmatched", len(github_issues))
         return []
 
+    issue_url_pattern = (
+        context.issue_url_pattern if context else _github_issue_url_pattern()
+    )
+
     # Create a mapping from GitHub issue number to issue object for quick lookup
-    github_issues_by_number = {
-        issue.issue.number: issue.issue for issue in github_issues
-    }
+    github_issues_by_number = {issue.number: issue for issue in github_issues}
 
     # Collect all assignments in memory first
     issue_assignments = set()
@@ -712,7 +1411,7 @@ def _map_closed_archived_issues(github_issues):
             continue
 
         # Method 1: Check if contribution URL is a GitHub issue URL
-        issue_number = _is_url_github_issue(contribution.url)
+        issue_number = _is_url_github_issue(contribution.url, issue_url_pattern)
         if issue_number and issue_number in github_issues_by_number:
             # This contribution URL points directly to a GitHub issue
             issue_assignments.add((issue_number, contribution.id, IssueStatus.ARCHIVED))
@@ -720,12 +1419,10 @@ def _map_closed_archived_issues(github_issues):
 
         # Method 2: Search through issues for this contribution's URL in their bodies
         for github_issue in github_issues:
-            search_text = "\n".join(
-                [github_issue.issue.body or "", *github_issue.comments]
-            )
+            search_text = "\n".join([github_issue.body or "", *github_issue.comments])
             if contribution.url in search_text:
                 issue_assignments.add(
-                    (github_issue.issue.number, contribution.id, IssueStatus.ARCHIVED)
+                    (github_issue.number, contribution.id, IssueStatus.ARCHIVED)
                 )
                 break  # One issue per contribution (first match found)
 
@@ -735,133 +1432,102 @@ def _map_closed_archived_issues(github_issues):
     # Process all assignments in bulk
     _create_issues_bulk(list(issue_assignments))
 
+    matched = {_number for _number, _, _ in issue_assignments}
+    report.count("closed_archived", "mapped", len(matched))
+    report.count("closed_archived", "unmatched", len(github_issues) - len(matched))
+
     unprocessed_github_issues = [
         issue
         for issue in github_issues
-        if issue.issue.number not in {_number for _number, _, _ in issue_assignments}
-        and "[Internal]" not in issue.issue.title
-        and "wontfix" not in [label.name for label in issue.issue.labels]
-        and "addressed" not in [label.name for label in issue.issue.labels]
+        if issue.number not in matched
+        and "[Internal]" not in issue.title
+        and "wontfix" not in issue.labels
+        and "addressed" not in issue.labels
     ]
 
     return unprocessed_github_issues
 
 
-@transaction.atomic
-def _map_open_issues(github_issues):
-    """Fetch open GitHub issues and create contributions for detected contributors.
+def _classify_open_issues(github_issues, context, workers=1, report=None):
+    """Return issue number, contributor, platform, reward and URL for open issues.
 
-    This function retrieves all open GitHub issues and attempts to:
-    1. Identify contributors from issue bodies
-    2. Identify platforms from issue bodies
-    3. Determine rewards based on issue labels
-    4. Extract URLs from issue bodies
-    5. Create contributions with the detected information
+    Issues without body and comments, internal issues and the ones without
+    identified contributor or reward are skipped.
 
-    :param github_issues: collection of GitHub issue instances
-    :type github_issues: list
-    :var contributors: mapping from contributor info to contributor ID
-    :type contributors: dict of str: int
-    :var platforms: mapping from platform name to platform ID
-    :type platforms: dict of str: int
-    :var cycle: current active cycle
-    :type cycle: :class:`core.models.Cycle`
-    :var reward_mapping: mapping from label types to reward configurations
-    :type reward_mapping: dict of str: tuple
-    :return: True if operation completed successfully, False if no token provided
-    :rtype: bool
+    :param github_issues: open GitHub issues
+    :type github_issues: list of :class:`utils.issues_cache.IssueRecord`
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param workers: number of classification processes
+    :type workers: int
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
+    :var mapped_issues: classified issues
+    :type mapped_issues: list of tuple
+    :return: list of tuple (int, list, int, :class:`core.models.Reward`, str)
     """
-    if not github_issues:
-        return False
-
-    # Fetch existing rewards mapping
-    reward_mapping = _build_reward_mapping()
+    report = report or MappingReport()
+    mapped_issues = []
+    for classification in _classify_issues(github_issues, context, workers=workers):
+        if not classification:
+            report.count("open", "unclassified")
+            continue
 
-    # Fetch all contributors and create info mapping
-    contributors = {
-        contributor.info: contributor.id
-        for contributor in Contributor.objects.all()
-        if not any(
-            username in contributor.info
-            for username in GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS
-        )
-    }
+        number, contributor_ids, platform_id, reward, url, _ = classification
+        if not contributor_ids:
+            print("No contributor for GitHub issue", number)
+            report.count("open", "no_contributor")
+            continue  # Skip if no contributor identified
 
-    # Fetch all platforms by name
-    platforms = {
-        platform.name: platform.id for platform in SocialPlatform.objects.all()
-    }
+        if not reward:
+            print("No reward for GitHub issue", number)
+            report.count("open", "no_reward")
+            continue  # Skip if no reward identified
 
-    # Define current cycle
-    cycle = Cycle.objects.latest("start")
+        # Issue's author takes precedence over contributors found in text
+        mapped_issues.append((number, contributor_ids[:1], platform_id, reward, url))
 
-    # Process each open issue
-    for github_issue in github_issues:
-        if (
-            not (github_issue.issue.body or github_issue.comments)
-            or "[Internal]" in github_issue.issue.title
-        ):
-            continue
+    report.count("open", "mapped", len(mapped_issues))
+    return mapped_issues
 
-        number = github_issue.issue.number
 
-        search_text = "\n".join([github_issue.issue.body or "", *github_issue.comments])
+@transaction.atomic
+def _map_open_issues(github_issues, context=None, workers=1, report=None):
+    """Fetch open GitHub issues and create contributions for detected contributors.
 
-        # Identify contributor from issue user or text
-        contributor_id = _identify_contributor_from_user(
-            github_issue.issue.user.login, contributors, strict=False
-        )
-        if not contributor_id:
-            contributor_id = _identify_contributor_from_text(search_text, contributors)
-            if not contributor_id:
-                print("No contributor for GitHub issue", number)
-                continue  # Skip if no contributor identified
-
-        # Identify platform from issue body
-        platform_id = _identify_platform_from_text(search_text, platforms)
-        if not platform_id:
-            platform_id = next(
-                platform_id
-                for platform_name, platform_id in platforms.items()
-                if platform_name == "GitHub"
-            )
+    This function classifies all open GitHub issues by identifying contributor,
+    platform, reward and URL from the issue bodies, and then creates missing
+    Issue objects with CREATED status and their contributions in bulk.
 
-        reward = _identify_reward_from_issue_title(github_issue.issue.title)
-        if not reward:
-            reward = _identify_reward_from_labels(
-                github_issue.issue.labels, reward_mapping
-            )
-            if not reward:
-                print("No reward for GitHub issue", number)
-                continue  # Skip if no reward identified
-
-        # Extract URL from issue body
-        url = _extract_url_text(search_text, platform_id)
-
-        # Get or create issue
-        try:
-            issue = get_object_or_404(Issue, number=number, status=IssueStatus.CREATED)
-
-        except Http404:
-            issue = Issue.objects.create(number=number, status=IssueStatus.CREATED)
-
-        # Create contribution
-        Contribution.objects.create(
-            contributor_id=contributor_id,
-            cycle=cycle,
-            platform_id=platform_id,
-            reward=reward,
-            issue=issue,
-            percentage=1,
-            url=url,
-            confirmed=True,
-        )
+    :param github_issues: collection of GitHub issue records
+    :type github_issues: list
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param workers: number of classification processes
+    :type workers: int
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
+    :return: True if operation completed successfully, False if no token provided
+    :rtype: bool
+    """
+    if not github_issues:
+        return False
 
+    report = report or MappingReport()
+    report.count("open", "examined", len(github_issues))
+    context = context or MappingContext()
+    _persist_mapped_issues(
+        _classify_open_issues(github_issues, context, workers=workers, report=report),
+        IssueStatus.CREATED,
+        context.latest_cycle("start"),
+    )
     return True
 
 
 @transaction.atomic
-def _map_unprocessed_closed_archived_issues(github_issues):
+def _map_unprocessed_closed_archived_issues(
+    github_issues, context=None, workers=1, report=None
+):
     """Create contributions based on closing date from GitHub issues.
 
     This function processes GitHub issues labeled as "archived" and:
@@ -874,8 +1540,18 @@ def _map_unprocessed_closed_archived_issues(github_issues):
     7. Extracts URLs from issue bodies
     8. Creates contributions for each identified contributor
 
-    :param github_issues: collection of GitHub issue instances
+    :param github_issues: collection of GitHub issue records
     :type github_issues: list
+    :param context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :param workers: number of classification processes
+    :type workers: int
+    :param report: mapping run's report
+    :type report: :class:`MappingReport`
+    :var existing: numbers of archived issues having database records
+    :type existing: set
+    :var created: have contributors been created in this pass or not
+    :type created: Boolean
     :return: True if operation completed successfully, False if no issues found
     :rtype: bool
     """
@@ -883,116 +1559,86 @@ def _map_unprocessed_closed_archived_issues(github_issues):
     archived_issues = [
         issue
         for issue in github_issues
-        if any(label.name.lower() == "archived" for label in issue.issue.labels)
+        if any(label.lower() == "archived" for label in issue.labels)
     ]
 
+    report = report or MappingReport()
+    report.count("unprocessed_archived", "examined", len(github_issues))
+    report.count(
+        "unprocessed_archived",
+        "not_archived",
+        len(github_issues) - len(archived_issues),
+    )
     if not archived_issues:
         return False
 
-    # Fetch existing rewards mapping
-    reward_mapping = _build_reward_mapping()
-
-    # Fetch all contributors and create info mapping
-    contributors = {
-        contributor.info: contributor.id
-        for contributor in Contributor.objects.all()
-        if not any(
-            username in contributor.info
-            for username in GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS
-        )
-    }
-
-    # Fetch all platforms by name
-    platforms = {
-        platform.name: platform.id for platform in SocialPlatform.objects.all()
-    }
+    context = context or MappingContext()
+    existing = set(
+        Issue.objects.filter(
+            number__in=[issue.number for issue in archived_issues]
+        ).values_list("number", flat=True)
+    )
 
-    # Process each archived issue
-    for github_issue in archived_issues:
-        if (
-            not (github_issue.issue.body or github_issue.comments)
-            or "[Internal]" in github_issue.issue.title
-        ):
+    # Skip issues already having an associated Issue record
+    archived_issues = [
+        issue for issue in archived_issues if issue.number not in existing
+    ]
+    report.count("unprocessed_archived", "existing", len(existing))
+    created = False
+    for github_issue, classification in zip(
+        archived_issues,
+        _classify_issues(archived_issues, context, active=False, workers=workers),
+    ):
+        if not classification:
+            report.count("unprocessed_archived", "unclassified")
             continue
 
-        number = github_issue.issue.number
-
-        # Skip if issue already has an associated Issue record
-        if Issue.objects.filter(number=number).exists():
-            continue
+        number, contributor_ids, platform_id, reward, url, search_text = classification
 
         # Determine cycle based on closing date
-        if not github_issue.issue.closed_at:
+        if not github_issue.closed_at:
             print(f"No closing date for archived GitHub issue {number}, skipping")
+            report.count("unprocessed_archived", "no_closing_date")
             continue
 
-        cycle = Cycle.objects.filter(
-            start__lte=github_issue.issue.closed_at,
-            end__gte=github_issue.issue.closed_at,
-        ).first()
-
+        cycle = context.cycle_for(github_issue.closed_at)
         if not cycle:
             print(
-                f"No cycle found for closing date {github_issue.issue.closed_at}"
+                f"No cycle found for closing date {github_issue.closed_at}"
                 " in issue {number}, skipping"
             )
+            report.count("unprocessed_archived", "no_cycle")
             continue
 
-        # Combine body and comments for text analysis
-        search_text = "\n".join([github_issue.issue.body or "", *github_issue.comments])
-
-        # Identify platform from issue body
-        platform_id = _identify_platform_from_text(search_text, platforms)
-        if not platform_id:
-            platform_id = next(
-                platform_id
-                for platform_name, platform_id in platforms.items()
-                if platform_name == "GitHub"
-            )
-
-        reward = _identify_reward_from_issue_title(
-            github_issue.issue.title, active=False
-        )
         if not reward:
-            reward = _identify_reward_from_labels(
-                github_issue.issue.labels, reward_mapping
-            )
-            if not reward:
-                print(f"No reward for archived GitHub issue {number}")
-                continue  # Skip if no reward identified
-
-        # Extract URL from issue body
-        url = _extract_url_text(search_text, platform_id)
+            print(f"No reward for archived GitHub issue {number}")
+            report.count("unprocessed_archived", "no_reward")
+            continue  # Skip if no reward identified
 
         # Create issue with ARCHIVED status
         issue = Issue.objects.create(number=number, status=IssueStatus.ARCHIVED)
 
-        # Identify contributors - try multiple methods
-        contributor_ids = set()
-
-        # Method 1: Identify from issue user
-        user_contributor_id = _identify_contributor_from_user(
-            github_issue.issue.user.login, contributors, strict=False
-        )
-        if user_contributor_id:
-            contributor_ids.add(user_contributor_id)
-
-        # Method 2: Identify from issue text
-        text_contributor_id = _identify_contributor_from_text(search_text, contributors)
-        if text_contributor_id:
-            contributor_ids.add(text_contributor_id)
+        # Match again as the previous issues' contributors may match too
+        if created:
+            contributor_ids = _identify_contributors(
+                github_issue, search_text, context.contributors
+            )
 
-        # Method 3: Create new contributor from text patterns if none found
+        # Create new contributor from text patterns if none found
         if not contributor_ids:
-            created_contributor_id, contributors = _create_contributor_from_text(
-                search_text, contributors
+            created_contributor_id, _ = _create_contributor_from_text(
+                search_text, context.contributors
             )
             if created_contributor_id:
-                contributor_ids.add(created_contributor_id)
+                contributor_ids.append(created_contributor_id)
+                created = True
             else:
                 print(f"No contributors found for archived GitHub issue {number}")
+                report.count("unprocessed_archived", "no_contributor")
                 continue
 
+        report.count("unprocessed_archived", "mapped")
+
         # Create contributions for each identified contributor
         for contributor_id in contributor_ids:
             Contribution.objects.create(
@@ -1009,48 +1655,87 @@ def _map_unprocessed_closed_archived_issues(github_issues):
     return True
 
 
-def map_github_issues(github_token=""):
+def map_github_issues(
+    github_token="", full=False, workers=GITHUB_MAPPING_WORKERS, report_path=None
+):
     """Fetch existing GitHub issues and create database records from them.
 
+    Unless `full` is set, only the issues changed or left unmapped since the
+    last run are mapped, or all of them if contributions have changed. Every pass classifies its issues in `workers`
+    processes and then writes the database records from the main process.
+    Run's report is returned and written as JSON to `report_path` if provided.
+
     :param github_token: GitHub API token
     :type github_token: str
-    :var github_issues: collection of GitHub issue instances
-    :type github_issues: list
-    :var closed_size: number of issues created from closed GitHub issues
-    :type closed_size: int
-    :var size: number of issues created from GitHub issues
+    :param full: should all the cached issues be mapped or not
+    :type full: Boolean
+    :param workers: number of classification processes
+    :type workers: int
+    :param report_path: path to the JSON report file
+    :type report_path: :class:`pathlib.Path` or str
+    :var report: mapping run's report
+    :type report: :class:`MappingReport`
+    :var github_issues: collection of GitHub issue records
+    :type github_issues: dict
+    :var context: lookups shared by the mapping passes
+    :type context: :class:`MappingContext`
+    :var size: number of issues before the current pass
     :type size: int
-    :return: Boolean
+    :return: dict
     """
-    github_issues = _fetch_and_categorize_issues(github_token)
+    report = MappingReport()
+    with report.stage("fetch"):
+        github_issues = _issues_to_map(
+            _fetch_and_categorize_issues(github_token, report=report), full=full
+        )
+
+    with report.stage("context"):
+        context = MappingContext()
 
     print("Fetched closed issues size: ", len(github_issues.get("closed", [])))
-    unprocessed_github_issues = _map_closed_archived_issues(
-        github_issues.get("closed", [])
+    size = Issue.objects.count()
+    with report.stage("closed_archived"):
+        unprocessed_github_issues = _map_closed_archived_issues(
+            github_issues.get("closed", []), context, report=report
+        )
+
+    print(
+        "Issues created from closed archived GitHub issues: ",
+        Issue.objects.count() - size,
     )
-    closed_size = len(Issue.objects.all())
-    print("Issues created from closed archived GitHub issues: ", closed_size)
+    size = Issue.objects.count()
+    with report.stage("unprocessed_archived"):
+        _map_unprocessed_closed_archived_issues(
+            unprocessed_github_issues, context, workers=workers, report=report
+        )
 
-    _map_unprocessed_closed_archived_issues(unprocessed_github_issues)
     print(
         "Issues created from unprocessed archived GitHub issues: ",
-        len(Issue.objects.all()) - closed_size,
+        Issue.objects.count() - size,
     )
-    closed_size = len(Issue.objects.all())
+    size = Issue.objects.count()
+    with report.stage("closed_addressed"):
+        _map_closed_addressed_issues(
+            github_issues.get("closed", []), context, workers=workers, report=report
+        )
 
-    _map_closed_addressed_issues(github_issues.get("closed", []))
     print(
         "Issues created from closed addressed GitHub issues: ",
-        len(Issue.objects.all()) - closed_size,
+        Issue.objects.count() - size,
     )
 
-    closed_size = len(Issue.objects.all())
-    print("Issues created from closed GitHub issues: ", closed_size)
-
     print("Fetched open issues size: ", len(github_issues.get("open", [])))
-    _map_open_issues(github_issues.get("open", []))
-    size = len(Issue.objects.all())
-    print("Issues created from open GitHub issues: ", size - closed_size)
+    size = Issue.objects.count()
+    with report.stage("open"):
+        _map_open_issues(
+            github_issues.get("open", []), context, workers=workers, report=report
+        )
+
+    print("Issues created from open GitHub issues: ", Issue.objects.count() - size)
+    with report.stage("mapping_state"):
+        _save_mapping_state(github_issues)
+
+    if report_path:
+        report.write(report_path)
 
-    print("Total number of issues created: ", size)
-    return False
+    return report.as_dict()
@@ -4,13 +4,210 @@ import os
 from unittest import mock
 
 import pytest
+import requests
+from django.core.cache import cache
 
 from utils.bot import (
+    DiscordClient,
     _parse_discord_url,
     add_reaction_to_message,
+    add_reactions_to_messages,
     add_reply_to_message,
+    cache_message,
     message_from_url,
 )
+from utils.constants.core import (
+    DISCORD_API_TIMEOUT,
+    DISCORD_API_URL,
+    DISCORD_BULK_WORKERS,
+    DISCORD_MAX_RETRIES,
+    DISCORD_MESSAGE_CACHE_TIMEOUT,
+)
+
+
+@pytest.fixture(autouse=True)
+def discord_client_reset():
+    """Start and end every test with fresh Discord client's shared state."""
+    DiscordClient.reset()
+    yield
+    DiscordClient.reset()
+
+
+@pytest.fixture
+def locmem_cache(settings):
+    """Use local memory cache instead of development's dummy cache."""
+    settings.CACHES = {
+        "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+    }
+    cache.clear()
+    yield cache
+    cache.clear()
+
+
+def _response(status_code=200, headers=None, json_data=None):
+    response = mock.MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = json_data or {}
+    return response
+
+
+class TestUtilsBotDiscordClient:
+    """Testing class for :class:`utils.bot.DiscordClient`."""
+
+    def test_utils_bot_discordclient_session_is_shared(self):
+        session = DiscordClient()._session()
+        assert DiscordClient()._session() is session
+        assert session.headers["Authorization"] == (
+            "Bot " + os.environ["DISCORD_BOT_TOKEN"]
+        )
+        assert session.get_adapter(DISCORD_API_URL)._pool_maxsize == (
+            DISCORD_BULK_WORKERS
+        )
+
+    def test_utils_bot_discordclient_reset_closes_session(self):
+        session = mock.MagicMock()
+        DiscordClient.session = session
+        DiscordClient.buckets = {"bucket": {}}
+        DiscordClient.global_reset_at = 5.0
+        DiscordClient.reset()
+        session.close.assert_called_once_with()
+        assert DiscordClient.session is None
+        assert DiscordClient.buckets == {}
+        assert DiscordClient.global_reset_at == 0.0
+
+    @pytest.mark.parametrize(
+        "method,path,expected",
+        [
+            (
+                "PUT",
+                "/channels/5/messages/6/reactions/noted:7/@me",
+                "PUT /channels/5/messages/{message_id}/reactions/{emoji}/@me",
+            ),
+            ("POST", "/channels/5/messages", "POST /channels/5/messages"),
+            (
+                "GET",
+                "/channels/5/messages/6",
+                "GET /channels/5/messages/{message_id}",
+            ),
+        ],
+    )
+    def test_utils_bot_discordclient_route_key(self, method, path, expected):
+        assert DiscordClient().route_key(method, path) == expected
+
+    def test_utils_bot_discordclient_acquire_for_unknown_route(self, mocker):
+        mocked_sleep = mocker.patch("utils.bot.time.sleep")
+        DiscordClient()._acquire("GET /route")
+        mocked_sleep.assert_not_called()
+
+    def test_utils_bot_discordclient_acquire_takes_remaining_request(self, mocker):
+        mocked_sleep = mocker.patch("utils.bot.time.sleep")
+        mocker.patch("utils.bot.time.monotonic", return_value=100.0)
+        DiscordClient.route_buckets = {"GET /route": "bucket"}
+        DiscordClient.buckets = {
+            "bucket": {"limit": 5, "remaining": 2, "reset_at": 110.0}
+        }
+        DiscordClient()._acquire("GET /route")
+        assert DiscordClient.buckets["bucket"]["remaining"] == 1
+        mocked_sleep.assert_not_called()
+
+    def test_utils_bot_discordclient_acquire_waits_for_bucket_reset(self, mocker):
+        mocked_sleep = mocker.patch("utils.bot.time.sleep")
+        mocker.patch("utils.bot.time.monotonic", side_effect=[100.0, 102.5])
+        DiscordClient.route_buckets = {"GET /route": "bucket"}
+        DiscordClient.buckets = {
+            "bucket": {"limit": 5, "remaining": 0, "reset_at": 102.5}
+        }
+        DiscordClient()._acquire("GET /route")
+        mocked_sleep.assert_called_once_with(2.5)
+        assert DiscordClient.buckets["bucket"] == {
+            "limit": 5,
+            "remaining": 4,
+            "reset_at": 102.5 + DISCORD_API_TIMEOUT,
+        }
+
+    def test_utils_bot_discordclient_acquire_waits_for_global_reset(self, mocker):
+        mocked_sleep = mocker.patch("utils.bot.time.sleep")
+        mocker.patch("utils.bot.time.monotonic", side_effect=[100.0, 101.0])
+        DiscordClient.global_reset_at = 101.0
+        DiscordClient()._acquire("GET /route")
+        mocked_sleep.assert_called_once_with(1.0)
+
+    def test_utils_bot_discordclient_update_limits_from_headers(self, mocker):
+        mocker.patch("utils.bot.time.monotonic", return_value=100.0)
+        response = _response(
+            headers={
+                "X-RateLimit-Bucket": "bucket",
+                "X-RateLimit-Limit": "5",
+                "X-RateLimit-Remaining": "3",
+                "X-RateLimit-Reset-After": "1.5",
+            }
+        )
+        DiscordClient()._update_limits("GET /route", response)
+        assert DiscordClient.route_buckets == {"GET /route": "bucket"}
+        assert DiscordClient.buckets == {
+            "bucket": {"limit": 5, "remaining": 3, "reset_at": 101.5}
+        }
+
+    def test_utils_bot_discordclient_update_limits_without_headers(self):
+        DiscordClient()._update_limits("GET /route", _response())
+        assert DiscordClient.route_buckets == {}
+
+    def test_utils_bot_discordclient_handle_rate_limited_for_route(self, mocker):
+        mocker.patch("utils.bot.time.monotonic", return_value=100.0)
+        DiscordClient.route_buckets = {"GET /route": "bucket"}
+        DiscordClient.buckets = {
+            "bucket": {"limit": 5, "remaining": 3, "reset_at": 101.0}
+        }
+        response = _response(429, json_data={"retry_after": 2.5, "global": False})
+        assert DiscordClient()._handle_rate_limited("GET /route", response) == 2.5
+        assert DiscordClient.buckets["bucket"]["remaining"] == 0
+        assert DiscordClient.buckets["bucket"]["reset_at"] == 102.5
+        assert DiscordClient.global_reset_at == 0.0
+
+    def test_utils_bot_discordclient_handle_rate_limited_for_global(self, mocker):
+        mocker.patch("utils.bot.time.monotonic", return_value=100.0)
+        response = _response(429, json_data={"retry_after": 4, "global": True})
+        assert DiscordClient()._handle_rate_limited("GET /route", response) == 4.0
+        assert DiscordClient.global_reset_at == 104.0
+
+    def test_utils_bot_discordclient_handle_rate_limited_for_no_json(self, mocker):
+        response = _response(429, headers={"Retry-After": "3"})
+        response.json.side_effect = ValueError
+        assert DiscordClient()._handle_rate_limited("GET /route", response) == 3.0
+
+    def test_utils_bot_discordclient_request_functionality(self, mocker):
+        session = mock.MagicMock()
+        session.request.return_value = _response(204)
+        DiscordClient.session = session
+        response = DiscordClient().request("POST", "/channels/5/messages", json={})
+        assert response.status_code == 204
+        session.request.assert_called_once_with(
+            "POST",
+            f"{DISCORD_API_URL}/channels/5/messages",
+            timeout=DISCORD_API_TIMEOUT,
+            json={},
+        )
+
+    def test_utils_bot_discordclient_request_retries_rate_limited(self, mocker):
+        mocked_sleep = mocker.patch("utils.bot.time.sleep")
+        session = mock.MagicMock()
+        session.request.side_effect = [
+            _response(429, json_data={"retry_after": 0.5}),
+            _response(200),
+        ]
+        DiscordClient.session = session
+        assert DiscordClient().request("GET", "/route").status_code == 200
+        assert session.request.call_count == 2
+        mocked_sleep.assert_called_once_with(0.5)
+
+    def test_utils_bot_discordclient_request_gives_up_after_retries(self, mocker):
+        mocker.patch("utils.bot.time.sleep")
+        session = mock.MagicMock()
+        session.request.return_value = _response(429, json_data={"retry_after": 1})
+        DiscordClient.session = session
+        assert DiscordClient().request("GET", "/route").status_code == 429
+        assert session.request.call_count == DISCORD_MAX_RETRIES + 1
 
 
 class TestUtilsBotFunctions:
@@ -57,7 +254,7 @@ class TestUtilsBotFunctions:
             "python:123456789012345678",
         )
         url = f"https://discord.com/channels/{channel_id}/{message_id}"
-        with mock.patch("utils.bot.requests.put") as mocked_put, mock.patch(
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_put, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             returned = add_reaction_to_message(url, emoji)
@@ -74,19 +271,15 @@ class TestUtilsBotFunctions:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"]}
-        api_url = (
-            f"https://discord.com/api/v10/channels/{channel_id}/"
-            f"messages/{message_id}/reactions/{emoji}/@me"
-        )
-        with mock.patch("utils.bot.requests.put") as mocked_put, mock.patch(
+        api_path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_put, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             mocked_put.return_value.status_code = 505
             mocked_put.return_value.text = "error text"
             returned = add_reaction_to_message(url, emoji)
             assert returned is False
-            mocked_put.assert_called_once_with(api_url, headers=headers)
+            mocked_put.assert_called_once_with("PUT", api_path)
             mocked_logger.error.assert_called_once_with(
                 "Failed to add reaction: 505 - error text"
             )
@@ -100,28 +293,50 @@ class TestUtilsBotFunctions:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"]}
-        api_url = (
-            f"https://discord.com/api/v10/channels/{channel_id}/"
-            f"messages/{message_id}/reactions/{emoji}/@me"
-        )
-        with mock.patch("utils.bot.requests.put") as mocked_put, mock.patch(
+        api_path = f"/channels/{channel_id}/messages/{message_id}/reactions/{emoji}/@me"
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_put, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             mocked_put.return_value.status_code = 204
             returned = add_reaction_to_message(url, emoji)
             assert returned is True
-            mocked_put.assert_called_once_with(api_url, headers=headers)
+            mocked_put.assert_called_once_with("PUT", api_path)
             mocked_logger.info.assert_called_once_with(
                 f"Emoji {emoji} added successfully!"
             )
 
+    # # add_reactions_to_messages
+    def test_utils_bot_add_reactions_to_messages_for_no_urls(self):
+        with mock.patch("utils.bot.add_reaction_to_message") as mocked_add:
+            assert add_reactions_to_messages([], "emoji:1") == {}
+            mocked_add.assert_not_called()
+
+    def test_utils_bot_add_reactions_to_messages_functionality(self):
+        urls = ["url1", "url2", "url1", "url3"]
+        with mock.patch(
+            "utils.bot.add_reaction_to_message",
+            side_effect=lambda url, emoji: url != "url2",
+        ) as mocked_add:
+            returned = add_reactions_to_messages(urls, "emoji:1")
+            assert returned == {"url1": True, "url2": False, "url3": True}
+            assert mocked_add.call_count == 3
+            mocked_add.assert_any_call("url3", "emoji:1")
+
+    def test_utils_bot_add_reactions_to_messages_for_request_error(self):
+        with mock.patch(
+            "utils.bot.add_reaction_to_message",
+            side_effect=[True, requests.ConnectionError("error")],
+        ), mock.patch("utils.bot.logger") as mocked_logger:
+            returned = add_reactions_to_messages(["url1", "url2"], "emoji:1")
+            assert sorted(returned.values()) == [False, True]
+            mocked_logger.error.assert_called_once()
+
     # # add_reply_to_message
     def test_utils_bot_add_reply_to_message_for_wrong_url(self):
         """Test add_reply_to_message returns False for invalid Discord URL."""
         message_id, comment = ("1353382023309562020", "This is a test reply")
         url = f"https://discord.com/channels/906917846754418770/{message_id}"
-        with mock.patch("utils.bot.requests.post") as mocked_post, mock.patch(
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_post, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             returned = add_reply_to_message(url, comment)
@@ -138,23 +353,19 @@ class TestUtilsBotFunctions:
             "This is a test reply",
         )
         url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
-        headers = {
-            "Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"],
-            "Content-Type": "application/json",
-        }
-        api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
+        api_path = f"/channels/{channel_id}/messages"
         payload = {
             "content": comment,
             "message_reference": {"channel_id": channel_id, "message_id": message_id},
         }
-        with mock.patch("utils.bot.requests.post") as mocked_post, mock.patch(
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_post, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             mocked_post.return_value.status_code = 403
             mocked_post.return_value.text = "Forbidden"
             returned = add_reply_to_message(url, comment)
             assert returned is False
-            mocked_post.assert_called_once_with(api_url, headers=headers, json=payload)
+            mocked_post.assert_called_once_with("POST", api_path, json=payload)
             mocked_logger.error.assert_called_once_with(
                 "Failed to add reply: 403 - Forbidden"
             )
@@ -168,22 +379,18 @@ class TestUtilsBotFunctions:
             "This is a test reply",
         )
         url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
-        headers = {
-            "Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"],
-            "Content-Type": "application/json",
-        }
-        api_url = f"https://discord.com/api/v10/channels/{channel_id}/messages"
+        api_path = f"/channels/{channel_id}/messages"
         payload = {
             "content": comment,
             "message_reference": {"channel_id": channel_id, "message_id": message_id},
         }
-        with mock.patch("utils.bot.requests.post") as mocked_post, mock.patch(
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_post, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             mocked_post.return_value.status_code = 200
             returned = add_reply_to_message(url, comment)
             assert returned is True
-            mocked_post.assert_called_once_with(api_url, headers=headers, json=payload)
+            mocked_post.assert_called_once_with("POST", api_path, json=payload)
             mocked_logger.info.assert_called_once_with(
                 f"Reply added successfully to message {message_id}!"
             )
@@ -199,7 +406,7 @@ class TestUtilsBotFunctions:
         url = f"https://discord.com/channels/{guild_id}/{channel_id}/{message_id}"
 
         # Test with 201 status code (should return False as we expect 200)
-        with mock.patch("utils.bot.requests.post") as mocked_post, mock.patch(
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_post, mock.patch(
             "utils.bot.logger"
         ) as mocked_logger:
             mocked_post.return_value.status_code = 201
@@ -208,11 +415,62 @@ class TestUtilsBotFunctions:
             assert returned is False
             mocked_logger.error.assert_called_once()
 
+    # # cache_message
+    def test_utils_bot_cache_message_for_wrong_url(self):
+        with mock.patch("utils.bot.cache") as mocked_cache:
+            assert cache_message("https://example.com", "c", "a", "t") is False
+            mocked_cache.set.assert_not_called()
+
+    def test_utils_bot_cache_message_functionality(self):
+        url = "https://discord.com/channels/906917846754418770/1028021510453084161/1"
+        with mock.patch("utils.bot.cache") as mocked_cache:
+            assert cache_message(url, None, None, None) is True
+            mocked_cache.set.assert_called_once_with(
+                "discord-message:1028021510453084161:1",
+                {
+                    "success": True,
+                    "content": "",
+                    "author": "Unknown",
+                    "timestamp": "",
+                    "channel_id": "1028021510453084161",
+                    "message_id": "1",
+                    "raw_data": {},
+                },
+                DISCORD_MESSAGE_CACHE_TIMEOUT,
+            )
+
+    def test_utils_bot_message_from_url_returns_warmed_message(self, locmem_cache):
+        url = "https://discord.com/channels/906917846754418770/1028021510453084161/1"
+        cache_message(url, "content", "author", "timestamp")
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_request:
+            returned = message_from_url(url)
+            mocked_request.assert_not_called()
+
+        assert returned["content"] == "content"
+        assert returned["author"] == "author"
+        assert returned["timestamp"] == "timestamp"
+
+    def test_utils_bot_message_from_url_caches_retrieved_message(self, locmem_cache):
+        url = "https://discord.com/channels/906917846754418770/1028021510453084161/1"
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_request:
+            mocked_request.return_value = _response(json_data={"content": "content"})
+            first = message_from_url(url)
+            assert message_from_url(url) == first
+            mocked_request.assert_called_once()
+
+    def test_utils_bot_message_from_url_doesnt_cache_error(self, locmem_cache):
+        url = "https://discord.com/channels/906917846754418770/1028021510453084161/1"
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_request:
+            mocked_request.return_value = _response(404)
+            message_from_url(url)
+            message_from_url(url)
+            assert mocked_request.call_count == 2
+
     # # message_from_url
     def test_utils_bot_message_from_url_for_wrong_url(self):
         channel_id, message_id = "1028021510453084161", "1353382023309562020"
         url = f"https://discord.com/channels/{channel_id}/{message_id}"
-        with mock.patch("utils.bot.requests.get") as mocked_get:
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_get:
             returned = message_from_url(url)
             assert returned == {"success": False, "error": "Invalid URL"}
             mocked_get.assert_not_called()
@@ -222,11 +480,8 @@ class TestUtilsBotFunctions:
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"]}
-        api_url = (
-            f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
-        )
-        with mock.patch("utils.bot.requests.get") as mocked_get:
+        api_path = f"/channels/{channel_id}/messages/{message_id}"
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_get:
             mocked_get.return_value.status_code = 505
             mocked_get.return_value.text = "error text"
             returned = message_from_url(url)
@@ -235,22 +490,19 @@ class TestUtilsBotFunctions:
                 "error": "API Error: 505",
                 "response_text": "error text",
             }
-            mocked_get.assert_called_once_with(api_url, headers=headers)
+            mocked_get.assert_called_once_with("GET", api_path)
 
     def test_utils_bot_message_from_url_for_deafult_message_data(self):
         channel_id, message_id = "1028021510453084161", "1353382023309562020"
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"]}
-        api_url = (
-            f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
-        )
+        api_path = f"/channels/{channel_id}/messages/{message_id}"
         message_data = {
             "channel_id": channel_id,
             "message_id": message_id,
         }
-        with mock.patch("utils.bot.requests.get") as mocked_get:
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_get:
             mocked_get.return_value.status_code = 200
             mocked_get.return_value.json.return_value = message_data
             returned = message_from_url(url)
@@ -263,17 +515,14 @@ class TestUtilsBotFunctions:
                 "message_id": message_id,
                 "raw_data": message_data,
             }
-            mocked_get.assert_called_once_with(api_url, headers=headers)
+            mocked_get.assert_called_once_with("GET", api_path)
 
     def test_utils_bot_message_from_url_functionality(self):
         channel_id, message_id = "1028021510453084161", "1353382023309562020"
         url = (
             f"https://discord.com/channels/906917846754418770/{channel_id}/{message_id}"
         )
-        headers = {"Authorization": "Bot " + os.environ["DISCORD_BOT_TOKEN"]}
-        api_url = (
-            f"https://discord.com/api/v10/channels/{channel_id}/messages/{message_id}"
-        )
+        api_path = f"/channels/{channel_id}/messages/{message_id}"
         message_data = {
             "content": "message content",
             "author": {"username": "Author"},
@@ -281,7 +530,7 @@ class TestUtilsBotFunctions:
             "channel_id": channel_id,
             "message_id": message_id,
         }
-        with mock.patch("utils.bot.requests.get") as mocked_get:
+        with mock.patch("utils.bot.DiscordClient.request") as mocked_get:
             mocked_get.return_value.status_code = 200
             mocked_get.return_value.json.return_value = message_data
             returned = message_from_url(url)
@@ -294,4 +543,4 @@ class TestUtilsBotFunctions:
                 "message_id": message_id,
                 "raw_data": message_data,
             }
-            mocked_get.assert_called_once_with(api_url, headers=headers)
+            mocked_get.assert_called_once_with("GET", api_path)
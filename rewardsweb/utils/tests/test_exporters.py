@@ -0,0 +1,162 @@
+"""Testing module for :py:mod:`utils.exporters` module."""
+
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+import utils.exporters
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Issue,
+    IssueStatus,
+    Reward,
+    RewardType,
+    SocialPlatform,
+)
+from utils.exporters import (
+    CONTRIBUTION_EXPORT_FIELDS,
+    _EchoBuffer,
+    _handles_for_contributors,
+    contribution_export_rows,
+    csv_lines,
+    export_lines,
+    ndjson_lines,
+)
+
+
+@pytest.fixture
+def ledger():
+    """Create two contributors with handles and three contributions."""
+    discord = SocialPlatform.objects.create(name="Discord", prefix="")
+    twitter = SocialPlatform.objects.create(name="Twitter", prefix="@")
+    contributor1 = Contributor.objects.create(name="user1")
+    contributor2 = Contributor.objects.create(name="user2")
+    Handle.objects.create(contributor=contributor1, platform=discord, handle="user1")
+    Handle.objects.create(contributor=contributor1, platform=twitter, handle="tw1")
+    Handle.objects.create(contributor=contributor2, platform=discord, handle="user2")
+    cycle = Cycle.objects.create(start="2025-01-01", end="2025-03-31")
+    reward_type = RewardType.objects.create(label="F", name="Feature Request")
+    reward = Reward.objects.create(type=reward_type, level=2, amount=60000)
+    issue = Issue.objects.create(number=505, status=IssueStatus.ADDRESSED)
+    contributions = [
+        Contribution.objects.create(
+            contributor=contributor,
+            cycle=cycle,
+            platform=discord,
+            reward=reward,
+            issue=issue if index == 0 else None,
+            percentage=Decimal("0.5"),
+            url=f"https://example.com/{index}",
+            confirmed=bool(index),
+        )
+        for index, contributor in enumerate([contributor1, contributor2, contributor1])
+    ]
+    return contributions
+
+
+class TestUtilsExportersConstants:
+    """Testing class for :py:mod:`utils.exporters` constants."""
+
+    def test_utils_exporters_export_formats(self):
+        assert utils.exporters.EXPORT_FORMATS == ("ndjson", "csv")
+
+    def test_utils_exporters_export_values_cover_export_fields(self):
+        assert set(CONTRIBUTION_EXPORT_FIELDS) - {"handles"} == set(
+            utils.exporters.CONTRIBUTION_EXPORT_VALUES
+        ) - {"contributor_id"}
+
+
+class TestUtilsExportersHelpers:
+    """Testing class for :py:mod:`utils.exporters` helper functions."""
+
+    def test_utils_exporters_echobuffer_write_returns_value(self):
+        assert _EchoBuffer().write("a,b\r\n") == "a,b\r\n"
+
+    @pytest.mark.django_db
+    def test_utils_exporters_handles_for_contributors(self, ledger):
+        contributor1, contributor2 = ledger[0].contributor, ledger[1].contributor
+        returned = _handles_for_contributors({contributor1.id, contributor2.id})
+        assert returned == {contributor1.id: "user1 @tw1", contributor2.id: "user2"}
+
+    @pytest.mark.django_db
+    def test_utils_exporters_handles_for_contributors_without_handles(self):
+        contributor = Contributor.objects.create(name="nohandles")
+        assert _handles_for_contributors({contributor.id}) == {}
+
+    def test_utils_exporters_csv_lines(self):
+        rows = [
+            {field: index for field in CONTRIBUTION_EXPORT_FIELDS} for index in range(2)
+        ]
+        returned = list(csv_lines(iter(rows)))
+        assert len(returned) == 3
+        assert returned[0] == ",".join(CONTRIBUTION_EXPORT_FIELDS) + "\r\n"
+        assert returned[1] == ",".join("0" for _ in CONTRIBUTION_EXPORT_FIELDS) + "\r\n"
+        assert returned[2] == ",".join("1" for _ in CONTRIBUTION_EXPORT_FIELDS) + "\r\n"
+
+    def test_utils_exporters_ndjson_lines_serializes_decimals_and_dates(self):
+        rows = [{"percentage": Decimal("0.50"), "cycle_start": date(2025, 1, 1)}]
+        returned = list(ndjson_lines(iter(rows)))
+        assert returned == ['{"percentage": "0.50", "cycle_start": "2025-01-01"}\n']
+
+
+class TestUtilsExportersFunctions:
+    """Testing class for :py:mod:`utils.exporters` main functions."""
+
+    @pytest.mark.django_db
+    def test_utils_exporters_contribution_export_rows_projection(self, ledger):
+        rows = list(contribution_export_rows())
+        assert [row["id"] for row in rows] == [c.id for c in ledger]
+        first = rows[0]
+        assert list(first) == CONTRIBUTION_EXPORT_FIELDS
+        assert first["contributor"] == "user1"
+        assert first["handles"] == "user1 @tw1"
+        assert first["cycle_id"] == ledger[0].cycle_id
+        assert first["cycle_start"] == date(2025, 1, 1)
+        assert first["cycle_end"] == date(2025, 3, 31)
+        assert first["platform"] == "Discord"
+        assert first["reward_type"] == "F"
+        assert first["reward_level"] == 2
+        assert first["reward_amount"] == 60000
+        assert first["percentage"] == Decimal("0.5")
+        assert first["issue_number"] == 505
+        assert first["issue_status"] == IssueStatus.ADDRESSED
+        assert first["confirmed"] is False
+        assert first["url"] == "https://example.com/0"
+        assert rows[1]["handles"] == "user2"
+        assert rows[1]["issue_number"] is None
+        assert rows[1]["issue_status"] is None
+
+    @pytest.mark.django_db
+    def test_utils_exporters_contribution_export_rows_queries_handles_per_chunk(
+        self, ledger, django_assert_num_queries
+    ):
+        with django_assert_num_queries(3):
+            rows = list(contribution_export_rows(chunk_size=2))
+
+        assert len(rows) == 3
+        assert rows[2]["handles"] == "user1 @tw1"
+
+    @pytest.mark.django_db
+    def test_utils_exporters_contribution_export_rows_for_empty_ledger(self):
+        assert list(contribution_export_rows()) == []
+
+    @pytest.mark.django_db
+    def test_utils_exporters_export_lines_for_ndjson(self, ledger):
+        returned = list(export_lines("ndjson"))
+        assert len(returned) == 3
+        parsed = json.loads(returned[0])
+        assert parsed["id"] == ledger[0].id
+        assert parsed["percentage"] == "0.50"
+        assert parsed["cycle_start"] == "2025-01-01"
+
+    @pytest.mark.django_db
+    def test_utils_exporters_export_lines_for_csv(self, ledger):
+        returned = list(export_lines("csv", chunk_size=1))
+        assert len(returned) == 4
+        assert returned[0].startswith("id,contributor,handles,")
+        assert returned[3].startswith(f"{ledger[2].id},user1,user1 @tw1,")
@@ -9,16 +9,26 @@ from django.db.utils import IntegrityError
 from django.http import Http404
 
 import utils.importers
-from core.models import RewardType
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Reward,
+    RewardType,
+    SocialPlatform,
+)
 from utils.importers import (
     CONTRIBUTION_CSV_COLUMNS,
     REWARDS_COLLECTION,
     _append_gaps_to_cycles_dataframe,
     _check_current_cycle,
+    _contributor_ids,
     _create_active_rewards,
     _create_superusers,
     _dataframe_from_csv,
     _import_contributions,
+    _import_handles,
     _import_rewards,
     _parse_addresses,
     _parse_label_and_name_from_reward_type,
@@ -758,192 +768,235 @@ class TestUtilsImportersHelperFunctions:
 
         assert result is None
 
+    # # _contributor_ids
+    @pytest.mark.django_db
+    def test_utils_importers_contributor_ids_functionality(self, mocker):
+        discord = SocialPlatform.objects.create(name="Discord", prefix="")
+        github = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        alice = Contributor.objects.create(name="alice", address="A" * 58)
+        Handle.objects.create(contributor=alice, platform=discord, handle="alice")
+        Handle.objects.create(contributor=alice, platform=github, handle="alice")
+        for name in ("bob1", "bob2"):
+            Handle.objects.create(
+                contributor=Contributor.objects.create(name=name),
+                platform=github if name == "bob1" else discord,
+                handle="bob",
+            )
+        mocked_from_handle = mocker.patch(
+            "utils.importers.Contributor.objects.from_full_handle",
+            side_effect=[mocker.MagicMock(id=101), mocker.MagicMock(id=102)],
+        )
+
+        assert _contributor_ids(["alice", "g@alice", "g@new", "new", "g@bob"]) == {
+            "alice": alice.id,
+            "g@alice": alice.id,
+            "g@new": 101,
+            "new": 101,
+            "g@bob": 102,
+        }
+        assert mocked_from_handle.call_args_list == [
+            mocker.call("g@new"),
+            mocker.call("g@bob"),
+        ]
+
     # # _import_contributions
+    def _contributions_data(self, rows=1, **kwargs):
+        row = {
+            "contributor": "alice",
+            "cycle_start": "2023-01-01",
+            "cycle_end": "2023-01-31",
+            "platform": "github",
+            "url": "https://example.com",
+            "type": "[F] Feature Request",
+            "level": 1,
+            "percentage": 50.0,
+            "reward": 1.5,
+            "comment": "Test comment",
+        }
+        row.update(kwargs)
+        return pd.DataFrame([row] * rows, columns=CONTRIBUTION_CSV_COLUMNS)
+
+    def _populate(self):
+        platform = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        contributor = Contributor.objects.create(name="alice")
+        Handle.objects.create(
+            contributor=contributor, platform=platform, handle="alice"
+        )
+        cycle = Cycle.objects.create(start="2023-01-01", end="2023-01-31")
+        reward_type = RewardType.objects.create(label="F", name="Feature Request")
+        reward = Reward.objects.create(type=reward_type, level=1, amount=1_500_000)
+        return contributor, cycle, platform, reward
+
+    @pytest.mark.django_db
     def test_utils_importers_import_contributions(self, mocker):
-        # Create real DataFrame
-        mock_data = pd.DataFrame(
-            [
-                {
-                    "contributor": "testuser",
-                    "cycle_start": "2023-01-01",
-                    "platform": "GitHub",
-                    "type": "[F] Feature",
-                    "level": 1,
-                    "reward": 1000,
-                    "percentage": 50.0,
-                    "url": "https://example.com",
-                    "comment": "Test comment",
-                }
-            ]
+        contributor, cycle, platform, reward = self._populate()
+        mocked_adjust = mocker.patch(
+            "utils.importers.StatisticsSnapshot.objects.adjust"
         )
+        mocked_bump = mocker.patch("utils.importers.bump_data_version")
 
-        mocked_contributor = mocker.MagicMock()
-        mocked_cycle = mocker.MagicMock()
-        mocked_platform = mocker.MagicMock()
-        mocked_reward_type = mocker.MagicMock()
-        mocked_reward = mocker.MagicMock()
-
-        mocked_contributor_from_handle = mocker.patch(
-            "utils.importers.Contributor.objects.from_full_handle"
+        _import_contributions(
+            self._contributions_data(2),
+            _parse_label_and_name_from_reward_type,
+            _reward_amount,
         )
-        mocked_contributor_from_handle.return_value = mocked_contributor
-
-        mocked_cycle_get = mocker.patch("utils.importers.Cycle.objects.get")
-        mocked_cycle_get.return_value = mocked_cycle
 
-        mocked_platform_get = mocker.patch("utils.importers.SocialPlatform.objects.get")
-        mocked_platform_get.return_value = mocked_platform
+        contributions = list(Contribution.objects.order_by("id"))
+        assert len(contributions) == 2
+        for contribution in contributions:
+            assert contribution.contributor == contributor
+            assert contribution.cycle == cycle
+            assert contribution.platform == platform
+            assert contribution.reward == reward
+            assert contribution.percentage == 50
+            assert contribution.url == "https://example.com"
+            assert contribution.comment == "Test comment"
+            assert contribution.confirmed is True
 
-        mocked_parse_callback = mocker.MagicMock(return_value=("F", "Feature"))
-        mocked_get_object_or_404 = mocker.patch("utils.importers.get_object_or_404")
-        mocked_get_object_or_404.return_value = mocked_reward_type
+        mocked_adjust.assert_called_once_with(
+            num_contributions=2, total_rewards=3_000_000
+        )
+        mocked_bump.assert_called_once_with()
 
-        mocked_reward_get = mocker.patch("utils.importers.Reward.objects.get")
-        mocked_reward_get.return_value = mocked_reward
+    @pytest.mark.django_db
+    def test_utils_importers_import_contributions_handles_missing_values(self):
+        _, _, _, reward = self._populate()
+        reward_type = RewardType.objects.create(label="S", name="Suggestion")
+        suggestion = Reward.objects.create(type=reward_type, level=1, amount=0)
 
-        mocked_amount_callback = mocker.MagicMock(return_value=1000000)
-        mocked_contribution_create = mocker.patch(
-            "utils.importers.Contribution.objects.create"
+        _import_contributions(
+            pd.concat(
+                [
+                    self._contributions_data(
+                        level=float("nan"),
+                        percentage=float("nan"),
+                        url=float("nan"),
+                        comment=float("nan"),
+                    ),
+                    self._contributions_data(type="Custom", reward=float("nan")),
+                ]
+            ),
+            _parse_label_and_name_from_reward_type_legacy,
+            _reward_amount_legacy,
         )
 
-        _import_contributions(mock_data, mocked_parse_callback, mocked_amount_callback)
+        first, second = Contribution.objects.order_by("id")
+        assert first.reward == reward
+        assert first.percentage == 1
+        assert first.url is None
+        assert first.comment is None
+        assert second.reward == suggestion
 
-        mocked_contributor_from_handle.assert_called_once_with("testuser")
-        mocked_cycle_get.assert_called_once_with(start="2023-01-01")
-        mocked_platform_get.assert_called_once_with(name__iexact="GitHub")
-        mocked_parse_callback.assert_called_once_with("[F] Feature")
-        mocked_get_object_or_404.assert_called_once_with(
-            RewardType, label="F", name="Feature"
-        )
-        mocked_reward_get.assert_called_once_with(
-            type=mocked_reward_type, level=1, amount=1000000
+    @pytest.mark.django_db
+    def test_utils_importers_import_contributions_in_chunks(self, mocker):
+        self._populate()
+        mocker.patch("utils.importers.IMPORT_CHUNK_SIZE", 2)
+        mocked_bulk_create = mocker.spy(
+            utils.importers.Contribution.objects, "bulk_create"
         )
-        mocked_contribution_create.assert_called_once()
 
-    def test_utils_importers_import_contributions_handles_missing_values(self, mocker):
-        """Test _import_contributions handles missing values correctly."""
-        # Create real DataFrame with missing values
-        mock_data = pd.DataFrame(
-            [
-                {
-                    "contributor": "testuser",
-                    "cycle_start": "2023-01-01",
-                    "platform": "GitHub",
-                    "type": "[F] Feature",
-                    "level": float("nan"),  # Missing level
-                    "reward": 1000,
-                    "percentage": float("nan"),  # Missing percentage
-                    "url": float("nan"),  # Missing URL
-                    "comment": float("nan"),  # Missing comment
-                }
-            ]
+        _import_contributions(
+            self._contributions_data(5),
+            _parse_label_and_name_from_reward_type,
+            _reward_amount,
         )
 
-        mocked_contributor = mocker.MagicMock()
-        mocked_cycle = mocker.MagicMock()
-        mocked_platform = mocker.MagicMock()
-        mocked_reward_type = mocker.MagicMock()
-        mocked_reward = mocker.MagicMock()
+        assert mocked_bulk_create.call_args.kwargs == {"batch_size": 2}
+        assert Contribution.objects.count() == 5
 
-        mocker.patch(
-            "utils.importers.Contributor.objects.from_full_handle",
-            return_value=mocked_contributor,
-        )
-        mocker.patch("utils.importers.Cycle.objects.get", return_value=mocked_cycle)
-        mocker.patch(
-            "utils.importers.SocialPlatform.objects.get", return_value=mocked_platform
-        )
-        mocker.patch(
-            "utils.importers._parse_label_and_name_from_reward_type",
-            return_value=("F", "Feature"),
-        )
-        mocker.patch(
-            "utils.importers.get_object_or_404", return_value=mocked_reward_type
-        )
-        mocker.patch("utils.importers.Reward.objects.get", return_value=mocked_reward)
-        mocker.patch("utils.importers._reward_amount", return_value=1000000)
-        mocked_contribution_create = mocker.patch(
-            "utils.importers.Contribution.objects.create"
+    @pytest.mark.django_db
+    def test_utils_importers_import_contributions_queries_dont_depend_on_rows(
+        self, query_budget
+    ):
+        self._populate()
+        data = self._contributions_data(20)
+
+        with query_budget(6):
+            _import_contributions(
+                data, _parse_label_and_name_from_reward_type, _reward_amount
+            )
+
+        assert Contribution.objects.count() == 20
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "fields,exception",
+        [
+            ({"cycle_start": "2024-01-01"}, Cycle.DoesNotExist),
+            ({"platform": "Reddit"}, SocialPlatform.DoesNotExist),
+            ({"level": 3}, Reward.DoesNotExist),
+            ({"type": "[B] Bug Report"}, Reward.DoesNotExist),
+        ],
+    )
+    def test_utils_importers_import_contributions_for_missing_lookup(
+        self, fields, exception
+    ):
+        self._populate()
+        with pytest.raises(exception):
+            _import_contributions(
+                self._contributions_data(**fields),
+                _parse_label_and_name_from_reward_type,
+                _reward_amount,
+            )
+
+        assert Contribution.objects.count() == 0
+
+    def test_utils_importers_import_contributions_for_empty_data(self, mocker):
+        mocked_ids = mocker.patch("utils.importers._contributor_ids")
+        mocked_bulk_create = mocker.patch(
+            "utils.importers.Contribution.objects.bulk_create"
         )
 
         _import_contributions(
-            mock_data,
+            pd.DataFrame(columns=CONTRIBUTION_CSV_COLUMNS),
             _parse_label_and_name_from_reward_type,
             _reward_amount,
         )
 
-        # Verify default values are used for missing data
-        mocked_contribution_create.assert_called_once()
-        call_kwargs = mocked_contribution_create.call_args[1]
-        assert call_kwargs["percentage"] == 1  # Default for missing percentage
-        assert call_kwargs["url"] is None  # Default for missing URL
-        assert call_kwargs["comment"] is None  # Default for missing comment
+        mocked_ids.assert_not_called()
+        mocked_bulk_create.assert_not_called()
 
-    def test_utils_importers_import_contributions_multiple_rows(self, mocker):
-        """Test _import_contributions processes multiple rows correctly."""
-        # Create real DataFrame with multiple rows
-        mock_data = pd.DataFrame(
+    # # _import_handles
+    @pytest.mark.django_db
+    def test_utils_importers_import_handles_functionality(self, mocker):
+        discord = SocialPlatform.objects.create(name="Discord", prefix="")
+        github = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        first = Contributor.objects.create(name="first", address="A" * 58)
+        second = Contributor.objects.create(name="second", address="B" * 58)
+        third = Contributor.objects.create(name="third")
+        mocked_from_handle = mocker.patch(
+            "utils.importers.Contributor.objects.from_full_handle",
+            return_value=third,
+        )
+
+        _import_handles(
             [
-                {
-                    "contributor": "user1",
-                    "cycle_start": "2023-01-01",
-                    "platform": "GitHub",
-                    "type": "[F] Feature",
-                    "level": 1,
-                    "reward": 1000,
-                    "percentage": 100.0,
-                    "url": "https://example.com/1",
-                    "comment": "Comment 1",
-                },
-                {
-                    "contributor": "user2",
-                    "cycle_start": "2023-02-01",
-                    "platform": "Discord",
-                    "type": "[B] Bug",
-                    "level": 2,
-                    "reward": 500,
-                    "percentage": 50.0,
-                    "url": None,
-                    "comment": "Comment 2",
-                },
+                ("A" * 58, ["first", "g@first"]),
+                ("B" * 58, ["g@second"]),
+                ("C" * 58, ["third", "g@third"]),
             ]
         )
 
-        mocked_contributor = mocker.MagicMock()
-        mocked_cycle = mocker.MagicMock()
-        mocked_platform = mocker.MagicMock()
-        mocked_reward_type = mocker.MagicMock()
-        mocked_reward = mocker.MagicMock()
-
-        mocker.patch(
-            "utils.importers.Contributor.objects.from_full_handle",
-            return_value=mocked_contributor,
-        )
-        mocker.patch("utils.importers.Cycle.objects.get", return_value=mocked_cycle)
-        mocker.patch(
-            "utils.importers.SocialPlatform.objects.get", return_value=mocked_platform
-        )
-        mocker.patch(
-            "utils.importers._parse_label_and_name_from_reward_type",
-            return_value=("F", "Feature"),
-        )
-        mocker.patch(
-            "utils.importers.get_object_or_404", return_value=mocked_reward_type
-        )
-        mocker.patch("utils.importers.Reward.objects.get", return_value=mocked_reward)
-        mocker.patch("utils.importers._reward_amount", return_value=1000000)
-        mocked_contribution_create = mocker.patch(
-            "utils.importers.Contribution.objects.create"
+        assert sorted(
+            Handle.objects.values_list("contributor_id", "platform_id", "handle")
+        ) == sorted(
+            [
+                (first.id, discord.id, "first"),
+                (first.id, github.id, "first"),
+                (second.id, github.id, "second"),
+                (third.id, discord.id, "third"),
+                (third.id, github.id, "third"),
+            ]
         )
+        mocked_from_handle.assert_called_once_with("third", address="C" * 58)
 
-        _import_contributions(
-            mock_data,
-            _parse_label_and_name_from_reward_type,
-            _reward_amount,
-        )
+    @pytest.mark.django_db
+    def test_utils_importers_import_handles_for_missing_platform(self):
+        Contributor.objects.create(name="first", address="A" * 58)
+        with pytest.raises(SocialPlatform.DoesNotExist):
+            _import_handles([("A" * 58, ["g@first"])])
 
-        # Verify create was called twice (once for each row)
-        assert mocked_contribution_create.call_count == 2
+        assert Handle.objects.count() == 0
 
     # _import_rewards
     def test_utils_importers_import_rewards_new_type(self, mocker):
@@ -1454,7 +1507,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
 
         # Mock Handle creation completely to avoid database issues
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock DataFrame creation with real DataFrames
         mock_data = pd.DataFrame(
@@ -1538,16 +1591,7 @@ class TestUtilsImportersPublicFunctions:
         # Mock Contributor creation
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
 
-        # Mock Handle creation completely to avoid database issues
-        handle1, handle2, handle3 = (
-            mocker.MagicMock(),
-            mocker.MagicMock(),
-            mocker.MagicMock(),
-        )
-        mocked_handle = mocker.patch(
-            "utils.importers.Handle.objects.from_address_and_full_handle",
-            side_effect=[handle1, handle2, handle3],
-        )
+        mocked_handles = mocker.patch("utils.importers._import_handles")
 
         # Mock DataFrame creation with real DataFrames
         mock_data = pd.DataFrame(
@@ -1600,16 +1644,12 @@ class TestUtilsImportersPublicFunctions:
 
         result = import_from_csv("contributions.csv", "legacy.csv")
 
-        calls = [
-            mocker.call("ADDRESS1", "handle1"),
-            mocker.call("ADDRESS1", "handle1b"),
-            mocker.call("ADDRESS2", "handle2"),
-        ]
-        mocked_handle.assert_has_calls(calls, any_order=True)
-        assert mocked_handle.call_count == 3
-        handle1.save.assert_called_once_with()
-        handle2.save.assert_called_once_with()
-        handle3.save.assert_called_once_with()
+        mocked_handles.assert_called_once_with(
+            [
+                ("ADDRESS1", ["handle1", "handle1b"]),
+                ("ADDRESS2", ["handle2"]),
+            ]
+        )
 
         assert result is False
 
@@ -1658,7 +1698,7 @@ class TestUtilsImportersPublicFunctions:
         # Mock other dependencies minimally
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
         mocker.patch(
             "utils.importers._dataframe_from_csv",
             side_effect=[mock_data, mock_legacy_data],
@@ -1721,7 +1761,7 @@ class TestUtilsImportersPublicFunctions:
         )
 
         # Mock Handle creation
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Create proper mock DataFrames with all required columns
         mock_data = pd.DataFrame(
@@ -1786,7 +1826,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock DataFrame creation with cycle data - include all required columns
         mock_data = pd.DataFrame(
@@ -1871,7 +1911,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock DataFrame creation with all required columns
         mock_data = pd.DataFrame(
@@ -1950,7 +1990,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock DataFrame creation with all required columns
         mock_data = pd.DataFrame(
@@ -2032,7 +2072,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Create proper mock DataFrames with all required columns
         mock_data = pd.DataFrame(
@@ -2095,7 +2135,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock cycle operations to handle empty data
         mocker.patch("utils.importers.Cycle.objects.bulk_create")
@@ -2129,7 +2169,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers._parse_addresses", return_value=[])
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock empty DataFrames for cycle operations
         empty_cycles_df = pd.DataFrame(columns=["cycle_start", "cycle_end"])
@@ -2165,7 +2205,7 @@ class TestUtilsImportersPublicFunctions:
         mocker.patch("utils.importers.social_platform_prefixes")
         mocker.patch("utils.importers.SocialPlatform.objects.bulk_create")
         mocker.patch("utils.importers.Contributor.objects.bulk_create")
-        mocker.patch("utils.importers.Handle.objects.from_address_and_full_handle")
+        mocker.patch("utils.importers._import_handles")
 
         # Mock DataFrames
         mock_data = pd.DataFrame(
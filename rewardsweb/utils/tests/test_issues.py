@@ -1,30 +1,98 @@
 """Testing module for :py:mod:`utils.issues` module."""
 
-from django.conf import settings
+import hashlib
+import hmac
+from collections import Counter
+from datetime import datetime, timedelta
 
-from utils.constants.core import GITHUB_ISSUES_START_DATE
+import pytest
+import requests
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.models import GitHubIssueMirror
+from utils.constants.core import (
+    GITHUB_API_TIMEOUT,
+    GITHUB_API_URL,
+    GITHUB_CLIENTS_POOL_SIZE,
+    GITHUB_FETCH_PAGES_AHEAD,
+    GITHUB_FETCH_WORKERS,
+    GITHUB_ISSUES_PER_PAGE,
+    GITHUB_ISSUES_START_DATE,
+    GITHUB_MIRROR_ETAG_CACHE_KEY,
+    GITHUB_RATE_LIMIT_RESERVE,
+    GITHUB_TOKEN_EXPIRY_MARGIN,
+)
 from utils.constants.ui import MISSING_TOKEN_TEXT
 from utils.issues import (
     GitHubApp,
+    _clients,
     _contributor_link,
+    _fetch_issue_record,
+    _fetch_issues_page,
     _github_client,
     _github_repository,
     _prepare_issue_body_from_contribution,
     _prepare_issue_labels_from_contribution,
     _prepare_issue_priority_from_contribution,
     _prepare_issue_title_from_contribution,
+    _wait_for_rate_limit,
     close_issue_with_labels,
     create_github_issue,
-    fetch_issues,
+    discard_client,
+    fetch_issue_records,
     issue_by_number,
+    is_valid_webhook_signature,
     issue_data_for_contribution,
+    pooled_client,
     set_labels_to_issue,
+    sync_issues_mirror,
 )
+from utils.issues_cache import IssueRecord
+
+
+@pytest.fixture(autouse=True)
+def github_app_reset():
+    """Clear GitHub bot's process-wide caches and clients pool around tests."""
+    GitHubApp.reset()
+    _clients.clear()
+    yield
+    GitHubApp.reset()
+    _clients.clear()
 
 
 class TestUtilsIssuesGitHubApp:
     """Testing class for :py:mod:`utils.issues.GitHubApp` class."""
 
+    # # reset
+    def test_utils_issues_githubapp_reset_clears_caches(self, mocker):
+        session = mocker.MagicMock()
+        GitHubApp.signing_keys["test.pem"] = "key"
+        GitHubApp.token, GitHubApp.token_expires_at = "token", 1.0
+        GitHubApp.session = session
+        GitHubApp.reset()
+        assert GitHubApp.signing_keys == {}
+        assert GitHubApp.token is None
+        assert GitHubApp.token_expires_at == 0.0
+        assert GitHubApp.session is None
+        session.close.assert_called_once_with()
+
+    # # signing_key
+    def test_utils_issues_githubapp_signing_key_is_loaded_once(self, mocker):
+        mock_settings = mocker.MagicMock()
+        mocker.patch("utils.issues.settings", mock_settings)
+        mock_open = mocker.mock_open(read_data=b"test_key")
+        mocker.patch("builtins.open", mock_open)
+        mocked_load = mocker.patch("utils.issues.load_pem_private_key")
+        instance = GitHubApp()
+        assert instance.signing_key("test.pem") == mocked_load.return_value
+        assert GitHubApp().signing_key("test.pem") == mocked_load.return_value
+        mock_open.assert_called_once_with(
+            mock_settings.BASE_DIR.parent / "fixtures" / "test.pem", "rb"
+        )
+        mocked_load.assert_called_once_with(b"test_key", password=None)
+
     # # jwt_token
     def test_utils_issues_githubapp_jwt_token_no_env_vars(self, mocker):
         mocked_get_env_variable = mocker.patch(
@@ -44,11 +112,7 @@ class TestUtilsIssuesGitHubApp:
             "utils.issues.get_env_variable",
             side_effect=["test.pem", "test_id"],
         )
-        mock_settings = mocker.MagicMock()
-        mock_settings.BASE_DIR.parent = mocker.MagicMock()
-        mocker.patch("utils.issues.settings", mock_settings)
-        mock_open = mocker.mock_open(read_data=b"test_key")
-        mocker.patch("builtins.open", mock_open)
+        mocked_signing_key = mocker.patch.object(GitHubApp, "signing_key")
         mock_datetime = mocker.MagicMock()
         mock_timedelta = mocker.MagicMock()
         mocker.patch("utils.issues.datetime", mock_datetime)
@@ -57,7 +121,7 @@ class TestUtilsIssuesGitHubApp:
         mocker.patch("utils.issues.jwt", mock_jwt)
 
         instance = GitHubApp()
-        instance.jwt_token()
+        assert instance.jwt_token() == mock_jwt.encode.return_value
 
         mocked_get_env_variable.assert_has_calls(
             [
@@ -65,10 +129,9 @@ class TestUtilsIssuesGitHubApp:
                 mocker.call("GITHUB_BOT_CLIENT_ID", ""),
             ]
         )
-        mock_open.assert_called_once_with(
-            mock_settings.BASE_DIR.parent / "fixtures" / "test.pem", "rb"
-        )
+        mocked_signing_key.assert_called_once_with("test.pem")
         mock_jwt.encode.assert_called_once()
+        assert mock_jwt.encode.call_args[0][1] == mocked_signing_key.return_value
 
     # # installation_token
     def test_utils_issues_githubapp_installation_token_no_id(self, mocker):
@@ -87,55 +150,303 @@ class TestUtilsIssuesGitHubApp:
         instance = GitHubApp()
         assert instance.installation_token() is None
         mock_jwt_token.assert_called_once_with()
+        assert GitHubApp.session is None
 
     def test_utils_issues_githubapp_installation_token_request_fails(self, mocker):
         mocker.patch("utils.issues.get_env_variable", return_value="test_id")
         mocker.patch.object(GitHubApp, "jwt_token", return_value="test_jwt")
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 400
-        mocked_requests = mocker.patch(
-            "utils.issues.requests.post", return_value=mock_response
-        )
+        session = mocker.MagicMock()
+        session.post.return_value.status_code = 400
+        mocker.patch("utils.issues.requests.Session", return_value=session)
         instance = GitHubApp()
         assert instance.installation_token() is None
-        mocked_requests.assert_called_once()
+        session.post.assert_called_once()
+        assert GitHubApp.token is None
 
     def test_utils_issues_githubapp_installation_token_success(self, mocker):
         mocker.patch("utils.issues.get_env_variable", return_value="test_id")
         mocker.patch.object(GitHubApp, "jwt_token", return_value="test_jwt")
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {"token": "test_token"}
-        mocked_requests = mocker.patch(
-            "utils.issues.requests.post", return_value=mock_response
+        session = mocker.MagicMock()
+        session.headers = {}
+        session.post.return_value.status_code = 201
+        session.post.return_value.json.return_value = {
+            "token": "test_token",
+            "expires_at": "2100-01-01T00:00:00Z",
+        }
+        mocked_session = mocker.patch(
+            "utils.issues.requests.Session", return_value=session
         )
         instance = GitHubApp()
         assert instance.installation_token() == "test_token"
-        mocked_requests.assert_called_once()
+        mocked_session.assert_called_once_with()
+        assert session.headers["Accept"] == "application/vnd.github.v3+json"
+        session.post.assert_called_once_with(
+            f"{GITHUB_API_URL}/app/installations/test_id/access_tokens",
+            headers={"Authorization": "Bearer test_jwt"},
+            timeout=GITHUB_API_TIMEOUT,
+        )
+        assert (
+            GitHubApp.token_expires_at
+            == datetime.fromisoformat("2100-01-01T00:00:00+00:00").timestamp()
+        )
+
+    def test_utils_issues_githubapp_installation_token_is_cached(self, mocker):
+        mocker.patch("utils.issues.get_env_variable", return_value="test_id")
+        mocked_jwt_token = mocker.patch.object(
+            GitHubApp, "jwt_token", return_value="test_jwt"
+        )
+        session = mocker.MagicMock()
+        session.post.return_value.status_code = 201
+        session.post.return_value.json.return_value = {
+            "token": "test_token",
+            "expires_at": "2100-01-01T00:00:00Z",
+        }
+        mocker.patch("utils.issues.requests.Session", return_value=session)
+        assert GitHubApp().installation_token() == "test_token"
+        assert GitHubApp().installation_token() == "test_token"
+        mocked_jwt_token.assert_called_once_with()
+        session.post.assert_called_once()
+
+    def test_utils_issues_githubapp_installation_token_refreshed_before_expiry(
+        self, mocker
+    ):
+        mocker.patch("utils.issues.get_env_variable", return_value="test_id")
+        mocker.patch.object(GitHubApp, "jwt_token", return_value="test_jwt")
+        session = mocker.MagicMock()
+        session.post.return_value.status_code = 201
+        session.post.return_value.json.return_value = {"token": "new_token"}
+        mocker.patch("utils.issues.requests.Session", return_value=session)
+        mocker.patch("utils.issues.time.time", return_value=1000.0)
+        GitHubApp.token = "old_token"
+        GitHubApp.token_expires_at = 1000.0 + GITHUB_TOKEN_EXPIRY_MARGIN - 1
+        old_client = mocker.MagicMock()
+        _clients["old_token"] = old_client
+        assert GitHubApp().installation_token() == "new_token"
+        session.post.assert_called_once()
+        assert GitHubApp.token_expires_at == 1000.0 + GITHUB_TOKEN_EXPIRY_MARGIN
+        assert "old_token" not in _clients
+        old_client.close.assert_called_once_with()
 
     # # client
     def test_utils_issues_githubapp_client_no_token(self, mocker):
         mock_installation_token = mocker.patch.object(
             GitHubApp, "installation_token", return_value=None
         )
-        mocked_github = mocker.patch("utils.issues.Github")
+        mocked_pooled = mocker.patch("utils.issues.pooled_client")
         instance = GitHubApp()
         assert instance.client() is None
         mock_installation_token.assert_called_once_with()
-        mocked_github.assert_not_called()
+        mocked_pooled.assert_not_called()
 
     def test_utils_issues_githubapp_client_success(self, mocker):
         mock_installation_token = mocker.patch.object(
             GitHubApp, "installation_token", return_value="test_token"
         )
-        mock_github_instance = mocker.MagicMock()
-        mocked_github = mocker.patch(
-            "utils.issues.Github", return_value=mock_github_instance
-        )
+        mocked_pooled = mocker.patch("utils.issues.pooled_client")
         instance = GitHubApp()
-        assert instance.client() == mock_github_instance
+        assert instance.client() == mocked_pooled.return_value
         mock_installation_token.assert_called_once_with()
-        mocked_github.assert_called_once_with("test_token")
+        mocked_pooled.assert_called_once_with("test_token")
+
+
+class TestUtilsIssuesPooledClient:
+    """Testing class for :py:func:`utils.issues.pooled_client` function."""
+
+    def test_utils_issues_pooled_client_reuses_client(self, mocker):
+        mocked_auth = mocker.patch("utils.issues.Auth.Token")
+        mocked_github = mocker.patch("utils.issues.Github")
+        assert pooled_client("token") == mocked_github.return_value
+        assert pooled_client("token") == mocked_github.return_value
+        mocked_auth.assert_called_once_with("token")
+        mocked_github.assert_called_once_with(
+            auth=mocked_auth.return_value,
+            timeout=GITHUB_API_TIMEOUT,
+            per_page=GITHUB_ISSUES_PER_PAGE,
+            pool_size=GITHUB_FETCH_WORKERS,
+        )
+
+    def test_utils_issues_pooled_client_for_different_tokens(self, mocker):
+        mocker.patch("utils.issues.Auth.Token")
+        client1, client2 = mocker.MagicMock(), mocker.MagicMock()
+        mocker.patch("utils.issues.Github", side_effect=[client1, client2])
+        assert pooled_client("token1") == client1
+        assert pooled_client("token2") == client2
+        assert pooled_client("token1") == client1
+
+    def test_utils_issues_pooled_client_drops_least_recently_used(self, mocker):
+        mocker.patch("utils.issues.Auth.Token")
+        mocker.patch(
+            "utils.issues.Github",
+            side_effect=lambda **kwargs: mocker.MagicMock(),
+        )
+        for index in range(GITHUB_CLIENTS_POOL_SIZE):
+            pooled_client(f"token{index}")
+
+        pooled_client("token0")
+        evicted = _clients["token1"]
+        pooled_client("new")
+        assert len(_clients) == GITHUB_CLIENTS_POOL_SIZE
+        assert "token0" in _clients
+        assert "token1" not in _clients
+        evicted.close.assert_called_once_with()
+        _clients["token0"].close.assert_not_called()
+
+
+class TestUtilsIssuesDiscardClient:
+    """Testing class for :py:func:`utils.issues.discard_client` function."""
+
+    def test_utils_issues_discard_client_closes_client(self, mocker):
+        client = mocker.MagicMock()
+        _clients["token"] = client
+        discard_client("token")
+        assert "token" not in _clients
+        client.close.assert_called_once_with()
+
+    def test_utils_issues_discard_client_for_missing_token(self):
+        discard_client("token")
+        assert not _clients
+
+
+class TestUtilsIssuesConcurrentFetching:
+    """Testing class for :py:mod:`utils.issues` concurrent fetching functions."""
+
+    def _issues(self, mocker, count, start=0):
+        return [
+            mocker.MagicMock(
+                number=start + index,
+                state="open",
+                title="title",
+                body="body",
+                labels=[],
+                closed_at=None,
+                updated_at=None,
+                pull_request=None,
+                comments=0,
+            )
+            for index in range(count)
+        ]
+
+    def _paginated(self, mocker, pages):
+        mock_client = mocker.MagicMock(rate_limiting=(5000, 5000))
+        mocker.patch("utils.issues.pooled_client", return_value=mock_client)
+        mock_repo = mocker.MagicMock()
+        mocker.patch("utils.issues._github_repository", return_value=mock_repo)
+        mock_repo.get_issues.return_value.get_page.side_effect = lambda page: (
+            pages[page] if page < len(pages) else []
+        )
+        return mock_repo
+
+    # # _wait_for_rate_limit
+    def test_utils_issues_wait_for_rate_limit_enough_requests_left(self, mocker):
+        mocked_sleep = mocker.patch("utils.issues.time.sleep")
+        client = mocker.MagicMock(rate_limiting=(GITHUB_RATE_LIMIT_RESERVE + 1, 5000))
+        _wait_for_rate_limit(client)
+        mocked_sleep.assert_not_called()
+
+    def test_utils_issues_wait_for_rate_limit_sleeps_until_reset(self, mocker):
+        mocker.patch("utils.issues.time.time", return_value=1000.0)
+        mocked_sleep = mocker.patch("utils.issues.time.sleep")
+        client = mocker.MagicMock(
+            rate_limiting=(GITHUB_RATE_LIMIT_RESERVE, 5000),
+            rate_limiting_resettime=1060,
+        )
+        _wait_for_rate_limit(client)
+        mocked_sleep.assert_called_once_with(61.0)
+
+    def test_utils_issues_wait_for_rate_limit_reset_already_passed(self, mocker):
+        mocker.patch("utils.issues.time.time", return_value=2000.0)
+        mocked_sleep = mocker.patch("utils.issues.time.sleep")
+        client = mocker.MagicMock(rate_limiting=(0, 5000), rate_limiting_resettime=1060)
+        _wait_for_rate_limit(client)
+        mocked_sleep.assert_not_called()
+
+    # # _fetch_issues_page
+    def test_utils_issues_fetch_issues_page_functionality(self, mocker):
+        mocked_wait = mocker.patch("utils.issues._wait_for_rate_limit")
+        client, issues = mocker.MagicMock(), mocker.MagicMock()
+        assert _fetch_issues_page(client, issues, 3) == issues.get_page.return_value
+        mocked_wait.assert_called_once_with(client)
+        issues.get_page.assert_called_once_with(3)
+
+    # # _fetch_issue_record
+    def test_utils_issues_fetch_issue_record_no_comments(self, mocker):
+        mocked_wait = mocker.patch("utils.issues._wait_for_rate_limit")
+        issue = self._issues(mocker, 1)[0]
+        record = _fetch_issue_record(mocker.MagicMock(), issue)
+        assert record == IssueRecord.from_github(issue)
+        assert record.comments == ()
+        mocked_wait.assert_not_called()
+        issue.get_comments.assert_not_called()
+
+    def test_utils_issues_fetch_issue_record_functionality(self, mocker):
+        mocked_wait = mocker.patch("utils.issues._wait_for_rate_limit")
+        client = mocker.MagicMock()
+        issue = self._issues(mocker, 1)[0]
+        issue.comments = 2
+        issue.get_comments.return_value = [
+            mocker.MagicMock(body="first"),
+            mocker.MagicMock(body="second"),
+        ]
+        record = _fetch_issue_record(client, issue)
+        assert record.number == 0
+        assert record.comments == ("first", "second")
+        mocked_wait.assert_called_once_with(client)
+
+    # # fetch_issue_records
+    def test_utils_issues_fetch_issue_records_single_page(self, mocker):
+        issues = self._issues(mocker, 3)
+        issues[1].comments = 1
+        issues[1].get_comments.return_value = [mocker.MagicMock(body="comment")]
+        mock_repo = self._paginated(mocker, [issues])
+
+        result = list(fetch_issue_records("token"))
+
+        assert [(record.number, record.comments) for record in result] == [
+            (0, ()),
+            (1, ("comment",)),
+            (2, ()),
+        ]
+        mock_repo.get_issues.assert_called_once_with(
+            state="all", sort="updated", direction="asc", since=GITHUB_ISSUES_START_DATE
+        )
+
+    def test_utils_issues_fetch_issue_records_multiple_pages_in_order(self, mocker):
+        pages = [
+            self._issues(mocker, GITHUB_ISSUES_PER_PAGE),
+            self._issues(mocker, GITHUB_ISSUES_PER_PAGE, GITHUB_ISSUES_PER_PAGE),
+            self._issues(mocker, 5, 2 * GITHUB_ISSUES_PER_PAGE),
+        ]
+        mock_repo = self._paginated(mocker, pages)
+
+        result = list(fetch_issue_records("token", since="since", workers=4))
+
+        assert [record.number for record in result] == list(
+            range(2 * GITHUB_ISSUES_PER_PAGE + 5)
+        )
+        requested = sorted(
+            call.args[0]
+            for call in mock_repo.get_issues.return_value.get_page.call_args_list
+        )
+        assert requested[: len(pages)] == list(range(len(pages)))
+        assert len(requested) <= len(pages) + GITHUB_FETCH_PAGES_AHEAD - 1
+        assert mock_repo.get_issues.call_args.kwargs["since"] == "since"
+
+    def test_utils_issues_fetch_issue_records_counts_requests(self, mocker):
+        issues = self._issues(mocker, 3)
+        issues[1].comments = 1
+        issues[2].comments = GITHUB_ISSUES_PER_PAGE + 1
+        self._paginated(mocker, [issues])
+        counter = Counter()
+
+        assert len(list(fetch_issue_records("token", counter=counter))) == 3
+        assert counter == {"issues": 1, "comments": 3}
+
+    def test_utils_issues_fetch_issue_records_skips_pull_requests(self, mocker):
+        issues = self._issues(mocker, 2)
+        issues[0].pull_request = mocker.MagicMock()
+        self._paginated(mocker, [issues])
+
+        assert [record.number for record in fetch_issue_records("token")] == [1]
 
 
 class TestUtilsIssuesHelperFunctions:
@@ -174,6 +485,162 @@ class TestUtilsIssuesHelperFunctions:
         mocked_contributor.assert_called_once_with(handle)
 
 
+class TestUtilsIssuesWebhookSignature:
+    """Testing class for :py:func:`utils.issues.is_valid_webhook_signature`."""
+
+    def _signature(self, secret, payload):
+        return "sha256=" + hmac.new(secret, payload, hashlib.sha256).hexdigest()
+
+    def test_utils_issues_is_valid_webhook_signature_for_valid_signature(
+        self, monkeypatch
+    ):
+        monkeypatch.setenv("GITHUB_WEBHOOK_SECRET", "secret")
+        payload = b'{"action": "edited"}'
+        signature = self._signature(b"secret", payload)
+        assert is_valid_webhook_signature(payload, signature) is True
+
+    def test_utils_issues_is_valid_webhook_signature_for_invalid_signature(
+        self, monkeypatch
+    ):
+        monkeypatch.setenv("GITHUB_WEBHOOK_SECRET", "secret")
+        payload = b'{"action": "edited"}'
+        signature = self._signature(b"other", payload)
+        assert is_valid_webhook_signature(payload, signature) is False
+        assert is_valid_webhook_signature(payload, "") is False
+
+    def test_utils_issues_is_valid_webhook_signature_for_missing_secret(
+        self, monkeypatch
+    ):
+        monkeypatch.delenv("GITHUB_WEBHOOK_SECRET", raising=False)
+        payload = b"{}"
+        signature = self._signature(b"", payload)
+        assert is_valid_webhook_signature(payload, signature) is False
+
+
+def _github_issue(number, updated_at="2025-01-02T10:00:00Z"):
+    """Return GitHub REST API issue object with provided `number`."""
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "body": "Body",
+        "state": "open",
+        "labels": [],
+        "assignees": [],
+        "user": {"login": "author"},
+        "html_url": f"https://github.com/owner/repo/issues/{number}",
+        "comments": 0,
+        "created_at": "2025-01-01T10:00:00Z",
+        "updated_at": updated_at,
+        "closed_at": None,
+    }
+
+
+def _response(mocker, status_code=200, data=None, etag=None, next_url=None):
+    """Return mocked GitHub REST API response."""
+    response = mocker.MagicMock()
+    response.status_code = status_code
+    response.json.return_value = data or []
+    response.headers = {"ETag": etag} if etag else {}
+    response.links = {"next": {"url": next_url}} if next_url else {}
+    return response
+
+
+@pytest.mark.django_db
+class TestUtilsIssuesSyncIssuesMirror:
+    """Testing class for :py:func:`utils.issues.sync_issues_mirror`."""
+
+    @pytest.fixture
+    def locmem_cache(self, settings):
+        """Use local memory cache instead of development's dummy cache."""
+        settings.CACHES = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        cache.clear()
+        yield cache
+        cache.clear()
+
+    def test_utils_issues_sync_issues_mirror_for_no_token(self, mocker):
+        mocker.patch("utils.issues.GitHubApp.installation_token", return_value=None)
+        returned = sync_issues_mirror()
+        assert returned == {"success": False, "error": MISSING_TOKEN_TEXT}
+
+    def test_utils_issues_sync_issues_mirror_fetches_all_pages(
+        self, mocker, locmem_cache
+    ):
+        session = mocker.patch("utils.issues.requests.Session").return_value
+        session.get.side_effect = [
+            _response(
+                mocker,
+                data=[_github_issue(1), _github_issue(2)],
+                etag='"first"',
+                next_url="https://api.github.com/next",
+            ),
+            _response(mocker, data=[_github_issue(3)], etag='"second"'),
+        ]
+        returned = sync_issues_mirror("token")
+        assert returned == {"success": True, "updated": 3}
+        assert GitHubIssueMirror.objects.count() == 3
+        assert locmem_cache.get(GITHUB_MIRROR_ETAG_CACHE_KEY) == '"first"'
+        session.headers.update.assert_called_once_with(
+            {
+                "Authorization": "Bearer token",
+                "Accept": "application/vnd.github+json",
+            }
+        )
+        first_call, second_call = session.get.call_args_list
+        assert first_call.args[0] == (
+            f"https://api.github.com/repos/{settings.GITHUB_REPO_OWNER}/"
+            f"{settings.GITHUB_REPO_NAME}/issues"
+        )
+        assert first_call.kwargs["params"]["since"] == (
+            GITHUB_ISSUES_START_DATE.isoformat()
+        )
+        assert first_call.kwargs["headers"] == {}
+        assert second_call.args == ("https://api.github.com/next",)
+        assert second_call.kwargs == {"timeout": GITHUB_API_TIMEOUT}
+        session.close.assert_called_once_with()
+
+    def test_utils_issues_sync_issues_mirror_requests_since_last_update(
+        self, mocker, locmem_cache
+    ):
+        GitHubIssueMirror.objects.update_from_github(
+            [_github_issue(1), _github_issue(2, updated_at="2025-02-01T08:00:00Z")]
+        )
+        locmem_cache.set(GITHUB_MIRROR_ETAG_CACHE_KEY, '"etag"')
+        session = mocker.patch("utils.issues.requests.Session").return_value
+        session.get.return_value = _response(mocker, status_code=304, etag='"etag"')
+        GitHubIssueMirror.objects.update(synced_at=timezone.now() - timedelta(days=1))
+        returned = sync_issues_mirror("token")
+        assert returned == {"success": True, "updated": 0}
+        kwargs = session.get.call_args.kwargs
+        assert kwargs["params"]["since"] == "2025-02-01T08:00:00+00:00"
+        assert kwargs["headers"] == {"If-None-Match": '"etag"'}
+        assert all(mirror.is_fresh() for mirror in GitHubIssueMirror.objects.all())
+
+    def test_utils_issues_sync_issues_mirror_uses_bot_token(self, mocker, locmem_cache):
+        mocker.patch(
+            "utils.issues.GitHubApp.installation_token", return_value="bottoken"
+        )
+        session = mocker.patch("utils.issues.requests.Session").return_value
+        session.get.return_value = _response(mocker, status_code=304)
+        sync_issues_mirror()
+        assert session.headers.update.call_args.args[0]["Authorization"] == (
+            "Bearer bottoken"
+        )
+
+    def test_utils_issues_sync_issues_mirror_for_request_error(
+        self, mocker, locmem_cache
+    ):
+        session = mocker.patch("utils.issues.requests.Session").return_value
+        response = _response(mocker, status_code=500)
+        response.raise_for_status.side_effect = requests.HTTPError("server error")
+        session.get.return_value = response
+        returned = sync_issues_mirror("token")
+        assert returned == {"success": False, "error": "server error"}
+        assert locmem_cache.get(GITHUB_MIRROR_ETAG_CACHE_KEY) is None
+        session.close.assert_called_once_with()
+
+
 class TestUtilsIssuesCrudFunctions:
     """Testing class for :py:mod:`utils.issues` CRUD functions."""
 
@@ -209,20 +676,17 @@ class TestUtilsIssuesCrudFunctions:
     def test_utils_issues_github_client_for_user_token(self, mocker):
         mock_user = mocker.MagicMock()
         mock_token = mocker.MagicMock()
-        mock_auth, mock_client = mocker.MagicMock(), mocker.MagicMock()
         mock_githubapp = mocker.MagicMock()
         mock_githubapp.client.return_value = None
         mocked_githubapp = mocker.patch(
             "utils.issues.GitHubApp", return_value=mock_githubapp
         )
-        mocked_auth = mocker.patch("utils.issues.Auth.Token", return_value=mock_auth)
-        mocked_github = mocker.patch("utils.issues.Github", return_value=mock_client)
+        mocked_pooled = mocker.patch("utils.issues.pooled_client")
         mock_user.profile.github_token = mock_token
         returned = _github_client(mock_user)
-        assert returned == mock_client
+        assert returned == mocked_pooled.return_value
         mocked_githubapp.assert_called_once_with()
-        mocked_auth.assert_called_once_with(mock_token)
-        mocked_github.assert_called_once_with(auth=mock_auth)
+        mocked_pooled.assert_called_once_with(mock_token)
 
     # # _github_repository
     def test_utils_issues_github_repository_functionality(self, mocker):
@@ -233,70 +697,6 @@ class TestUtilsIssuesCrudFunctions:
             f"{settings.GITHUB_REPO_OWNER}/{settings.GITHUB_REPO_NAME}"
         )
 
-    # # fetch_issues
-    def test_utils_issues_fetch_issues_no_client(self, mocker):
-        """Test handling when GitHub client creation fails."""
-        github_token = "test_token"
-        mock_auth = mocker.MagicMock()
-
-        mocked_auth = mocker.patch("utils.issues.Auth.Token", return_value=mock_auth)
-        mocked_github = mocker.patch("utils.issues.Github", return_value=None)
-
-        result = fetch_issues(github_token)
-
-        assert result == []
-        mocked_auth.assert_called_once_with(github_token)
-        mocked_github.assert_called_once_with(auth=mock_auth)
-
-    def test_utils_issues_fetch_issues_success(self, mocker):
-        """Test successful retrieval of all issues."""
-        github_token = "test_token"
-        mock_auth = mocker.MagicMock()
-        mock_client = mocker.MagicMock()
-        mock_repo = mocker.MagicMock()
-        mock_issues = mocker.MagicMock()
-        mocked_auth = mocker.patch("utils.issues.Auth.Token", return_value=mock_auth)
-        mocked_github = mocker.patch("utils.issues.Github", return_value=mock_client)
-        mocked_repo = mocker.patch(
-            "utils.issues._github_repository", return_value=mock_repo
-        )
-        mock_repo.get_issues.return_value = mock_issues
-
-        result = fetch_issues(github_token)
-
-        assert result == mock_issues
-        mocked_auth.assert_called_once_with(github_token)
-        mocked_github.assert_called_once_with(auth=mock_auth)
-        mocked_repo.assert_called_once_with(mock_client)
-        mock_repo.get_issues.assert_called_once_with(
-            state="all", sort="updated", direction="asc", since=GITHUB_ISSUES_START_DATE
-        )
-
-    def test_utils_issues_fetch_issues_success_provided_arguments(self, mocker):
-        """Test successful retrieval of all issues."""
-        github_token = "test_token"
-        mock_auth = mocker.MagicMock()
-        mock_client = mocker.MagicMock()
-        mock_repo = mocker.MagicMock()
-        mock_issues = mocker.MagicMock()
-
-        mocked_auth = mocker.patch("utils.issues.Auth.Token", return_value=mock_auth)
-        mocked_github = mocker.patch("utils.issues.Github", return_value=mock_client)
-        mocked_repo = mocker.patch(
-            "utils.issues._github_repository", return_value=mock_repo
-        )
-        mock_repo.get_issues.return_value = mock_issues
-        since = mocker.MagicMock()
-        result = fetch_issues(github_token, state="closed", since=since)
-
-        assert result == mock_issues
-        mocked_auth.assert_called_once_with(github_token)
-        mocked_github.assert_called_once_with(auth=mock_auth)
-        mocked_repo.assert_called_once_with(mock_client)
-        mock_repo.get_issues.assert_called_once_with(
-            state="closed", sort="updated", direction="asc", since=since
-        )
-
     # # close_issue_with_labels
     def test_utils_issues_close_issue_with_labels_for_no_client(self, mocker):
         user = mocker.MagicMock()
@@ -354,7 +754,7 @@ class TestUtilsIssuesCrudFunctions:
         mocked_repo.assert_called_once_with(client)
         repo.get_issue.assert_called_once_with(issue_number)
         issue.edit.assert_called_once_with(state="closed")
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
         issue.set_labels.assert_not_called()
         issue.create_comment.assert_not_called()
 
@@ -390,7 +790,7 @@ class TestUtilsIssuesCrudFunctions:
         issue.set_labels.assert_called_once_with("label1", "label2")
         issue.create_comment.assert_called_once_with(comment)
         issue.edit.assert_called_once_with(state="closed")
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
 
     # # create_github_issue
     def test_utils_issues_create_github_issue_for_no_client(self, mocker):
@@ -434,7 +834,7 @@ class TestUtilsIssuesCrudFunctions:
         mocked_client.assert_called_once_with(user)
         mocked_repo.assert_called_once_with(client)
         repo.create_issue.assert_called_once_with(title=title, body=body, labels=[])
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
 
     def test_utils_issues_create_github_issue_functionality(self, mocker):
         user = mocker.MagicMock()
@@ -454,7 +854,7 @@ class TestUtilsIssuesCrudFunctions:
         mocked_client.assert_called_once_with(user)
         mocked_repo.assert_called_once_with(client)
         repo.create_issue.assert_called_once_with(title=title, body=body, labels=labels)
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
 
     # # issue_by_number
     def test_utils_issues_issue_by_number_for_no_client(self, mocker):
@@ -543,7 +943,7 @@ class TestUtilsIssuesCrudFunctions:
         mocked_client.assert_called_once_with(user)
         mocked_repo.assert_called_once_with(client)
         repo.get_issue.assert_called_once_with(issue_number)
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
 
     def test_utils_issues_issue_by_number_with_none_dates(self, mocker):
         user = mocker.MagicMock()
@@ -594,7 +994,7 @@ class TestUtilsIssuesCrudFunctions:
         mocked_client.assert_called_once_with(user)
         mocked_repo.assert_called_once_with(client)
         repo.get_issue.assert_called_once_with(issue_number)
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
 
     # # set_labels_to_issue
     def test_utils_issues_set_labels_to_issue_for_no_client(self, mocker):
@@ -651,7 +1051,7 @@ class TestUtilsIssuesCrudFunctions:
         repo.get_issue.assert_has_calls(calls, any_order=True)
         assert repo.get_issue.call_count == 2
         issue.set_labels.assert_called_once_with("label1", "label2")
-        client.close.assert_called_once_with()
+        client.close.assert_not_called()
 
 
 class TestUtilsIssuesPrepareFunctions:
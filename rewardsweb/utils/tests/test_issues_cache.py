@@ -0,0 +1,223 @@
+"""Testing module for :py:mod:`utils.issues_cache` module."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from utils.issues_cache import (
+    ISSUE_FIELDS,
+    ISSUE_MAPPED,
+    ISSUE_UNMAPPED,
+    ISSUES_CACHE_PATH,
+    GitHubIssuesCache,
+    IssueRecord,
+    _serialize,
+)
+
+
+def _record(number, state="open", day=1, **kwargs):
+    fields = {
+        "number": number,
+        "state": state,
+        "title": f"Issue {number}",
+        "body": "body",
+        "labels": ["bug"],
+        "author": "author",
+        "closed_at": None,
+        "updated_at": datetime(2024, 1, day, tzinfo=timezone.utc),
+        "comments": ["comment"],
+    }
+    fields.update(kwargs)
+    return IssueRecord(**fields)
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = GitHubIssuesCache(tmp_path / "cache" / "issues.db")
+    yield cache
+    cache.cleanup()
+
+
+class TestUtilsIssuesCacheFunctions:
+    """Testing class for :py:mod:`utils.issues_cache` functions."""
+
+    def test_utils_issues_cache_module_constants(self):
+        assert ISSUES_CACHE_PATH.name == "github_issues.db"
+        assert ISSUES_CACHE_PATH.parent.name == "fixtures"
+        assert ISSUE_FIELDS[0] == "number"
+
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            (datetime(2024, 1, 1, tzinfo=timezone.utc), "2024-01-01T00:00:00+00:00"),
+            (["a", "b"], '["a", "b"]'),
+            (("a",), '["a"]'),
+            ("text", "text"),
+            (5, 5),
+            (None, None),
+        ],
+    )
+    def test_utils_issues_cache_serialize(self, value, expected):
+        assert _serialize(value) == expected
+
+
+class TestUtilsIssuesCacheIssueRecord:
+    """Testing class for :py:class:`utils.issues_cache.IssueRecord`."""
+
+    def _github_issue(self, mocker, user="author"):
+        issue = mocker.MagicMock(
+            number=5,
+            state="closed",
+            title="[F1] Title",
+            body="body",
+            closed_at=datetime(2024, 1, 3, tzinfo=timezone.utc),
+            updated_at=datetime(2024, 1, 4, tzinfo=timezone.utc),
+        )
+        label = mocker.MagicMock()
+        label.name = "bug"
+        issue.labels = [label]
+        issue.user = mocker.MagicMock(login=user) if user else None
+        return issue
+
+    def test_utils_issues_cache_issuerecord_is_slotted(self):
+        record = IssueRecord(1, "open")
+        assert IssueRecord.__slots__ == ISSUE_FIELDS
+        assert not hasattr(record, "__dict__")
+        with pytest.raises(AttributeError):
+            record.extra = "value"
+
+    def test_utils_issues_cache_issuerecord_init_defaults(self):
+        record = IssueRecord(1, "open", labels=["bug"], comments=["comment"])
+        assert record.title is None
+        assert record.body is None
+        assert record.labels == ("bug",)
+        assert record.author is None
+        assert record.comments == ("comment",)
+
+    def test_utils_issues_cache_issuerecord_from_github(self, mocker):
+        record = IssueRecord.from_github(self._github_issue(mocker), ["comment"])
+        assert record.fields() == {
+            "number": 5,
+            "state": "closed",
+            "title": "[F1] Title",
+            "body": "body",
+            "labels": ("bug",),
+            "author": "author",
+            "closed_at": datetime(2024, 1, 3, tzinfo=timezone.utc),
+            "updated_at": datetime(2024, 1, 4, tzinfo=timezone.utc),
+            "comments": ("comment",),
+        }
+
+    def test_utils_issues_cache_issuerecord_from_github_without_user(self, mocker):
+        record = IssueRecord.from_github(self._github_issue(mocker, user=None))
+        assert record.author is None
+        assert record.comments == ()
+
+    def test_utils_issues_cache_issuerecord_equality(self):
+        assert _record(1) == _record(1)
+        assert _record(1) != _record(1, comments=[])
+        assert _record(1) != "record"
+
+    def test_utils_issues_cache_issuerecord_fingerprint(self):
+        assert _record(1).fingerprint() == _record(1).fingerprint()
+        assert len(_record(1).fingerprint()) == 64
+        assert _record(1).fingerprint() != _record(1, day=2).fingerprint()
+        assert _record(1).fingerprint() != _record(1, comments=[]).fingerprint()
+
+    def test_utils_issues_cache_issuerecord_repr(self):
+        assert repr(_record(7)) == "IssueRecord(number=7, state='open')"
+
+
+class TestUtilsIssuesCacheGitHubIssuesCache:
+    """Testing class for :py:class:`utils.issues_cache.GitHubIssuesCache`."""
+
+    def test_utils_issues_cache_githubissuescache_init_creates_database(self, tmp_path):
+        path = tmp_path / "missing" / "issues.db"
+        cache = GitHubIssuesCache(path)
+        assert path.exists()
+        assert cache.db_path == path
+        assert cache.issues() == []
+        assert cache.timestamp() is None
+        cache.cleanup()
+
+    def test_utils_issues_cache_githubissuescache_upsert_and_issues(self, cache):
+        closed_at = datetime(2024, 1, 4, tzinfo=timezone.utc)
+        cache.upsert([_record(2, day=3), _record(1, "closed", closed_at=closed_at)])
+        assert cache.issues() == [
+            _record(1, "closed", closed_at=closed_at),
+            _record(2, day=3),
+        ]
+
+    def test_utils_issues_cache_githubissuescache_upsert_replaces_by_number(
+        self, cache
+    ):
+        cache.upsert([_record(1), _record(2)])
+        cache.upsert([_record(1, "closed", day=5, comments=[])])
+        assert cache.issues() == [
+            _record(2),
+            _record(1, "closed", day=5, comments=[]),
+        ]
+
+    def test_utils_issues_cache_githubissuescache_issues_for_empty_values(self, cache):
+        cache.upsert([IssueRecord(1, "open")])
+        assert cache.issues()[0].fields() == {
+            "number": 1,
+            "state": "open",
+            "title": None,
+            "body": None,
+            "labels": (),
+            "author": None,
+            "closed_at": None,
+            "updated_at": None,
+            "comments": (),
+        }
+
+    def test_utils_issues_cache_githubissuescache_timestamp(self, cache):
+        cache.set_timestamp(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        cache.set_timestamp(datetime(2024, 2, 1, tzinfo=timezone.utc))
+        assert cache.timestamp() == datetime(2024, 2, 1, tzinfo=timezone.utc)
+
+    def test_utils_issues_cache_githubissuescache_persists_between_instances(
+        self, cache
+    ):
+        cache.upsert([_record(1)])
+        cache.set_timestamp(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        other = GitHubIssuesCache(cache.db_path)
+        assert other.issues() == [_record(1)]
+        assert other.timestamp() == datetime(2024, 1, 1, tzinfo=timezone.utc)
+        other.cleanup()
+
+    def test_utils_issues_cache_githubissuescache_clear(self, cache):
+        cache.upsert([_record(1)])
+        cache.set_timestamp(datetime(2024, 1, 1, tzinfo=timezone.utc))
+        cache.clear()
+        assert cache.issues() == []
+        assert cache.timestamp() is None
+
+    def test_utils_issues_cache_githubissuescache_cleanup_no_connection(self, cache):
+        cache.conn.close()
+        cache.conn = None
+        cache.cleanup()
+
+    def test_utils_issues_cache_githubissuescache_mapping_state(self, cache):
+        assert cache.mapping_state() == {}
+        cache.set_mapping_state([(1, "a", ISSUE_MAPPED), (2, "b", ISSUE_UNMAPPED)])
+        cache.set_mapping_state([(2, "c", ISSUE_MAPPED)])
+        assert cache.mapping_state() == {1: ("a", ISSUE_MAPPED), 2: ("c", ISSUE_MAPPED)}
+
+    def test_utils_issues_cache_githubissuescache_clear_keeps_mapping_state(
+        self, cache
+    ):
+        cache.set_mapping_state([(1, "a", ISSUE_MAPPED)])
+        cache.set_contributions_fingerprint("b")
+        cache.clear()
+        assert cache.mapping_state() == {1: ("a", ISSUE_MAPPED)}
+        assert cache.contributions_fingerprint() == "b"
+
+    def test_utils_issues_cache_githubissuescache_contributions_fingerprint(
+        self, cache
+    ):
+        assert cache.contributions_fingerprint() is None
+        cache.set_contributions_fingerprint("a")
+        cache.set_contributions_fingerprint("b")
+        assert cache.contributions_fingerprint() == "b"
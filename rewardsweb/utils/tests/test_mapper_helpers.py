@@ -1,18 +1,36 @@
 """Testing module for :py:mod:`utils.mappers` module's classes and helper functions."""
 
-import pickle
+import json
 import re
 from collections import defaultdict
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from unittest import mock
 
 import pytest
 from django.conf import settings
 
 import utils.mappers
-from core.models import Reward, RewardType, SocialPlatform
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Handle,
+    Issue,
+    Reward,
+    RewardType,
+    SocialPlatform,
+)
+from utils.constants.core import GITHUB_ISSUES_START_DATE
+from utils.issues_cache import (
+    ISSUE_MAPPED,
+    ISSUE_UNMAPPED,
+    GitHubIssuesCache,
+    IssueRecord,
+)
 from utils.mappers import (
-    CustomIssue,
+    ContributorMatcher,
+    MappingContext,
+    MappingReport,
     _build_reward_mapping,
     _extract_url_text,
     _fetch_and_categorize_issues,
@@ -22,8 +40,11 @@ from utils.mappers import (
     _identify_reward_from_issue_title,
     _identify_reward_from_labels,
     _is_url_github_issue,
+    _contributions_fingerprint,
+    _issues_to_map,
     _load_saved_issues,
     _save_issues,
+    _save_mapping_state,
 )
 
 
@@ -37,128 +58,324 @@ class TestUtilsMappersConstants:
             ("URL_EXCEPTIONS", ["discord.com/invite"]),
             ("REWARD_LABELS", ["F", "B", "AT", "CT", "IC", "TWR", "D", "ER"]),
             ("REWARD_PATTERN", re.compile("^\\[(F|B|AT|CT|IC|TWR|D|ER)(1|2|3)\\]")),
+            ("MARKDOWN_URL_PATTERN", re.compile(r"\[[^\]]*\]\(([^)]+)\)")),
         ],
     )
     def test_utils_mappers_module_constants(self, constant, value):
         assert getattr(utils.mappers, constant) == value
 
 
-class TestUtilsMappersCustomIssue:
-    """Testing class for :class:`utils.mappers.CustomIssue` wrapper."""
+class TestUtilsMappersContributorMatcher:
+    """Testing class for :class:`utils.mappers.ContributorMatcher` mapping."""
+
+    def test_utils_mappers_contributormatcher_is_subclass_of_dict(self):
+        assert issubclass(ContributorMatcher, dict)
+
+    def test_utils_mappers_contributormatcher_from_text_mapping_order_priority(self):
+        matcher = ContributorMatcher({"Jane (jane, js)": 1, "Bob (d@bob, t@b0)": 2})
+        assert matcher.from_text("bob talked to JS") == 1
+        assert matcher.from_text("bob talked to j.s.") == 2
+        assert matcher.from_text("nobody") is None
+
+    def test_utils_mappers_contributormatcher_from_text_overlapping_patterns(self):
+        matcher = ContributorMatcher({"hers": 1, "Other (she, his)": 2, "he": 3})
+        assert matcher.from_text("ushers") == 1
+        assert matcher.from_text("usher") == 2
+        assert matcher.from_text("ahishe") == 2
+        assert matcher.from_text("the") == 3
+
+    def test_utils_mappers_contributormatcher_from_text_for_empty_name(self):
+        matcher = ContributorMatcher({"John (d@john, t@jd)": 1, "(d@x, t@y)": 2})
+        assert matcher.from_text("anything") == 2
+        assert matcher.from_text("t@jd") == 1
+
+    def test_utils_mappers_contributormatcher_builds_automaton_once(self, mocker):
+        matcher = ContributorMatcher({"John (d@john, t@jd)": 1})
+        mocked_build = mocker.spy(matcher, "_build_automaton")
+        matcher.from_text("john")
+        matcher.from_text("jd")
+        mocked_build.assert_called_once_with()
+
+    def test_utils_mappers_contributormatcher_rebuilds_after_change(self):
+        matcher = ContributorMatcher({"John (d@john, t@jd)": 1})
+        assert matcher.from_text("new user") is None
+        assert matcher.from_handle("new") is None
+        matcher["New (d@new, t@new1)"] = 2
+        assert matcher.from_text("new user") == 2
+        assert matcher.from_handle("new") == 2
+        matcher.update({"Other": 3})
+        assert matcher.from_text("other") == 3
+        del matcher["New (d@new, t@new1)"]
+        assert matcher.from_text("new user") is None
+        assert matcher.from_handle("d@new") is None
+
+    def test_utils_mappers_contributormatcher_from_handle(self):
+        matcher = ContributorMatcher(
+            {"John (g@John_Doe, u/johnd)": 1, "Jane (g@jane, d@john_doe)": 2}
+        )
+        assert matcher.from_handle("g@john_doe") == 1
+        assert matcher.from_handle("JOHN_DOE") == 1
+        assert matcher.from_handle("d@john_doe") == 2
+        assert matcher.from_handle("johnd") == 1
+        assert matcher.from_handle("jane") == 2
+        assert matcher.from_handle("john_d") is None
+
+    def test_utils_mappers_contributormatcher_from_handle_for_single_handle_name(
+        self,
+    ):
+        matcher = ContributorMatcher({"g@alice": 1, "u/bob": 2})
+        assert matcher.from_handle("alice") == 1
+        assert matcher.from_handle("g@alice") == 1
+        assert matcher.from_handle("bob") == 2
+        assert _identify_contributor_from_user("alice", matcher, strict=False) == 1
+
+    def test_utils_mappers_contributormatcher_add_handles(self):
+        matcher = ContributorMatcher({"Alice": 1, "Bob (g@bob, d@bobby)": 2})
+        assert matcher.from_handle("alice_gh") is None
+        matcher.add_handles([("g@Alice_GH", 1), ("d@bob", 1)])
+        assert matcher.from_handle("alice_gh") == 1
+        assert matcher.from_handle("g@alice_gh") == 1
+        assert matcher.from_handle("bob") == 2
+        matcher["Carol"] = 3
+        assert matcher.from_handle("alice_gh") == 1
+
+
+@pytest.mark.django_db
+class TestUtilsMappersMappingContext:
+    """Testing class for :class:`utils.mappers.MappingContext` lookups."""
+
+    def _populate(self):
+        github = SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        discord = SocialPlatform.objects.create(name="Discord", prefix="d@")
+        contributor = Contributor.objects.create(name="Jane")
+        Handle.objects.create(contributor=contributor, platform=github, handle="jane")
+        reward_type = RewardType.objects.create(label="F", name="Feature Request")
+        rewards = [
+            Reward.objects.create(type=reward_type, level=1, amount=10),
+            Reward.objects.create(type=reward_type, level=1, amount=20, active=False),
+            Reward.objects.create(type=reward_type, level=2, amount=30),
+        ]
+        cycles = [
+            Cycle.objects.create(start="2024-01-01", end="2024-01-31"),
+            Cycle.objects.create(start="2024-02-01", end="2024-02-29"),
+            Cycle.objects.create(start="2024-03-01"),
+        ]
+        return github, discord, contributor, rewards, cycles
+
+    def test_utils_mappers_mappingcontext_init_fetches_lookups(self, mocker):
+        github, discord, contributor, rewards, cycles = self._populate()
+        mocked_build = mocker.patch(
+            "utils.mappers._build_reward_mapping", return_value={"bug": rewards[0]}
+        )
+
+        context = MappingContext()
+
+        assert context.contributors == {contributor.info: contributor.id}
+        assert isinstance(context.contributors, ContributorMatcher)
+        assert context.platforms == {"GitHub": github.id, "Discord": discord.id}
+        assert context.platform_names == {github.id: "github", discord.id: "discord"}
+        assert context.rewards == {
+            ("F", 1, True): rewards[0],
+            ("F", 1, False): rewards[1],
+            ("F", 2, True): rewards[2],
+        }
+        mocked_build.assert_called_once_with(rewards)
+        assert context.reward_mapping == {"bug": rewards[0]}
+        assert context.cycles == cycles
+        assert context.issue_url_pattern.pattern.endswith("/issues/(\\d+).*")
+
+    def test_utils_mappers_mappingcontext_init_adds_handle_records(self):
+        github = self._populate()[0]
+        contributor = Contributor.objects.create(name="Alice")
+        Handle.objects.create(contributor=contributor, platform=github, handle="ally")
+        context = MappingContext()
+        assert context.contributors.from_handle("ally") == contributor.id
+        assert context.contributors.from_handle("g@ally") == contributor.id
+
+    def test_utils_mappers_mappingcontext_init_skips_excluded_contributors(
+        self, mocker
+    ):
+        self._populate()
+        mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", ("Jane",))
+        assert MappingContext().contributors == {}
+
+    def test_utils_mappers_mappingcontext_init_for_no_cycles(self):
+        context = MappingContext()
+        assert context.cycles == []
+        with pytest.raises(Cycle.DoesNotExist):
+            context.latest_cycle("end")
+
+    def test_utils_mappers_mappingcontext_latest_cycle(self, django_assert_num_queries):
+        longest = Cycle.objects.create(start="2024-01-01", end="2024-12-31")
+        latest = Cycle.objects.create(start="2024-02-01", end="2024-02-29")
+        context = MappingContext()
+        with django_assert_num_queries(2):
+            assert context.latest_cycle("end") == longest
+            assert context.latest_cycle("start") == latest
+            assert context.latest_cycle("end") == longest
+
+    def test_utils_mappers_mappingcontext_init_number_of_queries(self, query_budget):
+        self._populate()
+        with query_budget(5):
+            MappingContext()
 
-    def test_utils_mappers_custom_issue_initialization(self, mocker):
-        """Test basic initialization."""
-        mock_issue = mocker.MagicMock()
-        mock_issue.number = 101
+    @pytest.mark.parametrize(
+        "moment,index",
+        [
+            (datetime(2024, 1, 1), 0),
+            (datetime(2024, 1, 31, 23, 59), 0),
+            (datetime(2024, 2, 10, tzinfo=timezone.utc), 1),
+            (datetime(2024, 3, 1, tzinfo=timezone.utc), None),
+            (datetime(2023, 12, 31), None),
+        ],
+    )
+    def test_utils_mappers_mappingcontext_cycle_for(self, moment, index):
+        cycles = self._populate()[4]
+        context = MappingContext()
+        with mock.patch("utils.mappers.Cycle.objects") as mocked_cycles:
+            result = context.cycle_for(moment)
+
+        mocked_cycles.filter.assert_not_called()
+        assert result == (cycles[index] if index is not None else None)
 
-        custom_issue = CustomIssue(issue=mock_issue, comments=[])
 
-        assert custom_issue.issue == mock_issue
-        assert custom_issue.comments == []
+class TestUtilsMappersMappingReport:
+    """Testing class for :class:`utils.mappers.MappingReport`."""
 
-    def test_utils_mappers_custom_issue_with_comments(self, mocker):
-        """Test initialization with comments."""
-        mock_issue = mocker.MagicMock()
-        mock_issue.number = 102
+    def test_utils_mappers_mappingreport_init(self):
+        report = MappingReport()
+        assert report.stages == {}
+        assert report.outcomes == {}
+        assert report.github_requests == {}
 
-        comments = [mocker.MagicMock(), mocker.MagicMock()]
-        custom_issue = CustomIssue(issue=mock_issue, comments=comments)
+    @pytest.mark.django_db
+    def test_utils_mappers_mappingreport_stage_records_time_and_queries(self):
+        report = MappingReport()
+        with report.stage("first"):
+            Cycle.objects.count()
+            Cycle.objects.count()
+
+        with report.stage("second"):
+            pass
+
+        assert list(report.stages) == ["first", "second"]
+        assert report.stages["first"]["queries"] == 2
+        assert report.stages["first"]["seconds"] >= 0
+        assert report.stages["second"]["queries"] == 0
+
+    def test_utils_mappers_mappingreport_as_dict(self):
+        report = MappingReport()
+        report.stages = {
+            "fetch": {"seconds": 1.5, "queries": 0},
+            "open": {"seconds": 0.25, "queries": 7},
+        }
+        report.github_requests.update({"issues": 2, "comments": 3})
+        report.count("open", "examined", 5)
+        report.count("open", "mapped", 2)
+        report.count("open", "no_reward", 2)
+        report.count("open", "unclassified")
+        report.count("closed_archived", "examined", 0)
+
+        assert report.as_dict() == {
+            "seconds": 1.75,
+            "queries": 7,
+            "github_requests": 5,
+            "stages": report.stages,
+            "issues": {
+                "open": {
+                    "examined": 5,
+                    "mapped": 2,
+                    "skipped": {"no_reward": 2, "unclassified": 1},
+                },
+                "closed_archived": {"examined": 0, "mapped": 0, "skipped": {}},
+            },
+        }
 
-        assert custom_issue.issue == mock_issue
-        assert custom_issue.comments == comments
+    def test_utils_mappers_mappingreport_write(self, tmp_path):
+        report = MappingReport()
+        report.count("open", "examined", 3)
+        path = tmp_path / "report.json"
+
+        report.write(path)
+
+        assert json.loads(path.read_text()) == report.as_dict()
 
 
 class TestUtilsMappersHelpers:
     """Testing class for :py:mod:`utils.mappers` helper functions."""
 
     # # _build_reward_mapping
-    @pytest.mark.django_db
+    def _reward(self, mocker, label, amount, active=True):
+        return mocker.MagicMock(
+            type=mocker.MagicMock(label=label), amount=amount, active=active
+        )
+
     def test_utils_mappers_build_reward_mapping_success(self, mocker):
         """Test _build_reward_mapping successfully builds mapping."""
-        # Mock Reward objects
-        mock_reward1 = mocker.MagicMock()
-        mock_reward2 = mocker.MagicMock()
-
-        # Mock REWARDS_COLLECTION to return known values
         mock_rewards_collection = [
             ["[AT] Admin Task", 1000000],
             ["[F] Feature Request", 2000000],
         ]
         mocker.patch("utils.mappers.REWARDS_COLLECTION", mock_rewards_collection)
-
-        # Mock ISSUE_CREATION_LABEL_CHOICES
         mock_label_choices = [
             ("admin task", "Admin Task"),
             ("feature request", "Feature Request"),
         ]
         mocker.patch("utils.mappers.ISSUE_CREATION_LABEL_CHOICES", mock_label_choices)
+        mock_reward1 = self._reward(mocker, "AT", 1000000)
+        mock_reward2 = self._reward(mocker, "F", 2000000)
+        rewards = [
+            self._reward(mocker, "AT", 1000000, active=False),
+            self._reward(mocker, "AT", 2000000),
+            mock_reward2,
+            mock_reward1,
+        ]
 
-        # Mock Reward.objects.get to return rewards
-        mocker.patch(
-            "utils.mappers.Reward.objects.get", side_effect=[mock_reward1, mock_reward2]
-        )
-
-        result = _build_reward_mapping()
+        result = _build_reward_mapping(rewards)
 
-        assert "admin task" in result
-        assert "feature request" in result
-        assert result["admin task"] == mock_reward1
-        assert result["feature request"] == mock_reward2
+        assert result == {"admin task": mock_reward1, "feature request": mock_reward2}
 
-    @pytest.mark.django_db
     def test_utils_mappers_build_reward_mapping_no_reward_found(self, mocker):
         """Test _build_reward_mapping when no reward is found."""
         mock_rewards_collection = [
             ["[AT] Admin Task", 1000000],
         ]
         mocker.patch("utils.mappers.REWARDS_COLLECTION", mock_rewards_collection)
-
         mock_label_choices = [
             ("admin task", "Admin Task"),
         ]
         mocker.patch("utils.mappers.ISSUE_CREATION_LABEL_CHOICES", mock_label_choices)
+        mocked_print = mocker.patch("utils.mappers.print")
 
-        # Mock Reward.DoesNotExist
-        mocker.patch(
-            "utils.mappers.Reward.objects.get",
-            side_effect=Reward.DoesNotExist("No reward found"),
-        )
-
-        result = _build_reward_mapping()
+        result = _build_reward_mapping([self._reward(mocker, "F", 1000000)])
 
         assert result == {}
+        mocked_print.assert_called_once_with(
+            "No active reward found for AT with amount 1000000"
+        )
 
-    @pytest.mark.django_db
     def test_utils_mappers_build_reward_mapping_multiple_rewards(self, mocker):
         """Test _build_reward_mapping when multiple rewards are found."""
         mock_rewards_collection = [
             ["[AT] Admin Task", 1000000],
         ]
         mocker.patch("utils.mappers.REWARDS_COLLECTION", mock_rewards_collection)
-
         mock_label_choices = [
             ("admin task", "Admin Task"),
         ]
         mocker.patch("utils.mappers.ISSUE_CREATION_LABEL_CHOICES", mock_label_choices)
+        mocked_print = mocker.patch("utils.mappers.print")
+        mock_reward = self._reward(mocker, "AT", 1000000)
 
-        mock_reward = mocker.MagicMock()
-
-        # Mock MultipleObjectsReturned and then first()
-        mocker.patch(
-            "utils.mappers.Reward.objects.get",
-            side_effect=Reward.MultipleObjectsReturned("Multiple rewards"),
-        )
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter",
-            return_value=mocker.MagicMock(first=lambda: mock_reward),
+        result = _build_reward_mapping(
+            [mock_reward, self._reward(mocker, "AT", 1000000)]
         )
 
-        result = _build_reward_mapping()
-
-        assert "admin task" in result
-        assert result["admin task"] == mock_reward
+        assert result == {"admin task": mock_reward}
+        mocked_print.assert_called_once_with(
+            "Multiple rewards found for AT, using first one"
+        )
 
-    @pytest.mark.django_db
     def test_utils_mappers_build_reward_mapping_no_bracket_match(self, mocker):
         """Test _build_reward_mapping when no bracket pattern is found."""
         mock_rewards_collection = [
@@ -171,413 +388,246 @@ class TestUtilsMappersHelpers:
         ]
         mocker.patch("utils.mappers.ISSUE_CREATION_LABEL_CHOICES", mock_label_choices)
 
-        result = _build_reward_mapping()
+        result = _build_reward_mapping([self._reward(mocker, "AT", 1000000)])
 
         assert result == {}
 
     # # _extract_url_text
-    @pytest.mark.django_db
-    def test_utils_mappers_extract_url_text_markdown_link(self, mocker):
+    def test_utils_mappers_extract_url_text_markdown_link(self):
         """Test _extract_url_text with markdown link."""
         body = "Check this [Discord link](https://discord.com/channels/123/456)"
-        platform_id = 1
 
-        # Mock SocialPlatform
-        mock_platform = mocker.MagicMock()
-        mock_platform.name = "Discord"
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.get", return_value=mock_platform
-        )
-
-        result = _extract_url_text(body, platform_id)
+        result = _extract_url_text(body, "discord")
 
         assert result == "https://discord.com/channels/123/456"
 
-    @pytest.mark.django_db
-    def test_utils_mappers_extract_url_text_multiple_links(self, mocker):
+    def test_utils_mappers_extract_url_text_multiple_links(self):
         """Test _extract_url_text with multiple markdown links."""
         body = """
         Check these links:
         [GitHub issue](https://github.com/user/repo/issues/123)
+        [Discord invite](https://discord.com/invite/abc)
         [Discord channel](https://discord.com/channels/123/456)
         """
-        platform_id = 1
 
-        mock_platform = mocker.MagicMock()
-        mock_platform.name = "Discord"
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.get", return_value=mock_platform
-        )
-
-        result = _extract_url_text(body, platform_id)
+        result = _extract_url_text(body, "discord")
 
         assert result == "https://discord.com/channels/123/456"
 
-    @pytest.mark.django_db
-    def test_utils_mappers_extract_url_text_no_matching_platform(self, mocker):
+    def test_utils_mappers_extract_url_text_no_matching_platform(self):
         """Test _extract_url_text with no matching platform in URLs."""
         body = "Check [GitHub issue](https://github.com/user/repo/issues/123)"
-        platform_id = 1
 
-        mock_platform = mocker.MagicMock()
-        mock_platform.name = "Discord"
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.get", return_value=mock_platform
-        )
-
-        result = _extract_url_text(body, platform_id)
+        result = _extract_url_text(body, "discord")
 
         assert result is None
 
-    @pytest.mark.django_db
-    def test_utils_mappers_extract_url_text_platform_not_found(self, mocker):
+    def test_utils_mappers_extract_url_text_platform_not_found(self):
         """Test _extract_url_text when platform is not found."""
         body = "Some text with [link](https://example.com)"
-        platform_id = 999
-
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.get",
-            side_effect=SocialPlatform.DoesNotExist("Platform not found"),
-        )
 
-        result = _extract_url_text(body, platform_id)
+        result = _extract_url_text(body, None)
 
         assert result is None
 
-    @pytest.mark.django_db
-    def test_utils_mappers_extract_url_text_no_markdown_links(self, mocker):
+    def test_utils_mappers_extract_url_text_no_markdown_links(self):
         """Test _extract_url_text with no markdown links."""
         body = "Just plain text without any markdown links"
-        platform_id = 1
-
-        mock_platform = mocker.MagicMock()
-        mock_platform.name = "Discord"
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.get", return_value=mock_platform
-        )
 
-        result = _extract_url_text(body, platform_id)
+        result = _extract_url_text(body, "discord")
 
         assert result is None
 
     # # _fetch_and_categorize_issues
-    def test_utils_mappers_fetch_and_categorize_issues_no_token(self, mocker):
-        """Test _fetch_and_categorize_issues returns saved issues when no token provided."""
-        saved_issues = {
-            "closed": ["issue1"],
-            "open": ["issue2"],
-            "timestamp": "2024-01-01",
-        }
-
-        mocker.patch("utils.mappers._load_saved_issues", return_value=saved_issues)
+    def _record(self, number, state="open", day=2, comments=()):
+        return IssueRecord(
+            number,
+            state,
+            title=f"Issue {number}",
+            body="body",
+            author="author",
+            updated_at=datetime(2024, 1, day, tzinfo=timezone.utc),
+            comments=comments,
+        )
 
-        result = _fetch_and_categorize_issues("", refetch=False)
+    def _fetched(self, mocker, records):
+        return mocker.patch("utils.mappers.fetch_issue_records", return_value=records)
 
-        assert result == saved_issues
+    @pytest.fixture
+    def issues_cache(self, mocker, tmp_path):
+        cache = GitHubIssuesCache(tmp_path / "github_issues.db")
+        mocker.patch(
+            "utils.mappers.GitHubIssuesCache",
+            side_effect=lambda: GitHubIssuesCache(tmp_path / "github_issues.db"),
+        )
+        yield cache
+        cache.cleanup()
 
-    def test_utils_mappers_fetch_and_categorize_issues_refetch_false_uses_saved(
-        self, mocker
+    def test_utils_mappers_fetch_and_categorize_issues_no_token(
+        self, mocker, issues_cache
     ):
-        """Test _fetch_and_categorize_issues uses saved issues when refetch is False."""
-        saved_issues = {
-            "closed": ["issue1"],
-            "open": ["issue2"],
-            "timestamp": "2024-01-01",
-        }
-
-        mocker.patch("utils.mappers._load_saved_issues", return_value=saved_issues)
-        mocker.patch("utils.mappers.fetch_issues", return_value=[])
+        """Test _fetch_and_categorize_issues returns cached issues without token."""
+        _save_issues(
+            issues_cache,
+            [
+                self._record(1, "closed"),
+                self._record(2, comments=["comment"]),
+            ],
+            datetime(2024, 1, 3, tzinfo=timezone.utc),
+        )
+        mocked_fetch = self._fetched(mocker, [])
 
-        result = _fetch_and_categorize_issues("valid_token", refetch=False)
+        result = _fetch_and_categorize_issues("", refetch=False)
 
-        assert result == saved_issues
+        mocked_fetch.assert_not_called()
+        assert [issue.number for issue in result["closed"]] == [1]
+        assert [issue.number for issue in result["open"]] == [2]
+        assert result["open"][0].comments == ("comment",)
 
-    def test_utils_mappers_fetch_and_categorize_issues_refetch_true_fetches_new(
-        self, mocker
+    def test_utils_mappers_fetch_and_categorize_issues_uses_cached_timestamp(
+        self, mocker, issues_cache
     ):
-        """Test _fetch_and_categorize_issues fetches new issues when refetch is True."""
-
-        new_issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2, 10, 30, 0),
-            ),
-            mocker.MagicMock(
-                state="open",
-                number=102,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2, 11, 45, 0),
-            ),
-        ]
+        """Test _fetch_and_categorize_issues fetches issues updated after cache's sync."""
+        timestamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        issues_cache.set_timestamp(timestamp)
+        mocked_fetch = self._fetched(mocker, [])
 
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mock_fetch_issues = mocker.patch(
-            "utils.mappers.fetch_issues", return_value=new_issues
-        )
-        mocker.patch("utils.mappers._save_issues")
+        report = MappingReport()
 
-        result = _fetch_and_categorize_issues("valid_token", refetch=True)
+        _fetch_and_categorize_issues("valid_token", refetch=False, report=report)
 
-        mock_fetch_issues.assert_called_once()
-        assert len(result["closed"]) == 1
-        assert len(result["open"]) == 1
-        assert result["closed"][0].issue.number == 101
-        assert result["open"][0].issue.number == 102
+        mocked_fetch.assert_called_once_with(
+            "valid_token", since=timestamp, counter=report.github_requests
+        )
 
-    def test_utils_mappers_fetch_and_categorize_issues_saves_every_10_issues(
-        self, mocker
+    def test_utils_mappers_fetch_and_categorize_issues_uses_default_since(
+        self, mocker, issues_cache
     ):
-        """Test _fetch_and_categorize_issues saves progress every 10 issues."""
-
-        issues = []
-        for i in range(25):
-            issue = mocker.MagicMock(
-                state="open" if i % 2 == 0 else "closed",
-                number=100 + i,
-                pull_request=None,
-                updated_at=datetime(2024, 1, i + 1),
-            )
-            issues.append(issue)
+        """Test _fetch_and_categorize_issues uses default since for empty cache."""
+        mocked_fetch = self._fetched(mocker, [])
 
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mocker.patch("utils.mappers.fetch_issues", return_value=issues)
-        mock_save_issues = mocker.patch("utils.mappers._save_issues")
-
-        _fetch_and_categorize_issues("valid_token", refetch=True)
+        _fetch_and_categorize_issues("valid_token", refetch=False)
 
-        # Should save at issues 9, 19 (0-indexed: 10th, 20th) and at the end
-        # 10th (index 9), 20th (index 19), and final (25th)
-        assert mock_save_issues.call_count == 4
+        mocked_fetch.assert_called_once_with(
+            "valid_token", since=GITHUB_ISSUES_START_DATE, counter=None
+        )
 
-    def test_utils_mappers_fetch_and_categorize_issues_uses_since_parameter(
-        self, mocker
+    def test_utils_mappers_fetch_and_categorize_issues_refetch_clears_cache(
+        self, mocker, issues_cache
     ):
-        """Test _fetch_and_categorize_issues uses since parameter from saved issues."""
-
-        saved_issues = {"closed": ["old_issue"], "timestamp": datetime(2024, 1, 1)}
-        new_issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-        ]
-
-        mocker.patch("utils.mappers._load_saved_issues", return_value=saved_issues)
-        mock_fetch_issues = mocker.patch(
-            "utils.mappers.fetch_issues", return_value=new_issues
+        """Test _fetch_and_categorize_issues refetches everything when refetch is True."""
+        _save_issues(
+            issues_cache,
+            [self._record(1)],
+            datetime(2024, 1, 3, tzinfo=timezone.utc),
         )
-        mocker.patch("utils.mappers._save_issues")
-
-        _fetch_and_categorize_issues("valid_token", refetch=False)
-
-        # Should use timestamp from saved issues as since parameter
-        mock_fetch_issues.assert_called_once_with(
-            "valid_token", state="all", since=datetime(2024, 1, 1)
+        mocked_fetch = self._fetched(
+            mocker,
+            [
+                self._record(101, "closed"),
+                self._record(102, "open", day=3),
+            ],
         )
 
-    def test_utils_mappers_fetch_and_categorize_issues_uses_default_since(self, mocker):
-        """Test _fetch_and_categorize_issues uses default since when no saved timestamp."""
-
-        saved_issues = {"closed": ["old_issue"]}  # No timestamp
-        new_issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-        ]
+        result = _fetch_and_categorize_issues("valid_token", refetch=True)
 
-        mocker.patch("utils.mappers._load_saved_issues", return_value=saved_issues)
-        mock_fetch_issues = mocker.patch(
-            "utils.mappers.fetch_issues", return_value=new_issues
+        mocked_fetch.assert_called_once_with(
+            "valid_token", since=GITHUB_ISSUES_START_DATE, counter=None
+        )
+        assert [issue.number for issue in result["closed"]] == [101]
+        assert [issue.number for issue in result["open"]] == [102]
+        assert issues_cache.timestamp() == datetime(
+            2024, 1, 3, tzinfo=timezone.utc
+        ) + timedelta(seconds=10)
+
+    def test_utils_mappers_fetch_and_categorize_issues_upserts_changed_issues(
+        self, mocker, issues_cache
+    ):
+        """Test _fetch_and_categorize_issues replaces cached issues changing state."""
+        _save_issues(
+            issues_cache,
+            [
+                self._record(1),
+                self._record(2),
+            ],
+            datetime(2024, 1, 2, tzinfo=timezone.utc),
         )
-        mocker.patch("utils.mappers._save_issues")
+        self._fetched(mocker, [self._record(1, "closed", day=5)])
 
-        _fetch_and_categorize_issues("valid_token", refetch=True)
+        result = _fetch_and_categorize_issues("valid_token")
 
-        # Should use GITHUB_ISSUES_START_DATE as since parameter
-        from utils.constants.core import GITHUB_ISSUES_START_DATE
+        assert [issue.number for issue in result["closed"]] == [1]
+        assert [issue.number for issue in result["open"]] == [2]
 
-        mock_fetch_issues.assert_called_once_with(
-            "valid_token", state="all", since=GITHUB_ISSUES_START_DATE
+    def test_utils_mappers_fetch_and_categorize_issues_saves_every_10_issues(
+        self, mocker, issues_cache
+    ):
+        """Test _fetch_and_categorize_issues saves progress every 10 issues."""
+        self._fetched(
+            mocker,
+            [self._record(100 + i, day=i + 1) for i in range(25)],
+        )
+        mocked_save = mocker.patch(
+            "utils.mappers._save_issues", wraps=utils.mappers._save_issues
         )
-
-    def test_utils_mappers_fetch_and_categorize_issues_empty_fetch(self, mocker):
-        """Test _fetch_and_categorize_issues handles empty fetch results."""
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mocker.patch("utils.mappers.fetch_issues", return_value=[])
-        mock_save_issues = mocker.patch("utils.mappers._save_issues")
 
         result = _fetch_and_categorize_issues("valid_token", refetch=True)
 
-        assert result == defaultdict(list)
-        mock_save_issues.assert_not_called()  # No issues to save
-
-    def test_utils_mappers_fetch_and_categorize_issues_only_pull_requests(self, mocker):
-        """Test _fetch_and_categorize_issues when all results are pull requests."""
-
-        issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=True,
-                updated_at=datetime(2024, 1, 2),
-            ),
-            mocker.MagicMock(
-                state="open",
-                number=102,
-                pull_request=True,
-                updated_at=datetime(2024, 1, 2),
-            ),
+        # 1st, 11th, 21st and final save, each with issues fetched since the last one
+        assert mocked_save.call_count == 4
+        assert [len(call.args[1]) for call in mocked_save.call_args_list] == [
+            1,
+            10,
+            10,
+            4,
         ]
+        assert len(result["open"]) == 25
 
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mocker.patch("utils.mappers.fetch_issues", return_value=issues)
-        mock_save_issues = mocker.patch("utils.mappers._save_issues")
+    def test_utils_mappers_fetch_and_categorize_issues_empty_fetch(
+        self, mocker, issues_cache
+    ):
+        """Test _fetch_and_categorize_issues handles empty fetch results."""
+        self._fetched(mocker, [])
+        mocked_save = mocker.patch("utils.mappers._save_issues")
 
         result = _fetch_and_categorize_issues("valid_token", refetch=True)
 
-        assert result["closed"] == []
-        assert result["open"] == []
-        # Should still save at the end even with no regular issues
-        mock_save_issues.assert_called_once()
+        assert result == defaultdict(list)
+        mocked_save.assert_not_called()
+        assert issues_cache.timestamp() is None
 
-    def test_utils_mappers_fetch_and_categorize_issues_progress_printing(self, mocker):
+    def test_utils_mappers_fetch_and_categorize_issues_progress_printing(
+        self, mocker, issues_cache
+    ):
         """Test _fetch_and_categorize_issues prints progress every 10 issues."""
-
-        issues = []
-        for i in range(15):
-            issue = mocker.MagicMock(
-                state="open",
-                number=100 + i,
-                pull_request=None,
-                updated_at=datetime(2024, 1, i + 1),
-            )
-            issues.append(issue)
-
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mocker.patch("utils.mappers.fetch_issues", return_value=issues)
-        mocker.patch("utils.mappers._save_issues")
+        self._fetched(
+            mocker,
+            [self._record(100 + i, day=i + 1) for i in range(15)],
+        )
         mock_print = mocker.patch("builtins.print")
 
         _fetch_and_categorize_issues("valid_token", refetch=True)
 
-        # Should print at issue numbers 100, 110 (0-indexed: 1st, 11th)
         print_calls = [
             call for call in mock_print.call_args_list if "Issue number:" in str(call)
         ]
-        assert len(print_calls) == 2
-        # Check the actual call arguments
-        assert print_calls[0] == mock.call("Issue number: ", 100)
-        assert print_calls[1] == mock.call("Issue number: ", 110)
-
-    def test_utils_mappers_fetch_and_categorize_issues_final_count_print(self, mocker):
-        """Test _fetch_and_categorize_issues prints final count."""
-
-        issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-            mocker.MagicMock(
-                state="open",
-                number=102,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-            mocker.MagicMock(
-                state="closed",
-                number=103,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-        ]
-
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mocker.patch("utils.mappers.fetch_issues", return_value=issues)
-        mocker.patch("utils.mappers._save_issues")
-        mock_print = mocker.patch("builtins.print")
-
-        _fetch_and_categorize_issues("valid_token", refetch=True)
-
-        # Should print final count
-        final_print_call = mock_print.call_args_list[-1]
-        assert "Number of issues: 3" in str(final_print_call)
-
-    def test_utils_mappers_fetch_and_categorize_issues_mixed_states(self, mocker):
-        issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-            mocker.MagicMock(
-                state="open",
-                number=102,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-            mocker.MagicMock(
-                state="closed",
-                number=103,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-            mocker.MagicMock(
-                state="open",
-                number=104,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
-        ]
-
-        mocker.patch("utils.mappers._load_saved_issues", return_value=defaultdict(list))
-        mocker.patch("utils.mappers.fetch_issues", return_value=issues)
-        mocker.patch("utils.mappers._save_issues")
-
-        result = _fetch_and_categorize_issues("valid_token", refetch=True)
-
-        assert len(result["closed"]) == 2
-        assert len(result["open"]) == 2
-        assert result["closed"][0].issue.number == 101
-        assert result["closed"][1].issue.number == 103
-        assert result["open"][0].issue.number == 102
-        assert result["open"][1].issue.number == 104
-
-    def test_utils_mappers_fetch_and_categorize_issues_handles_missing_keys_in_print(
-        self, mocker
-    ):
-
-        issues = [
-            mocker.MagicMock(
-                state="closed",
-                number=101,
-                pull_request=None,
-                updated_at=datetime(2024, 1, 2),
-            ),
+        assert print_calls == [
+            mock.call("Issue number: ", 100),
+            mock.call("Issue number: ", 110),
         ]
+        assert "Number of issues: 15" in str(mock_print.call_args_list[-1])
 
-        # Mock _load_saved_issues to return a dict without 'open' key
-        saved_issues = {"closed": [], "timestamp": datetime(2024, 1, 1)}
-        mocker.patch("utils.mappers._load_saved_issues", return_value=saved_issues)
-
-        mocker.patch("utils.mappers.fetch_issues", return_value=issues)
-        mocker.patch("utils.mappers._save_issues")
-        mock_print = mocker.patch("builtins.print")
+    def test_utils_mappers_fetch_and_categorize_issues_closes_cache(self, mocker):
+        """Test _fetch_and_categorize_issues closes cache on fetching error."""
+        mocked_cache = mocker.patch("utils.mappers.GitHubIssuesCache")
+        mocker.patch(
+            "utils.mappers.fetch_issue_records", side_effect=ValueError("error")
+        )
 
-        # This should not raise TypeError
-        _fetch_and_categorize_issues("valid_token", refetch=True)
+        with pytest.raises(ValueError):
+            _fetch_and_categorize_issues("valid_token")
 
-        # Verify the print was called successfully
-        mock_print.assert_called()
+        mocked_cache.return_value.cleanup.assert_called_once_with()
 
     # # _identify_contributor_from_text
     def test_utils_mappers_identify_contributor_from_text_name_part_match(self):
@@ -942,7 +992,7 @@ class TestUtilsMappersHelpers:
         assert result is None
 
     def test_utils_mappers_identify_contributor_from_user_partial_match_strict(self):
-        """Test partial match within contributor info when strict=True."""
+        """Test partial handle doesn't match when strict=True."""
         # Setup
         user = "john"
         contributors = {
@@ -954,13 +1004,13 @@ class TestUtilsMappersHelpers:
         # Execute
         result = _identify_contributor_from_user(user, contributors, strict=True)
 
-        # Assert - should match both john_doe and johnny_cash due to partial match
-        assert result == 1  # First match
+        # Assert - handles are matched exactly
+        assert result is None
 
     def test_utils_mappers_identify_contributor_from_user_partial_match_non_strict(
         self,
     ):
-        """Test partial match within contributor info when strict=False."""
+        """Test partial handle doesn't match when strict=False."""
         # Setup
         user = "john"
         contributors = {
@@ -972,8 +1022,16 @@ class TestUtilsMappersHelpers:
         # Execute
         result = _identify_contributor_from_user(user, contributors, strict=False)
 
-        # Assert - should match both
-        assert result == 1  # First match
+        # Assert - handles are matched exactly
+        assert result is None
+
+    def test_utils_mappers_identify_contributor_from_user_name_match_non_strict(self):
+        """Test contributor's name and simple info match when strict=False."""
+        contributors = {"John (d@johnny, t@jd)": 1, "Jane": 2}
+
+        assert _identify_contributor_from_user("JOHN", contributors, strict=False) == 1
+        assert _identify_contributor_from_user("jane", contributors, strict=False) == 2
+        assert _identify_contributor_from_user("john", contributors) is None
 
     def test_utils_mappers_identify_contributor_from_user_empty_contributors(self):
         """Test with empty contributors dictionary."""
@@ -1053,15 +1111,15 @@ class TestUtilsMappersHelpers:
         user = "john"
         contributors = {
             "John Doe (g@john_doe, t@johndoe)": 1,
-            "John Smith (g@john_smith)": 2,  # Also matches
-            "Johnny Cash (g@johnny)": 3,  # Also matches
+            "John Smith (g@john, t@jsmith)": 2,  # Matches
+            "Johnny Cash (g@john, d@johnny)": 3,  # Also matches
         }
 
         # Execute
         result = _identify_contributor_from_user(user, contributors, strict=True)
 
         # Assert - should return first match
-        assert result == 1
+        assert result == 2
 
     def test_utils_mappers_identify_contributor_from_user_with_magicmock(self):
         """Test using MagicMock for contributors."""
@@ -1183,7 +1241,7 @@ class TestUtilsMappersHelpers:
         assert result_non_strict == 1  # Matches both, returns first
 
     def test_utils_mappers_identify_contributor_from_user_exact_handle_matching(self):
-        """Test that the function does substring matching, not exact handle matching."""
+        """Test that the function does exact handle matching, not substring matching."""
         # Setup
         user = "john"
         contributors = {
@@ -1194,8 +1252,8 @@ class TestUtilsMappersHelpers:
         # Execute
         result = _identify_contributor_from_user(user, contributors, strict=True)
 
-        # Assert - both match due to substring search, returns first
-        assert result == 1
+        # Assert
+        assert result == 2
 
     # # _identify_platform_from_text
     @pytest.mark.django_db
@@ -1251,12 +1309,7 @@ class TestUtilsMappersHelpers:
     @pytest.mark.django_db
     def test_utils_mappers_identify_reward_from_labels_exact_match(self, mocker):
         """Test _identify_reward_from_labels with exact label match."""
-        mock_label1 = mocker.MagicMock()
-        mock_label1.name = "admin task"
-        mock_label2 = mocker.MagicMock()
-        mock_label2.name = "other label"
-
-        labels = [mock_label1, mock_label2]
+        labels = ["admin task", "other label"]
         reward_mapping = {"admin task": "reward1", "feature request": "reward2"}
 
         result = _identify_reward_from_labels(labels, reward_mapping)
@@ -1266,10 +1319,7 @@ class TestUtilsMappersHelpers:
     @pytest.mark.django_db
     def test_utils_mappers_identify_reward_from_labels_case_insensitive(self, mocker):
         """Test _identify_reward_from_labels is case insensitive."""
-        mock_label = mocker.MagicMock()
-        mock_label.name = "ADMIN TASK"
-
-        labels = [mock_label]
+        labels = ["ADMIN TASK"]
         reward_mapping = {"admin task": "reward1"}
 
         result = _identify_reward_from_labels(labels, reward_mapping)
@@ -1279,10 +1329,7 @@ class TestUtilsMappersHelpers:
     @pytest.mark.django_db
     def test_utils_mappers_identify_reward_from_labels_no_match(self, mocker):
         """Test _identify_reward_from_labels with no matching labels."""
-        mock_label = mocker.MagicMock()
-        mock_label.name = "unrelated label"
-
-        labels = [mock_label]
+        labels = ["unrelated label"]
         reward_mapping = {"admin task": "reward1"}
 
         result = _identify_reward_from_labels(labels, reward_mapping)
@@ -1302,10 +1349,7 @@ class TestUtilsMappersHelpers:
     @pytest.mark.django_db
     def test_utils_mappers_identify_reward_from_labels_empty_mapping(self, mocker):
         """Test _identify_reward_from_labels with empty reward mapping."""
-        mock_label = mocker.MagicMock()
-        mock_label.name = "admin task"
-
-        labels = [mock_label]
+        labels = ["admin task"]
         reward_mapping = {}
 
         result = _identify_reward_from_labels(labels, reward_mapping)
@@ -1314,14 +1358,7 @@ class TestUtilsMappersHelpers:
 
     def test_utils_mappers_identify_reward_from_labels_partial_match(self, mocker):
         """Test _identify_reward_from_labels returns reward for partial label match."""
-        # Mock label objects
-        mock_label1 = mocker.MagicMock()
-        mock_label1.name = "admin task priority"  # Contains "admin task" as exact words
-
-        mock_label2 = mocker.MagicMock()
-        mock_label2.name = "other-label"
-
-        labels = [mock_label1, mock_label2]
+        labels = ["admin task priority", "other-label"]
 
         # Mock reward mapping
         mock_reward = mocker.MagicMock()
@@ -1336,432 +1373,99 @@ class TestUtilsMappersHelpers:
         assert result == mock_reward
 
     # # _identify_reward_from_issue_title
-    def test_utils_mappers_identify_reward_from_issue_title_empty_title(self, mocker):
-        """Test that empty title returns None."""
-        # Mock get_object_or_404 to ensure it's not called
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
-
-        result = _identify_reward_from_issue_title("")
-
-        assert result is None
-        mock_get_object_or_404.assert_not_called()
-
-    def test_utils_mappers_identify_reward_from_issue_title_none_title(self, mocker):
-        """Test that None title returns None."""
-        # Mock get_object_or_404 to ensure it's not called
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
-
-        result = _identify_reward_from_issue_title(None)
-
-        assert result is None
-        mock_get_object_or_404.assert_not_called()
-
-    def test_utils_mappers_identify_reward_from_issue_title_no_pattern_match(
-        self, mocker
-    ):
-        """Test that title without reward pattern returns None."""
-        # Mock get_object_or_404 to ensure it's not called
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
-
-        result = _identify_reward_from_issue_title(
-            "Regular issue title without pattern"
-        )
-
-        assert result is None
-        mock_get_object_or_404.assert_not_called()
-
-    def test_utils_mappers_identify_reward_from_issue_title_pattern_in_middle(
-        self, mocker
+    @pytest.mark.parametrize(
+        "title",
+        [
+            "",
+            None,
+            "Regular issue title without pattern",
+            "Some text [F1] more text",
+            "[F0] Invalid level",
+            "[F4] Invalid level",
+            "[F10] Invalid level",
+            "[f1] lowercase label",
+            "[at3] lowercase label",
+            "[F1",
+            "F1]",
+            "[F 1]",
+            "[F-1]",
+            "[]",
+            "[F]",
+            "[1]",
+            "(F1)",
+            "{F1}",
+        ],
+    )
+    def test_utils_mappers_identify_reward_from_issue_title_no_match(
+        self, mocker, title
     ):
-        """Test that pattern not at start of title returns None."""
-        # Mock get_object_or_404 to ensure it's not called
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
+        """Test that title without valid reward pattern returns None."""
+        rewards = mocker.MagicMock()
 
-        result = _identify_reward_from_issue_title("Some text [F1] more text")
+        result = _identify_reward_from_issue_title(title, rewards)
 
         assert result is None
-        mock_get_object_or_404.assert_not_called()
-
-    def test_utils_mappers_identify_reward_from_issue_title_pattern_with_whitespace(
-        self, mocker
-    ):
-        """Test that pattern matches with leading/trailing whitespace."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("  [F1] Issue title with spaces  ")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="F")
-        mock_reward_filter.first.assert_called_once()
-
-    def test_utils_mappers_identify_reward_from_issue_title_valid_f1_pattern(
-        self, mocker
-    ):
-        """Test valid F1 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[F1] Fix bug in module")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="F")
-        mock_reward_filter.first.assert_called_once()
-
-    def test_utils_mappers_identify_reward_from_issue_title_valid_b2_pattern(
-        self, mocker
-    ):
-        """Test valid B2 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[B2] Build new feature")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="B")
-        mock_reward_filter.first.assert_called_once()
-
-    def test_utils_mappers_identify_reward_from_issue_title_valid_at3_pattern(
-        self, mocker
-    ):
-        """Test valid AT3 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[AT3] Advanced testing")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="AT")
-        mock_reward_filter.first.assert_called_once()
+        rewards.get.assert_not_called()
 
-    def test_utils_mappers_identify_reward_from_issue_title_valid_ct1_pattern(
-        self, mocker
-    ):
-        """Test valid CT1 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[CT1] Code review task")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="CT")
-        mock_reward_filter.first.assert_called_once()
-
-    def test_utils_mappers_identify_reward_from_issue_title_valid_ic2_pattern(
-        self, mocker
-    ):
-        """Test valid IC2 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[IC2] Integration challenge")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="IC")
-        mock_reward_filter.first.assert_called_once()
-
-    def test_utils_mappers_identify_reward_from_issue_title_valid_twr3_pattern(
-        self, mocker
-    ):
-        """Test valid TWR3 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[TWR3] Technical writing reward")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="TWR")
-        mock_reward_filter.first.assert_called_once()
-
-    def test_utils_mappers_identify_reward_from_issue_title_valid_d1_pattern(
-        self, mocker
+    @pytest.mark.parametrize(
+        "title,key",
+        [
+            ("[F1] Fix bug in module", ("F", 1, True)),
+            ("  [F1] Issue title with spaces  ", ("F", 1, True)),
+            ("[B2] Build new feature", ("B", 2, True)),
+            ("[AT3] Advanced testing", ("AT", 3, True)),
+            ("[CT1] Code review task", ("CT", 1, True)),
+            ("[IC2] Integration challenge", ("IC", 2, True)),
+            ("[TWR3] Technical writing reward", ("TWR", 3, True)),
+            ("[D1] Documentation task", ("D", 1, True)),
+            ("[ER2] Emergency response", ("ER", 2, True)),
+        ],
+    )
+    def test_utils_mappers_identify_reward_from_issue_title_valid_pattern(
+        self, mocker, title, key
     ):
-        """Test valid D1 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
+        """Test valid pattern returns reward by its label and level."""
         mock_reward = mocker.MagicMock(spec=Reward)
 
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[D1] Documentation task")
+        result = _identify_reward_from_issue_title(title, {key: mock_reward})
 
         assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="D")
-        mock_reward_filter.first.assert_called_once()
 
-    def test_utils_mappers_identify_reward_from_issue_title_valid_er2_pattern(
+    def test_utils_mappers_identify_reward_from_issue_title_all_reward_labels(
         self, mocker
     ):
-        """Test valid ER2 pattern returns reward."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
-        mock_reward = mocker.MagicMock(spec=Reward)
-
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[ER2] Emergency response")
-
-        assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="ER")
-        mock_reward_filter.first.assert_called_once()
+        """Test all valid reward labels from REWARD_LABELS."""
+        rewards = {
+            (label, level, True): mocker.MagicMock(spec=Reward)
+            for label in ["F", "B", "AT", "CT", "IC", "TWR", "D", "ER"]
+            for level in [1, 2, 3]
+        }
+        for (label, level, _), reward in rewards.items():
+            title = f"[{label}{level}] Test issue"
+            assert _identify_reward_from_issue_title(title, rewards) == reward
 
     def test_utils_mappers_identify_reward_from_issue_title_reward_not_found(
         self, mocker
     ):
         """Test that when reward doesn't exist, returns None."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
+        rewards = {("F", 2, True): mocker.MagicMock(spec=Reward)}
 
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return None
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
-        )
-
-        result = _identify_reward_from_issue_title("[F1] Fix bug")
+        result = _identify_reward_from_issue_title("[F1] Fix bug", rewards)
 
         assert result is None
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="F")
-        mock_reward_filter.first.assert_called_once()
 
     def test_utils_mappers_identify_reward_from_issue_title_inactive_reward(
         self, mocker
     ):
-        """Test that active=False parameter is passed correctly."""
-        mock_reward_type = mocker.MagicMock(spec=RewardType)
+        """Test that active=False parameter is used for lookup."""
         mock_reward = mocker.MagicMock(spec=Reward)
+        rewards = {("F", 1, True): mocker.MagicMock(), ("F", 1, False): mock_reward}
 
-        # Mock get_object_or_404 to return reward type
-        mock_get_object_or_404 = mocker.patch(
-            "utils.mappers.get_object_or_404", return_value=mock_reward_type
-        )
-
-        # Mock Reward.objects.filter().first() to return reward
-        mock_reward_filter = mocker.MagicMock()
-        mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-        mocked_filter = mocker.patch(
-            "utils.mappers.Reward.objects.filter", return_value=mock_reward_filter
+        result = _identify_reward_from_issue_title(
+            "[F1] Fix bug", rewards, active=False
         )
 
-        result = _identify_reward_from_issue_title("[F1] Fix bug", active=False)
-
         assert result == mock_reward
-        mock_get_object_or_404.assert_called_once_with(RewardType, label="F")
-        # Verify that Reward.objects.filter was called with active=False
-        mock_reward_filter.first.assert_called_once()
-        # Check the filter call arguments
-        mocked_filter.assert_called_once_with(
-            type=mock_reward_type, level=1, active=False
-        )
-
-    def test_utils_mappers_identify_reward_from_issue_title_all_reward_labels(
-        self, mocker
-    ):
-        """Test all valid reward labels from REWARD_LABELS."""
-        reward_labels = ["F", "B", "AT", "CT", "IC", "TWR", "D", "ER"]
-
-        for label in reward_labels:
-            for level in [1, 2, 3]:
-                mock_reward_type = mocker.MagicMock(spec=RewardType)
-                mock_reward = mocker.MagicMock(spec=Reward)
-
-                # Mock get_object_or_404 to return reward type
-                mock_get_object_or_404 = mocker.patch(
-                    "utils.mappers.get_object_or_404", return_value=mock_reward_type
-                )
-
-                # Mock Reward.objects.filter().first() to return reward
-                mock_reward_filter = mocker.MagicMock()
-                mock_reward_filter.first = mocker.MagicMock(return_value=mock_reward)
-                mocker.patch(
-                    "utils.mappers.Reward.objects.filter",
-                    return_value=mock_reward_filter,
-                )
-
-                title = f"[{label}{level}] Test issue"
-                result = _identify_reward_from_issue_title(title)
-
-                assert result == mock_reward
-                mock_get_object_or_404.assert_called_once_with(RewardType, label=label)
-                mock_reward_filter.first.assert_called_once()
-
-                # Reset mocks for next iteration
-                mocker.stopall()
-
-    def test_utils_mappers_identify_reward_from_issue_title_invalid_level(self, mocker):
-        """Test that invalid level (not 1,2,3) doesn't match pattern."""
-        # Mock get_object_or_404 to ensure it's not called
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
-
-        # Test levels outside valid range
-        invalid_titles = [
-            "[F0] Invalid level",
-            "[F4] Invalid level",
-            "[F9] Invalid level",
-            "[F10] Invalid level",
-        ]
-
-        for title in invalid_titles:
-            result = _identify_reward_from_issue_title(title)
-            assert result is None
-
-        # Verify get_object_or_404 was never called
-        mock_get_object_or_404.assert_not_called()
-
-    def test_utils_mappers_identify_reward_from_issue_title_case_sensitivity(
-        self, mocker
-    ):
-        """Test that pattern matching is case sensitive."""
-        # Mock get_object_or_404 to ensure it's not called for lowercase
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
-
-        # Test lowercase labels (should not match)
-        lowercase_titles = [
-            "[f1] lowercase label",
-            "[b2] lowercase label",
-            "[at3] lowercase label",
-        ]
-
-        for title in lowercase_titles:
-            result = _identify_reward_from_issue_title(title)
-            assert result is None
-
-        # Verify get_object_or_404 was never called for lowercase
-        mock_get_object_or_404.assert_not_called()
-
-    def test_utils_mappers_identify_reward_from_issue_title_malformed_patterns(
-        self, mocker
-    ):
-        """Test various malformed patterns that should not match."""
-        # Mock get_object_or_404 to ensure it's not called
-        mock_get_object_or_404 = mocker.patch("utils.mappers.get_object_or_404")
-
-        malformed_titles = [
-            "[F1",  # Missing closing bracket
-            "F1]",  # Missing opening bracket
-            "[F 1]",  # Space between label and level
-            "[F-1]",  # Wrong separator
-            "[F_1]",  # Wrong separator
-            "[]",  # Empty brackets
-            "[F]",  # Missing level
-            "[1]",  # Missing label
-            "(F1)",  # Wrong brackets
-            "{F1}",  # Wrong brackets
-        ]
-
-        for title in malformed_titles:
-            result = _identify_reward_from_issue_title(title)
-            assert result is None
-
-        # Verify get_object_or_404 was never called
-        mock_get_object_or_404.assert_not_called()
 
     # # _is_url_github_issue
     def test_utils_mappers_is_url_github_issue_valid_url(self):
@@ -1775,6 +1479,13 @@ class TestUtilsMappersHelpers:
 
         assert result == 123
 
+    def test_utils_mappers_is_url_github_issue_for_provided_pattern(self):
+        """Test provided compiled pattern is used for matching."""
+        pattern = re.compile(r"^.*example\.com/issues/(\d+).*")
+
+        assert _is_url_github_issue("https://example.com/issues/5", pattern) == 5
+        assert _is_url_github_issue("https://github.com/issues/5", pattern) is False
+
     def test_utils_mappers_is_url_github_issue_invalid_domain(self):
         """Test invalid domain returns False."""
         invalid_url = "https://gitlab.com/owner/repo/issues/123"
@@ -1827,213 +1538,121 @@ class TestUtilsMappersHelpers:
 
 
 class TestUtilsMappersIOFunctions:
-    """Testing class for :py:mod:`utils.mappers` helper functions."""
+    """Testing class for :py:mod:`utils.mappers` I/O functions."""
+
+    def _record(self, number, state):
+        return IssueRecord(
+            number,
+            state,
+            title="[F1] Title",
+            labels=["bug"],
+            updated_at=datetime(2024, 1, number, tzinfo=timezone.utc),
+            comments=["comment"],
+        )
 
     # # _load_saved_issues
-    def test_utils_mappers_load_saved_issues_returns_defaultdict(self, mocker):
-        with (
-            mock.patch("utils.mappers.Path") as mocked_path,
-            mock.patch(
-                "utils.mappers.read_pickle", return_value={}
-            ) as mocked_read_pickle,
-        ):
-            # Mock the path chain
-            mock_path_instance = mocker.MagicMock()
-            mocked_path.return_value = mock_path_instance
-            mock_path_instance.resolve.return_value.parent.parent.__truediv__.return_value = (
-                mocker.MagicMock()
-            )
-
-            result = _load_saved_issues()
-
-            assert isinstance(result, defaultdict)
-            mocked_read_pickle.assert_called_once()
-
-    def test_utils_mappers_load_saved_issues_loads_data_correctly(self, mocker):
-        test_data = {
-            "repo1": [{"id": 1, "title": "Issue 1"}],
-            "repo2": [{"id": 2, "title": "Issue 2"}],
-            "timestamp": 1234567890,
-        }
-        with (
-            mock.patch("utils.mappers.Path") as mocked_path,
-            mock.patch(
-                "utils.mappers.read_pickle", return_value=test_data
-            ) as mocked_read_pickle,
-        ):
-            # Mock the path chain
-            mock_path_instance = mocker.MagicMock()
-            mocked_path.return_value = mock_path_instance
-            mock_path_instance.resolve.return_value.parent.parent.__truediv__.return_value = (
-                mocker.MagicMock()
-            )
-
-            result = _load_saved_issues()
-
-            assert isinstance(result, defaultdict)
-            assert dict(result) == test_data
-            mocked_read_pickle.assert_called_once()
-
-    def test_utils_mappers_load_saved_issues_handles_empty_data(self, mocker):
-        with (
-            mock.patch("utils.mappers.Path") as mocked_path,
-            mock.patch(
-                "utils.mappers.read_pickle", return_value={}
-            ) as mocked_read_pickle,
-        ):
-            # Mock the path chain
-            mock_path_instance = mocker.MagicMock()
-            mocked_path.return_value = mock_path_instance
-            mock_path_instance.resolve.return_value.parent.parent.__truediv__.return_value = (
-                mocker.MagicMock()
-            )
-
-            result = _load_saved_issues()
-
-            assert isinstance(result, defaultdict)
-            assert dict(result) == {}
-            mocked_read_pickle.assert_called_once()
+    def test_utils_mappers_load_saved_issues_for_empty_cache(self, tmp_path):
+        cache = GitHubIssuesCache(tmp_path / "issues.db")
+        result = _load_saved_issues(cache)
+        assert isinstance(result, defaultdict)
+        assert dict(result) == {}
+        cache.cleanup()
 
     # # _save_issues
-    def test_utils_mappers_save_issues_writes_to_file(self, mocker):
-        github_issues = {
-            "repo1": [{"id": 1, "title": "Issue 1"}],
-            "repo2": [{"id": 2, "title": "Issue 2"}],
-        }
-        timestamp = 1234567890
-
-        with (
-            mock.patch("utils.mappers.Path") as mocked_path,
-            mock.patch("utils.mappers.open", mock.mock_open()) as mocked_open,
-            mock.patch("utils.mappers.pickle.dump") as mocked_pickle_dump,
-        ):
-            # Mock the entire path chain correctly
-            mock_final_path = mocker.MagicMock()
-
-            # Set up the chain: Path() -> resolve() -> parent -> parent -> __truediv__("fixtures") -> __truediv__("github_issues.pkl")
-            mock_path_instance = mocker.MagicMock()
-            mocked_path.return_value = mock_path_instance
-
-            mock_resolve = mocker.MagicMock()
-            mock_path_instance.resolve.return_value = mock_resolve
-
-            mock_parent1 = mocker.MagicMock()
-            mock_parent2 = mocker.MagicMock()
-            mock_resolve.parent = mock_parent1
-            mock_parent1.parent = mock_parent2
-
-            # Mock the __truediv__ chain
-            mock_parent2.__truediv__.return_value = mock_final_path
-            mock_final_path.__truediv__.return_value = mock_final_path
-
-            _save_issues(github_issues, timestamp)
-
-            # Assert open was called with the final path
-            mocked_open.assert_called_once_with(mock_final_path, "wb")
-
-            # Verify pickle.dump was called
-            mocked_pickle_dump.assert_called_once()
-
-            # Check that timestamp was added to the data
-            call_args = mocked_pickle_dump.call_args[0]
-            saved_data = call_args[0]
-            assert saved_data["timestamp"] == timestamp
-            assert saved_data["repo1"] == github_issues["repo1"]
-            assert saved_data["repo2"] == github_issues["repo2"]
-
-    def test_utils_mappers_save_issues_creates_directory(self, mocker):
-        github_issues = {"repo1": [{"id": 1, "title": "Issue 1"}]}
-        timestamp = 1234567890
-
-        with (
-            mock.patch("utils.mappers.Path") as mocked_path,
-            mock.patch("utils.mappers.open", mock.mock_open()),
-            mock.patch("utils.mappers.pickle.dump"),
-        ):
-            # Mock the entire path chain correctly
-            mock_final_path = mocker.MagicMock()
-            mock_parent_dir = mocker.MagicMock()
-            mock_final_path.parent = mock_parent_dir
-
-            # Set up the chain
-            mock_path_instance = mocker.MagicMock()
-            mocked_path.return_value = mock_path_instance
-
-            mock_resolve = mocker.MagicMock()
-            mock_path_instance.resolve.return_value = mock_resolve
-
-            mock_parent1 = mocker.MagicMock()
-            mock_parent2 = mocker.MagicMock()
-            mock_resolve.parent = mock_parent1
-            mock_parent1.parent = mock_parent2
-
-            # Mock the __truediv__ chain to return our final path
-            mock_parent2.__truediv__.return_value = mock_final_path
-            mock_final_path.__truediv__.return_value = mock_final_path
-
-            _save_issues(github_issues, timestamp)
-
-            # Assert mkdir was called on the parent directory
-            mock_parent_dir.mkdir.assert_called_once_with(parents=True, exist_ok=True)
-
-    def test_utils_mappers_save_issues_handles_permission_error(self, mocker):
-        github_issues = {"repo1": [{"id": 1, "title": "Issue 1"}]}
-        timestamp = 1234567890
-
-        with (
-            mock.patch("utils.mappers.Path") as mocked_path,
-            mock.patch(
-                "utils.mappers.open", side_effect=PermissionError("Permission denied")
-            ),
-            mock.patch("utils.mappers.pickle.dump"),
-        ):
-            # Mock the path chain
-            mock_path_instance = mocker.MagicMock()
-            mocked_path.return_value = mock_path_instance
-            mock_path_instance.resolve.return_value.parent.parent.__truediv__.return_value = (
-                mocker.MagicMock()
-            )
-
-            with pytest.raises(PermissionError):
-                _save_issues(github_issues, timestamp)
-
-    def test_utils_mappers_save_and_load_roundtrip(self, mocker, tmp_path):
-        # Import here to avoid circular imports if needed
-
-        def mock_read_pickle(filename):
-            if filename.exists():
-                with open(filename, "rb") as f:
-                    return pickle.load(f)
-            return {}
-
-        def mock_save_issues(github_issues, timestamp):
-            path = tmp_path / "github_issues.pkl"
-            github_issues["timestamp"] = timestamp
-            path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "wb") as f:
-                pickle.dump(github_issues, f)
-
-        def mock_load_saved_issues():
-            github_issues = defaultdict(list)
-            path = tmp_path / "github_issues.pkl"
-            data = mock_read_pickle(path)
-            for key in data:
-                github_issues[key] = data[key]
-            return github_issues
-
-        test_data = {
-            "repo1": [{"id": 1, "title": "Issue 1", "state": "open"}],
-            "repo2": [{"id": 2, "title": "Issue 2", "state": "closed"}],
-        }
-        timestamp = 1234567890
+    def test_utils_mappers_save_and_load_roundtrip(self, tmp_path):
+        cache = GitHubIssuesCache(tmp_path / "issues.db")
+        timestamp = datetime(2024, 1, 5, tzinfo=timezone.utc)
+        records = [self._record(1, "closed"), self._record(2, "open")]
+        _save_issues(cache, records, timestamp)
+        result = _load_saved_issues(cache)
+        assert dict(result) == {"closed": [records[0]], "open": [records[1]]}
+        assert cache.timestamp() == timestamp
+        cache.cleanup()
+
+    # # _issues_to_map
+    @pytest.mark.django_db
+    def test_utils_mappers_issues_to_map_for_full(self, mocker):
+        mocked_cache = mocker.patch("utils.mappers.GitHubIssuesCache")
+        github_issues = {"open": [self._record(1, "open")]}
+        assert _issues_to_map(github_issues, full=True) is github_issues
+        mocked_cache.assert_not_called()
 
-        # Save the data
-        mock_save_issues(test_data.copy(), timestamp)
+    @pytest.mark.django_db
+    def test_utils_mappers_issues_to_map_functionality(self, mocker, tmp_path):
+        cache = GitHubIssuesCache(tmp_path / "issues.db")
+        mocker.patch("utils.mappers.GitHubIssuesCache", return_value=cache)
+        mapped, changed, unmapped, deleted, new = (
+            self._record(number, "closed") for number in range(1, 6)
+        )
+        cache.set_mapping_state(
+            [
+                (1, mapped.fingerprint(), ISSUE_MAPPED),
+                (2, "previous", ISSUE_MAPPED),
+                (3, unmapped.fingerprint(), ISSUE_UNMAPPED),
+                (4, deleted.fingerprint(), ISSUE_MAPPED),
+            ]
+        )
+        for number in (1, 2, 3):
+            Issue.objects.create(number=number)
 
-        # Load the data
-        loaded_data = mock_load_saved_issues()
+        cache.set_contributions_fingerprint(_contributions_fingerprint())
+
+        result = _issues_to_map(
+            {"closed": [mapped, changed, unmapped, deleted], "open": [new]}
+        )
 
-        # Verify
-        expected_data = test_data.copy()
-        expected_data["timestamp"] = timestamp
-        assert dict(loaded_data) == expected_data
+        assert dict(result) == {"closed": [changed, unmapped, deleted], "open": [new]}
+
+    @pytest.mark.django_db
+    def test_utils_mappers_issues_to_map_for_changed_contributions(
+        self, mocker, tmp_path
+    ):
+        cache = GitHubIssuesCache(tmp_path / "issues.db")
+        mocker.patch("utils.mappers.GitHubIssuesCache", return_value=cache)
+        mapped = self._record(1, "closed")
+        cache.set_mapping_state([(1, mapped.fingerprint(), ISSUE_MAPPED)])
+        Issue.objects.create(number=1)
+        cache.set_contributions_fingerprint("previous")
+        github_issues = {"closed": [mapped]}
+        assert _issues_to_map(github_issues) is github_issues
+
+    # # _contributions_fingerprint
+    @pytest.mark.django_db
+    def test_utils_mappers_contributions_fingerprint_functionality(self):
+        contributor = Contributor.objects.create(name="fingerprinted")
+        cycle = Cycle.objects.create(start="2025-01-01", end="2025-01-31")
+        platform = SocialPlatform.objects.create(name="Discord", prefix="d@")
+        reward_type = RewardType.objects.create(label="F", name="Feature Request")
+        reward = Reward.objects.create(type=reward_type, level=1, amount=10)
+        empty = _contributions_fingerprint()
+        contribution = Contribution.objects.create(
+            contributor=contributor,
+            cycle=cycle,
+            platform=platform,
+            reward=reward,
+            url="https://example.com/1",
+        )
+        created = _contributions_fingerprint()
+        assert created != empty
+        assert _contributions_fingerprint() == created
+        contribution.url = "https://example.com/2"
+        contribution.save()
+        assert _contributions_fingerprint() != created
+
+    # # _save_mapping_state
+    @pytest.mark.django_db
+    def test_utils_mappers_save_mapping_state_functionality(self, mocker, tmp_path):
+        def cache():
+            return GitHubIssuesCache(tmp_path / "issues.db")
+
+        mocker.patch("utils.mappers.GitHubIssuesCache", side_effect=cache)
+        mapped, unmapped = self._record(1, "closed"), self._record(2, "open")
+        Issue.objects.create(number=1)
+
+        _save_mapping_state({"closed": [mapped], "open": [unmapped]})
+
+        assert cache().mapping_state() == {
+            1: (mapped.fingerprint(), ISSUE_MAPPED),
+            2: (unmapped.fingerprint(), ISSUE_UNMAPPED),
+        }
+        assert cache().contributions_fingerprint() == _contributions_fingerprint()
@@ -1,20 +1,39 @@
 """Testing module for :py:mod:`utils.mappers` module's mapping functions."""
 
+import json
 from datetime import datetime
 
 import pytest
 from django.conf import settings
-from django.http import Http404
 
-from core.models import Issue, IssueStatus
+from core.models import (
+    Contribution,
+    Contributor,
+    Cycle,
+    Issue,
+    IssueStatus,
+    Reward,
+    RewardType,
+    SocialPlatform,
+)
 from utils.constants.core import GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS
+from utils.issues_cache import GitHubIssuesCache, IssueRecord
 from utils.mappers import (
+    MappingContext,
+    MappingReport,
+    _classify_closed_addressed_issues,
+    _classify_issue,
+    _classify_issues,
+    _classify_issues_chunk,
+    _classify_open_issues,
     _create_contributor_from_text,
     _create_issues_bulk,
+    _init_classification_worker,
     _map_closed_addressed_issues,
     _map_closed_archived_issues,
     _map_open_issues,
     _map_unprocessed_closed_archived_issues,
+    _persist_mapped_issues,
     map_github_issues,
 )
 
@@ -549,21 +568,22 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"  # Ensure name is properly set
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock the absolute minimum
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
 
         # Mock empty contributors
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
         # Mock platforms - need at least one platform
@@ -576,6 +596,7 @@ class TestUtilsMappersMapClosedAddressedIssues:
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[mock_cycle])
         mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
 
         # Mock the identification functions to return None (so issue gets skipped but function returns True)
@@ -604,13 +625,12 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "bug"  # Different label
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Some body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         result = _map_closed_addressed_issues([mock_issue])
@@ -626,14 +646,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By test_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock all dependencies
@@ -648,7 +667,8 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor.id = 1
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -668,6 +688,7 @@ class TestUtilsMappersMapClosedAddressedIssues:
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[mock_cycle])
         mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
 
         # Mock identification functions
@@ -679,33 +700,16 @@ class TestUtilsMappersMapClosedAddressedIssues:
             "utils.mappers._extract_url_text", return_value="https://example.com"
         )
 
-        # Mock issue operations
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mock_created_issue = mocker.MagicMock()
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mock_created_issue
-        )
-
         # Mock contributor identification - return actual IDs
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
 
-        # Mock contribution operations
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_closed_addressed_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
+        assert len(mocked_persist.call_args[0][0]) == 1
 
     @pytest.mark.django_db
     def test_utils_mappers_map_closed_addressed_issues_skip_internal_issues(
@@ -717,13 +721,12 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Some body"
         mock_issue_obj.title = "[Internal] Test Issue"
         mock_issue_obj.number = 101
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock minimal dependencies
@@ -735,7 +738,8 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor.id = 1
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -748,6 +752,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -767,14 +774,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By test_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -786,7 +792,8 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor.id = 1
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -799,6 +806,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -825,14 +835,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By new_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -842,7 +851,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock empty contributors (no existing contributors)
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
         # Mock platforms
@@ -854,6 +865,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -874,12 +888,6 @@ class TestUtilsMappersMapClosedAddressedIssues:
         # Mock URL extraction
         mocker.patch("utils.mappers._extract_url_text", return_value=None)
 
-        # Mock issue operations
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mocker.MagicMock()
-        )
-
         # Mock contributor identification to return None
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=None)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
@@ -890,24 +898,14 @@ class TestUtilsMappersMapClosedAddressedIssues:
             return_value=(2, {"new_user": 2}),
         )
 
-        # Mock contribution operations
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_closed_addressed_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
-        call_kwargs = mock_contribution_create.call_args[1]
-        assert call_kwargs["reward"] == mock_reward_title
+        assert len(mocked_persist.call_args[0][0]) == 1
+        mapped_issue = mocked_persist.call_args[0][0][0]
+        assert mapped_issue[3] == mock_reward_title
         mocked_reward_labels.assert_not_called()
 
     @pytest.mark.django_db
@@ -920,14 +918,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -942,7 +939,8 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor.id = 1
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -961,6 +959,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -976,34 +977,18 @@ class TestUtilsMappersMapClosedAddressedIssues:
         # Mock URL extraction
         mocker.patch("utils.mappers._extract_url_text", return_value=None)
 
-        # Mock issue operations
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mocker.MagicMock()
-        )
-
         # Mock contributor identification
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
 
-        # Mock contribution operations
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_closed_addressed_issues([mock_issue])
 
         assert result is True
         # Verify contribution was created with GitHub platform ID (1)
-        call_kwargs = mock_contribution_create.call_args[1]
-        assert call_kwargs["platform_id"] == 1
+        mapped_issue = mocked_persist.call_args[0][0][0]
+        assert mapped_issue[2] == 1
 
     @pytest.mark.django_db
     def test_utils_mappers_map_closed_addressed_issues_create_new_contributor(
@@ -1015,14 +1000,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By new_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -1032,7 +1016,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock empty contributors (no existing contributors)
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
         # Mock platforms
@@ -1044,6 +1030,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -1059,12 +1048,6 @@ class TestUtilsMappersMapClosedAddressedIssues:
         # Mock URL extraction
         mocker.patch("utils.mappers._extract_url_text", return_value=None)
 
-        # Mock issue operations
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mocker.MagicMock()
-        )
-
         # Mock contributor identification to return None
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=None)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
@@ -1075,22 +1058,12 @@ class TestUtilsMappersMapClosedAddressedIssues:
             return_value=(2, {"new_user": 2}),
         )
 
-        # Mock contribution operations
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_closed_addressed_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
+        assert len(mocked_persist.call_args[0][0]) == 1
 
     @pytest.mark.django_db
     def test_utils_mappers_map_closed_addressed_issues_no_contributors_found(
@@ -1102,14 +1075,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Some body without contributor info"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "unknown_user"
+        mock_issue_obj.author = "unknown_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -1119,7 +1091,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock empty contributors
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
         # Mock platforms
@@ -1131,6 +1105,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -1146,12 +1123,6 @@ class TestUtilsMappersMapClosedAddressedIssues:
         # Mock URL extraction
         mocker.patch("utils.mappers._extract_url_text", return_value=None)
 
-        # Mock issue operations
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mocker.MagicMock()
-        )
-
         # Mock contributor identification to return None
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=None)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
@@ -1176,14 +1147,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -1198,7 +1168,8 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor.id = 1
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -1211,9 +1182,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
-        mocker.patch(
-            "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
-        )
+        mock_cycle = mocker.MagicMock()
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[mock_cycle])
+        mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
 
         # Mock platform identification
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
@@ -1226,35 +1197,22 @@ class TestUtilsMappersMapClosedAddressedIssues:
         # Mock URL extraction
         mocker.patch("utils.mappers._extract_url_text", return_value=None)
 
-        # Mock existing issue with CREATED status
-        mock_existing_issue = mocker.MagicMock()
-        mock_existing_issue.status = IssueStatus.CREATED
-        mock_existing_issue.save = mocker.MagicMock()
-
-        mocker.patch(
-            "utils.mappers.Issue.objects.get", return_value=mock_existing_issue
-        )
-
         # Mock contributor identification
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
 
-        # Mock contribution operations
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mocker.patch("utils.mappers.Contribution.objects.create")
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_closed_addressed_issues([mock_issue])
 
         assert result is True
-        # Verify issue status was updated to ADDRESSED
-        assert mock_existing_issue.status == IssueStatus.ADDRESSED
-        mock_existing_issue.save.assert_called_once()
+        # Verify issues are persisted as ADDRESSED, updating the CREATED ones
+        mocked_persist.assert_called_once_with(
+            [(101, [1], 1, mock_reward, None)],
+            IssueStatus.ADDRESSED,
+            mock_cycle,
+            update_statuses=(IssueStatus.CREATED,),
+        )
 
     @pytest.mark.django_db
     def test_utils_mappers_map_closed_addressed_issues_skip_empty_body(self, mocker):
@@ -1264,13 +1222,12 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = None  # Empty body
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []  # Empty comments
 
         # Mock minimal dependencies
@@ -1282,7 +1239,8 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor.id = 1
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -1295,6 +1253,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -1314,14 +1275,13 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_label.name = "addressed"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By user1 and user2 in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -1340,7 +1300,7 @@ class TestUtilsMappersMapClosedAddressedIssues:
         mock_contributor2.id = 2
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mock_contributor1, mock_contributor2],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
@@ -1354,6 +1314,9 @@ class TestUtilsMappersMapClosedAddressedIssues:
         )
 
         # Mock cycle
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -1369,227 +1332,159 @@ class TestUtilsMappersMapClosedAddressedIssues:
         # Mock URL extraction
         mocker.patch("utils.mappers._extract_url_text", return_value=None)
 
-        # Mock issue operations
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mocker.MagicMock()
-        )
-
         # Mock contributor identification to return multiple IDs
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=2)
 
-        # Mock contribution operations
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_closed_addressed_issues([mock_issue])
 
         assert result is True
         # Verify two contributions were created
-        assert mock_contribution_create.call_count == 2
-
-    @pytest.mark.django_db
-    def test_utils_mappers_map_closed_addressed_issues_existing_issue_already_addressed(
-        self, mocker
+        assert mocked_persist.call_args[0][0][0][1] == [1, 2]
+
+
+@pytest.fixture
+def mapping_records():
+    """Create cycle, platform, reward and two contributors for mapping tests."""
+    reward_type = RewardType.objects.create(label="F", name="Feature")
+    return {
+        "cycle": Cycle.objects.create(start="2025-01-01", end="2025-01-31"),
+        "platform": SocialPlatform.objects.create(name="GitHub", prefix="g@"),
+        "reward": Reward.objects.create(type=reward_type, level=1, amount=1000),
+        "contributors": [
+            Contributor.objects.create(name="user1"),
+            Contributor.objects.create(name="user2"),
+        ],
+    }
+
+
+@pytest.mark.django_db
+class TestUtilsMappersPersistMappedIssues:
+    """Testing class for :py:mod:`utils.mappers` _persist_mapped_issues function."""
+
+    def _mapped(self, records, number, *indexes, url="https://example.com"):
+        return (
+            number,
+            [records["contributors"][index].id for index in indexes],
+            records["platform"].id,
+            records["reward"],
+            url,
+        )
+
+    def test_utils_mappers_persist_mapped_issues_for_no_issues(self):
+        assert _persist_mapped_issues([], IssueStatus.ADDRESSED, None) == []
+
+    def test_utils_mappers_persist_mapped_issues_creates_issues_and_contributions(
+        self, mapping_records, mocker
     ):
-        """Test that existing issues with ADDRESSED status are not modified."""
-        # Create proper mock structure
-        mock_label = mocker.MagicMock()
-        mock_label.name = "addressed"
-
-        mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
-        mock_issue_obj.body = "Test body with contributor info"
-        mock_issue_obj.title = "Test Issue"
-        mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
-
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
-        mock_issue.comments = []
-
-        # Mock dependencies
-        mock_reward = mocker.MagicMock()
-        mocker.patch(
-            "utils.mappers._build_reward_mapping", return_value={"bug": mock_reward}
-        )
-
-        # Mock contributors
-        mock_contributor = mocker.MagicMock()
-        mock_contributor.info = "Test User"
-        mock_contributor.id = 1
-
-        mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
-        )
-        mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
-
-        # Mock platforms
-        mock_platform = mocker.MagicMock()
-        mock_platform.name = "GitHub"
-        mock_platform.id = 1
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.all", return_value=[mock_platform]
-        )
-
-        # Mock cycle
-        mocker.patch(
-            "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
-        )
-
-        # Mock platform identification
-        mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
-
-        # Mock reward identification
-        mocker.patch(
-            "utils.mappers._identify_reward_from_labels", return_value=mock_reward
-        )
-
-        # Mock URL extraction
-        mocker.patch("utils.mappers._extract_url_text", return_value=None)
-
-        # Mock existing issue with ADDRESSED status (already addressed)
-        mock_existing_issue = mocker.MagicMock()
-        mock_existing_issue.status = IssueStatus.ADDRESSED  # Already ADDRESSED
-        mock_existing_issue.save = mocker.MagicMock()
-
-        mocker.patch(
-            "utils.mappers.Issue.objects.get", return_value=mock_existing_issue
-        )
-
-        # Mock contributor identification
-        mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
-        mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
-
-        # Mock contribution operations - return existing contribution
-        mock_existing_contribution = mocker.MagicMock()
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(
-            return_value=mock_existing_contribution
-        )
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
-        )
-
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
-
-        result = _map_closed_addressed_issues([mock_issue])
-
-        assert result is True
-        # Verify issue status was NOT changed (already ADDRESSED)
-        assert mock_existing_issue.status == IssueStatus.ADDRESSED
-        mock_existing_issue.save.assert_not_called()  # Should not save since status didn't change
-        # Verify no new contribution was created (existing one found)
-        mock_contribution_create.assert_not_called()
-
-    @pytest.mark.django_db
-    def test_utils_mappers_map_closed_addressed_issues_skip_when_contribution_exists(
-        self, mocker
+        mocked_bump = mocker.patch("utils.mappers.bump_data_version")
+        mocked_adjust = mocker.patch("utils.mappers.StatisticsSnapshot.objects.adjust")
+        created = _persist_mapped_issues(
+            [
+                self._mapped(mapping_records, 101, 0, 1),
+                self._mapped(mapping_records, 102, 1, url=None),
+                self._mapped(mapping_records, 103),
+            ],
+            IssueStatus.ADDRESSED,
+            mapping_records["cycle"],
+        )
+        assert len(created) == 3
+        assert set(Issue.objects.values_list("number", "status")) == {
+            (101, IssueStatus.ADDRESSED),
+            (102, IssueStatus.ADDRESSED),
+            (103, IssueStatus.ADDRESSED),
+        }
+        contribution = Contribution.objects.get(issue__number=102)
+        assert contribution.contributor == mapping_records["contributors"][1]
+        assert contribution.cycle == mapping_records["cycle"]
+        assert contribution.platform == mapping_records["platform"]
+        assert contribution.reward == mapping_records["reward"]
+        assert contribution.percentage == 1
+        assert contribution.url is None
+        assert contribution.confirmed is True
+        assert Contribution.objects.filter(issue__number=101).count() == 2
+        mocked_adjust.assert_called_once_with(num_contributions=3, total_rewards=3000)
+        mocked_bump.assert_called_once_with()
+
+    def test_utils_mappers_persist_mapped_issues_updates_issue_statuses(
+        self, mapping_records
     ):
-        """Test that no new contribution is created when existing contribution exists."""
-        # Create proper mock structure
-        mock_label = mocker.MagicMock()
-        mock_label.name = "addressed"
-
-        mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
-        mock_issue_obj.body = "Test body with contributor info"
-        mock_issue_obj.title = "Test Issue"
-        mock_issue_obj.number = 101
-        mock_issue_obj.user.login = "github_user"
-
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
-        mock_issue.comments = []
-
-        # Mock dependencies
-        mock_reward = mocker.MagicMock()
-        mocker.patch(
-            "utils.mappers._build_reward_mapping", return_value={"bug": mock_reward}
-        )
-
-        # Mock contributors
-        mock_contributor = mocker.MagicMock()
-        mock_contributor.info = "Test User"
-        mock_contributor.id = 1
-
-        mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
-        )
-        mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
-
-        # Mock platforms
-        mock_platform = mocker.MagicMock()
-        mock_platform.name = "GitHub"
-        mock_platform.id = 1
-        mocker.patch(
-            "utils.mappers.SocialPlatform.objects.all", return_value=[mock_platform]
-        )
-
-        # Mock cycle
-        mock_cycle = mocker.MagicMock()
-        mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
-
-        # Mock platform identification
-        mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
-
-        # Mock reward identification
-        mocker.patch(
-            "utils.mappers._identify_reward_from_labels", return_value=mock_reward
-        )
-
-        # Mock URL extraction
-        mocker.patch(
-            "utils.mappers._extract_url_text", return_value="https://example.com"
-        )
-
-        # Mock issue operations - create new issue
-        mocker.patch("utils.mappers.Issue.objects.get", side_effect=Issue.DoesNotExist)
-        mock_created_issue = mocker.MagicMock()
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mock_created_issue
-        )
-
-        # Mock contributor identification
-        mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
-        mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
-
-        # Mock contribution operations - return EXISTING contribution (not None)
-        mock_existing_contribution = (
-            mocker.MagicMock()
-        )  # This represents an existing contribution
-        mock_contribution_filter = mocker.MagicMock()
-        mock_contribution_filter.first = mocker.MagicMock(
-            return_value=mock_existing_contribution
-        )  # Returns truthy value
-        mocker.patch(
-            "utils.mappers.Contribution.objects.filter",
-            return_value=mock_contribution_filter,
+        Issue.objects.create(number=101, status=IssueStatus.CREATED)
+        Issue.objects.create(number=102, status=IssueStatus.WONTFIX)
+        _persist_mapped_issues(
+            [
+                self._mapped(mapping_records, 101, 0),
+                self._mapped(mapping_records, 102, 0),
+            ],
+            IssueStatus.ADDRESSED,
+            mapping_records["cycle"],
+            update_statuses=(IssueStatus.CREATED,),
         )
+        assert Issue.objects.get(number=101).status == IssueStatus.ADDRESSED
+        assert Issue.objects.get(number=102).status == IssueStatus.WONTFIX
+        assert Contribution.objects.filter(issue__number=102).count() == 1
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
+    def test_utils_mappers_persist_mapped_issues_skips_existing_contributions(
+        self, mapping_records, mocker
+    ):
+        mocked_bump = mocker.patch("utils.mappers.bump_data_version")
+        issue = Issue.objects.create(number=101, status=IssueStatus.ADDRESSED)
+        Contribution.objects.create(
+            contributor=mapping_records["contributors"][0],
+            cycle=mapping_records["cycle"],
+            platform=mapping_records["platform"],
+            reward=mapping_records["reward"],
+            issue=issue,
+        )
+        mocked_bump.reset_mock()
+        created = _persist_mapped_issues(
+            [
+                self._mapped(mapping_records, 101, 0),
+                self._mapped(mapping_records, 101, 0, 1),
+            ],
+            IssueStatus.ADDRESSED,
+            mapping_records["cycle"],
+            update_statuses=(IssueStatus.CREATED,),
         )
+        assert [c.contributor for c in created] == [mapping_records["contributors"][1]]
+        assert Contribution.objects.filter(issue=issue).count() == 2
+        assert Issue.objects.count() == 1
+        mocked_bump.assert_called_once_with()
 
-        result = _map_closed_addressed_issues([mock_issue])
+    def test_utils_mappers_persist_mapped_issues_for_nothing_changed(
+        self, mapping_records, mocker
+    ):
+        Issue.objects.create(number=101, status=IssueStatus.ADDRESSED)
+        mocked_bump = mocker.patch("utils.mappers.bump_data_version")
+        assert (
+            _persist_mapped_issues(
+                [self._mapped(mapping_records, 101)],
+                IssueStatus.ADDRESSED,
+                mapping_records["cycle"],
+                update_statuses=(IssueStatus.CREATED,),
+            )
+            == []
+        )
+        mocked_bump.assert_not_called()
+
+    def test_utils_mappers_persist_mapped_issues_number_of_queries(
+        self, mapping_records, query_budget
+    ):
+        Issue.objects.create(number=1, status=IssueStatus.CREATED)
+        mapped_issues = [
+            self._mapped(mapping_records, number, 0, 1) for number in range(1, 51)
+        ]
+        with query_budget(7):
+            _persist_mapped_issues(
+                mapped_issues,
+                IssueStatus.ADDRESSED,
+                mapping_records["cycle"],
+                update_statuses=(IssueStatus.CREATED,),
+            )
 
-        assert result is True
-        # Verify NO new contribution was created since existing one was found
-        mock_contribution_create.assert_not_called()
-        # Verify that Contribution.objects.filter was called with correct parameters
-        mock_contribution_filter.first.assert_called_once()
+        assert Contribution.objects.count() == 100
 
 
 class TestUtilsMappersMapClosedArchivedIssues:
@@ -1657,8 +1552,8 @@ class TestUtilsMappersMapClosedArchivedIssues:
 
         # Mock GitHub issue with URL in body
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Check out https://example.com/contrib for details"
+        mock_issue.number = 101
+        mock_issue.body = "Check out https://example.com/contrib for details"
 
         mocker.patch("utils.mappers._is_url_github_issue", return_value=False)
         mocked_create_issues_bulk = mocker.patch("utils.mappers._create_issues_bulk")
@@ -1701,8 +1596,8 @@ class TestUtilsMappersMapClosedArchivedIssues:
 
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 456  # Matching issue number
-        mock_issue.issue.body = "Some issue body without the URL"
+        mock_issue.number = 456  # Matching issue number
+        mock_issue.body = "Some issue body without the URL"
 
         mocker.patch("utils.mappers._is_url_github_issue", return_value=456)
         mocked_create_issues_bulk = mocker.patch("utils.mappers._create_issues_bulk")
@@ -1748,8 +1643,8 @@ class TestUtilsMappersMapClosedArchivedIssues:
         )
 
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Contains https://valid.com/url"
+        mock_issue.number = 101
+        mock_issue.body = "Contains https://valid.com/url"
 
         mocker.patch("utils.mappers._is_url_github_issue", return_value=False)
         mocked_create_issues_bulk = mocker.patch("utils.mappers._create_issues_bulk")
@@ -1787,8 +1682,8 @@ class TestUtilsMappersMapClosedArchivedIssues:
         )
 
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Contains https://example.com/contrib"
+        mock_issue.number = 101
+        mock_issue.body = "Contains https://example.com/contrib"
 
         mocker.patch("utils.mappers._is_url_github_issue", return_value=False)
         mocked_create_issues_bulk = mocker.patch("utils.mappers._create_issues_bulk")
@@ -1833,8 +1728,8 @@ class TestUtilsMappersMapClosedArchivedIssues:
 
         # Mock GitHub issue without body but with matching number
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 456
-        mock_issue.issue.body = None
+        mock_issue.number = 456
+        mock_issue.body = None
 
         mocker.patch("utils.mappers._is_url_github_issue", return_value=456)
         mocked_create_issues_bulk = mocker.patch("utils.mappers._create_issues_bulk")
@@ -1870,34 +1765,34 @@ class TestUtilsMappersMapClosedArchivedIssues:
         )
 
         mock_issue1 = mocker.MagicMock()
-        mock_issue1.issue.title = "[Internal] foo bar"
-        mock_issue1.issue.body = "Internal issue body"
-        mock_issue1.issue.number = 100
+        mock_issue1.title = "[Internal] foo bar"
+        mock_issue1.body = "Internal issue body"
+        mock_issue1.number = 100
         mock_issue1.comments = []  # Empty list of strings, not MagicMock
 
         mock_issue2 = mocker.MagicMock()
-        mock_issue2.issue.number = 101
-        mock_issue2.issue.body = "Contains completely different URL"
-        mock_issue2.issue.title = "Test Issue"
+        mock_issue2.number = 101
+        mock_issue2.body = "Contains completely different URL"
+        mock_issue2.title = "Test Issue"
         mock_issue2.comments = []  # Empty list of strings
 
         mock_issue3 = mocker.MagicMock()
         label1, label2 = mocker.MagicMock(), mocker.MagicMock()
         label1.name = "foobar"
         label2.name = "wontfix"
-        mock_issue3.issue.labels = [label1, label2]
-        mock_issue3.issue.body = "Wontfix issue"
-        mock_issue3.issue.number = 102
-        mock_issue3.issue.title = "Wontfix Issue"
+        mock_issue3.labels = [label1.name, label2.name]
+        mock_issue3.body = "Wontfix issue"
+        mock_issue3.number = 102
+        mock_issue3.title = "Wontfix Issue"
         mock_issue3.comments = []
 
         label3 = mocker.MagicMock()
         label3.name = "addressed"
         mock_issue4 = mocker.MagicMock()
-        mock_issue4.issue.labels = [label3]
-        mock_issue4.issue.body = "Addressed issue"
-        mock_issue4.issue.number = 103
-        mock_issue4.issue.title = "Addressed Issue"
+        mock_issue4.labels = [label3.name]
+        mock_issue4.body = "Addressed issue"
+        mock_issue4.number = 103
+        mock_issue4.title = "Addressed Issue"
         mock_issue4.comments = []
 
         mocker.patch("utils.mappers._is_url_github_issue", return_value=False)
@@ -1946,14 +1841,14 @@ class TestUtilsMappersMapClosedArchivedIssues:
 
         # Mock multiple issues
         mock_issue1 = mocker.MagicMock()
-        mock_issue1.issue.number = 101
-        mock_issue1.issue.body = "Contains https://example.com/body_match"
+        mock_issue1.number = 101
+        mock_issue1.body = "Contains https://example.com/body_match"
 
         mock_issue2 = mocker.MagicMock()
-        mock_issue2.issue.number = 202
-        mock_issue2.issue.body = "No matching URL here"
+        mock_issue2.number = 202
+        mock_issue2.body = "No matching URL here"
         mocked_is_url = mocker.patch("utils.mappers._is_url_github_issue")
-        mocked_is_url.side_effect = lambda url: (
+        mocked_is_url.side_effect = lambda url, pattern: (
             202 if url == github_issue_url else False
         )
         mocked_create_issues_bulk = mocker.patch("utils.mappers._create_issues_bulk")
@@ -1985,12 +1880,12 @@ class TestUtilsMappersMapOpenIssues:
         """Test _map_open_issues successfully creates contributions."""
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Discord discussion about feature"
-        mock_issue.issue.title = "Feature Request"
-        mock_issue.issue.user.login = "testuser"
+        mock_issue.number = 101
+        mock_issue.body = "Discord discussion about feature"
+        mock_issue.title = "Feature Request"
+        mock_issue.author = "testuser"
         mock_issue.comments = []
-        mock_issue.issue.labels = []
+        mock_issue.labels = []
 
         # Mock all dependencies
         mocker.patch(
@@ -1999,7 +1894,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mocker.MagicMock(info="testuser (g@testuser)", id=1)],
         )
 
@@ -2009,6 +1904,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mock_cycle = mocker.MagicMock()
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[mock_cycle])
         mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
 
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
@@ -2022,29 +1918,27 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mock_issue_obj = mocker.MagicMock()
-        mocker.patch("utils.mappers.get_object_or_404", side_effect=Http404)
-        mocker.patch("utils.mappers.Issue.objects.create", return_value=mock_issue_obj)
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
+        assert len(mocked_persist.call_args[0][0]) == 1
+        assert mocked_persist.call_args[0][1] == IssueStatus.CREATED
+        assert mocked_persist.call_args[1] == {}
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_reward_from_title(self, mocker):
         """Test _map_open_issues successfully creates contributions."""
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Discord discussion about feature"
-        mock_issue.issue.title = "Feature Request"
-        mock_issue.issue.user.login = "testuser"
+        mock_issue.number = 101
+        mock_issue.body = "Discord discussion about feature"
+        mock_issue.title = "Feature Request"
+        mock_issue.author = "testuser"
         mock_issue.comments = []
-        mock_issue.issue.labels = []
+        mock_issue.labels = []
 
         # Mock all dependencies
         mocker.patch(
@@ -2053,7 +1947,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mocker.MagicMock(info="testuser (g@testuser)", id=1)],
         )
 
@@ -2063,6 +1957,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mock_cycle = mocker.MagicMock()
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[mock_cycle])
         mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
 
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=1)
@@ -2083,30 +1978,26 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mock_issue_obj = mocker.MagicMock()
-        mocker.patch("utils.mappers.get_object_or_404", side_effect=Http404)
-        mocker.patch("utils.mappers.Issue.objects.create", return_value=mock_issue_obj)
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
-        mockwed_reward_title.assert_called_once_with(mock_issue.issue.title)
+        assert len(mocked_persist.call_args[0][0]) == 1
+        mockwed_reward_title.assert_called_once_with(mock_issue.title, {}, active=True)
         mockwed_reward_labels.assert_not_called()
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_for_excluded_contributors(self, mocker):
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Discord discussion about feature"
-        mock_issue.issue.title = "Feature Request"
-        mock_issue.issue.user.login = "testuser"
+        mock_issue.number = 101
+        mock_issue.body = "Discord discussion about feature"
+        mock_issue.title = "Feature Request"
+        mock_issue.author = "testuser"
         mock_issue.comments = []
-        mock_issue.issue.labels = []
+        mock_issue.labels = []
 
         # Mock all dependencies
         mocker.patch(
@@ -2116,7 +2007,7 @@ class TestUtilsMappersMapOpenIssues:
 
         excluded_contributor = GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS[0]
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[
                 mocker.MagicMock(info=f"{excluded_contributor} (g@testuser)", id=1)
             ],
@@ -2128,6 +2019,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mock_cycle = mocker.MagicMock()
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[mock_cycle])
         mocker.patch("utils.mappers.Cycle.objects.latest", return_value=mock_cycle)
 
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
@@ -2140,83 +2032,84 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mock_issue_obj = mocker.MagicMock()
-        mocker.patch("utils.mappers.get_object_or_404", side_effect=Http404)
-        mocker.patch("utils.mappers.Issue.objects.create", return_value=mock_issue_obj)
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_not_called()
+        assert mocked_persist.call_args[0][0] == []
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_skip_no_contributor(self, mocker):
         """Test _map_open_issues skips issues with no contributor."""
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Some text"
-        mock_issue.issue.title = "No Internal"
-        mock_issue.issue.user.login = "unknownuser"
+        mock_issue.number = 101
+        mock_issue.body = "Some text"
+        mock_issue.title = "No Internal"
+        mock_issue.author = "unknownuser"
         mock_issue.comments = []
 
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.SocialPlatform.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
         mocker.patch("utils.mappers._identify_contributor_from_user", return_value=None)
         mocker.patch("utils.mappers._identify_contributor_from_text", return_value=None)
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_not_called()
+        assert mocked_persist.call_args[0][0] == []
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_skip_internal_title(self, mocker):
         """Test _map_open_issues skips issues with [Internal] in title."""
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Some text"
-        mock_issue.issue.title = "[Internal] Internal task"
+        mock_issue.number = 101
+        mock_issue.body = "Some text"
+        mock_issue.title = "[Internal] Internal task"
         mock_issue.comments = []
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
-        mocker.patch("utils.mappers.Cycle.objects.latest")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_not_called()
+        assert mocked_persist.call_args[0][0] == []
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_skip_no_body_comments(self, mocker):
         """Test _map_open_issues skips issues with no body or comments."""
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = None
+        mock_issue.number = 101
+        mock_issue.body = None
         mock_issue.comments = []
-        mock_issue.issue.title = "Regular issue"
+        mock_issue.title = "Regular issue"
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
+        mocker.patch("utils.mappers.Cycle.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
-        mocker.patch("utils.mappers.Cycle.objects.latest")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_not_called()
+        assert mocked_persist.call_args[0][0] == []
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_skip_no_contributor_from_user_fallback_text(
@@ -2224,14 +2117,14 @@ class TestUtilsMappersMapOpenIssues:
     ):
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Discord discussion about feature by @johndoe"
-        mock_issue.issue.title = "Feature Request"
-        mock_issue.issue.user.login = (
+        mock_issue.number = 101
+        mock_issue.body = "Discord discussion about feature by @johndoe"
+        mock_issue.title = "Feature Request"
+        mock_issue.author = (
             "unknownuser"  # This won't match in _identify_contributor_from_user
         )
         mock_issue.comments = []
-        mock_issue.issue.labels = [mocker.MagicMock(name="feature")]
+        mock_issue.labels = ["feature"]
 
         # Mock dependencies
         mocker.patch(
@@ -2241,7 +2134,7 @@ class TestUtilsMappersMapOpenIssues:
 
         # Mock contributors - user login won't match, but text will
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mocker.MagicMock(info="John Doe (johndoe)", id=1)],
         )
 
@@ -2250,6 +2143,9 @@ class TestUtilsMappersMapOpenIssues:
             return_value=[mocker.MagicMock(name="Discord", id=1)],
         )
 
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -2270,30 +2166,24 @@ class TestUtilsMappersMapOpenIssues:
             return_value="https://discord.com/test",
         )
 
-        mocker.patch("utils.mappers.get_object_or_404", side_effect=Http404)
-        mocker.patch(
-            "utils.mappers.Issue.objects.create", return_value=mocker.MagicMock()
-        )
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
+        assert len(mocked_persist.call_args[0][0]) == 1
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_for_no_platform(self, mocker):
         """Test _map_open_issues skips issue when no platform is identified."""
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "General discussion about feature"
-        mock_issue.issue.title = "Feature Request"
-        mock_issue.issue.user.login = "johndoe"
+        mock_issue.number = 101
+        mock_issue.body = "General discussion about feature"
+        mock_issue.title = "Feature Request"
+        mock_issue.author = "johndoe"
         mock_issue.comments = []
-        mock_issue.issue.labels = [mocker.MagicMock(name="feature")]
+        mock_issue.labels = ["feature"]
 
         # Mock dependencies
         mocker.patch(
@@ -2302,7 +2192,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mocker.MagicMock(info="John Doe (johndoe)", id=1)],
         )
         platform1 = mocker.MagicMock()
@@ -2316,6 +2206,9 @@ class TestUtilsMappersMapOpenIssues:
             return_value=[platform1, platform2],
         )
 
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -2330,28 +2223,24 @@ class TestUtilsMappersMapOpenIssues:
             "utils.mappers._identify_reward_from_labels", return_value="mock_reward"
         )
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_called_once()
+        assert len(mocked_persist.call_args[0][0]) == 1
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_skip_no_reward(self, mocker):
         """Test _map_open_issues skips issue when no reward is identified."""
         # Mock GitHub issue
         mock_issue = mocker.MagicMock()
-        mock_issue.issue.number = 101
-        mock_issue.issue.body = "Discord discussion about feature"
-        mock_issue.issue.title = "Feature Request"
-        mock_issue.issue.user.login = "johndoe"
+        mock_issue.number = 101
+        mock_issue.body = "Discord discussion about feature"
+        mock_issue.title = "Feature Request"
+        mock_issue.author = "johndoe"
         mock_issue.comments = []
-        mock_issue.issue.labels = [
-            mocker.MagicMock(name="unknown-label")
-        ]  # No matching reward
+        mock_issue.labels = ["unknown-label"]  # No matching reward
 
         # Mock dependencies
         mocker.patch(
@@ -2360,7 +2249,7 @@ class TestUtilsMappersMapOpenIssues:
         )
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mocker.MagicMock(info="John Doe (johndoe)", id=1)],
         )
 
@@ -2369,6 +2258,9 @@ class TestUtilsMappersMapOpenIssues:
             return_value=[mocker.MagicMock(name="Discord", id=1)],
         )
 
+        mocker.patch(
+            "utils.mappers.Cycle.objects.all", return_value=[mocker.MagicMock()]
+        )
         mocker.patch(
             "utils.mappers.Cycle.objects.latest", return_value=mocker.MagicMock()
         )
@@ -2381,14 +2273,12 @@ class TestUtilsMappersMapOpenIssues:
             "utils.mappers._identify_reward_from_labels", return_value=None
         )  # Reward match fails
 
-        mock_contribution_create = mocker.patch(
-            "utils.mappers.Contribution.objects.create"
-        )
+        mocked_persist = mocker.patch("utils.mappers._persist_mapped_issues")
 
         result = _map_open_issues([mock_issue])
 
         assert result is True
-        mock_contribution_create.assert_not_called()
+        assert mocked_persist.call_args[0][0] == []
 
     @pytest.mark.django_db
     def test_utils_mappers_map_open_issues_transaction_decorator(self):
@@ -2400,6 +2290,287 @@ class TestUtilsMappersMapOpenIssues:
 
         assert result is False
 
+    @pytest.mark.django_db
+    def test_utils_mappers_classify_open_issues_without_queries(self, query_budget):
+        discord = SocialPlatform.objects.create(name="Discord", prefix="d@")
+        SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        reward = Reward.objects.create(
+            type=RewardType.objects.create(label="F", name="Feature Request"),
+            level=1,
+            amount=1000,
+        )
+        contributor = Contributor.objects.create(name="johndoe")
+        Cycle.objects.create(start="2024-01-01")
+        records = [
+            IssueRecord(
+                number,
+                "open",
+                title="[F1] Feature",
+                body="By johndoe in [Discord](https://discord.com/channels/1/2)",
+            )
+            for number in range(1, 6)
+        ]
+        context = MappingContext()
+
+        with query_budget(0):
+            mapped_issues = _classify_open_issues(records, context)
+
+        assert mapped_issues == [
+            (
+                number,
+                [contributor.id],
+                discord.id,
+                reward,
+                "https://discord.com/channels/1/2",
+            )
+            for number in range(1, 6)
+        ]
+
+
+class TestUtilsMappersClassifyIssues:
+    """Testing class for :py:mod:`utils.mappers` classification functions."""
+
+    def _context(self):
+        SocialPlatform.objects.create(name="Discord", prefix="d@")
+        SocialPlatform.objects.create(name="GitHub", prefix="g@")
+        reward_type = RewardType.objects.create(label="F", name="Feature Request")
+        Reward.objects.create(type=reward_type, level=1, amount=1000)
+        Reward.objects.create(type=reward_type, level=2, amount=2000, active=False)
+        Contributor.objects.create(name="johndoe")
+        return MappingContext()
+
+    @pytest.mark.django_db
+    @pytest.mark.parametrize(
+        "title,body,comments",
+        [
+            ("[F1] Feature", None, ()),
+            ("[F1] Feature", "", ()),
+            ("[F1] [Internal] Feature", "By johndoe", ()),
+        ],
+    )
+    def test_utils_mappers_classify_issue_for_skipped_issue(
+        self, title, body, comments
+    ):
+        record = IssueRecord(1, "open", title=title, body=body, comments=comments)
+        assert _classify_issue(record, self._context()) is None
+
+    @pytest.mark.django_db
+    def test_utils_mappers_classify_issue_functionality(self):
+        context = self._context()
+        record = IssueRecord(
+            5,
+            "closed",
+            title="[F1] Feature",
+            body="By johndoe in [Discord](https://discord.com/channels/1/2)",
+            author="johndoe",
+            comments=["comment"],
+        )
+        assert _classify_issue(record, context) == (
+            5,
+            [Contributor.objects.get(name="johndoe").id],
+            context.platforms["Discord"],
+            Reward.objects.get(level=1),
+            "https://discord.com/channels/1/2",
+            "By johndoe in [Discord](https://discord.com/channels/1/2)\ncomment",
+        )
+
+    @pytest.mark.django_db
+    def test_utils_mappers_classify_issue_for_fallbacks_and_inactive(self):
+        context = self._context()
+        record = IssueRecord(5, "closed", title="[F2] Feature", body="text")
+        assert _classify_issue(record, context, active=False) == (
+            5,
+            [],
+            context.platforms["GitHub"],
+            Reward.objects.get(level=2),
+            None,
+            "text",
+        )
+        assert _classify_issue(record, context)[3] is None
+
+    def test_utils_mappers_classify_issues_chunk_uses_worker_context(self, mocker):
+        context = mocker.MagicMock()
+        mocked_classify = mocker.patch(
+            "utils.mappers._classify_issue", side_effect=["first", "second"]
+        )
+        _init_classification_worker(context)
+        assert _classify_issues_chunk(["a", "b"], active=False) == [
+            "first",
+            "second",
+        ]
+        mocked_classify.assert_called_with("b", context, active=False)
+
+    def test_utils_mappers_classify_issues_in_process_for_single_worker(self, mocker):
+        context = mocker.MagicMock()
+        mocked_pool = mocker.patch("utils.mappers.ProcessPoolExecutor")
+        mocked_classify = mocker.patch(
+            "utils.mappers._classify_issue", side_effect=lambda issue, *_, **__: issue
+        )
+        assert _classify_issues(list(range(300)), context, workers=1) == list(
+            range(300)
+        )
+        assert mocked_classify.call_count == 300
+        mocked_pool.assert_not_called()
+
+    def test_utils_mappers_classify_issues_in_process_for_few_issues(self, mocker):
+        mocker.patch("utils.mappers.GITHUB_MAPPING_CHUNK_SIZE", 10)
+        mocked_pool = mocker.patch("utils.mappers.ProcessPoolExecutor")
+        mocker.patch(
+            "utils.mappers._classify_issue", side_effect=lambda issue, *_, **__: issue
+        )
+        assert _classify_issues(list(range(10)), mocker.MagicMock(), workers=4) == (
+            list(range(10))
+        )
+        mocked_pool.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_utils_mappers_classify_issues_in_worker_processes(self, mocker):
+        mocker.patch("utils.mappers.GITHUB_MAPPING_CHUNK_SIZE", 3)
+        context = self._context()
+        records = [
+            IssueRecord(
+                number,
+                "open",
+                title=f"[F{1 + number % 2}] Feature",
+                body="By johndoe" if number % 3 else "",
+            )
+            for number in range(1, 11)
+        ]
+        expected = [_classify_issue(record, context) for record in records]
+
+        assert _classify_issues(records, context, workers=2) == expected
+        assert _classify_issues(records, context, active=False, workers=2) == [
+            _classify_issue(record, context, active=False) for record in records
+        ]
+
+    @pytest.mark.django_db
+    def test_utils_mappers_classify_open_issues_reports_outcomes(self):
+        context = self._context()
+        records = [
+            IssueRecord(1, "open", title="[F1] Feature", body="By johndoe"),
+            IssueRecord(2, "open", title="[F1] Feature", body="By nobody"),
+            IssueRecord(3, "open", title="Feature", body="By johndoe"),
+            IssueRecord(4, "open", title="[F1] Feature"),
+        ]
+        report = MappingReport()
+
+        assert len(_classify_open_issues(records, context, report=report)) == 1
+        assert report.outcomes["open"] == {
+            "mapped": 1,
+            "no_contributor": 1,
+            "no_reward": 1,
+            "unclassified": 1,
+        }
+
+    def _mock_contributor_creation(self, mocker):
+        def create(text, contributors):
+            contributor = Contributor.objects.create(name="newbie")
+            contributors[contributor.info] = contributor.id
+            return contributor.id, contributors
+
+        return mocker.patch(
+            "utils.mappers._create_contributor_from_text", side_effect=create
+        )
+
+    @pytest.mark.django_db
+    def test_utils_mappers_classify_closed_addressed_issues_matches_created(
+        self, mocker
+    ):
+        context = self._context()
+        self._mock_contributor_creation(mocker)
+        records = [
+            IssueRecord(1, "closed", title="[F1] Feature", body="By newbie on Discord"),
+            IssueRecord(
+                2, "closed", title="[F1] Feature", body="By johndoe", author="newbie"
+            ),
+        ]
+
+        result = _classify_closed_addressed_issues(records, context)
+
+        newbie = Contributor.objects.get(name="newbie")
+        johndoe = Contributor.objects.get(name="johndoe")
+        assert [issue[1] for issue in result] == [
+            [newbie.id],
+            [newbie.id, johndoe.id],
+        ]
+
+    @pytest.mark.django_db
+    def test_utils_mappers_map_unprocessed_closed_archived_issues_matches_created(
+        self, mocker
+    ):
+        context = self._context()
+        Cycle.objects.create(start="2024-01-01", end="2024-01-31")
+        context = MappingContext()
+        self._mock_contributor_creation(mocker)
+        closed_at = datetime(2024, 1, 10, 12)
+        records = [
+            IssueRecord(
+                number,
+                "closed",
+                title="[F2] Feature",
+                body=body,
+                labels=["archived"],
+                author=author,
+                closed_at=closed_at,
+            )
+            for number, body, author in [
+                (1, "By newbie on Discord", None),
+                (2, "By johndoe", "newbie"),
+            ]
+        ]
+
+        assert _map_unprocessed_closed_archived_issues(records, context)
+
+        newbie = Contributor.objects.get(name="newbie")
+        johndoe = Contributor.objects.get(name="johndoe")
+        assert set(
+            Contribution.objects.filter(issue__number=2).values_list(
+                "contributor_id", flat=True
+            )
+        ) == {newbie.id, johndoe.id}
+
+    @pytest.mark.django_db
+    def test_utils_mappers_map_unprocessed_closed_archived_issues_reports_outcomes(
+        self,
+    ):
+        context = self._context()
+        Cycle.objects.create(start="2024-01-01", end="2024-01-31")
+        Issue.objects.create(number=2)
+        context = MappingContext()
+        closed_at = datetime(2024, 1, 10, 12)
+        records = [
+            IssueRecord(
+                number,
+                "closed",
+                title=title,
+                body=body,
+                labels=labels,
+                closed_at=closed,
+            )
+            for number, title, body, labels, closed in [
+                (1, "[F2] Feature", "By johndoe", ["archived"], closed_at),
+                (2, "[F2] Feature", "By johndoe", ["archived"], closed_at),
+                (3, "[F2] Feature", "", ["archived"], closed_at),
+                (4, "[F2] Feature", "By johndoe", ["archived"], None),
+                (5, "[F2] Feature", "By johndoe", ["archived"], datetime(2023, 1, 1)),
+                (6, "[F1] Feature", "By johndoe", ["archived"], closed_at),
+                (7, "[F2] Feature", "By johndoe", [], closed_at),
+            ]
+        ]
+        report = MappingReport()
+
+        assert _map_unprocessed_closed_archived_issues(records, context, report=report)
+        assert report.outcomes["unprocessed_archived"] == {
+            "examined": 7,
+            "not_archived": 1,
+            "existing": 1,
+            "unclassified": 1,
+            "no_closing_date": 1,
+            "no_cycle": 1,
+            "no_reward": 1,
+            "mapped": 1,
+        }
+
 
 class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
     """Testing class for :py:mod:`utils.mappers` _map_unprocessed_closed_archived_issues function."""
@@ -2422,10 +2593,9 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "bug"  # Different label
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
 
         result = _map_unprocessed_closed_archived_issues([mock_issue])
         assert result is False
@@ -2439,18 +2609,19 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Some body"
         mock_issue_obj.title = "[Internal] Test Issue"
         mock_issue_obj.number = 101
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock minimal dependencies
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
         mocker.patch("utils.mappers.SocialPlatform.objects.all", return_value=[])
 
@@ -2466,18 +2637,19 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = None  # Empty body
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []  # Empty comments
 
         # Mock minimal dependencies
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
         mocker.patch("utils.mappers.SocialPlatform.objects.all", return_value=[])
 
@@ -2493,24 +2665,25 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock minimal dependencies
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
         mocker.patch("utils.mappers.SocialPlatform.objects.all", return_value=[])
 
-        # Mock Issue.objects.filter.exists() to return True (issue already exists)
+        # Mock Issue.objects.filter to return existing issue number
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=True)
+        mock_issue_filter.values_list.return_value = [101]
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
@@ -2527,25 +2700,26 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = None  # No closing date
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock minimal dependencies
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
         mocker.patch("utils.mappers.SocialPlatform.objects.all", return_value=[])
 
-        # Mock Issue.objects.filter.exists() to return False (issue doesn't exist)
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
@@ -2562,35 +2736,32 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock minimal dependencies
         mocker.patch("utils.mappers._build_reward_mapping", return_value={})
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
         mocker.patch("utils.mappers.SocialPlatform.objects.all", return_value=[])
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
-        # Mock Cycle.objects.filter().first() to return None (no cycle found)
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=None)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        # Mock cycle lookup to return None (no cycle found)
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=None)
 
         result = _map_unprocessed_closed_archived_issues([mock_issue])
         assert result is True  # Found archived issues but skipped no cycle
@@ -2604,14 +2775,13 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -2622,7 +2792,8 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_contributor.info = "Test User"
         mock_contributor.id = 1
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -2634,20 +2805,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             "utils.mappers.SocialPlatform.objects.all", return_value=[mock_platform]
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock platform identification
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
@@ -2670,15 +2837,14 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Some body without contributor info"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
-        mock_issue_obj.user.login = "unknown_user"
+        mock_issue_obj.author = "unknown_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -2688,7 +2854,9 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         )
 
         # Mock empty contributors
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
         # Mock platforms
@@ -2699,20 +2867,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             "utils.mappers.SocialPlatform.objects.all", return_value=[mock_platform]
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock platform identification
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
@@ -2752,15 +2916,14 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By test_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -2774,7 +2937,8 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_contributor.info = "Test User (g@test_user, d@testuser)"
         mock_contributor.id = 1
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -2792,20 +2956,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             return_value=[mock_platform1, mock_platform2],
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock identification functions
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=2)
@@ -2854,15 +3014,14 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By test_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -2876,7 +3035,8 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_contributor.info = "Test User (g@test_user, d@testuser)"
         mock_contributor.id = 1
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -2894,20 +3054,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             return_value=[mock_platform1, mock_platform2],
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock identification functions
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=2)
@@ -2949,9 +3105,7 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             url="https://example.com",
             confirmed=True,
         )
-        mocked_reward_title.assert_called_once_with(
-            mock_issue.issue.title, active=False
-        )
+        mocked_reward_title.assert_called_once_with(mock_issue.title, {}, active=False)
         mocked_reward_labels.assert_not_called()
 
     @pytest.mark.django_db
@@ -2963,15 +3117,14 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "Test body"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -2985,7 +3138,8 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_contributor.info = "Test User"
         mock_contributor.id = 1
         mocker.patch(
-            "utils.mappers.Contributor.objects.all", return_value=[mock_contributor]
+            "utils.mappers.Contributor.objects.prefetch_related",
+            return_value=[mock_contributor],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
@@ -3003,20 +3157,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             return_value=[mock_platform1, mock_platform2],
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock platform identification to return None (fallback scenario)
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=None)
@@ -3060,15 +3210,14 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By new_user in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -3078,7 +3227,9 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         )
 
         # Mock empty contributors
-        mocker.patch("utils.mappers.Contributor.objects.all", return_value=[])
+        mocker.patch(
+            "utils.mappers.Contributor.objects.prefetch_related", return_value=[]
+        )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
 
         # Mock platforms
@@ -3089,20 +3240,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             "utils.mappers.SocialPlatform.objects.all", return_value=[mock_platform]
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock platform identification
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
@@ -3150,15 +3297,14 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_label.name = "archived"
 
         mock_issue_obj = mocker.MagicMock()
-        mock_issue_obj.labels = [mock_label]
+        mock_issue_obj.labels = [mock_label.name]
         mock_issue_obj.body = "By user1 and user2 in [Discord]"
         mock_issue_obj.title = "Test Issue"
         mock_issue_obj.number = 101
         mock_issue_obj.closed_at = datetime(2023, 1, 1)
-        mock_issue_obj.user.login = "github_user"
+        mock_issue_obj.author = "github_user"
 
-        mock_issue = mocker.MagicMock()
-        mock_issue.issue = mock_issue_obj
+        mock_issue = mock_issue_obj
         mock_issue.comments = []
 
         # Mock dependencies
@@ -3177,7 +3323,7 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
         mock_contributor2.id = 2
 
         mocker.patch(
-            "utils.mappers.Contributor.objects.all",
+            "utils.mappers.Contributor.objects.prefetch_related",
             return_value=[mock_contributor1, mock_contributor2],
         )
         mocker.patch("utils.mappers.GITHUB_ISSUES_EXCLUDED_CONTRIBUTORS", [])
@@ -3190,20 +3336,16 @@ class TestUtilsMappersMapUnprocessedClosedArchivedIssues:
             "utils.mappers.SocialPlatform.objects.all", return_value=[mock_platform]
         )
 
-        # Mock Issue.objects.filter.exists() to return False
+        # Mock Issue.objects.filter to return no existing issues
         mock_issue_filter = mocker.MagicMock()
-        mock_issue_filter.exists = mocker.MagicMock(return_value=False)
+        mock_issue_filter.values_list.return_value = []
         mocker.patch(
             "utils.mappers.Issue.objects.filter", return_value=mock_issue_filter
         )
 
         # Mock cycle
         mock_cycle = mocker.MagicMock()
-        mock_cycle_filter = mocker.MagicMock()
-        mock_cycle_filter.first = mocker.MagicMock(return_value=mock_cycle)
-        mocker.patch(
-            "utils.mappers.Cycle.objects.filter", return_value=mock_cycle_filter
-        )
+        mocker.patch("utils.mappers.MappingContext.cycle_for", return_value=mock_cycle)
 
         # Mock platform identification
         mocker.patch("utils.mappers._identify_platform_from_text", return_value=1)
@@ -3255,18 +3397,43 @@ class TestUtilsMappersPublicFunctions:
         )
         mock_addressed = mocker.patch("utils.mappers._map_closed_addressed_issues")
         mock_open_issues = mocker.patch("utils.mappers._map_open_issues")
+        mock_to_map = mocker.patch(
+            "utils.mappers._issues_to_map", side_effect=lambda issues, full: issues
+        )
+        mock_save_state = mocker.patch("utils.mappers._save_mapping_state")
+        mock_context = mocker.patch("utils.mappers.MappingContext")
+        context = mock_context.return_value
+        report = mocker.patch("utils.mappers.MappingReport").return_value
         result = map_github_issues(github_token="github_token")
 
-        mock_categorize.assert_called_once_with("github_token")
-        mock_archived.assert_called_once_with(closed_issues)
-        mock_unprocesed.assert_called_once_with(mock_archived.return_value)
-        mock_addressed.assert_called_once_with(closed_issues)
-        mock_open_issues.assert_called_once_with(open_issues)
-
-        assert result is False
+        mock_categorize.assert_called_once_with("github_token", report=report)
+        mock_to_map.assert_called_once_with(github_issues, full=False)
+        mock_save_state.assert_called_once_with(github_issues)
+        mock_context.assert_called_once_with()
+        mock_archived.assert_called_once_with(closed_issues, context, report=report)
+        mock_unprocesed.assert_called_once_with(
+            mock_archived.return_value, context, workers=1, report=report
+        )
+        mock_addressed.assert_called_once_with(
+            closed_issues, context, workers=1, report=report
+        )
+        mock_open_issues.assert_called_once_with(
+            open_issues, context, workers=1, report=report
+        )
+        assert [call.args[0] for call in report.stage.call_args_list] == [
+            "fetch",
+            "context",
+            "closed_archived",
+            "unprocessed_archived",
+            "closed_addressed",
+            "open",
+            "mapping_state",
+        ]
+        report.write.assert_not_called()
+        assert result == report.as_dict.return_value
 
     @pytest.mark.django_db
-    def test_utils_mappers_map_github_issues_for_no_token(self, mocker):
+    def test_utils_mappers_map_github_issues_for_no_token(self, mocker, tmp_path):
         mock_categorize = mocker.patch(
             "utils.mappers._fetch_and_categorize_issues", return_value={}
         )
@@ -3276,12 +3443,67 @@ class TestUtilsMappersPublicFunctions:
         )
         mock_addressed = mocker.patch("utils.mappers._map_closed_addressed_issues")
         mock_open_issues = mocker.patch("utils.mappers._map_open_issues")
-        result = map_github_issues(github_token="github_token")
+        mocker.patch("utils.mappers._save_mapping_state")
+        context = mocker.patch("utils.mappers.MappingContext").return_value
+        report_path = tmp_path / "report.json"
+        result = map_github_issues(
+            github_token="github_token", full=True, workers=4, report_path=report_path
+        )
+
+        report = mock_categorize.call_args.kwargs["report"]
+        mock_categorize.assert_called_once_with("github_token", report=report)
+        mock_archived.assert_called_once_with([], context, report=report)
+        mock_unprocesed.assert_called_once_with(
+            mock_archived.return_value, context, workers=4, report=report
+        )
+        mock_addressed.assert_called_once_with([], context, workers=4, report=report)
+        mock_open_issues.assert_called_once_with([], context, workers=4, report=report)
+        assert list(result["stages"]) == [
+            "fetch",
+            "context",
+            "closed_archived",
+            "unprocessed_archived",
+            "closed_addressed",
+            "open",
+            "mapping_state",
+        ]
+        assert json.loads(report_path.read_text()) == result
 
-        mock_categorize.assert_called_once_with("github_token")
-        mock_archived.assert_called_once_with([])
-        mock_unprocesed.assert_called_once_with(mock_archived.return_value)
-        mock_addressed.assert_called_once_with([])
-        mock_open_issues.assert_called_once_with([])
+    @pytest.mark.django_db
+    def test_utils_mappers_map_github_issues_maps_only_changed_issues(
+        self, mocker, tmp_path
+    ):
+        def cache():
+            return GitHubIssuesCache(tmp_path / "issues.db")
 
-        assert result is False
+        mocker.patch("utils.mappers.GitHubIssuesCache", side_effect=cache)
+        records = [
+            IssueRecord(number, "open", title=f"Issue {number}") for number in (1, 2, 3)
+        ]
+        mocker.patch(
+            "utils.mappers._fetch_and_categorize_issues",
+            side_effect=lambda token, report: {
+                state: [record for record in records if record.state == state]
+                for state in ("open", "closed")
+            },
+        )
+        mocked_open = mocker.patch(
+            "utils.mappers._map_open_issues",
+            side_effect=lambda issues, context, **kwargs: Issue.objects.bulk_create(
+                [Issue(number=issue.number) for issue in issues if issue.number < 3],
+                ignore_conflicts=True,
+            ),
+        )
+        mocker.patch("utils.mappers._map_closed_archived_issues", return_value=[])
+        mocker.patch("utils.mappers._map_unprocessed_closed_archived_issues")
+        mocker.patch("utils.mappers._map_closed_addressed_issues")
+
+        map_github_issues()
+        records[1] = IssueRecord(2, "closed", title="Issue 2")
+        map_github_issues()
+        map_github_issues(full=True)
+
+        assert [
+            [issue.number for issue in call.args[0]]
+            for call in mocked_open.call_args_list
+        ] == [[1, 2, 3], [3], [1, 3]]